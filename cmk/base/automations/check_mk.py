@@ -192,7 +192,7 @@ from cmk.checkengine.specs.checkresults import ServiceState
 from cmk.checkengine.specs.parameters import TimespecificParameters
 from cmk.checkengine.submitters import ServiceDetails
 from cmk.checkengine.summarize import summarize
-from cmk.checkengine.value_store import AllValueStoresStore, ValueStoreManager
+from cmk.checkengine.value_store import JournaledValueStoresStore, ValueStoreManager
 from cmk.core_client import CoreAction
 from cmk.discover_plugins import (
     addons_plugins_local_path,
@@ -899,7 +899,7 @@ def _execute_discovery(
 
     with (
         set_value_store_manager(
-            ValueStoreManager(host_name, AllValueStoresStore(counters_dir / host_name)),
+            ValueStoreManager(host_name, JournaledValueStoresStore(counters_dir / host_name)),
             store_changes=False,
         ) as value_store_manager,
     ):
@@ -2389,6 +2389,7 @@ class AutomationDeleteHosts(ABCDeleteHosts):
             str(tree_path_gz.legacy),
             str(status_data_tree.path),
             str(status_data_tree.legacy),
+            str(inv_paths.history_index(hostname)),
         ]
 
     def _delete_host_files(self, hostname: HostName) -> None:
@@ -3855,6 +3856,8 @@ def _automation_update_dns_cache(
             ),
             get_ip_stack_config=env.ip_lookup_config.ip_stack_config,
             lookup_ip_address=ip_lookup.make_lookup_ip_address(env.ip_lookup_config),
+            max_workers=env.loaded_config.dns_cache_update_workers,
+            lookup_timeout=env.loaded_config.dns_cache_update_timeout,
         )
     )
 
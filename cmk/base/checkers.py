@@ -12,8 +12,10 @@ from __future__ import annotations
 
 import functools
 import logging
+import queue
 import socket
 import sys
+import threading
 import time
 from collections.abc import Callable, Container, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
@@ -139,6 +141,7 @@ __all__ = [
 ]
 
 type _Labels = Mapping[str, str]
+type _Fetched = tuple[SourceInfo, result.Result[AgentRawData | SNMPRawData, Exception], Snapshot]
 
 
 @dataclass(frozen=True)
@@ -163,6 +166,7 @@ def _fetch_all(
     secrets: FetcherSecrets,
     *,
     simulation: bool,
+    max_concurrent_fetches: int = 1,
 ) -> Sequence[
     tuple[
         SourceInfo,
@@ -170,17 +174,71 @@ def _fetch_all(
         Snapshot,
     ]
 ]:
-    return [
-        _do_fetch(
-            trigger,
+    """Fetch the raw data of all sources
+
+    The sources are independent of each other, so a host with an agent,
+    SNMP, a special agent and piggyback data only has to wait for the
+    slowest of them if `max_concurrent_fetches` allows it.  The result
+    is always in the order of `sources`.
+    """
+    jobs = [
+        (
             source.source_info(),
             source.file_cache(simulation=simulation, file_cache_options=file_cache_options),
             source.fetcher(),
-            mode,
-            secrets,
         )
         for source in sources
     ]
+    if (
+        max_concurrent_fetches <= 1
+        or len(jobs) <= 1
+        # The ad hoc secrets are written to (and removed from) the same file by every fetch.
+        or isinstance(secrets, AdHocSecrets)
+    ):
+        return [
+            _do_fetch(trigger, source_info, file_cache, fetcher, mode, secrets)
+            for source_info, file_cache, fetcher in jobs
+        ]
+
+    # Note: The fetchers are I/O bound (sockets, subprocesses, files), so threads are
+    # good enough here.  If we are interrupted (MKTimeout is raised in the main thread by
+    # the alarm signal handler), a hanging fetcher must not keep the process from exiting.
+    # So the workers are daemon threads, which are not joined at interpreter exit.
+    todo: queue.SimpleQueue[tuple[int, tuple[SourceInfo, FileCache, Fetcher]] | None] = (
+        queue.SimpleQueue()
+    )
+    done: queue.SimpleQueue[tuple[int, _Fetched | Exception]] = queue.SimpleQueue()
+    stopped = threading.Event()
+
+    def work() -> None:
+        while not stopped.is_set() and (item := todo.get()) is not None:
+            index, (source_info, file_cache, fetcher) = item
+            try:
+                done.put(
+                    (index, _do_fetch(trigger, source_info, file_cache, fetcher, mode, secrets))
+                )
+            except Exception as e:
+                done.put((index, e))
+
+    for item in enumerate(jobs):
+        todo.put(item)
+    n_workers = min(max_concurrent_fetches, len(jobs))
+    for _n in range(n_workers):
+        todo.put(None)
+    for n in range(n_workers):
+        threading.Thread(target=work, name=f"fetch_{n}", daemon=True).start()
+
+    fetched: dict[int, _Fetched] = {}
+    try:
+        while len(fetched) < len(jobs):
+            index, fetch_result = done.get()
+            if isinstance(fetch_result, Exception):
+                raise fetch_result
+            fetched[index] = fetch_result
+    finally:
+        # Fetches which have not started yet are skipped
+        stopped.set()
+    return [fetched[index] for index in range(len(jobs))]
 
 
 def _do_fetch(
@@ -391,6 +449,7 @@ class CMKFetcher(FetcherFunction):
         simulation_mode: bool,
         metric_backend_fetcher_factory: Callable[[HostAddress], Fetcher[AgentRawData] | None],
         max_cachefile_age: MaxAge | None = None,
+        max_concurrent_fetches: int = 1,
     ) -> None:
         self.config_cache: Final = config_cache
         self.host_tags: Final = host_tags
@@ -412,6 +471,7 @@ class CMKFetcher(FetcherFunction):
         self.simulation_mode: Final = simulation_mode
         self.max_cachefile_age: Final = max_cachefile_age
         self.metric_backend_fetcher_factory: Final = metric_backend_fetcher_factory
+        self.max_concurrent_fetches: Final = max_concurrent_fetches
 
     def __call__(
         self, host_name: HostName, *, ip_address: HostAddress | None
@@ -527,6 +587,7 @@ class CMKFetcher(FetcherFunction):
                 mode=self.mode,
                 secrets=secrets_config,
                 simulation=self.simulation_mode,
+                max_concurrent_fetches=self.max_concurrent_fetches,
             )
         ]
 
@@ -19,10 +19,13 @@ import copy
 import dataclasses
 import enum
 import itertools
+import marshal
+import mmap
 import numbers
 import os
 import pickle
 import socket
+import struct
 import sys
 import time
 from collections.abc import Callable, Container, Iterable, Iterator, Mapping, Sequence
@@ -603,6 +606,24 @@ def load_packed_config(config_path: Path) -> dict[str, Any]:
     }
 
 
+def load_packed_config_of_host(config_path: Path, host_name: HostName) -> dict[str, Any]:
+    """Load the configuration for the CMK helpers of one host
+
+    Like load_packed_config(), but the host specific variables only cover the host, the
+    clusters it is a node of and their nodes, or the nodes of the cluster. The configuration
+    built from it is only valid for checking this host.
+
+    Falls back to the complete configuration if the host slices are missing, e.g. written by
+    a previous version, or do not know the host.
+    """
+    if (helper_config := HostSlicedConfigStore.from_serial(config_path).read(host_name)) is None:
+        return load_packed_config(config_path)
+    return {
+        **get_default_config(),
+        **helper_config,
+    }
+
+
 def perform_post_config_loading_actions(
     loaded_context: dict[str, Any],
     get_builtin_host_labels: Callable[[SiteId], Labels],
@@ -797,13 +818,13 @@ def save_packed_config(
 ) -> None:
     """Create and store a precompiled configuration for Checkmk helper processes"""
     base_config = config_cache.base_config
-    PackedConfigStore.from_serial(config_path).write(
-        PackedConfigGenerator(
-            config_cache,
-            hosts_config,
-            {f.name: getattr(base_config, f.name) for f in dataclasses.fields(base_config)},
-        ).generate()
-    )
+    helper_config = PackedConfigGenerator(
+        config_cache,
+        hosts_config,
+        {f.name: getattr(base_config, f.name) for f in dataclasses.fields(base_config)},
+    ).generate()
+    PackedConfigStore.from_serial(config_path).write(helper_config)
+    HostSlicedConfigStore.from_serial(config_path).write(helper_config)
 
 
 class PackedConfigGenerator:
@@ -965,6 +986,176 @@ class PackedConfigStore:
             return pickle.load(f)  # nosec B301 # BNS:c3c5e9
 
 
+# The variables of the packed configuration with a value per host name
+_HOST_KEYED_VARIABLES: Final = frozenset(
+    {
+        "clustered_services_of",
+        "explicit_snmp_communities",
+        "host_attributes",
+        "host_labels",
+        "host_paths",
+        "host_tags",
+        "hosttags",
+        "ipaddresses",
+        "ipv6addresses",
+        "management_ipmi_credentials",
+        "management_protocol",
+        "management_snmp_credentials",
+        "shadow_hosts",
+    }
+)
+_HOST_SPECIFIC_VARIABLES: Final = _HOST_KEYED_VARIABLES | {
+    "all_hosts",
+    "clusters",
+    "explicit_host_conf",
+    "explicit_service_custom_variables",
+}
+
+
+class HostSlicedConfigStore:
+    """The packed configuration sliced by host
+
+    Loading the complete packed configuration and building the config cache from it takes
+    the longer the more hosts there are, even if only one host is checked. This store holds
+    the variables which are independent of the hosts once, and for each host the entries of
+    the host specific variables of the host, its clusters and their nodes. It is memory
+    mapped, only the table of hosts and the entries of the requested host are read.
+    """
+
+    _MAGIC: Final = b"CMK-PACKED-CONFIG-HOSTS\0"
+    _VERSION: Final = 1
+    # version, length of the host table, length of the common part
+    _HEADER: Final = struct.Struct("<BQQ")
+
+    def __init__(self, path: Path) -> None:
+        self.path: Final = path
+
+    @classmethod
+    def from_serial(cls, config_path: Path) -> HostSlicedConfigStore:
+        return cls(cls.make_host_sliced_config_store_path(config_path))
+
+    @classmethod
+    def make_host_sliced_config_store_path(cls, config_path: Path) -> Path:
+        return config_path / "precompiled_check_config.hosts"
+
+    def write(self, helper_config: Mapping[str, Any]) -> None:
+        common = {
+            varname: value
+            for varname, value in helper_config.items()
+            if varname not in _HOST_SPECIFIC_VARIABLES
+        }
+        raw_common = pickle.dumps(common)
+
+        table: dict[str, tuple[int, int]] = {}
+        raw_slices: list[bytes] = []
+        offset = len(raw_common)
+        for host_name, host_slice in _make_host_slices(helper_config).items():
+            raw_slice = pickle.dumps(host_slice)
+            table[str(host_name)] = (offset, len(raw_slice))
+            raw_slices.append(raw_slice)
+            offset += len(raw_slice)
+        raw_table = marshal.dumps(table)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f"{self.path.suffix}.compiled")
+        with tmp_path.open("wb") as compiled_file:
+            compiled_file.write(self._MAGIC)
+            compiled_file.write(self._HEADER.pack(self._VERSION, len(raw_table), len(raw_common)))
+            compiled_file.write(raw_table)
+            compiled_file.write(raw_common)
+            compiled_file.writelines(raw_slices)
+        tmp_path.rename(self.path)
+
+    def read(self, host_name: HostName) -> Mapping[str, Any] | None:
+        """The packed configuration of the host, None if the host or the file is missing"""
+        try:
+            with self.path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                if m[: len(self._MAGIC)] != self._MAGIC:
+                    return None
+                version, table_length, common_length = self._HEADER.unpack_from(m, len(self._MAGIC))
+                if version != self._VERSION:
+                    return None
+                table_start = len(self._MAGIC) + self._HEADER.size
+                data_start = table_start + table_length
+                # Only written by us, see write()
+                table = marshal.loads(m[table_start:data_start])  # nosec B302
+                if (entry := table.get(str(host_name))) is None:
+                    return None
+                offset, length = entry
+                return {
+                    **pickle.loads(  # nosec B301 # BNS:c3c5e9
+                        m[data_start : data_start + common_length]
+                    ),
+                    **pickle.loads(  # nosec B301 # BNS:c3c5e9
+                        m[data_start + offset : data_start + offset + length]
+                    ),
+                }
+        except (OSError, ValueError, EOFError, TypeError, struct.error):
+            # Missing, empty or truncated
+            return None
+
+
+def _make_host_slices(helper_config: Mapping[str, Any]) -> dict[HostName, dict[str, Any]]:
+    """The host specific variables of the packed configuration for each host
+
+    A node needs its clusters to find the clustered services, a cluster needs its nodes to
+    check them. Both need the other nodes of these clusters, e.g. for the host tags of the
+    clusters.
+    """
+    all_hosts = {
+        HostName(entry.split("|", 1)[0]): entry for entry in helper_config.get("all_hosts", [])
+    }
+    clusters = {
+        HostName(entry.split("|", 1)[0]): (entry, nodes)
+        for entry, nodes in helper_config.get("clusters", {}).items()
+    }
+
+    related_hosts: dict[HostName, set[HostName]] = {
+        host_name: {host_name} for host_name in itertools.chain(all_hosts, clusters)
+    }
+    for cluster_name, (_entry, tagged_nodes) in clusters.items():
+        members = {cluster_name, *(HostName(node.split("|", 1)[0]) for node in tagged_nodes)}
+        for member in members:
+            related_hosts.setdefault(member, {member}).update(members)
+
+    service_custom_variables: dict[HostName, dict[tuple[HostName, ServiceName], Any]] = {}
+    for key, value in helper_config.get("explicit_service_custom_variables", {}).items():
+        service_custom_variables.setdefault(key[0], {})[key] = value
+
+    keyed = {
+        varname: value
+        for varname, value in helper_config.items()
+        if varname in _HOST_KEYED_VARIABLES
+    }
+    explicit_host_conf: Mapping[str, Mapping[HostName, Any]] = helper_config.get(
+        "explicit_host_conf", {}
+    )
+
+    host_slices: dict[HostName, dict[str, Any]] = {}
+    for host_name, related in related_hosts.items():
+        hosts = sorted(related)
+        host_slice: dict[str, Any] = {
+            varname: {h: value[h] for h in hosts if h in value} for varname, value in keyed.items()
+        }
+        if "all_hosts" in helper_config:
+            host_slice["all_hosts"] = [all_hosts[h] for h in hosts if h in all_hosts]
+        if "clusters" in helper_config:
+            host_slice["clusters"] = dict(clusters[h] for h in hosts if h in clusters)
+        if "explicit_host_conf" in helper_config:
+            host_slice["explicit_host_conf"] = {
+                key: {h: mapping[h] for h in hosts if h in mapping}
+                for key, mapping in explicit_host_conf.items()
+            }
+        if "explicit_service_custom_variables" in helper_config:
+            host_slice["explicit_service_custom_variables"] = {
+                key: value
+                for h in hosts
+                for key, value in service_custom_variables.get(h, {}).items()
+            }
+        host_slices[host_name] = host_slice
+    return host_slices
+
+
 def parse_hostname_list(
     config_cache: ConfigCache,
     hosts_config: Hosts,
@@ -2708,12 +2899,16 @@ class ConfigCache:
                 return SNMPBackendEnum.INLINE
             if host_backend == "classic":
                 return SNMPBackendEnum.CLASSIC
+            if host_backend == "builtin":
+                return SNMPBackendEnum.BUILTIN
             raise MKGeneralException(f"Bad Host SNMP Backend configuration: {host_backend}")
 
         if with_inline_snmp and self._loaded_config.snmp_backend_default == "inline":
             return SNMPBackendEnum.INLINE
         if self._loaded_config.snmp_backend_default == "classic":
             return SNMPBackendEnum.CLASSIC
+        if self._loaded_config.snmp_backend_default == "builtin":
+            return SNMPBackendEnum.BUILTIN
         # Note: in the above case we raise here.
         # I am not sure if this different behavior is intentional.
         return SNMPBackendEnum.CLASSIC
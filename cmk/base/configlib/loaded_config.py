@@ -102,6 +102,8 @@ class BaseConfig:
     is_distributed_setup_remote_site: bool
     simulation_mode: bool
     use_dns_cache: bool
+    dns_cache_update_workers: int
+    dns_cache_update_timeout: float
     ipaddresses: Mapping[HostName, HostAddress]
     ipv6addresses: Mapping[HostName, HostAddress]
     inventory_check_interval: object
@@ -201,6 +203,7 @@ class BaseConfig:
     restart_locking: Literal["abort", "wait"] | None
     check_submission: Literal["file", "pipe"]
     check_max_cachefile_age: int
+    check_max_concurrent_fetches: int
     check_mk_perfdata_with_times: bool
     perfdata_format: Literal["pnp", "standard"]
     host_notification_periods: Sequence[RuleSpec[object]]
@@ -218,6 +221,8 @@ class BaseConfig:
     notification_fallback_email: str
     notification_fallback_format: tuple[NotificationPluginNameStr, NotifyPluginParamsDict]
     notification_plugin_timeout: int
+    notification_delivery_workers: int
+    notification_plugin_concurrency: Mapping[NotificationPluginNameStr, int]
     notification_logging: int
     notification_spooling: bool | Literal["local", "remote", "both", "off"] | None
     notification_spool_to: object
@@ -264,7 +269,7 @@ class BaseConfig:
     snmp_bulk_size: Sequence[RuleSpec[int]]
     snmp_character_encodings: Sequence[RuleSpec[str | None]]
     snmp_backend_hosts: Sequence[RuleSpec[object]]
-    snmp_backend_default: Literal["inline", "classic"]
+    snmp_backend_default: Literal["inline", "classic", "builtin"]
     snmp_limit_oid_range: Sequence[RuleSpec[object]]
     snmp_exclude_sections: Sequence[RuleSpec[Mapping[str, Sequence[str]]]]
     snmp_without_sys_descr: Sequence[RuleSpec[bool]]
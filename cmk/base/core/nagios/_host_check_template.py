@@ -97,7 +97,7 @@ def main() -> int:
         plugins = load_selected_plugins(CONFIG.locations, sections, checks, validate=debug)
 
         app = make_app(cmk_version.edition(omd_root))
-        raw_config = config.load_packed_config(active_config_path)
+        raw_config = config.load_packed_config_of_host(active_config_path, CONFIG.hostname)
         # The precompiled host check resolves the addresses dynamically at
         # config-generation time (potentially via DNS) and ships them in the
         # template. CONFIG.ip{,v6}addresses is populated not only with the
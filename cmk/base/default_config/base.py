@@ -51,12 +51,15 @@ snmp_ports: list[RuleSpec[int]] = []
 tcp_connect_timeout = 5.0
 tcp_connect_timeouts: list[RuleSpec[float]] = []
 use_dns_cache = True  # prevent DNS by using own cache file
+dns_cache_update_workers = 16  # number of concurrent lookups when updating the DNS cache
+dns_cache_update_timeout = 10.0  # secs. per lookup when updating the DNS cache
 delay_precompile = False  # delay Python compilation to Nagios execution
 restart_locking: Literal["abort", "wait"] | None = "abort"
 check_submission: Literal["file", "pipe"] = "file"
 default_host_group = "check_mk"
 
 check_max_cachefile_age = 0  # per default do not use cache files when checking
+check_max_concurrent_fetches = 1  # number of data sources of one host fetched in parallel
 cluster_max_cachefile_age = 90  # secs.
 piggyback_max_cachefile_age = 3600  # secs
 # Ruleset for translating piggyback host names
@@ -85,7 +88,7 @@ http_proxies: dict[str, HTTPProxySpec] = {}
 # SNMP communities and encoding
 
 # Global config for SNMP Backend
-snmp_backend_default: Literal["inline", "classic"] = "inline"
+snmp_backend_default: Literal["inline", "classic", "builtin"] = "inline"
 
 # Ruleset to enable specific SNMP Backend for each host.
 snmp_backend_hosts: list[RuleSpec[object]] = []
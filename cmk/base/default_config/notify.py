@@ -34,6 +34,11 @@ notification_parameter: NotificationParameterSpecs = {}
 # Check every 10 seconds for ripe bulks
 notification_bulk_interval = 10
 notification_plugin_timeout = 60
+# Number of threads delivering the notifications in keepalive mode, 0 delivers them
+# synchronously. Plug-ins not listed in notification_plugin_concurrency are called
+# one at a time, which keeps the order of their notifications.
+notification_delivery_workers = 8
+notification_plugin_concurrency: dict[NotificationPluginNameStr, int] = {}
 
 # Notification Spooling.
 
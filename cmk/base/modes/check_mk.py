@@ -118,7 +118,7 @@ from cmk.checkengine.sources import SourceBuilder
 from cmk.checkengine.specs.checkresults import ActiveCheckResult, ServiceState
 from cmk.checkengine.submitters import get_submitter
 from cmk.checkengine.summarize import summarize, SummarizerFunction
-from cmk.checkengine.value_store import AllValueStoresStore, ValueStoreManager
+from cmk.checkengine.value_store import JournaledValueStoresStore, ValueStoreManager
 from cmk.discover_plugins import discover_families, PluginGroup
 from cmk.inventory.paths import Paths as InventoryPaths
 from cmk.inventory.structured_data import (
@@ -213,6 +213,8 @@ def parse_snmp_backend(backend: object) -> SNMPBackendEnum | None:
             return SNMPBackendEnum.CLASSIC
         case "stored-walk":
             return SNMPBackendEnum.STORED_WALK
+        case "builtin":
+            return SNMPBackendEnum.BUILTIN
         case _:
             raise ValueError(backend)
 
@@ -357,7 +359,7 @@ _SNMP_BACKEND_OPTION: Final = Option(
     long_option="snmp-backend",
     short_help="Override default SNMP backend",
     argument=True,
-    argument_descr="inline|classic|stored-walk",
+    argument_descr="inline|classic|stored-walk|builtin",
 )
 
 # .
@@ -1028,6 +1030,8 @@ def _mode_update_dns_cache(app: CheckmkBaseApp) -> None:
             _forced_ip_lookup()  # this makes little sense.
             or ip_lookup.make_lookup_ip_address(ip_lookup_config)
         ),
+        max_workers=loading_result.loaded_config.dns_cache_update_workers,
+        lookup_timeout=loading_result.loaded_config.dns_cache_update_timeout,
     )
 
 
@@ -2231,6 +2235,7 @@ def _mode_check_discovery(
             discovery=discovery_file_cache_max_age,
             inventory=1.5 * check_interval,
         ),
+        max_concurrent_fetches=loaded_config.check_max_concurrent_fetches,
         secrets_config_relay=AdHocSecrets(
             path=cmk.utils.password_store.active_secrets_path_relay(),
             secrets=(
@@ -2905,6 +2910,7 @@ def run_checking(
             FetchMode.CHECKING if selected_sections is NO_SELECTION else FetchMode.FORCE_SECTIONS
         ),
         simulation_mode=loaded_config.simulation_mode,
+        max_concurrent_fetches=loaded_config.check_max_concurrent_fetches,
         secrets_config_relay=secrets_config_relay,
         secrets_config_site=secrets_config_site,
         metric_backend_fetcher_factory=lambda hn: app.make_metric_backend_fetcher(
@@ -2956,7 +2962,7 @@ def run_checking(
         error_handler,
         set_value_store_manager(
             ValueStoreManager(
-                hostname, AllValueStoresStore(cmk.utils.paths.counters_dir / hostname)
+                hostname, JournaledValueStoresStore(cmk.utils.paths.counters_dir / hostname)
             ),
             store_changes=not dry_run,
         ) as value_store_manager,
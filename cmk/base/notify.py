@@ -30,8 +30,10 @@ import json
 import logging
 import os
 import re
+import signal
 import subprocess
 import sys
+import threading
 import time
 import traceback
 import uuid
@@ -40,7 +42,7 @@ from contextlib import suppress
 from dataclasses import dataclass, field
 from functools import partial
 from pathlib import Path
-from typing import cast, Literal
+from typing import cast, Literal, Self
 
 import livestatus
 from livestatus import MKLivestatusException
@@ -62,6 +64,7 @@ from cmk.base.automations.automations import Automation, load_config, load_plugi
 from cmk.base.base_app import CheckmkBaseApp
 from cmk.base.configlib.loaded_config import BaseConfig
 from cmk.base.modes.modes import Mode, Option
+from cmk.base.notify_delivery import DeliveryPool
 from cmk.base.utils import register_sigint_handler
 from cmk.ccc import store
 from cmk.ccc.exceptions import MKGeneralException, MKTimeout
@@ -124,6 +127,8 @@ logger = logging.getLogger("cmk.base.notify")
 
 _log_to_stdout = False
 notify_mode = "notify"
+# Delivers the notifications in keepalive mode, unless notification_delivery_workers is 0
+_delivery_pool: DeliveryPool | None = None
 
 _ContactgroupName = str
 
@@ -180,6 +185,8 @@ class NotificationConfig:
     fallback_email: str
     fallback_format: _FallbackFormat
     plugin_timeout: int
+    delivery_workers: int
+    plugin_concurrency: Mapping[NotificationPluginNameStr, int]
     spooling: Literal["local", "remote", "both", "off"]
     logging_level: int
     host_parameters_cb: Callable[[HostName, NotificationPluginNameStr], Mapping[str, object]]
@@ -259,6 +266,8 @@ def make_notification_config(
         fallback_email=base_config.notification_fallback_email,
         fallback_format=base_config.notification_fallback_format,
         plugin_timeout=base_config.notification_plugin_timeout,
+        delivery_workers=base_config.notification_delivery_workers,
+        plugin_concurrency=base_config.notification_plugin_concurrency,
         spooling=resolve_spooling(
             edition, base_config.notification_spooling, base_config.notification_spool_to
         ),
@@ -287,6 +296,7 @@ type _CoreTimeperiodsActive = Mapping[str, bool]
 notification_logdir = cmk.utils.paths.var_dir / "notify"
 notification_spooldir = cmk.utils.paths.var_dir / "notify/spool"
 notification_bulkdir = str(cmk.utils.paths.var_dir / "notify/bulk")
+notification_queuedir = cmk.utils.paths.var_dir / "notify/delivery"
 notification_log = cmk.utils.paths.log_dir / "notify.log"
 
 notification_log_template = (
@@ -817,6 +827,17 @@ def _notify_keepalive(
     config_contacts: ConfigContacts,
     all_timeperiods: TimeperiodSpecs,
 ) -> None:
+    global _delivery_pool
+    if notification_config.delivery_workers:
+        _delivery_pool = DeliveryPool(
+            notification_queuedir,
+            partial(_deliver_via_plugin, plugin_timeout=notification_config.plugin_timeout),
+            max_workers=notification_config.delivery_workers,
+            plugin_concurrency=notification_config.plugin_concurrency,
+        )
+        if num_queued := _delivery_pool.resume():
+            logger.info("Resuming delivery of %d queued notifications", num_queued)
+
     events.event_keepalive(
         event_function=partial(
             _notify_notify,
@@ -828,15 +849,33 @@ def _notify_keepalive(
             all_timeperiods=all_timeperiods,
         ),
         call_every_loop=partial(
-            _send_ripe_bulks,
+            _notify_keepalive_loop,
             get_http_proxy,
             bulk_interval=notification_config.bulk_interval,
             plugin_timeout=notification_config.plugin_timeout,
         ),
         loop_interval=notification_config.bulk_interval,
+        shutdown_function=None if _delivery_pool is None else _delivery_pool.shutdown,
     )
 
 
+def _notify_keepalive_loop(
+    get_http_proxy: events.ProxyGetter,
+    timeperiods_active: _CoreTimeperiodsActive,
+    *,
+    bulk_interval: int,
+    plugin_timeout: int,
+) -> None:
+    _send_ripe_bulks(
+        get_http_proxy,
+        timeperiods_active,
+        bulk_interval=bulk_interval,
+        plugin_timeout=plugin_timeout,
+    )
+    if _delivery_pool is not None:
+        _delivery_pool.log_metrics()
+
+
 def _automation_notification_replay(
     app: CheckmkBaseApp,
     args: list[str],
@@ -1297,7 +1336,7 @@ def _process_notifications(
                     else rbn_split_plugin_context(plugin_context)
                 )
                 for context in plugin_contexts:
-                    call_notification_script(plugin_name, context, plugin_timeout=plugin_timeout)
+                    _deliver_notification(plugin_name, context, plugin_timeout=plugin_timeout)
             else:
                 logger.info("No rule matched, would notify fallback contacts, but none configured")
     else:
@@ -1359,7 +1398,7 @@ def _process_notifications(
                     else:
                         if dispatch and entry.plugin_name != dispatch:
                             continue
-                        call_notification_script(
+                        _deliver_notification(
                             entry.plugin_name, context, plugin_timeout=plugin_timeout
                         )
 
@@ -2134,6 +2173,39 @@ def path_to_notification_script(plugin_name: NotificationPluginNameStr) -> str |
     return str(path)
 
 
+def _deliver_notification(
+    plugin_name: NotificationPluginNameStr,
+    plugin_context: NotificationContext,
+    *,
+    plugin_timeout: int,
+) -> None:
+    if _delivery_pool is None:
+        call_notification_script(plugin_name, plugin_context, plugin_timeout=plugin_timeout)
+        return
+    logger.info("     queueing for delivery via %s", plugin_name)
+    _delivery_pool.submit(plugin_name, plugin_context)
+
+
+def _deliver_via_plugin(
+    plugin_name: NotificationPluginNameStr,
+    plugin_context: NotificationContext,
+    *,
+    plugin_timeout: int,
+) -> None:
+    try:
+        call_notification_script(plugin_name, plugin_context, plugin_timeout=plugin_timeout)
+    except Exception as e:
+        logger.exception("    ERROR:")
+        log_to_history(
+            notification_result_message(
+                plugin=NotificationPluginName(plugin_name),
+                context=plugin_context,
+                exit_code=NotificationResultCode(2),
+                output=[str(e)],
+            )
+        )
+
+
 # This is the function that finally sends the actual notification.
 # It does this by calling an external script are creating a
 # plain email and calling bin/mail.
@@ -2166,6 +2238,10 @@ def call_notification_script(
 
     plugin_log("executing %s" % path)
 
+    # The alarm signal is only delivered to the main thread. The worker threads of the
+    # delivery pool kill the plug-in with a timer instead, together with its children, as
+    # they would keep the output pipe open.
+    in_main_thread = threading.current_thread() is threading.main_thread()
     with subprocess.Popen(
         [path],
         stdout=subprocess.PIPE,
@@ -2173,13 +2249,15 @@ def call_notification_script(
         env=notification_script_env(plugin_context),
         encoding="utf-8",
         close_fds=True,
+        process_group=None if in_main_thread else 0,
     ) as p:
         output_lines: list[str] = []
         assert p.stdout is not None
 
-        with Timeout(
-            plugin_timeout,
-            message="Notification plug-in timed out",
+        with (
+            Timeout(plugin_timeout, message="Notification plug-in timed out")
+            if in_main_thread
+            else _KillTimer(p, plugin_timeout)
         ) as timeout_guard:
             try:
                 while True:
@@ -2201,6 +2279,10 @@ def call_notification_script(
                 )
                 p.kill()
 
+    if timeout_guard.signaled and isinstance(timeout_guard, _KillTimer):
+        plugin_log(
+            "Notification plug-in did not finish within %d seconds. Terminated." % plugin_timeout
+        )
     if exitcode := 1 if timeout_guard.signaled else p.returncode:
         plugin_log("Plug-in exited with code %d" % exitcode)
 
@@ -2219,6 +2301,30 @@ def call_notification_script(
     return exitcode
 
 
+class _KillTimer:
+    """Kill the process group of a plug-in after the timeout, like Timeout, but in any thread"""
+
+    def __init__(self, process: subprocess.Popen[str], timeout: int) -> None:
+        self._timer = threading.Timer(timeout, self._kill, args=(process,))
+        self._signaled = False
+
+    @property
+    def signaled(self) -> bool:
+        return self._signaled
+
+    def _kill(self, process: subprocess.Popen[str]) -> None:
+        self._signaled = True
+        with suppress(ProcessLookupError):
+            os.killpg(process.pid, signal.SIGKILL)
+
+    def __enter__(self) -> Self:
+        self._timer.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._timer.cancel()
+
+
 # Construct the environment for the notification script
 def notification_script_env(plugin_context: NotificationContext) -> PluginNotificationContext:
     # Use half of the maximum allowed string length MAX_ARG_STRLEN
@@ -2652,6 +2758,20 @@ def _send_ripe_bulks(
     if ripe:
         logger.info("Sending out %d ripe bulk notifications", len(ripe))
         for bulk in ripe:
+            if _delivery_pool is not None:
+                if not _delivery_pool.submit_bulk(
+                    cast(NotificationPluginNameStr, bulk[0].split("/")[-2]),
+                    bulk[0],
+                    partial(
+                        notify_bulk,
+                        bulk[0],
+                        bulk[-1],
+                        get_http_proxy,
+                        plugin_timeout=plugin_timeout,
+                    ),
+                ):
+                    logger.info("Bulk %s is still being sent", bulk[0])
+                continue
             try:
                 notify_bulk(bulk[0], bulk[-1], get_http_proxy, plugin_timeout=plugin_timeout)
             except Exception:
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+"""Concurrent delivery of notifications in keepalive mode
+
+The notifications are written to a queue directory before they are handed to the
+worker threads and are removed from it once the plug-in has been called. Entries left
+over by a previous process, e.g. one that has been restarted while plug-ins were still
+waiting, are delivered again on startup.
+
+Every plug-in has a limit of concurrently running deliveries. Deliveries exceeding the
+limit wait in the order in which they have been submitted, so with the default limit of
+one the notifications of a plug-in are still delivered one after another.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from cmk.ccc import store
+from cmk.events.notification_result import NotificationContext
+from cmk.events.notification_spool_file import NotificationViaPlugin
+from cmk.utils.notify_types import NotificationPluginNameStr
+
+logger = logging.getLogger("cmk.base.notify.delivery")
+
+DEFAULT_PLUGIN_CONCURRENCY: Final = 1
+METRICS_INTERVAL: Final = 60.0
+
+
+@dataclass(frozen=True)
+class QueuedNotification:
+    path: Path
+    plugin_name: NotificationPluginNameStr
+    context: NotificationContext
+    queued: float
+
+
+@dataclass
+class PluginMetrics:
+    """Delivery statistics of one plug-in
+
+    The queue depth and the number of running deliveries are current values, the other
+    values refer to the deliveries finished since the last report.
+    """
+
+    waiting: int = 0
+    running: int = 0
+    delivered: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    delivery_time: float = 0.0
+    max_delivery_time: float = 0.0
+
+
+@dataclass(frozen=True)
+class _Task:
+    function: Callable[[], object]
+    key: str | None
+    queued: float
+
+
+class DeliveryPool:
+    def __init__(
+        self,
+        queue_dir: Path,
+        deliver: Callable[[NotificationPluginNameStr, NotificationContext], object],
+        *,
+        max_workers: int,
+        plugin_concurrency: Mapping[NotificationPluginNameStr, int],
+    ) -> None:
+        self._queue_dir: Final = queue_dir
+        self._deliver: Final = deliver
+        self._plugin_concurrency: Final = plugin_concurrency
+        self._executor: Final = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="notify-delivery"
+        )
+        self._lock: Final = threading.Lock()
+        self._waiting: dict[NotificationPluginNameStr, deque[_Task]] = {}
+        self._running: dict[NotificationPluginNameStr, int] = {}
+        self._keys: set[str] = set()
+        self._metrics: dict[NotificationPluginNameStr, PluginMetrics] = {}
+        self._last_report = time.time()
+        self._shut_down = False
+
+    def resume(self) -> int:
+        """Submit the notifications which are left in the queue directory"""
+        notifications = load_queued_notifications(self._queue_dir)
+        for notification in notifications:
+            self._submit_queued(notification)
+        return len(notifications)
+
+    def submit(self, plugin_name: NotificationPluginNameStr, context: NotificationContext) -> None:
+        self._submit_queued(queue_notification(self._queue_dir, plugin_name, context))
+
+    def submit_bulk(
+        self, plugin_name: NotificationPluginNameStr, bulk_dir: str, send: Callable[[], object]
+    ) -> bool:
+        """Submit sending a bulk unless the same bulk is still waiting or being sent
+
+        The bulk files are removed after sending, so the bulk directory is the queue.
+        """
+        return self._submit(plugin_name, _Task(send, bulk_dir, time.time()))
+
+    def _submit_queued(self, notification: QueuedNotification) -> None:
+        def deliver() -> None:
+            try:
+                self._deliver(notification.plugin_name, notification.context)
+            finally:
+                notification.path.unlink(missing_ok=True)
+
+        self._submit(notification.plugin_name, _Task(deliver, None, notification.queued))
+
+    def _submit(self, plugin_name: NotificationPluginNameStr, task: _Task) -> bool:
+        with self._lock:
+            if task.key is not None:
+                if task.key in self._keys:
+                    return False
+                self._keys.add(task.key)
+            self._waiting.setdefault(plugin_name, deque()).append(task)
+            self._dispatch(plugin_name)
+        return True
+
+    def _dispatch(self, plugin_name: NotificationPluginNameStr) -> None:
+        waiting = self._waiting[plugin_name]
+        limit = self._plugin_concurrency.get(plugin_name, DEFAULT_PLUGIN_CONCURRENCY)
+        while waiting and not self._shut_down and self._running.get(plugin_name, 0) < limit:
+            task = waiting.popleft()
+            self._running[plugin_name] = self._running.get(plugin_name, 0) + 1
+            self._executor.submit(self._run, plugin_name, task)
+
+    def _run(self, plugin_name: NotificationPluginNameStr, task: _Task) -> None:
+        started = time.time()
+        try:
+            task.function()
+        except Exception:
+            logger.exception("ERROR delivering via %s:", plugin_name)
+        finished = time.time()
+
+        with self._lock:
+            self._running[plugin_name] -= 1
+            if task.key is not None:
+                self._keys.discard(task.key)
+
+            metrics = self._metrics.setdefault(plugin_name, PluginMetrics())
+            metrics.delivered += 1
+            metrics.wait_time += started - task.queued
+            metrics.max_wait_time = max(metrics.max_wait_time, started - task.queued)
+            metrics.delivery_time += finished - started
+            metrics.max_delivery_time = max(metrics.max_delivery_time, finished - started)
+
+            self._dispatch(plugin_name)
+
+    def metrics(self) -> dict[NotificationPluginNameStr, PluginMetrics]:
+        with self._lock:
+            return self._collect_metrics()
+
+    def _collect_metrics(self) -> dict[NotificationPluginNameStr, PluginMetrics]:
+        return {
+            plugin_name: PluginMetrics(
+                waiting=len(self._waiting.get(plugin_name, ())),
+                running=self._running.get(plugin_name, 0),
+                delivered=metrics.delivered,
+                wait_time=metrics.wait_time,
+                max_wait_time=metrics.max_wait_time,
+                delivery_time=metrics.delivery_time,
+                max_delivery_time=metrics.max_delivery_time,
+            )
+            for plugin_name in self._waiting.keys() | self._metrics.keys()
+            for metrics in [self._metrics.get(plugin_name, PluginMetrics())]
+        }
+
+    def log_metrics(self) -> None:
+        """Log the metrics of all busy plug-ins, at most once per METRICS_INTERVAL"""
+        if (now := time.time()) - self._last_report < METRICS_INTERVAL:
+            return
+        self._last_report = now
+        with self._lock:
+            collected = self._collect_metrics()
+            self._metrics.clear()
+
+        for plugin_name, metrics in sorted(collected.items()):
+            if not (metrics.waiting or metrics.running or metrics.delivered):
+                continue
+            logger.info(
+                "Delivery via %s: %d waiting, %d running, %d delivered, "
+                "wait time %.2f s (max %.2f s), delivery time %.2f s (max %.2f s)",
+                plugin_name,
+                metrics.waiting,
+                metrics.running,
+                metrics.delivered,
+                metrics.wait_time / metrics.delivered if metrics.delivered else 0.0,
+                metrics.max_wait_time,
+                metrics.delivery_time / metrics.delivered if metrics.delivered else 0.0,
+                metrics.max_delivery_time,
+            )
+
+    def shutdown(self) -> None:
+        """Wait for the running deliveries
+
+        The waiting notifications stay in the queue directory for the next process.
+        """
+        with self._lock:
+            self._shut_down = True
+        self._executor.shutdown(wait=True)
+
+
+def queue_notification(
+    queue_dir: Path, plugin_name: NotificationPluginNameStr, context: NotificationContext
+) -> QueuedNotification:
+    queue_dir.mkdir(parents=True, exist_ok=True)
+    path = queue_dir / str(uuid.uuid4())
+    path_new = path.with_suffix(".new")
+    path_new.write_text(f"{NotificationViaPlugin({'plugin': plugin_name, 'context': context})!r}\n")
+    path_new.rename(path)  # We need an atomic creation!
+    return QueuedNotification(path, plugin_name, context, time.time())
+
+
+def load_queued_notifications(queue_dir: Path) -> list[QueuedNotification]:
+    """Load the queued notifications, the oldest first"""
+    notifications: list[QueuedNotification] = []
+    if not queue_dir.exists():
+        return notifications
+
+    for path in queue_dir.iterdir():
+        if path.suffix == ".new":
+            path.unlink(missing_ok=True)
+            continue
+
+        try:
+            queued = path.stat().st_mtime
+            data = store.load_object_from_file(path, default=None)
+            notifications.append(
+                QueuedNotification(
+                    path, data["plugin"], NotificationContext(data["context"]), queued
+                )
+            )
+        except Exception as e:
+            logger.info("Deleting corrupted or empty queue file %s: %s", path, e)
+            path.unlink(missing_ok=True)
+
+    return sorted(notifications, key=lambda n: n.queued)
@@ -122,19 +122,36 @@ class RowTableLivestatus(RowTable):
         return rows, len(data)
 
 
-def debug_livestatus(query: Query) -> None:
-    if all(
+def _show_livestatus_debug_output() -> bool:
+    return all(
         (
             active_config.debug_livestatus_queries,
             request.accept_mimetypes.accept_html,
             display_options.enabled(display_options.W),
         )
-    ):
+    )
+
+
+def debug_livestatus(query: Query) -> None:
+    if _show_livestatus_debug_output():
         html.open_div(class_=["livestatus", "message"])
         html.tt(str(query).replace("\n", "<br>\n"))
         html.close_div()
 
 
+def debug_livestatus_site_latencies() -> None:
+    """Show which sites took how long to answer the last query"""
+    if _show_livestatus_debug_output() and (latencies := sites.live().site_latencies()):
+        html.open_div(class_=["livestatus", "message"])
+        html.tt(
+            ", ".join(
+                f"{site_id}: {latency * 1000:.1f} ms"
+                for site_id, latency in sorted(latencies.items(), key=lambda i: -i[1])
+            )
+        )
+        html.close_div()
+
+
 def query_row(
     query: Query, only_sites: OnlySites, limit: int | None, auth_domain: str
 ) -> LivestatusRow:
@@ -158,6 +175,7 @@ def query_livestatus(
     sites.live().set_auth_domain(auth_domain)
     with sites.only_sites(only_sites), sites.prepend_site(), sites.set_limit(limit):
         data = sites.live().query(query)
+        debug_livestatus_site_latencies()
 
     sites.live().set_auth_domain("read")
 
@@ -4,31 +4,20 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 from collections.abc import Callable, Iterator, Sequence
-from statistics import fmean
+
+from cmk.graphing_engine import ConsolidationFunction, resample, TimeRange
+from cmk.graphing_engine import TimeSeries as EngineTimeSeries
 
 
 def rrd_timestamps(*, start: int, end: int, step: int) -> list[int]:
     return [] if step == 0 else [t + step for t in range(start, end, step)]
 
 
-def _aggregation_functions(series: Sequence[float | None], aggr: str | None) -> float | None:
-    """Aggregate data in series list according to aggr
-
-    If series has None values they are dropped before aggregation"""
-    cleaned_series = [x for x in series if x is not None]
-    if not cleaned_series:
-        return None
-
-    aggr = "max" if aggr is None else aggr.lower()
-    match aggr:
-        case "average":
-            return fmean(cleaned_series)
-        case "max":
-            return max(cleaned_series)
-        case "min":
-            return min(cleaned_series)
-        case _:
-            raise ValueError(f"Invalid Aggregation function {aggr}, only max, min, average allowed")
+def _consolidation_function(cf: str | None) -> ConsolidationFunction:
+    try:
+        return ConsolidationFunction("max" if cf is None else cf.lower())
+    except ValueError:
+        raise ValueError(f"Invalid Aggregation function {cf}, only max, min, average allowed")
 
 
 class TimeSeries:
@@ -66,13 +55,9 @@ class TimeSeries:
 
     def forward_fill_resample(self, *, start: int, end: int, step: int) -> Sequence[float | None]:
         """Upsample by forward filling values"""
-        if start == self.start and end == self.end and step == self.step:
-            return self.values
-        idx_max = len(self.values) - 1
-        return [
-            self.values[max(0, min(int((t - self.start) / self.step), idx_max))]
-            for t in range(start, end, step)
-        ]
+        return self._resample(
+            start=start, end=end, step=step, consolidation_function=ConsolidationFunction.MAX
+        )
 
     def downsample(
         self, *, start: int, end: int, step: int, cf: str | None = "max"
@@ -81,26 +66,25 @@ class TimeSeries:
         cf : str ('max', 'average', 'min')
              consolidation function imitating RRD methods
         """
+        return self._resample(
+            start=start, end=end, step=step, consolidation_function=_consolidation_function(cf)
+        )
+
+    def _resample(
+        self, *, start: int, end: int, step: int, consolidation_function: ConsolidationFunction
+    ) -> Sequence[float | None]:
+        # The engine forward fills for a smaller step and downsamples otherwise, which is
+        # how _align_and_resample_rrds() chooses between the two methods as well.
         if start == self.start and end == self.end and step == self.step:
             return self.values
-
-        dwsa = []
-        co: list[float | None] = []
-        desired_times = rrd_timestamps(start=start, end=end, step=step)
-        i = 0
-        for t, val in self.time_data_pairs():
-            if t > desired_times[i]:
-                dwsa.append(_aggregation_functions(co, cf))
-                co = []
-                i += 1
-            co.append(val)
-
-        diff_len = len(desired_times) - len(dwsa)
-        if diff_len > 0:
-            dwsa.append(_aggregation_functions(co, cf))
-            dwsa += [None] * (diff_len - 1)
-
-        return dwsa
+        return resample(
+            EngineTimeSeries(
+                time_range=TimeRange(start=self.start, end=self.end, step=self.step),
+                values=self.values,
+            ),
+            TimeRange(start=start, end=end, step=step),
+            consolidation_function,
+        ).values
 
     def time_data_pairs(self) -> list[tuple[int, float | None]]:
         return list(
@@ -21,12 +21,14 @@ from cmk.gui.watolib.rulespecs import RulespecGroupRegistry, RulespecRegistry
 
 from . import _rulespec
 from ._cleanup import ConfigVariableInventoryCleanup, InventoryCleanup
+from ._history import InventoryHistoryComputation
 from ._icon import InventoryHistoryIcon, InventoryIcon
 from ._openapi import register as openapi_register
 from ._rulespec import RulespecGroupInventory
 from ._tree import (
     get_history,
     get_raw_status_data_via_livestatus,
+    HistoryDeltaTrees,
     InventoryPath,
     load_delta_tree,
     load_latest_delta_tree,
@@ -44,6 +46,7 @@ from ._webapi import page_host_inv_api
 from .filters import FilterHasInv, FilterInvHasSoftwarePackage
 
 __all__ = [
+    "HistoryDeltaTrees",
     "InventoryPath",
     "RulespecGroupInventory",
     "TreeSource",
@@ -81,6 +84,13 @@ def register(
             interval=timedelta(hours=24),
         )
     )
+    cron_job_registry.register(
+        CronJob[Config](
+            name="execute_inventory_history_computation_job",
+            callable=InventoryHistoryComputation(cmk.utils.paths.omd_root),
+            interval=timedelta(hours=1),
+        )
+    )
     visual_info_registry.register(VisualInfoInventoryHistory)
     filter_registry.register(FilterHasInv())
     filter_registry.register(FilterInvHasSoftwarePackage())
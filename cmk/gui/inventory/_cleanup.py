@@ -296,6 +296,7 @@ class _FilePathsOfHost:
     status_data_tree: TreePath
     archive_file_paths: Sequence[Path]
     delta_cache_file_paths: Sequence[Path]
+    history_index: Path
 
 
 def _collect_files_from_directory(directory: Path) -> Sequence[Path]:
@@ -368,6 +369,7 @@ def _compute_classified_file_paths(
             delta_cache_file_paths=_collect_files_from_directory(
                 inventory_paths.delta_cache_host(h)
             ),
+            history_index=inventory_paths.history_index(h),
         )
         for h in host_names
     }
@@ -423,12 +425,13 @@ def _compute_classified_file_paths(
             for host_name, folders_and_files in abandoned_folders_and_files_by_host.items()
         ],
         # Construct remaining inventory or status data tree files of unknown hosts
-        # (without archive or delta cache files)
+        # (without archive or delta cache files) and the history indexes of unknown hosts
         abandoned_files=[
             _File(path=file_path, timestamp=timestamp)
             for file_path in (
                 set(inventory_paths.inventory_dir.glob("[!.]*"))
                 .union(inventory_paths.status_data_dir.glob("*"))
+                .union(inventory_paths.history_index_dir.glob("*"))
                 .difference(
                     fp
                     for fps in file_paths_by_host.values()
@@ -439,6 +442,7 @@ def _compute_classified_file_paths(
                         fps.inventory_tree_gz.legacy,
                         fps.status_data_tree.path,
                         fps.status_data_tree.legacy,
+                        fps.history_index,
                     ]
                 )
                 .difference(f.path for fs in abandoned_tree_files_by_host.values() for f in fs)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from pathlib import Path
+
+from cmk.ccc.hostaddress import HostName
+from cmk.gui.config import Config
+from cmk.gui.log import logger
+from cmk.inventory.paths import Paths as InventoryPaths
+from cmk.inventory.structured_data import compute_history_entries
+
+
+def _collect_host_names(archive_dir: Path) -> Sequence[HostName]:
+    try:
+        directories = [d for d in archive_dir.iterdir() if d.is_dir()]
+    except FileNotFoundError:
+        return []
+
+    host_names = []
+    for directory in directories:
+        try:
+            host_names.append(HostName(directory.name))
+        except ValueError:
+            logger.warning("Skip inventory archive of invalid host name %r", directory.name)
+    return host_names
+
+
+class InventoryHistoryComputation:
+    """Compute the delta trees of the inventory history in advance
+
+    Opening the inventory history of a host then only needs to load the cached entries.
+    """
+
+    def __init__(self, omd_root: Path) -> None:
+        super().__init__()
+        self.omd_root = omd_root
+
+    def __call__(self, config: Config) -> None:
+        compute_history_entries(
+            self.omd_root,
+            _collect_host_names(InventoryPaths(self.omd_root).archive_dir),
+            # Leave some room for the monitoring core and the helpers
+            max_workers=max(1, (os.cpu_count() or 1) // 2),
+        )
@@ -28,15 +28,17 @@ from cmk.gui.i18n import _
 from cmk.gui.logged_in import user
 from cmk.gui.watolib.groups_io import NothingOrChoices, PermittedPath
 from cmk.inventory.structured_data import (
+    filter_delta_tree,
     filter_tree,
     HistoryArchivePath,
     HistoryDeltaPath,
-    HistoryEntry,
+    HistoryIndexEntry,
     HistoryStore,
     ImmutableDeltaTree,
     ImmutableTree,
     InventoryStore,
     load_history,
+    load_history_index,
     merge_trees,
     parse_from_raw_status_data_tree,
     parse_visible_raw_path,
@@ -351,22 +353,67 @@ def load_delta_tree(
     )
 
 
+class HistoryDeltaTrees:
+    """Look up the delta trees of the history of a host by their timestamps
+
+    Unlike 'load_delta_tree', the history paths are only collected once, so looking up
+    the delta trees of all history entries of a host does not collect them again and again.
+    """
+
+    def __init__(self, history_store: HistoryStore, hostname: HostName) -> None:
+        self._history_store = history_store
+        self._hostname = hostname
+        self._paths: dict[int, HistoryDeltaPath | HistoryArchivePath] | None = None
+
+    def _get_paths(self) -> dict[int, HistoryDeltaPath | HistoryArchivePath]:
+        if self._paths is None:
+            self._paths = (
+                {}  # just for security reasons
+                if "/" in self._hostname
+                else {
+                    r.ok.current_timestamp: r.ok
+                    for r in self._history_store.collect_history_paths(host_name=self._hostname)
+                    if r.is_ok()
+                }
+            )
+        return self._paths
+
+    def lookup(self, timestamp: int) -> ImmutableDeltaTree:
+        """Empty if there is no (readable) history entry at the time of 'timestamp'"""
+        if (path := self._get_paths().get(timestamp)) is None:
+            return ImmutableDeltaTree()
+        entry_result = self._history_store.load_history_entry(host_name=self._hostname, path=path)
+        if entry_result.is_error():
+            # Corrupted files are reported when the history is loaded, see 'get_history'.
+            return ImmutableDeltaTree()
+        if isinstance(permitted_paths := _get_permitted_inventory_paths(), list):
+            return filter_delta_tree(
+                entry_result.ok.delta_tree,
+                _make_filter_choices_from_permitted_paths(permitted_paths),
+            )
+        return entry_result.ok.delta_tree
+
+
 def get_history(
     history_store: HistoryStore, hostname: HostName
-) -> tuple[Sequence[HistoryEntry], Sequence[str]]:
+) -> tuple[Sequence[HistoryIndexEntry], Sequence[str]]:
+    """Load the history entries without their delta trees, see 'load_delta_tree'"""
     if "/" in hostname:
         return [], []  # just for security reasons
 
+    if not isinstance(permitted_paths := _get_permitted_inventory_paths(), list):
+        history_index = load_history_index(history_store, hostname)
+        return history_index.entries, _sort_corrupted_history_files(
+            history_store.inv_paths.archive_dir, history_index.corrupted
+        )
+
+    # The indexed statistics include the paths the user is not permitted to see.
     history = load_history(
         history_store,
         hostname,
         history_paths_filter=lambda paths: paths,
-        delta_tree_filters=(
-            _make_filter_choices_from_permitted_paths(permitted_paths)
-            if isinstance(permitted_paths := _get_permitted_inventory_paths(), list)
-            else None
-        ),
+        delta_tree_filters=_make_filter_choices_from_permitted_paths(permitted_paths),
     )
-    return history.entries, _sort_corrupted_history_files(
-        history_store.inv_paths.archive_dir, history.corrupted
+    return [HistoryIndexEntry.from_history_entry(e) for e in history.entries], (
+        _sort_corrupted_history_files(history_store.inv_paths.archive_dir, history.corrupted)
     )
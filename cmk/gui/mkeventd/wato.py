@@ -280,6 +280,10 @@ def register(
     config_var_registry.register(ConfigVariableEventConsoleServiceLevels)
     config_var_registry.register(ConfigVariableEventConsoleSqliteHousekeepingInterval)
     config_var_registry.register(ConfigVariableEventConsoleSqliteFreelistSize)
+    config_var_registry.register(ConfigVariableEventConsoleSqliteJournalMode)
+    config_var_registry.register(ConfigVariableEventConsoleSqliteSynchronous)
+    config_var_registry.register(ConfigVariableEventConsoleSqliteWriteBatchSize)
+    config_var_registry.register(ConfigVariableEventConsoleSqliteWriteBatchInterval)
 
     rulespec_group_registry.register(RulespecGroupEventConsole)
     rulespec_registry.register(ECEventLimitRulespec)
@@ -4248,6 +4252,78 @@ ConfigVariableEventConsoleSqliteFreelistSize = ConfigVariable(
     ),
 )
 
+ConfigVariableEventConsoleSqliteJournalMode = ConfigVariable(
+    group=ConfigVariableGroupEventConsoleGeneric,
+    primary_domain=ConfigDomainEventConsole,
+    ident="sqlite_journal_mode",
+    valuespec=lambda context: DropdownChoice(
+        title=_("Event Console history journal mode"),
+        help=_(
+            "The write-ahead log (WAL) allows the Event Console to read its history while new "
+            "entries are written. Only use the rollback journal if the history is located on a "
+            "file system that does not support the write-ahead log, like some network file systems."
+        ),
+        choices=[
+            ("wal", _("Write-ahead log")),
+            ("delete", _("Rollback journal")),
+        ],
+    ),
+)
+
+ConfigVariableEventConsoleSqliteSynchronous = ConfigVariable(
+    group=ConfigVariableGroupEventConsoleGeneric,
+    primary_domain=ConfigDomainEventConsole,
+    ident="sqlite_synchronous",
+    valuespec=lambda context: DropdownChoice(
+        title=_("Event Console history synchronization"),
+        help=_(
+            "Controls how often the Event Console history is synchronized to the disk. "
+            "With <i>normal</i> synchronization and the write-ahead log, the latest entries "
+            "may be lost on a power failure, but the history is never corrupted. <i>Full</i> "
+            "synchronization makes every write durable at the expense of throughput. "
+            "<i>Off</i> is the fastest, but the history may get corrupted on a power failure."
+        ),
+        choices=[
+            ("off", _("Off")),
+            ("normal", _("Normal")),
+            ("full", _("Full")),
+        ],
+    ),
+)
+
+ConfigVariableEventConsoleSqliteWriteBatchSize = ConfigVariable(
+    group=ConfigVariableGroupEventConsoleGeneric,
+    primary_domain=ConfigDomainEventConsole,
+    ident="sqlite_write_batch_size",
+    valuespec=lambda context: Integer(
+        title=_("Event Console history write batch size"),
+        help=_(
+            "New entries of the Event Console history are collected in memory and written "
+            "in a single transaction once this number of entries is reached, or when the "
+            "write batch interval has passed. Set this to 1 to write every entry immediately."
+        ),
+        unit=_("entries"),
+        minvalue=1,
+        maxvalue=100000,
+    ),
+)
+
+ConfigVariableEventConsoleSqliteWriteBatchInterval = ConfigVariable(
+    group=ConfigVariableGroupEventConsoleGeneric,
+    primary_domain=ConfigDomainEventConsole,
+    ident="sqlite_write_batch_interval",
+    valuespec=lambda context: Age(
+        title=_("Event Console history write batch interval"),
+        help=_(
+            "The maximum time new entries of the Event Console history are kept in memory "
+            "before they are written. Pending entries are always written before the history "
+            "is queried and when the Event Console is stopped."
+        ),
+        minvalue=1,
+        maxvalue=60,
+    ),
+)
+
 ConfigVariableEventConsoleStatisticsInterval = ConfigVariable(
     group=ConfigVariableGroupEventConsoleGeneric,
     primary_domain=ConfigDomainEventConsole,
@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Awaitable, Collection, Iterable, Iterator, Mapping
+from collections.abc import Awaitable, Collection, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from itertools import chain
 from typing import override
@@ -94,6 +94,14 @@ class IndexBuilder:
     def key_match_texts(cls, prefix: str) -> str:
         return cls.add_to_prefix(prefix, "match_texts")
 
+    @classmethod
+    def key_trigrams(cls, prefix: str) -> str:
+        return cls.add_to_prefix(prefix, "trigrams")
+
+    @classmethod
+    def key_trigram(cls, prefix: str, trigram: str) -> str:
+        return cls.add_to_prefix(cls.add_to_prefix(prefix, "trigram"), trigram)
+
     def _build_index(
         self,
         match_item_generators: Iterable[ABCMatchItemGenerator],
@@ -132,20 +140,19 @@ class IndexBuilder:
 
         localize(current_language)
 
-    @classmethod
     def _add_language_independent_item_generators_to_redis(
-        cls,
+        self,
         match_item_generators: Iterable[ABCMatchItemGenerator],
         redis_pipeline: redis.client.Pipeline,
         user_permissions: UserPermissions,
     ) -> None:
-        key_categories_li = cls.key_categories(cls.PREFIX_LOCALIZATION_INDEPENDENT)
+        key_categories_li = self.key_categories(self.PREFIX_LOCALIZATION_INDEPENDENT)
         for match_item_generator in match_item_generators:
-            cls._add_match_item_generator_to_redis(
+            self._add_match_item_generator_to_redis(
                 match_item_generator,
                 redis_pipeline,
                 key_categories_li,
-                cls.PREFIX_LOCALIZATION_INDEPENDENT,
+                self.PREFIX_LOCALIZATION_INDEPENDENT,
                 user_permissions,
             )
 
@@ -170,9 +177,8 @@ class IndexBuilder:
                     user_permissions,
                 )
 
-    @classmethod
     def _add_match_item_generator_to_redis(
-        cls,
+        self,
         match_item_generator: ABCMatchItemGenerator,
         redis_pipeline: redis.client.Pipeline,
         category_key: str,
@@ -183,34 +189,45 @@ class IndexBuilder:
             category_key,
             match_item_generator.name,
         )
-        cls._add_match_items_to_redis(
+        self._add_match_items_to_redis(
             match_item_generator,
             redis_pipeline,
             prefix,
             user_permissions,
         )
 
-    @classmethod
     def _add_match_items_to_redis(
-        cls,
+        self,
         match_item_generator: ABCMatchItemGenerator,
         redis_pipeline: redis.client.Pipeline,
         redis_prefix: str,
         user_permissions: UserPermissions,
     ) -> None:
-        prefix = cls.add_to_prefix(redis_prefix, match_item_generator.name)
-        key_match_texts = cls.key_match_texts(prefix)
-        redis_pipeline.delete(key_match_texts)
+        """Add the match items of a category and its trigram index
+
+        For each trigram of the match texts, the index holds the set of the numbers of the match
+        items containing it. Another set lists the trigrams of the category, so the index can be
+        removed when the category is rebuilt.
+        """
+        prefix = self.add_to_prefix(redis_prefix, match_item_generator.name)
+        key_match_texts = self.key_match_texts(prefix)
+        key_trigrams = self.key_trigrams(prefix)
+        previous_trigrams = self._redis_client.smembers(key_trigrams)
+        assert not isinstance(previous_trigrams, Awaitable)
+        redis_pipeline.delete(
+            key_match_texts,
+            key_trigrams,
+            *(self.key_trigram(prefix, trigram) for trigram in previous_trigrams),
+        )
+        # The last match item with the same text wins
+        idx_by_match_text: dict[str, int] = {}
         for idx, match_item in enumerate(
             match_item_generator.generate_match_items(user_permissions)
         ):
+            match_text = " ".join(match_item.match_texts)
+            idx_by_match_text[match_text] = idx
             redis_pipeline.hset(
-                key_match_texts,
-                key=" ".join(match_item.match_texts),
-                value=str(idx),
-            )
-            redis_pipeline.hset(
-                cls.add_to_prefix(prefix, idx),
+                self.add_to_prefix(prefix, idx),
                 mapping={
                     "title": match_item.title,
                     "topic": match_item.topic,
@@ -218,9 +235,22 @@ class IndexBuilder:
                     "loading_transition": match_item.loading_transition.value
                     if match_item.loading_transition
                     else "",
+                    "match_text": match_text,
                 },
             )
 
+        if idx_by_match_text:
+            redis_pipeline.hset(key_match_texts, mapping=idx_by_match_text)
+
+        indices_by_trigram: defaultdict[str, list[int]] = defaultdict(list)
+        for match_text, idx in idx_by_match_text.items():
+            for trigram in _trigrams(match_text):
+                indices_by_trigram[trigram].append(idx)
+        for trigram, indices in indices_by_trigram.items():
+            redis_pipeline.sadd(self.key_trigram(prefix, trigram), *indices)
+        if indices_by_trigram:
+            redis_pipeline.sadd(key_trigrams, *indices_by_trigram)
+
     def _mark_index_as_built(self) -> None:
         self._redis_client.set(
             self._KEY_INDEX_BUILT,
@@ -379,9 +409,11 @@ class IndexSearcher:
             raise IndexNotFoundException
 
         query_preprocessed = f"*{query.lower().replace(' ', '*')}*"
+        fragments = _query_fragments(query)
 
         results_localization_independent = self._search_redis_categories(
             query=query_preprocessed,
+            fragments=fragments,
             key_categories=IndexBuilder.key_categories(
                 IndexBuilder.PREFIX_LOCALIZATION_INDEPENDENT
             ),
@@ -390,6 +422,7 @@ class IndexSearcher:
         )
         results_localization_dependent = self._search_redis_categories(
             query=query_preprocessed,
+            fragments=fragments,
             key_categories=IndexBuilder.key_categories(IndexBuilder.PREFIX_LOCALIZATION_DEPENDENT),
             key_prefix_match_items=IndexBuilder.add_to_prefix(
                 IndexBuilder.PREFIX_LOCALIZATION_DEPENDENT,
@@ -431,6 +464,7 @@ class IndexSearcher:
         self,
         *,
         query: str,
+        fragments: Sequence[str] | None,
         key_categories: str,
         key_prefix_match_items: str,
         allowed_categories: frozenset[str] | None = None,
@@ -450,15 +484,7 @@ class IndexSearcher:
             )
             visibility_check = self._permissions_handler.get_visibility_check(category)
 
-            for _matched_text, idx_matched_item in self._redis_client.hscan_iter(
-                IndexBuilder.key_match_texts(prefix_category),
-                match=query,
-            ):
-                match_item_dict = self._redis_client.hgetall(
-                    IndexBuilder.add_to_prefix(prefix_category, idx_matched_item)
-                )
-                assert not isinstance(match_item_dict, Awaitable)
-
+            for match_item_dict in self._find_match_items(prefix_category, query, fragments):
                 # We translate the topics of our search results. For localization-dependent search
                 # results, such as rulesets, they are already localized anyway. However, for
                 # localization-independent results, such as hosts, they are not. For example,
@@ -483,6 +509,54 @@ class IndexSearcher:
                 )
         return results
 
+    def _find_match_items(
+        self, prefix_category: str, query: str, fragments: Sequence[str] | None
+    ) -> Iterator[dict[str, str]]:
+        """The match items of a category matching the query
+
+        The candidates are the match items containing all trigrams of the query. If the query has
+        no trigrams or the category has no trigram index yet, e.g. because it has been built by a
+        previous version, the match texts of the category are scanned instead.
+        """
+        trigrams = {trigram for fragment in fragments or () for trigram in _trigrams(fragment)}
+        if (
+            fragments is None
+            or not trigrams
+            or not self._redis_client.exists(IndexBuilder.key_trigrams(prefix_category))
+        ):
+            yield from self._get_match_items(
+                prefix_category,
+                (
+                    idx
+                    for _matched_text, idx in self._redis_client.hscan_iter(
+                        IndexBuilder.key_match_texts(prefix_category),
+                        match=query,
+                    )
+                ),
+            )
+            return
+
+        candidates = self._redis_client.sinter(
+            [IndexBuilder.key_trigram(prefix_category, trigram) for trigram in trigrams]
+        )
+        assert not isinstance(candidates, Awaitable)
+        yield from (
+            match_item_dict
+            for match_item_dict in self._get_match_items(
+                prefix_category, sorted(candidates, key=int)
+            )
+            if _matches_fragments(match_item_dict.get("match_text", ""), fragments)
+        )
+
+    def _get_match_items(
+        self, prefix_category: str, indices: Iterable[str]
+    ) -> list[dict[str, str]]:
+        with self._redis_client.pipeline(transaction=False) as pipeline:
+            for idx in indices:
+                pipeline.hgetall(IndexBuilder.add_to_prefix(prefix_category, idx))
+            match_items: list[dict[str, str]] = pipeline.execute()
+        return match_items
+
     @staticmethod
     def _sort_search_results(
         results: Mapping[str, Iterable[_SearchResultWithVisibilityCheck]],
@@ -531,6 +605,48 @@ class IndexSearcher:
                     yield result.category, topic, result.result
 
 
+def _trigrams(text: str) -> set[str]:
+    """The trigrams of the words of a text
+
+    >>> sorted(_trigrams("host abcd"))
+    ['abc', 'bcd', 'hos', 'ost']
+    """
+    return {word[i : i + 3] for word in text.split(" ") for i in range(len(word) - 2)}
+
+
+def _query_fragments(query: SearchQuery) -> list[str] | None:
+    """The parts of a query which have to appear in a match text in this order
+
+    None if the query contains other glob characters than "*", such queries are only matched
+    by Redis.
+
+    >>> _query_fragments("CPU load*level")
+    ['cpu', 'load', 'level']
+    >>> _query_fragments("host?") is None
+    True
+    """
+    query = query.lower()
+    if any(char in query for char in "?[]\\"):
+        return None
+    return [fragment for fragment in query.replace(" ", "*").split("*") if fragment]
+
+
+def _matches_fragments(match_text: str, fragments: Sequence[str]) -> bool:
+    """Same as matching the glob pattern *fragment1*fragment2*...*
+
+    >>> _matches_fragments("cpu utilization", ["cpu", "util"])
+    True
+    >>> _matches_fragments("cpu utilization", ["util", "cpu"])
+    False
+    """
+    position = 0
+    for fragment in fragments:
+        if (position := match_text.find(fragment, position)) == -1:
+            return False
+        position += len(fragment)
+    return True
+
+
 @dataclass(frozen=True)
 class _SearchResultWithVisibilityCheck:
     result: SearchResult
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Consolidated copy of the attribute files in the profile directories of the users
+
+Loading all users reads about a dozen small files from the profile directory of each user.
+With thousands of users, e.g. synchronized from LDAP, that is more than 100,000 files. The
+profile index holds the contents of these files of all users in a single file.
+
+The entry of a user is valid as long as the profile directory of the user has the same
+inode and modification time. The attribute files are replaced by renaming, created or
+removed, each of which updates the directory. Only users with a changed directory are read
+from their files again. Directories changed very recently are not put into the index, a
+following change within the resolution of the file system clock would go unnoticed.
+
+The files in the profile directories stay the primary store. The index is only a cache, it
+can be removed at any time and is rebuilt from them.
+"""
+
+import marshal
+import os
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+from cmk.ccc import store
+from cmk.ccc.user import UserId
+from cmk.gui.utils.roles import AutomationUserFile
+from cmk.utils.local_secrets import AutomationUserSecret
+
+_MAGIC = b"CMK-PROFILE-INDEX\0"
+_VERSION = 1
+
+# Directories changed within this time may change again without a new modification time
+_RACY_NS = 2 * 10**9
+
+_AUTOMATION_SECRET_FILE = "automation.secret"
+_AUTOMATION_USER_FILE = "automation_user.mk"
+
+
+class ProfileAttributes(NamedTuple):
+    """The raw contents of the attribute files of a user"""
+
+    # inode and modification time of the profile directory
+    directory: tuple[int, int]
+    attributes: Mapping[str, str]
+    has_automation_secret: bool
+    is_automation_user: bool
+
+
+type _Index = dict[str, ProfileAttributes]
+
+# The index last read or written by this process with the stat of its file and its keys
+_cached_indices: dict[Path, tuple[tuple[int, int, int], list[str], _Index]] = {}
+
+
+def profile_index_path(profile_dir: Path) -> Path:
+    return profile_dir.with_name(f"{profile_dir.name}.index")
+
+
+def load_profile_attributes(
+    profile_dir: Path, user_ids: Iterable[UserId], keys: Sequence[str]
+) -> dict[UserId, ProfileAttributes]:
+    """The attribute files named by the keys of all users having a profile directory
+
+    Attribute files which do not exist are missing from the attributes.
+    """
+    path = profile_index_path(profile_dir)
+    index = _read_index(path, keys)
+    now_ns = time.time_ns()
+    changed = False
+    result: dict[UserId, ProfileAttributes] = {}
+    for user_id in user_ids:
+        try:
+            stat = (profile_dir / user_id).stat()
+        except FileNotFoundError:
+            continue
+        directory = (stat.st_ino, stat.st_mtime_ns)
+        if (profile := index.get(user_id)) is None or profile.directory != directory:
+            # The directory is checked before reading, a change while reading is noticed later
+            profile = _read_profile(profile_dir, user_id, keys, directory)
+            if now_ns - stat.st_mtime_ns > _RACY_NS:
+                index[user_id] = profile
+                changed = True
+            elif index.pop(user_id, None) is not None:
+                changed = True
+        result[user_id] = profile
+
+    for removed in set(index) - set(result):
+        del index[removed]
+        changed = True
+    if changed:
+        _write_index(path, keys, index)
+    return result
+
+
+def _read_profile(
+    profile_dir: Path, user_id: UserId, keys: Sequence[str], directory: tuple[int, int]
+) -> ProfileAttributes:
+    try:
+        file_names = set(os.listdir(profile_dir / user_id))
+    except (NotADirectoryError, FileNotFoundError):
+        file_names = set()
+
+    attributes = {}
+    for key in keys:
+        if f"{key}.mk" not in file_names:
+            continue
+        try:
+            with open(profile_dir / user_id / f"{key}.mk") as file_object:
+                attributes[key] = file_object.read()
+        except OSError:
+            continue
+
+    return ProfileAttributes(
+        directory=directory,
+        attributes=attributes,
+        has_automation_secret=(
+            _AUTOMATION_SECRET_FILE in file_names
+            and AutomationUserSecret(user_id, profile_dir).exists()
+        ),
+        is_automation_user=(
+            _AUTOMATION_USER_FILE in file_names and AutomationUserFile(user_id, profile_dir).load()
+        ),
+    )
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _read_index(path: Path, keys: Sequence[str]) -> _Index:
+    if (stat_key := _stat_key(path)) is None:
+        return {}
+    if (cached := _cached_indices.get(path)) is not None and cached[0] == stat_key:
+        return dict(cached[2]) if cached[1] == list(keys) else {}
+
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    if raw[: len(_MAGIC) + 1] != _MAGIC + bytes([_VERSION]):
+        return {}
+    try:
+        # The index is only written by us, see _write_index()
+        index_keys, profiles = marshal.loads(raw[len(_MAGIC) + 1 :])  # nosec B302
+    except (EOFError, ValueError, TypeError):
+        return {}
+    if index_keys != list(keys):
+        return {}  # written by a version loading other attributes
+
+    index = {
+        user_id: ProfileAttributes(
+            directory=(directory[0], directory[1]),
+            attributes=attributes,
+            has_automation_secret=has_automation_secret,
+            is_automation_user=is_automation_user,
+        )
+        for user_id, (
+            directory,
+            attributes,
+            has_automation_secret,
+            is_automation_user,
+        ) in profiles.items()
+    }
+    _cached_indices[path] = (stat_key, index_keys, index)
+    return dict(index)
+
+
+def _write_index(path: Path, keys: Sequence[str], index: _Index) -> None:
+    raw = marshal.dumps(
+        (
+            list(keys),
+            {
+                # marshal only takes plain strings
+                str(user_id): (
+                    profile.directory,
+                    dict(profile.attributes),
+                    profile.has_automation_secret,
+                    profile.is_automation_user,
+                )
+                for user_id, profile in index.items()
+            },
+        )
+    )
+    try:
+        store.save_bytes_to_file(path, _MAGIC + bytes([_VERSION]) + raw)
+    except OSError:
+        return  # the index is only a cache, the users have been loaded anyway
+    if (stat_key := _stat_key(path)) is not None:
+        _cached_indices[path] = (stat_key, list(keys), dict(index))
@@ -57,6 +57,7 @@ from cmk.utils.paths import htpasswd_file, var_dir
 
 from ._connections import active_connections, get_connection, get_connection_uncached
 from ._connector import UserConnector
+from ._profile_index import load_profile_attributes
 from ._user_attribute import UserAttribute
 from ._user_spec import add_internal_attributes, new_user_template
 
@@ -221,27 +222,22 @@ def _load_users(lock: bool = False) -> Users:
         ("last_login", ast.literal_eval),
     ]
 
-    # Now read the user specific files
-    for user_dir in os.listdir(cmk.utils.paths.profile_dir):
-        if user_dir[0] == ".":
-            continue
-
-        uid = UserId(user_dir)
-        if uid not in result:
-            continue
-
+    # Now read the user specific files, most of them from the consolidated profile index
+    for uid, profile in load_profile_attributes(
+        cmk.utils.paths.profile_dir, list(result), [attr for attr, _conv_func in attributes]
+    ).items():
         # read special values from own files
         for attr, conv_func in attributes:
-            val = load_custom_attr(user_id=uid, key=attr, parser=conv_func)
-            if val is not None:
-                result[uid][attr] = val
+            # Same as load_custom_attr()
+            if (raw := profile.attributes.get(attr)) is not None and raw != "":
+                result[uid][attr] = conv_func(raw.strip())
 
-        result[uid]["store_automation_secret"] = AutomationUserSecret(uid).exists()
+        result[uid]["store_automation_secret"] = profile.has_automation_secret
         # The AutomationUserFile was added with 2.4. Previously the info to decide if a user is an
         # automation user was the automation secret. Instead of creating an update action let's
         # check both.
         result[uid]["is_automation_user"] = (
-            AutomationUserSecret(uid).exists() or AutomationUserFile(uid).load()
+            profile.has_automation_secret or profile.is_automation_user
         )
 
     return result
@@ -167,10 +167,10 @@ class RowTableInventoryHistory(ABCRowTable):
                     % ", ".join(sorted(corrupted_history_files)),
                 )
             )
+        # The delta trees are loaded by the painter, i.e. only for the rows which are shown.
         for history_entry in history:
             yield {
                 "invhist_time": history_entry.current_timestamp,
-                "invhist_delta": history_entry.delta_tree,
                 "invhist_removed": history_entry.removed,
                 "invhist_new": history_entry.new,
                 "invhist_changed": history_entry.changed,
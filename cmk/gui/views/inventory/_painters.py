@@ -10,6 +10,7 @@ import time
 from collections.abc import Callable, Mapping, Sequence
 from typing import TypedDict
 
+import cmk.utils.paths
 from cmk.ccc.hostaddress import HostName
 from cmk.ccc.site import SiteId
 from cmk.gui import sites
@@ -17,6 +18,7 @@ from cmk.gui.hooks import request_memoize
 from cmk.gui.htmllib.html import html
 from cmk.gui.http import request
 from cmk.gui.i18n import _
+from cmk.gui.inventory import HistoryDeltaTrees
 from cmk.gui.logged_in import LoggedInUser
 from cmk.gui.painter.v0 import Cell, Painter
 from cmk.gui.painter_options import paint_age, PainterOption, PainterOptions
@@ -27,6 +29,7 @@ from cmk.gui.utils.output_funnel import output_funnel
 from cmk.gui.valuespec import Checkbox, Dictionary, FixedValue
 from cmk.gui.view_utils import CellSpec, CSVExportError
 from cmk.inventory.structured_data import (
+    HistoryStore,
     ImmutableAttributes,
     ImmutableDeltaTree,
     ImmutableTree,
@@ -58,6 +61,12 @@ def _get_sites_with_same_named_hosts_cache() -> Mapping[HostName, Sequence[SiteI
     return cache
 
 
+@request_memoize()
+def _get_history_delta_trees(host_name: HostName) -> HistoryDeltaTrees:
+    # All rows of a host share the collected history paths.
+    return HistoryDeltaTrees(HistoryStore(cmk.utils.paths.omd_root), host_name)
+
+
 class MultipleInventoryTreesError(Exception):
     pass
 
@@ -200,7 +209,10 @@ class PainterInvhistDelta(Painter):
         except MultipleInventoryTreesError:
             return ImmutableDeltaTree()
 
-        return row.get("invhist_delta", ImmutableDeltaTree())
+        if "invhist_delta" in row:
+            return row["invhist_delta"]
+
+        return _get_history_delta_trees(row["host_name"]).lookup(row["invhist_time"])
 
     def render(self, row: Row, cell: Cell, user: LoggedInUser) -> CellSpec:
         if not (tree := self._compute_data(row, cell, user)):
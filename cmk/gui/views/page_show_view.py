@@ -305,9 +305,6 @@ def _get_view_rows(
 
         post_process_rows(view, all_active_filters, rows)
 
-    # Sorting - use view sorters and URL supplied sorters
-    _sort_data(rows, view.sorters, config)
-
     with CPUTracker(log.logger.debug) as filter_rows_tracker:
         # Apply non-Livestatus filters
         for filter_ in all_active_filters:
@@ -316,6 +313,10 @@ def _get_view_rows(
             except MKMissingDataError as e:
                 view.add_warning_message(str(e))
 
+    # Sorting - use view sorters and URL supplied sorters. Only the rows that passed
+    # the filters above need to be sorted.
+    _sort_data(rows, view.sorters, config)
+
     view.process_tracking.amount_unfiltered_rows = unfiltered_amount_of_rows
     view.process_tracking.amount_filtered_rows = len(rows)
     view.process_tracking.duration_fetch_rows = fetch_rows_tracker.duration
@@ -637,6 +638,10 @@ def _sort_data(data: Rows, sorters: list[SorterEntry], config: Config) -> None:
     if not sorters:
         return
 
+    if all(entry.sorter.key is not None for entry in sorters):
+        _sort_data_by_keys(data, sorters, config)
+        return
+
     # Handle case where join columns are not present for all rows
     def safe_compare(
         compfunc: SorterProtocol,
@@ -687,3 +692,53 @@ def _sort_data(data: Rows, sorters: list[SorterEntry], config: Config) -> None:
         return 0  # equal
 
     data.sort(key=functools.cmp_to_key(multisort))
+
+
+def _sort_data_by_keys(data: Rows, sorters: Sequence[SorterEntry], config: Config) -> None:
+    """Sort data with the key functions of the sorters
+
+    Consecutive sorters of the same direction are combined into one tuple key. As the
+    sorting is stable, sorting by these groups from the last to the first one gives the
+    same order as comparing the rows sorter by sorter. Usually all sorters have the
+    same direction and the rows are sorted in a single pass.
+    """
+    groups: list[tuple[bool, list[SorterEntry]]] = []
+    for entry in sorters:
+        descending = entry.negate != entry.sorter.key_descending
+        if groups and groups[-1][0] == descending:
+            groups[-1][1].append(entry)
+        else:
+            groups.append((descending, [entry]))
+
+    for descending, entries in reversed(groups):
+        data.sort(key=_row_key_function(entries, config), reverse=descending)
+
+
+def _row_key_function(entries: Sequence[SorterEntry], config: Config) -> Callable[[Row], Any]:
+    key_functions = [_entry_key_function(entry, config) for entry in entries]
+    if len(key_functions) == 1:
+        return key_functions[0]
+    return lambda row: tuple(key_function(row) for key_function in key_functions)
+
+
+def _entry_key_function(entry: SorterEntry, config: Config) -> Callable[[Row], Any]:
+    sort_key = entry.sorter.key
+    assert sort_key is not None
+    parameters = entry.parameters
+
+    def key(row: Row) -> Any:
+        return sort_key(row, parameters=parameters, config=config, request=request)
+
+    if (join_key := entry.join_key) is None:
+        return key
+
+    # Like safe_compare: Rows without the joined row come first, also for sorters with
+    # descending keys
+    missing = entry.sorter.key_descending
+
+    def join_column_key(row: Row) -> Any:
+        if (joined_row := row["JOIN"].get(join_key)) is None:
+            return missing, None
+        return not missing, key(joined_row)
+
+    return join_column_key
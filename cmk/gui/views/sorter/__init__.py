@@ -4,7 +4,7 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 
-from .base import ParameterizedSorter, Sorter, SorterEntry, SorterProtocol
+from .base import ParameterizedSorter, Sorter, SorterEntry, SorterKeyProtocol, SorterProtocol
 from .helpers import (
     cmp_custom_variable,
     cmp_ec_sl_simple_number,
@@ -29,6 +29,7 @@ from .sorters import register_sorters
 __all__ = [
     "Sorter",
     "SorterProtocol",
+    "SorterKeyProtocol",
     "ParameterizedSorter",
     "SorterEntry",
     "SorterRegistry",
@@ -42,6 +42,22 @@ class SorterProtocol(Protocol):
         """
 
 
+class SorterKeyProtocol(Protocol):
+    def __call__(
+        self,
+        row: Row,
+        *,
+        parameters: Mapping[str, Any] | None,
+        config: Config,
+        request: Request,
+    ) -> Any:
+        """The function key computes a sort key of a data row. It is called
+        once per row and sorting then compares the keys instead of calling
+        cmp for each pair of rows. The keys of a sorter must order the rows
+        exactly like its cmp function does.
+        """
+
+
 class SorterEntry(NamedTuple):
     sorter: Sorter
     negate: bool
@@ -50,7 +66,10 @@ class SorterEntry(NamedTuple):
 
 
 class Sorter:
-    """A sorter is used to sort the queried view rows according to a certain logic."""
+    """A sorter is used to sort the queried view rows according to a certain logic.
+
+    Sorters that provide a key function allow sorting the rows without pairwise
+    comparisons. If key_descending is set, larger keys sort first."""
 
     def __init__(
         self,
@@ -59,12 +78,17 @@ class Sorter:
         columns: Sequence[ColumnName],
         sort_function: SorterProtocol,
         load_inv: bool = False,
+        *,
+        key_function: SorterKeyProtocol | None = None,
+        key_descending: bool = False,
     ):
         self.ident = ident
         self._title = title
         self.columns = columns
         self.cmp = sort_function
         self.load_inv = load_inv
+        self.key = key_function
+        self.key_descending = key_descending
 
     @property
     def title(self) -> str:
@@ -80,6 +104,8 @@ class ParameterizedSorter(Sorter):
         sort_function: SorterProtocol,
         parameter_valuespec: Callable[[Config, Sequence[ColumnSpec]], Dictionary],
         load_inv: bool = False,
+        *,
+        key_function: SorterKeyProtocol | None = None,
     ):
-        super().__init__(ident, title, columns, sort_function, load_inv)
+        super().__init__(ident, title, columns, sort_function, load_inv, key_function=key_function)
         self.vs_parameters = parameter_valuespec
@@ -6,10 +6,11 @@
 # mypy: disable-error-code="no-any-return"
 # mypy: disable-error-code="type-arg"
 
-from typing import Literal
+from typing import Any, Literal
 
 from cmk.gui.num_split import cmp_num_split as _cmp_num_split
-from cmk.gui.type_defs import ColumnName, Row, SorterFunction
+from cmk.gui.num_split import num_split
+from cmk.gui.type_defs import ColumnName, Row, SorterFunction, SorterKeyFunction
 
 
 def cmp_simple_number(column: ColumnName, r1: Row, r2: Row) -> int:
@@ -18,28 +19,42 @@ def cmp_simple_number(column: ColumnName, r1: Row, r2: Row) -> int:
     return (v1 > v2) - (v1 < v2)
 
 
+def key_simple_number(column: ColumnName, row: Row) -> Any:
+    return row[column]
+
+
 def cmp_ec_sl_simple_number(column: ColumnName, r1: Row, r2: Row) -> int:
-    host_or_svc = column.split("_")[0]
+    v1 = key_ec_sl_simple_number(column, r1)
+    v2 = key_ec_sl_simple_number(column, r2)
+    return (v1 > v2) - (v1 < v2)
 
-    def _get_value(row: Row) -> str:
-        try:
-            index = row[column].index("EC_SL")
-        except ValueError:
-            return ""
-        return row[f"{host_or_svc}_custom_variable_values"][index]
 
-    return (_get_value(r1) > _get_value(r2)) - (_get_value(r1) < _get_value(r2))
+def key_ec_sl_simple_number(column: ColumnName, row: Row) -> str:
+    host_or_svc = column.split("_")[0]
+    try:
+        index = row[column].index("EC_SL")
+    except ValueError:
+        return ""
+    return row[f"{host_or_svc}_custom_variable_values"][index]
 
 
 def cmp_num_split(column: ColumnName, r1: Row, r2: Row) -> int:
     return _cmp_num_split(r1[column].lower(), r2[column].lower())
 
 
+def key_num_split(column: ColumnName, row: Row) -> tuple[int | str, ...]:
+    return num_split(row[column].lower())
+
+
 def cmp_simple_string(column: ColumnName, r1: Row, r2: Row) -> int:
     v1, v2 = r1.get(column, ""), r2.get(column, "")
     return cmp_insensitive_string(v1, v2)
 
 
+def key_simple_string(column: ColumnName, row: Row) -> tuple[str, str]:
+    return key_insensitive_string(row.get(column, ""))
+
+
 def cmp_insensitive_string(v1: str, v2: str) -> int:
     c = (v1.lower() > v2.lower()) - (v1.lower() < v2.lower())
     # force a strict order in case of equal spelling but different
@@ -49,12 +64,20 @@ def cmp_insensitive_string(v1: str, v2: str) -> int:
     return c
 
 
+def key_insensitive_string(v: str) -> tuple[str, str]:
+    return v.lower(), v
+
+
 def cmp_string_list(column: ColumnName, r1: Row, r2: Row) -> int:
     v1 = "".join(r1.get(column, []))
     v2 = "".join(r2.get(column, []))
     return cmp_insensitive_string(v1, v2)
 
 
+def key_string_list(column: ColumnName, row: Row) -> tuple[str, str]:
+    return key_insensitive_string("".join(row.get(column, [])))
+
+
 def cmp_custom_variable(r1: Row, r2: Row, key: str, cmp_func: SorterFunction) -> int:
     return (_get_custom_var(r1, key) > _get_custom_var(r2, key)) - (
         _get_custom_var(r1, key) < _get_custom_var(r2, key)
@@ -65,23 +88,40 @@ def cmp_ip_address(column: ColumnName, r1: Row, r2: Row) -> int:
     return compare_ips(r1.get(column, ""), r2.get(column, ""))
 
 
+def key_ip_address(column: ColumnName, row: Row) -> tuple:
+    return ip_sort_key(row.get(column, ""))
+
+
 def compare_ips(ip1: str, ip2: str, ipv: Literal["ipv4", "ipv6"] = "ipv4") -> int:
-    def split_ip(ip: str) -> tuple:
-        if ipv == "ipv4":
-            try:
-                return tuple(int(part) for part in ip.split("."))
-            except ValueError:
-                # Make hostnames comparable with IPv4 address representations
-                return (255, 255, 255, 255, ip)
-
-        # ipv == "ipv6"
-        if not ip:
-            return ("ffff",) * 8
-        return tuple(part for part in ip.split(":"))
-
-    v1, v2 = split_ip(ip1), split_ip(ip2)
+    v1, v2 = ip_sort_key(ip1, ipv), ip_sort_key(ip2, ipv)
     return (v1 > v2) - (v1 < v2)
 
 
+def ip_sort_key(ip: str, ipv: Literal["ipv4", "ipv6"] = "ipv4") -> tuple:
+    if ipv == "ipv4":
+        try:
+            return tuple(int(part) for part in ip.split("."))
+        except ValueError:
+            # Make hostnames comparable with IPv4 address representations
+            return (255, 255, 255, 255, ip)
+
+    # ipv == "ipv6"
+    if not ip:
+        return ("ffff",) * 8
+    return tuple(part for part in ip.split(":"))
+
+
+# Key functions of the cmp functions above. Sorters declared with one of these cmp
+# functions get the matching key function, see declare_simple_sorter().
+SORT_KEY_FUNCTIONS: dict[SorterFunction, SorterKeyFunction] = {
+    cmp_simple_number: key_simple_number,
+    cmp_ec_sl_simple_number: key_ec_sl_simple_number,
+    cmp_num_split: key_num_split,
+    cmp_simple_string: key_simple_string,
+    cmp_string_list: key_string_list,
+    cmp_ip_address: key_ip_address,
+}
+
+
 def _get_custom_var(row: Row, key: str) -> str:
     return row["custom_variables"].get(key, "")
@@ -29,6 +29,7 @@ def host_tag_config_based_sorters(hashable_tag_groups: HashableTagGroups) -> dic
             columns=["host_tags"],
             load_inv=False,
             sort_function=partial(_cmp_host_tag, tag_group=tag_group),
+            key_function=partial(_key_host_tag, tag_group=tag_group),
         )
         for tag_group in hashable_tag_groups.tag_groups
     }
@@ -48,6 +49,17 @@ def _cmp_host_tag(
     return (host_tag_1 > host_tag_2) - (host_tag_1 < host_tag_2)
 
 
+def _key_host_tag(
+    row: Row,
+    *,
+    parameters: Mapping[str, object] | None,
+    config: Config,
+    request: Request,
+    tag_group: TagGroup,
+) -> str:
+    return _get_tag_group_value(row, "host", tag_group)
+
+
 def _get_tag_group_value(row: Row, what: str, tag_group: TagGroup) -> str:
     tag_id = get_tag_groups(row, what).get(tag_group.id)
     if label := tag_choices_for_group(tag_group).get(tag_id):
@@ -15,10 +15,11 @@ from cmk.gui.painter.v0.helpers import RenderLink
 from cmk.gui.painter.v0.host_tag_painters import HashableTagGroups
 from cmk.gui.painter_options import PainterOptions
 from cmk.gui.theme.current_theme import theme
-from cmk.gui.type_defs import ColumnName, PainterName, SorterFunction
+from cmk.gui.type_defs import ColumnName, PainterName, SorterFunction, SorterKeyFunction
 from cmk.gui.utils.roles import UserPermissions
 
-from .base import Sorter
+from .base import Sorter, SorterKeyProtocol
+from .helpers import SORT_KEY_FUNCTIONS
 from .host_tag_sorters import host_tag_config_based_sorters
 
 
@@ -49,19 +50,38 @@ def register_sorter(ident: str, spec: dict[str, Any]) -> None:
     )
 
 
-def declare_simple_sorter(name: str, title: str, column: ColumnName, func: SorterFunction) -> None:
+def _column_key_function(
+    column: ColumnName, func: SorterFunction, key: SorterKeyFunction | None
+) -> SorterKeyProtocol | None:
+    if (key := key or SORT_KEY_FUNCTIONS.get(func)) is None:
+        return None
+    return lambda row, **_kwargs: key(column, row)
+
+
+def declare_simple_sorter(
+    name: str,
+    title: str,
+    column: ColumnName,
+    func: SorterFunction,
+    key: SorterKeyFunction | None = None,
+) -> None:
     sorter_registry.register(
         Sorter(
             ident=name,
             title=title,
             columns=[column],
             sort_function=lambda r1, r2, **_kwargs: func(column, r1, r2),
+            key_function=_column_key_function(column, func, key),
         )
     )
 
 
 def declare_1to1_sorter(
-    painter_name: PainterName, func: SorterFunction, col_num: int = 0, reverse: bool = False
+    painter_name: PainterName,
+    func: SorterFunction,
+    col_num: int = 0,
+    reverse: bool = False,
+    key: SorterKeyFunction | None = None,
 ) -> PainterName:
     painter = painter_registry[painter_name](
         config=active_config,
@@ -82,6 +102,8 @@ def declare_1to1_sorter(
                 if reverse
                 else lambda r1, r2, **_kwargs: func(painter.columns[col_num], r1, r2)
             ),
+            key_function=_column_key_function(painter.columns[col_num], func, key),
+            key_descending=reverse,
         )
     )
 
@@ -30,6 +30,9 @@ from .helpers import (
     cmp_simple_string,
     cmp_string_list,
     compare_ips,
+    ip_sort_key,
+    key_insensitive_string,
+    key_num_split,
 )
 from .registry import declare_1to1_sorter, declare_simple_sorter, SorterRegistry
 
@@ -61,7 +64,13 @@ def register_sorters(registry: SorterRegistry) -> None:
     registry.register(SorterNumProblems)
     registry.register(SorterHostDockerNode)
 
-    declare_simple_sorter("svcdescr", _("Service name"), "service_description", cmp_service_name)
+    declare_simple_sorter(
+        "svcdescr",
+        _("Service name"),
+        "service_description",
+        cmp_service_name,
+        key=key_service_name,
+    )
     declare_simple_sorter(
         "svcdispname",
         _("Service alternative display name"),
@@ -148,7 +157,7 @@ def register_sorters(registry: SorterRegistry) -> None:
     declare_1to1_sorter("host_group_memberlist", cmp_string_list)
     declare_1to1_sorter("host_contacts", cmp_string_list)
     declare_1to1_sorter("host_contact_groups", cmp_string_list)
-    declare_1to1_sorter("host_docker_node", cmp_docker_nodes)
+    declare_1to1_sorter("host_docker_node", cmp_docker_nodes, key=key_docker_nodes)
 
     # Host group
     declare_1to1_sorter("hg_num_services", cmp_simple_number)
@@ -221,9 +230,9 @@ def register_sorters(registry: SorterRegistry) -> None:
     declare_1to1_sorter("log_time", cmp_simple_number)
     declare_1to1_sorter("log_lineno", cmp_simple_number)
 
-    declare_1to1_sorter("log_what", cmp_log_what)
+    declare_1to1_sorter("log_what", cmp_log_what, key=key_log_what)
 
-    declare_1to1_sorter("log_date", cmp_date)
+    declare_1to1_sorter("log_date", cmp_date, key=key_date)
 
     # Alert statistics
     declare_simple_sorter(
@@ -288,11 +297,22 @@ def _sort_service_state(
     return (cmp_state_equiv(r1) > cmp_state_equiv(r2)) - (cmp_state_equiv(r1) < cmp_state_equiv(r2))
 
 
+def _key_service_state(
+    row: Row,
+    *,
+    parameters: Mapping[str, Any] | None,
+    config: Config,
+    request: Request,
+) -> int:
+    return cmp_state_equiv(row)
+
+
 SorterSvcstate = Sorter(
     ident="svcstate",
     title=_l("Service state"),
     columns=["service_state", "service_has_been_checked"],
     sort_function=_sort_service_state,
+    key_function=_key_service_state,
 )
 
 
@@ -309,11 +329,22 @@ def _sort_host_state(
     )
 
 
+def _key_host_state(
+    row: Row,
+    *,
+    parameters: Mapping[str, Any] | None,
+    config: Config,
+    request: Request,
+) -> int:
+    return cmp_host_state_equiv(row)
+
+
 SorterHoststate = Sorter(
     ident="hoststate",
     title=_l("Host state"),
     columns=["host_state", "host_has_been_checked"],
     sort_function=_sort_host_state,
+    key_function=_key_host_state,
 )
 
 
@@ -330,11 +361,22 @@ def _sort_site_host(
     )
 
 
+def _key_site_host(
+    row: Row,
+    *,
+    parameters: Mapping[str, Any] | None,
+    config: Config,
+    request: Request,
+) -> tuple[str, tuple[int | str, ...]]:
+    return row["site"], key_num_split("host_name", row)
+
+
 SorterSiteHost = Sorter(
     ident="site_host",
     title=_l("Host site and name"),
     columns=["site", "host_name"],
     sort_function=_sort_site_host,
+    key_function=_key_site_host,
 )
 
 
@@ -349,11 +391,22 @@ def _sort_host_name(
     return cmp_num_split("host_name", r1, r2)
 
 
+def _key_host_name(
+    row: Row,
+    *,
+    parameters: Mapping[str, Any] | None,
+    config: Config,
+    request: Request,
+) -> tuple[int | str, ...]:
+    return key_num_split("host_name", row)
+
+
 SorterHostName = Sorter(
     ident="host_name",
     title=_l("Host name"),
     columns=["host_name"],
     sort_function=_sort_host_name,
+    key_function=_key_host_name,
 )
 
 
@@ -370,11 +423,22 @@ def _sort_site_alias(
     )
 
 
+def _key_site_alias(
+    row: Row,
+    *,
+    parameters: Mapping[str, Any] | None,
+    config: Config,
+    request: Request,
+) -> str:
+    return config.sites[row["site"]]["alias"]
+
+
 SorterSitealias = Sorter(
     ident="sitealias",
     title=_l("Site Alias"),
     columns=["site"],
     sort_function=_sort_site_alias,
+    key_function=_key_site_alias,
 )
 
 
@@ -392,11 +456,23 @@ def _sort_tags(
     return (tag_groups_1 > tag_groups_2) - (tag_groups_1 < tag_groups_2)
 
 
+def _key_tags(
+    row: Row,
+    *,
+    parameters: Mapping[str, Any] | None,
+    config: Config,
+    request: Request,
+    object_type: str,
+) -> list[tuple[str, str]]:
+    return sorted(get_tag_groups(row, object_type).items())
+
+
 SorterHostTags = Sorter(
     ident="host",
     title=_l("Host Tags"),
     columns=["host_tags"],
     sort_function=partial(_sort_tags, object_type="host"),
+    key_function=partial(_key_tags, object_type="host"),
 )
 
 SorterServiceTags = Sorter(
@@ -404,6 +480,7 @@ SorterServiceTags = Sorter(
     title=_l("Service tags"),
     columns=["service_tags"],
     sort_function=partial(_sort_tags, object_type="service"),
+    key_function=partial(_key_tags, object_type="service"),
 )
 
 
@@ -421,11 +498,23 @@ def _sort_labels(
     return (labels_1 > labels_2) - (labels_1 < labels_2)
 
 
+def _key_labels(
+    row: Row,
+    *,
+    parameters: Mapping[str, Any] | None,
+    config: Config,
+    request: Request,
+    object_type: str,
+) -> list[tuple[str, str]]:
+    return sorted(get_labels(row, object_type).items())
+
+
 SorterHostLabels = Sorter(
     ident="host_labels",
     title=_l("Host labels"),
     columns=["host_labels"],
     sort_function=partial(_sort_labels, object_type="host"),
+    key_function=partial(_key_labels, object_type="host"),
 )
 
 
@@ -434,6 +523,7 @@ SorterServiceLabels = Sorter(
     title=_l("Service labels"),
     columns=["service_labels"],
     sort_function=partial(_sort_labels, object_type="service"),
+    key_function=partial(_key_labels, object_type="service"),
 )
 
 
@@ -443,6 +533,10 @@ def cmp_service_name(column: str, r1: Row, r2: Row) -> int:
     ) or cmp_num_split(column, r1, r2)
 
 
+def key_service_name(column: str, row: Row) -> tuple[int, tuple[int | str, ...]]:
+    return cmp_service_name_equiv(row[column]), key_num_split(column, row)
+
+
 def _sort_service_perf_val(
     r1: Row,
     r2: Row,
@@ -457,11 +551,23 @@ def _sort_service_perf_val(
     return (v1 > v2) - (v1 < v2)
 
 
+def _key_service_perf_val(
+    row: Row,
+    *,
+    parameters: Mapping[str, Any] | None,
+    config: Config,
+    request: Request,
+    num: int,
+) -> float:
+    return savefloat(get_perfdata_nth_value(row, num - 1, True))
+
+
 SorterSvcPerfVal01 = Sorter(
     ident="svc_perf_val01",
     title=_("Service performance data - value number 01"),
     columns=["service_perf_data"],
     sort_function=partial(_sort_service_perf_val, num=1),
+    key_function=partial(_key_service_perf_val, num=1),
 )
 
 SorterSvcPerfVal02 = Sorter(
@@ -469,6 +575,7 @@ SorterSvcPerfVal02 = Sorter(
     title=_("Service metrics - value number 02"),
     columns=["service_perf_data"],
     sort_function=partial(_sort_service_perf_val, num=2),
+    key_function=partial(_key_service_perf_val, num=2),
 )
 
 SorterSvcPerfVal03 = Sorter(
@@ -476,6 +583,7 @@ SorterSvcPerfVal03 = Sorter(
     title=_("Service performance data - value number 03"),
     columns=["service_perf_data"],
     sort_function=partial(_sort_service_perf_val, num=3),
+    key_function=partial(_key_service_perf_val, num=3),
 )
 
 
@@ -484,6 +592,7 @@ SorterSvcPerfVal04 = Sorter(
     title=_("Service performance data - value number 04"),
     columns=["service_perf_data"],
     sort_function=partial(_sort_service_perf_val, num=4),
+    key_function=partial(_key_service_perf_val, num=4),
 )
 
 SorterSvcPerfVal05 = Sorter(
@@ -491,6 +600,7 @@ SorterSvcPerfVal05 = Sorter(
     title=_("Service performance data - value number 05"),
     columns=["service_perf_data"],
     sort_function=partial(_sort_service_perf_val, num=5),
+    key_function=partial(_key_service_perf_val, num=5),
 )
 
 
@@ -499,6 +609,7 @@ SorterSvcPerfVal06 = Sorter(
     title=_("Service performance data - value number 06"),
     columns=["service_perf_data"],
     sort_function=partial(_sort_service_perf_val, num=6),
+    key_function=partial(_key_service_perf_val, num=6),
 )
 
 SorterSvcPerfVal07 = Sorter(
@@ -506,6 +617,7 @@ SorterSvcPerfVal07 = Sorter(
     title=_("Service performance data - value number 07"),
     columns=["service_perf_data"],
     sort_function=partial(_sort_service_perf_val, num=7),
+    key_function=partial(_key_service_perf_val, num=7),
 )
 
 SorterSvcPerfVal08 = Sorter(
@@ -513,6 +625,7 @@ SorterSvcPerfVal08 = Sorter(
     title=_("Service performance data - value number 08"),
     columns=["service_perf_data"],
     sort_function=partial(_sort_service_perf_val, num=8),
+    key_function=partial(_key_service_perf_val, num=8),
 )
 
 SorterSvcPerfVal09 = Sorter(
@@ -520,6 +633,7 @@ SorterSvcPerfVal09 = Sorter(
     title=_("Service performance data - value number 09"),
     columns=["service_perf_data"],
     sort_function=partial(_sort_service_perf_val, num=9),
+    key_function=partial(_key_service_perf_val, num=9),
 )
 
 SorterSvcPerfVal10 = Sorter(
@@ -527,6 +641,7 @@ SorterSvcPerfVal10 = Sorter(
     title=_("Service metrics - value number 10"),
     columns=["service_perf_data"],
     sort_function=partial(_sort_service_perf_val, num=10),
+    key_function=partial(_key_service_perf_val, num=10),
 )
 
 
@@ -540,15 +655,28 @@ def _sort_host_custom_variable(
 ) -> int:
     assert parameters is not None
     variable_name = parameters["ident"].upper()
+    return cmp_insensitive_string(
+        _get_host_custom_variable(r1, variable_name), _get_host_custom_variable(r2, variable_name)
+    )
 
-    def _get_value(row: Row) -> str:
-        try:
-            index = row["host_custom_variable_names"].index(variable_name)
-        except ValueError:
-            return ""
-        return row["host_custom_variable_values"][index]
 
-    return cmp_insensitive_string(_get_value(r1), _get_value(r2))
+def _key_host_custom_variable(
+    row: Row,
+    *,
+    parameters: Mapping[str, Any] | None,
+    config: Config,
+    request: Request,
+) -> tuple[str, str]:
+    assert parameters is not None
+    return key_insensitive_string(_get_host_custom_variable(row, parameters["ident"].upper()))
+
+
+def _get_host_custom_variable(row: Row, variable_name: str) -> str:
+    try:
+        index = row["host_custom_variable_names"].index(variable_name)
+    except ValueError:
+        return ""
+    return row["host_custom_variable_values"][index]
 
 
 def _sort_host_custom_variable_parameter_valuespec(
@@ -578,6 +706,7 @@ SorterCustomHostVariable = ParameterizedSorter(
     title=_l("Host custom attribute"),
     columns=["host_custom_variable_names", "host_custom_variable_values"],
     sort_function=_sort_host_custom_variable,
+    key_function=_key_host_custom_variable,
     parameter_valuespec=_sort_host_custom_variable_parameter_valuespec,
 )
 
@@ -591,25 +720,36 @@ def _sort_host_ip_addresses(
     config: Config,
     request: Request,
 ) -> int:
-    def get_address(row: Row, ipv: Literal["ipv4", "ipv6"]) -> str:
-        custom_vars = dict(
-            zip(row["host_custom_variable_names"], row["host_custom_variable_values"])
-        )
-        if ipv == "ipv4":
-            return custom_vars.get("ADDRESS_4", "")
-        return custom_vars.get("ADDRESS_6", "")
-
     for ipv in ip_versions:
-        if (result := compare_ips(get_address(r1, ipv), get_address(r2, ipv), ipv)) != 0:
+        if (result := compare_ips(_get_address(r1, ipv), _get_address(r2, ipv), ipv)) != 0:
             return result
     return 0
 
 
+def _key_host_ip_addresses(
+    ip_versions: Sequence[Literal["ipv4", "ipv6"]],
+    row: Row,
+    *,
+    parameters: Mapping[str, Any] | None,
+    config: Config,
+    request: Request,
+) -> tuple[tuple[int | str, ...], ...]:
+    return tuple(ip_sort_key(_get_address(row, ipv), ipv) for ipv in ip_versions)
+
+
+def _get_address(row: Row, ipv: Literal["ipv4", "ipv6"]) -> str:
+    custom_vars = dict(zip(row["host_custom_variable_names"], row["host_custom_variable_values"]))
+    if ipv == "ipv4":
+        return custom_vars.get("ADDRESS_4", "")
+    return custom_vars.get("ADDRESS_6", "")
+
+
 SorterHostIpv4Address = Sorter(
     ident="host_ipv4_address",
     title=_l("Host IPv4 address"),
     columns=["host_custom_variable_names", "host_custom_variable_values"],
     sort_function=partial(_sort_host_ip_addresses, ["ipv4"]),
+    key_function=partial(_key_host_ip_addresses, ["ipv4"]),
 )
 
 
@@ -618,6 +758,7 @@ SorterHostIpv6Address = Sorter(
     title=_l("Host IPv6 address"),
     columns=["host_custom_variable_names", "host_custom_variable_values"],
     sort_function=partial(_sort_host_ip_addresses, ["ipv6"]),
+    key_function=partial(_key_host_ip_addresses, ["ipv6"]),
 )
 
 
@@ -626,6 +767,7 @@ SorterHostIpAddresses = Sorter(
     title=_l("Host addresses (IPv4/IPv6)"),
     columns=["host_custom_variable_names", "host_custom_variable_values"],
     sort_function=partial(_sort_host_ip_addresses, ["ipv4", "ipv6"]),
+    key_function=partial(_key_host_ip_addresses, ["ipv4", "ipv6"]),
 )
 
 
@@ -646,11 +788,22 @@ def _sort_num_problems(
     )
 
 
+def _key_num_problems(
+    row: Row,
+    *,
+    parameters: Mapping[str, Any] | None,
+    config: Config,
+    request: Request,
+) -> int:
+    return row["host_num_services"] - row["host_num_services_ok"] - row["host_num_services_pending"]
+
+
 SorterNumProblems = Sorter(
     ident="num_problems",
     title=_l("Number of problems"),
     columns=["host_num_services", "host_num_services_ok", "host_num_services_pending"],
     sort_function=_sort_num_problems,
+    key_function=_key_num_problems,
 )
 
 
@@ -658,6 +811,10 @@ def cmp_log_what(col: str, a: Row, b: Row) -> int:
     return (log_what(a[col]) > log_what(b[col])) - (log_what(a[col]) < log_what(b[col]))
 
 
+def key_log_what(col: str, row: Row) -> int:
+    return log_what(row[col])
+
+
 def log_what(t: str) -> int:
     if "HOST" in t:
         return 1
@@ -681,6 +838,12 @@ def cmp_date(column: str, r1: Row, r2: Row) -> int:
     return (r2_date > r1_date) - (r2_date < r1_date)
 
 
+def key_date(column: str, row: Row) -> tuple[int, int]:
+    # Like cmp_date, the latest day comes first
+    start, end = get_day_start_timestamp(row[column])
+    return -start, -end
+
+
 def _get_docker_nodes(row: Row) -> str:
     if row.get("host_labels", {}).get("cmk/docker_object") != "container":
         return ""
@@ -699,6 +862,10 @@ def cmp_docker_nodes(column: str, r1: Row, r2: Row) -> int:
     return _sort_docker_nodes_(r1, r2, parameters=None, config=None, request=None)
 
 
+def key_docker_nodes(column: str, row: Row) -> tuple[str, str]:
+    return key_insensitive_string(_get_docker_nodes(row=row))
+
+
 def _sort_docker_nodes_(
     r1: Row,
     r2: Row,
@@ -717,4 +884,5 @@ SorterHostDockerNode = Sorter(
     title=_l("Node name"),
     columns=["host_labels", "host_label_sources"],
     sort_function=_sort_docker_nodes_,
+    key_function=lambda row, **_kwargs: key_docker_nodes("host_labels", row),
 )
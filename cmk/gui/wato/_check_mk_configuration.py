@@ -223,8 +223,11 @@ def register(
     config_variable_registry.register(ConfigVariableDelayPrecompile)
     config_variable_registry.register(ConfigVariableClusterMaxCachefileAge)
     config_variable_registry.register(ConfigVariablePiggybackMaxCachefileAge)
+    config_variable_registry.register(ConfigVariableCheckMaxConcurrentFetches)
     config_variable_registry.register(ConfigVariableCheckMKPerfdataWithTimes)
     config_variable_registry.register(ConfigVariableUseDNSCache)
+    config_variable_registry.register(ConfigVariableDNSCacheUpdateWorkers)
+    config_variable_registry.register(ConfigVariableDNSCacheUpdateTimeout)
     config_variable_registry.register(ConfigVariableChooseSNMPBackend)
     config_variable_registry.register(ConfigVariableSNMPwalkDownloadTimeout)
     config_variable_registry.register(ConfigVariableHTTPProxies)
@@ -3086,6 +3089,26 @@ ConfigVariablePiggybackMaxCachefileAge = ConfigVariable(
     ),
 )
 
+ConfigVariableCheckMaxConcurrentFetches = ConfigVariable(
+    group=ConfigVariableGroupCheckExecution,
+    primary_domain=ConfigDomainCore,
+    ident="check_max_concurrent_fetches",
+    valuespec=lambda context: Integer(
+        title=_("Maximum number of concurrently fetched data sources"),
+        help=_(
+            "The number of data sources (Checkmk agent, SNMP, special agents, piggyback "
+            "data, ...) of a single host that the Checkmk service may fetch at the same "
+            "time. With the default of 1 the data sources are fetched one after another, "
+            "so the execution time of the Checkmk service is the sum of the times needed "
+            "for all data sources. Increasing this value lets the service only wait for the "
+            "slowest data source. The reported CPU times of the individual data sources may "
+            "overlap in that case."
+        ),
+        minvalue=1,
+        maxvalue=16,
+    ),
+)
+
 ConfigVariableCheckMKPerfdataWithTimes = ConfigVariable(
     group=ConfigVariableGroupCheckExecution,
     primary_domain=ConfigDomainCore,
@@ -3122,15 +3145,48 @@ ConfigVariableUseDNSCache = ConfigVariable(
     ),
 )
 
+ConfigVariableDNSCacheUpdateWorkers = ConfigVariable(
+    group=ConfigVariableGroupCheckExecution,
+    primary_domain=ConfigDomainCore,
+    ident="dns_cache_update_workers",
+    valuespec=lambda context: Integer(
+        title=_("Concurrent lookups when updating the DNS cache"),
+        help=_(
+            "The number of IP address lookups that are done at the same time when the DNS "
+            "lookup cache is updated for all hosts. With a value of 1 the hosts are looked up "
+            "one after another."
+        ),
+        minvalue=1,
+        maxvalue=256,
+    ),
+)
+
+ConfigVariableDNSCacheUpdateTimeout = ConfigVariable(
+    group=ConfigVariableGroupCheckExecution,
+    primary_domain=ConfigDomainCore,
+    ident="dns_cache_update_timeout",
+    valuespec=lambda context: Float(
+        title=_("Timeout of a lookup when updating the DNS cache"),
+        help=_(
+            "When the DNS lookup cache is updated with concurrent lookups, a lookup that did "
+            "not return after this time is considered as failed."
+        ),
+        minvalue=0.1,
+        unit=_("sec"),
+    ),
+)
+
 
 def _transform_snmp_backend_from_valuespec(
     backend: SNMPBackendEnum,
-) -> Literal["classic", "inline"]:
+) -> Literal["classic", "inline", "builtin"]:
     match backend:
         case SNMPBackendEnum.CLASSIC:
             return "classic"
         case SNMPBackendEnum.INLINE:
             return "inline"
+        case SNMPBackendEnum.BUILTIN:
+            return "builtin"
         case _:
             raise MKConfigError("SNMPBackendEnum %r not implemented" % backend)
 
@@ -3145,9 +3201,10 @@ ConfigVariableChooseSNMPBackend = ConfigVariable(
             choices=[
                 (SNMPBackendEnum.CLASSIC, _("Use Classic SNMP Backend")),
                 (SNMPBackendEnum.INLINE, _("Use Inline SNMP Backend")),
+                (SNMPBackendEnum.BUILTIN, _("Use Built-in SNMP Backend")),
             ],
             help=_(
-                "By default Checkmk uses command line calls of Net-SNMP tools like snmpget or snmpwalk to gather SNMP information. For each request a new command line program is being executed. It is now possible to use the inline SNMP implementation which calls the respective libraries directly via its Python bindings. This should increase the performance of SNMP checks in a significant way. Both SNMP modes are features which improve the performance for large installations and are only available via our subscription."
+                "By default Checkmk uses command line calls of Net-SNMP tools like snmpget or snmpwalk to gather SNMP information. For each request a new command line program is being executed. It is now possible to use the inline SNMP implementation which calls the respective libraries directly via its Python bindings. This should increase the performance of SNMP checks in a significant way. Both SNMP modes are features which improve the performance for large installations and are only available via our subscription. The built-in SNMP backend sends the requests itself via one persistent connection per device, without starting Net-SNMP tools. It supports SNMP versions 1 and 2c, hosts using SNMPv3 are queried by the classic backend."
             ),
         ),
         to_valuespec=_transform_snmp_backend_hosts_to_valuespec,
@@ -5601,6 +5658,8 @@ def _transform_snmp_backend_hosts_to_valuespec(backend: object) -> SNMPBackendEn
         # We dropped pysnmp during the 2.1 beta because it is currently slow
         # and unreliable.
         return SNMPBackendEnum.CLASSIC
+    if backend == "builtin":
+        return SNMPBackendEnum.BUILTIN
     raise MKConfigError("SNMPBackendEnum %r not implemented" % backend)
 
 
@@ -5611,6 +5670,7 @@ def _valuespec_snmp_backend() -> Transform:
             choices=[
                 (SNMPBackendEnum.INLINE, _("Use Inline SNMP backend")),
                 (SNMPBackendEnum.CLASSIC, _("Use Classic backend")),
+                (SNMPBackendEnum.BUILTIN, _("Use Built-in backend")),
             ],
         ),
         to_valuespec=_transform_snmp_backend_hosts_to_valuespec,
@@ -14,6 +14,9 @@ from cmk.gui.valuespec import (
     DropdownChoice,
     EmailAddress,
     Integer,
+    ListOf,
+    Transform,
+    Tuple,
     ValueSpec,
 )
 from cmk.gui.watolib.config_domain_name import (
@@ -26,6 +29,7 @@ from cmk.gui.watolib.config_variable_groups import ConfigVariableGroupNotificati
 from cmk.gui.watolib.notification_parameter import (
     notification_parameter_registry,
 )
+from cmk.gui.watolib.user_scripts import user_script_choices
 from cmk.rulesets.v1.rule_specs import NotificationParameters
 
 
@@ -35,6 +39,8 @@ def register(config_variable_registry: ConfigVariableRegistry) -> None:
     config_variable_registry.register(ConfigVariableNotificationBacklog)
     config_variable_registry.register(ConfigVariableNotificationBulkInterval)
     config_variable_registry.register(ConfigVariableNotificationPluginTimeout)
+    config_variable_registry.register(ConfigVariableNotificationDeliveryWorkers)
+    config_variable_registry.register(ConfigVariableNotificationPluginConcurrency)
     config_variable_registry.register(ConfigVariableNotificationLogging)
     config_variable_registry.register(ConfigVariableFailedNotificationHorizon)
 
@@ -133,6 +139,57 @@ ConfigVariableNotificationPluginTimeout = ConfigVariable(
     ),
 )
 
+ConfigVariableNotificationDeliveryWorkers = ConfigVariable(
+    group=ConfigVariableGroupNotifications,
+    primary_domain=ConfigDomainCore,
+    ident="notification_delivery_workers",
+    valuespec=lambda context: Integer(
+        title=_("Concurrent notification deliveries"),
+        help=_(
+            "The notifications are delivered by this number of parallel workers, so that a "
+            "slow notification plug-in does not hold up the notifications via other plug-ins. "
+            "Notifications waiting for a worker are queued on disk and are delivered after a "
+            "restart of the core, too. Set this to 0 to call the plug-ins one after another "
+            "while processing the notifications."
+        ),
+        minvalue=0,
+        unit=_("workers"),
+    ),
+    need_restart=True,
+)
+
+ConfigVariableNotificationPluginConcurrency = ConfigVariable(
+    group=ConfigVariableGroupNotifications,
+    primary_domain=ConfigDomainCore,
+    ident="notification_plugin_concurrency",
+    valuespec=lambda context: Transform(
+        valuespec=ListOf(
+            valuespec=Tuple(
+                elements=[
+                    DropdownChoice(
+                        title=_("Notification method"),
+                        choices=user_script_choices("notifications"),
+                    ),
+                    Integer(title=_("Maximum concurrent deliveries"), minvalue=1),
+                ],
+                orientation="horizontal",
+            ),
+            title=_("Concurrent deliveries per notification method"),
+            help=_(
+                "Without a limit configured here the notifications of a notification method "
+                "are delivered one after another, in the order in which they have been created. "
+                "With a higher limit, e.g. for a ticket system that handles parallel requests, "
+                "later notifications may be delivered before earlier ones."
+            ),
+            add_label=_("Add limit"),
+            movable=False,
+        ),
+        to_valuespec=lambda d: sorted(d.items()),
+        from_valuespec=dict,
+    ),
+    need_restart=True,
+)
+
 
 def _valuespec_notification_logging(context: GlobalSettingsContext) -> DropdownChoice:
     return DropdownChoice(
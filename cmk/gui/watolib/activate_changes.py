@@ -17,12 +17,12 @@ from __future__ import annotations
 import ast
 import functools
 import hashlib
-import io
 import logging
 import os
 import re
 import shutil
 import subprocess
+import tempfile
 import time
 import traceback
 from collections import Counter
@@ -42,7 +42,7 @@ from html import unescape
 from itertools import filterfalse
 from multiprocessing.pool import AsyncResult, ThreadPool
 from pathlib import Path
-from typing import Any, assert_never, Final, Literal, NamedTuple, TypedDict
+from typing import Any, assert_never, BinaryIO, Final, Literal, NamedTuple, TypedDict
 from urllib.parse import urlparse
 
 from pydantic import BaseModel
@@ -793,21 +793,24 @@ def _synchronize_files(
 
     We build a simple tar archive containing all files to be synchronized.  The list of file to
     be deleted and the current config generation is handed over using dedicated HTTP parameters.
+    The archive is written to a temporary file next to the site config directory and read while
+    it is sent, so that the archives of all sites being synchronized are not held in memory.
     """
+    with tempfile.TemporaryFile(dir=site_config_dir.parent) as sync_archive:
+        _create_sync_archive(files_to_sync, site_config_dir, sync_archive)
+        sync_archive.seek(0)
 
-    sync_archive = _get_sync_archive(files_to_sync, site_config_dir)
-
-    response = cmk.gui.watolib.automations.do_remote_automation(
-        automation_config,
-        "receive-config-sync",
-        [
-            ("site_id", site_id),
-            ("to_delete", repr(files_to_delete)),
-            ("config_generation", "%d" % remote_config_generation),
-        ],
-        files={"sync_archive": io.BytesIO(sync_archive)},
-        debug=debug,
-    )
+        response = cmk.gui.watolib.automations.do_remote_automation(
+            automation_config,
+            "receive-config-sync",
+            [
+                ("site_id", site_id),
+                ("to_delete", repr(files_to_delete)),
+                ("config_generation", "%d" % remote_config_generation),
+            ],
+            files={"sync_archive": sync_archive},
+            debug=debug,
+        )
 
     if response is not True:
         raise MKGeneralException(
@@ -2435,7 +2438,8 @@ def _initialize_site_activation_state(
 def _get_config_sync_file_infos_per_inode(
     replication_paths: Sequence[ReplicationPath],
 ) -> Mapping[int, ConfigSyncFileInfo]:
-    inode_sync_states = {}
+    inode_sync_states: dict[int, ConfigSyncFileInfo] = {}
+    file_hash_cache = _ConfigSyncFileHashCache(_config_sync_file_hash_cache_path())
 
     for replication_path in replication_paths:
         replication_path_full = os.path.join(cmk.utils.paths.omd_root, replication_path.site_path)
@@ -2445,15 +2449,19 @@ def _get_config_sync_file_infos_per_inode(
 
         if replication_path.ty == ReplicationPathType.FILE:
             inode_sync_states[os.stat(replication_path_full).st_ino] = _get_config_sync_file_info(
-                replication_path_full
+                replication_path_full, file_hash_cache
             )
         elif replication_path.ty == ReplicationPathType.DIR:
             _get_replication_dir_config_sync_file_infos_per_inode(
-                inode_sync_states, replication_path_full, replication_path.is_excluded
+                inode_sync_states,
+                replication_path_full,
+                replication_path.is_excluded,
+                file_hash_cache,
             )
         else:
             raise NotImplementedError()
 
+    file_hash_cache.save()
     return inode_sync_states
 
 
@@ -2461,6 +2469,7 @@ def _get_replication_dir_config_sync_file_infos_per_inode(
     inode_sync_states: MutableMapping[int, ConfigSyncFileInfo],
     replication_path: str,
     replication_path_excluder: Callable[[str], bool],
+    file_hash_cache: _ConfigSyncFileHashCache,
 ) -> None:
     # Use os functionality instead of pathlib since it is faster
     for root, dir_names, file_names in os.walk(replication_path):
@@ -2473,7 +2482,7 @@ def _get_replication_dir_config_sync_file_infos_per_inode(
             try:
                 if os.path.islink(dir_path) and not dir_name == GENERAL_DIR_EXCLUDE:
                     inode_sync_states[os.stat(dir_path).st_ino] = _get_config_sync_file_info(
-                        dir_path
+                        dir_path, file_hash_cache
                     )
             except FileNotFoundError:
                 pass  # Ignore directories vanishing during processing
@@ -2481,7 +2490,9 @@ def _get_replication_dir_config_sync_file_infos_per_inode(
         for file_name in file_names:
             file_path = os.path.join(root, file_name)
             try:
-                inode_sync_states[os.stat(file_path).st_ino] = _get_config_sync_file_info(file_path)
+                inode_sync_states[os.stat(file_path).st_ino] = _get_config_sync_file_info(
+                    file_path, file_hash_cache
+                )
             except FileNotFoundError:
                 pass  # Ignore files vanishing during processing
 
@@ -2504,8 +2515,9 @@ def _prepare_for_activation_tasks(
     except Exception as e:
         initialization_failure = e
 
-    central_file_infos_per_site = {}
+    central_file_infos_per_site: dict[SiteId, ConfigSyncFileInfos] = {}
     site_activation_states_per_site = {}
+    sites_to_sync = []
     for site_id, snapshot_settings in sorted(site_snapshot_settings.items(), key=lambda e: e[0]):
         site_activation_state = _initialize_site_activation_state(
             site_id,
@@ -2533,14 +2545,37 @@ def _prepare_for_activation_tasks(
             site_activation_states_per_site[site_id] = site_activation_state
 
             if activate_changes.is_sync_needed(site_id, snapshot_settings.site_config):
-                central_file_infos_per_site[site_id] = _get_site_central_file_infos(
-                    site_id, snapshot_settings, config_sync_file_infos_per_inode
-                )
+                sites_to_sync.append(site_id)
         except Exception as e:
             _handle_activation_changes_exception(
                 logger.getChild(f"site[{site_id}]"), e, site_activation_state
             )
             _finalize_activation(site_id, activation_id, source)
+
+    if not sites_to_sync:
+        return central_file_infos_per_site, site_activation_states_per_site
+
+    # The file infos of the sites are computed in parallel. The infos of the files in the
+    # site config directories are mostly looked up by inode, but walking the directories
+    # takes a while for many sites.
+    with ThreadPool(processes=len(sites_to_sync)) as pool:
+        async_results = {
+            site_id: pool.apply_async(
+                _get_site_central_file_infos,
+                (site_id, site_snapshot_settings[site_id], config_sync_file_infos_per_inode),
+            )
+            for site_id in sites_to_sync
+        }
+        for site_id, async_result in async_results.items():
+            try:
+                central_file_infos_per_site[site_id] = async_result.get()
+            except Exception as e:
+                _handle_activation_changes_exception(
+                    logger.getChild(f"site[{site_id}]"),
+                    e,
+                    site_activation_states_per_site.pop(site_id),
+                )
+                _finalize_activation(site_id, activation_id, source)
     return central_file_infos_per_site, site_activation_states_per_site
 
 
@@ -2842,11 +2877,11 @@ def _handle_active_tasks(
 ) -> None:
     for site_id, async_result in list(active_tasks["fetch_sync_state"].items()):
         if not async_result.ready():
-            return
+            continue
 
         active_tasks["fetch_sync_state"].pop(site_id)
         if (fetch_sync_state_results := async_result.get()) is None:
-            return  # exception handling happens in thread
+            continue  # exception handling happens in thread
 
         sync_state, activation_state, sync_start_time = fetch_sync_state_results
         remote_config_generation_per_site[site_id] = sync_state.remote_config_generation
@@ -2866,11 +2901,11 @@ def _handle_active_tasks(
 
     for site_id, async_result in list(active_tasks["calc_sync_delta"].items()):
         if not async_result.ready():
-            return
+            continue
 
         active_tasks["calc_sync_delta"].pop(site_id)
         if (calc_sync_delta_result := async_result.get()) is None:
-            return  # exception handling happens in thread
+            continue  # exception handling happens in thread
 
         automation_config = automation_configs[site_id]
         assert isinstance(automation_config, RemoteAutomationConfig)
@@ -2893,11 +2928,11 @@ def _handle_active_tasks(
 
     for site_id, async_result in list(active_tasks["synchronize_files"].items()):
         if not async_result.ready():
-            return
+            continue
 
         active_tasks["synchronize_files"].pop(site_id)
         if (activation_state := async_result.get()) is None:
-            return  # exception handling happens in thread
+            continue  # exception handling happens in thread
 
         # Sync finished, now start the activation
         active_tasks["activate_site_changes"][site_id] = task_pool.apply_async(
@@ -2916,7 +2951,7 @@ def _handle_active_tasks(
 
     for site_id, async_result in list(active_tasks["activate_site_changes"].items()):
         if not async_result.ready():
-            return
+            continue
 
         active_tasks["activate_site_changes"].pop(site_id)
 
@@ -3448,7 +3483,7 @@ def _filter_remote_files(remote_files: set[str]) -> set[str]:
     return remote_files_to_keep
 
 
-def _get_sync_archive(to_sync: list[str], base_dir: Path) -> bytes:
+def _create_sync_archive(to_sync: list[str], base_dir: Path, sync_archive: BinaryIO) -> None:
     # Use native tar instead of python tarfile for performance reasons
     completed_process = subprocess.run(
         [
@@ -3464,23 +3499,19 @@ def _get_sync_archive(to_sync: list[str], base_dir: Path) -> bytes:
             "--preserve-permissions",
         ],
         input=b"\0".join(f.encode() for f in to_sync),
-        capture_output=True,
+        stdout=sync_archive,
+        stderr=subprocess.PIPE,
         close_fds=True,
         shell=False,
         check=False,
     )
 
-    # Since we don't stream the archive to the remote site (we could probably do this) it should be
-    # no problem to buffer it in memory for the moment
-
     if completed_process.returncode:
         raise MKGeneralException(
             _("Failed to create sync archive [%d]: %s")
             % (completed_process.returncode, completed_process.stderr.decode())
         )
 
-    return completed_process.stdout
-
 
 def _unpack_sync_archive(sync_archive: bytes, base_dir: Path) -> None:
     completed_process = subprocess.run(
@@ -3554,7 +3585,11 @@ class AutomationGetConfigSyncState(AutomationCommand[list[ReplicationPath]]):
 
     def execute(self, api_request: list[ReplicationPath]) -> GetConfigSyncStateResponse:
         with store.lock_checkmk_configuration(configuration_lockfile):
-            file_infos = _get_config_sync_file_infos(api_request, base_dir=cmk.utils.paths.omd_root)
+            file_hash_cache = _ConfigSyncFileHashCache(_config_sync_file_hash_cache_path())
+            file_infos = _get_config_sync_file_infos(
+                api_request, base_dir=cmk.utils.paths.omd_root, file_hash_cache=file_hash_cache
+            )
+            file_hash_cache.save()
             transport_file_infos = {
                 k: (v.st_mode, v.st_size, v.link_target, v.file_hash) for k, v in file_infos.items()
             }
@@ -3594,6 +3629,7 @@ def _get_config_sync_file_infos(
     replication_paths: list[ReplicationPath],
     base_dir: Path,
     config_sync_file_infos_per_inode: Mapping[int, ConfigSyncFileInfo] | None = None,
+    file_hash_cache: _ConfigSyncFileHashCache | None = None,
 ) -> ConfigSyncFileInfos:
     """Scans the given replication paths for the information needed for the config sync
 
@@ -3615,7 +3651,7 @@ def _get_config_sync_file_infos(
         match replication_path.ty:
             case ReplicationPathType.FILE:
                 infos[replication_path.site_path] = _get_config_sync_file_info(
-                    replication_path_full
+                    replication_path_full, file_hash_cache
                 )
 
             case ReplicationPathType.DIR:
@@ -3625,6 +3661,7 @@ def _get_config_sync_file_infos(
                     base_dir,
                     replication_path_full,
                     replication_path.is_excluded,
+                    file_hash_cache=file_hash_cache,
                 )
             case _:
                 assert_never(replication_path.ty)
@@ -3637,6 +3674,8 @@ def _get_replication_dir_config_sync_file_infos(
     base_dir: Path,
     replication_path: str,
     replication_path_excluder: Callable[[str], bool],
+    *,
+    file_hash_cache: _ConfigSyncFileHashCache | None,
 ) -> None:
     # Use os functionality instead of pathlib since it is faster
     for root, dir_names, file_names in os.walk(replication_path):
@@ -3656,19 +3695,31 @@ def _get_replication_dir_config_sync_file_infos(
                 ):
                     infos[valid_site_path] = sync_file_info
                 else:
-                    infos[valid_site_path] = _get_config_sync_file_info(config_sync_path)
+                    infos[valid_site_path] = _get_config_sync_file_info(
+                        config_sync_path, file_hash_cache
+                    )
             except FileNotFoundError:  # e.g. broken symlinks
-                infos[valid_site_path] = _get_config_sync_file_info(config_sync_path)
+                infos[valid_site_path] = _get_config_sync_file_info(
+                    config_sync_path, file_hash_cache
+                )
 
 
-def _get_config_sync_file_info(file_path: str) -> ConfigSyncFileInfo:
+def _get_config_sync_file_info(
+    file_path: str, file_hash_cache: _ConfigSyncFileHashCache | None = None
+) -> ConfigSyncFileInfo:
     stat = os.lstat(file_path)
     is_symlink = os.path.islink(file_path)
+    if is_symlink:
+        file_hash = None
+    elif file_hash_cache is None:
+        file_hash = _create_config_sync_file_hash(file_path)
+    else:
+        file_hash = file_hash_cache.file_hash(file_path, stat)
     return ConfigSyncFileInfo(
         stat.st_mode,
         stat.st_size,
         os.readlink(str(file_path)) if is_symlink else None,
-        _create_config_sync_file_hash(file_path) if not is_symlink else None,
+        file_hash,
     )
 
 
@@ -3683,6 +3734,44 @@ def _create_config_sync_file_hash(file_path: str) -> str:
     return sha256.hexdigest()
 
 
+def _config_sync_file_hash_cache_path() -> Path:
+    return wato_var_dir() / "config_sync_file_hashes.pkl"
+
+
+class _ConfigSyncFileHashCache:
+    """Persisted hashes of the files to be synchronized
+
+    The hashes are keyed by inode, modification time and size of the files, so that only new
+    and changed files are read again. Files modified within the last seconds are not cached,
+    as a second modification within the resolution of the modification time would go
+    unnoticed. Entries of files not looked up again are dropped when saving.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path: Final = path
+        try:
+            self._cached: Mapping[tuple[int, int, int], str] = store.load_object_from_pickle_file(
+                path, default={}
+            )
+        except Exception:
+            logger.warning("Ignoring corrupted config sync file hash cache %s", path)
+            self._cached = {}
+        self._used: dict[tuple[int, int, int], str] = {}
+        self._cacheable_before_ns: Final = time.time_ns() - 2 * 10**9
+
+    def file_hash(self, file_path: str, stat: os.stat_result) -> str:
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if (file_hash := self._cached.get(key)) is None:
+            file_hash = _create_config_sync_file_hash(file_path)
+        if stat.st_mtime_ns < self._cacheable_before_ns:
+            self._used[key] = file_hash
+        return file_hash
+
+    def save(self) -> None:
+        if self._used != self._cached:
+            store.save_object_to_pickle_file(self._path, self._used)
+
+
 def update_config_generation() -> None:
     """Increase the config generation ID
 
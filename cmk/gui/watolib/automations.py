@@ -20,8 +20,7 @@ import time
 from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from dataclasses import asdict, replace
-from io import BytesIO
-from typing import Annotated, Final, NamedTuple
+from typing import Annotated, BinaryIO, Final, NamedTuple
 
 import requests
 import urllib3
@@ -324,7 +323,7 @@ def _do_remote_automation_serialized(
     automation_config: RemoteAutomationConfig,
     command: str,
     vars_: Sequence[tuple[str, str]],
-    files: Mapping[str, BytesIO] | None,
+    files: Mapping[str, BinaryIO] | None,
     timeout: float | None,
     debug: bool,
 ) -> str:
@@ -393,7 +392,7 @@ def do_remote_automation(
     command: str,
     vars_: Sequence[tuple[str, str]],
     debug: bool,
-    files: Mapping[str, BytesIO] | None = None,
+    files: Mapping[str, BinaryIO] | None = None,
     timeout: float | None = None,
 ) -> object:
     serialized_response = _do_remote_automation_serialized(
@@ -422,7 +421,7 @@ def get_url_raw(
     insecure: bool,
     auth: tuple[str, str] | None = None,
     data: Mapping[str, str] | None = None,
-    files: Mapping[str, BytesIO] | None = None,
+    files: Mapping[str, BinaryIO] | None = None,
     timeout: float | None = None,
     add_headers: dict[str, str] | None = None,
 ) -> requests.Response:
@@ -433,13 +432,17 @@ def get_url_raw(
     }
     headers_.update(add_headers or {})
 
+    body: Mapping[str, str] | _MultipartFormData | None = data
+    if files:
+        body = _MultipartFormData(data or {}, files)
+        headers_["Content-Type"] = body.content_type
+
     try:
         response = requests.post(
             url,
-            data=data,
+            data=body,
             verify=not insecure,
             auth=auth,
-            files=files,
             timeout=timeout,
             headers=headers_,
         )
@@ -462,6 +465,57 @@ def get_url_raw(
     return response
 
 
+class _MultipartFormData:
+    """A multipart/form-data request body which reads the files while it is being sent
+
+    requests encodes all files of a request into a single bytes object. This body only holds
+    a chunk of a file at a time, e.g. when sending the sync archive of a site, and is sent
+    with a Content-Length, as the receiving site may not accept chunked requests.
+    """
+
+    _CHUNK_SIZE: Final = 64 * 1024
+
+    def __init__(self, fields: Mapping[str, str], files: Mapping[str, BinaryIO]) -> None:
+        self._boundary: Final = os.urandom(16).hex()
+        self._parts: Final[list[bytes | BinaryIO]] = []
+        for name, value in fields.items():
+            self._parts.append(self._part_header(name) + value.encode("utf-8") + b"\r\n")
+        for name, file in files.items():
+            self._parts.extend((self._part_header(name, filename=name), file, b"\r\n"))
+        self._parts.append(f"--{self._boundary}--\r\n".encode())
+        self._length: Final = sum(
+            len(part) if isinstance(part, bytes) else _remaining_size(part) for part in self._parts
+        )
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self._boundary}"
+
+    def _part_header(self, name: str, filename: str | None = None) -> bytes:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        return f"--{self._boundary}\r\nContent-Disposition: {disposition}\r\n\r\n".encode()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+                continue
+            while chunk := part.read(self._CHUNK_SIZE):
+                yield chunk
+
+
+def _remaining_size(file: BinaryIO) -> int:
+    position = file.tell()
+    size = file.seek(0, os.SEEK_END) - position
+    file.seek(position)
+    return size
+
+
 def _verify_compatibility(response: requests.Response) -> None:
     """Ensure we are compatible with the remote site
 
@@ -568,7 +622,7 @@ def get_url(
     insecure: bool,
     auth: tuple[str, str] | None = None,
     data: Mapping[str, str] | None = None,
-    files: Mapping[str, BytesIO] | None = None,
+    files: Mapping[str, BinaryIO] | None = None,
     timeout: float | None = None,
 ) -> str:
     return get_url_raw(url, insecure, auth, data, files, timeout).text
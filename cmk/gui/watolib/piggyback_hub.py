@@ -12,9 +12,11 @@ from livestatus import SiteConfiguration, SiteConfigurations
 
 from cmk.ccc.hostaddress import HostName
 from cmk.ccc.site import omd_site, SiteId
+from cmk.ccc.version import __version__, Version
 from cmk.gui.exceptions import MKUserError
 from cmk.gui.i18n import _
 from cmk.gui.site_config import is_distributed_setup_remote_site
+from cmk.gui.sites import states as sites_states
 from cmk.gui.type_defs import GlobalSettings
 from cmk.gui.watolib.site_changes import ChangeSpec
 from cmk.piggyback.hub import HostLocations, publish_persisted_locations_for_sites
@@ -55,6 +57,13 @@ def distribute_piggyback_hub_configs(
         compute_new_config(global_settings, configured_sites, hosts_sites),
         omd_root,
         omd_site(),
+        batching_sites=compute_batching_sites(
+            configured_sites,
+            {
+                site_id: site_status.get("livestatus_version", "")
+                for site_id, site_status in sites_states().items()
+            },
+        ),
     )
 
 
@@ -75,6 +84,26 @@ def compute_new_config(
     return ((site, _make_targets(site)) for site in sites_to_update)
 
 
+def compute_batching_sites(
+    configured_sites: Mapping[SiteId, SiteConfiguration],
+    site_versions: Mapping[SiteId, str],
+) -> Collection[SiteId]:
+    """The sites receiving batches of piggyback data
+
+    Only sites running at least the version of this site are known to receive them. Sites
+    not updated yet, or of unknown version, get the piggyback data per piggybacked host.
+    """
+    own_version = Version.from_str(__version__)
+
+    def _is_updated(site_id: SiteId) -> bool:
+        try:
+            return Version.from_str(site_versions.get(site_id, "")) >= own_version
+        except ValueError:
+            return False
+
+    return sorted(site_id for site_id in configured_sites if _is_updated(site_id))
+
+
 def _piggyback_hub_enabled(site_config: SiteConfiguration, global_settings: GlobalSettings) -> bool:
     if (enabled := site_config.get("globals", {}).get("piggyback_hub_enabled")) is not None:
         return enabled
@@ -56,6 +56,7 @@ class Paths:
         self.status_data_dir = omd_root / "tmp/check_mk/status_data"
         self.archive_dir = omd_root / "var/check_mk/inventory_archive"
         self.delta_cache_dir = omd_root / "var/check_mk/inventory_delta_cache"
+        self.history_index_dir = omd_root / "var/check_mk/inventory_history_index"
         self.auto_dir = omd_root / "var/check_mk/autoinventory"
 
     @property
@@ -104,3 +105,6 @@ class Paths:
             path=self.delta_cache_host(host_name) / f"{previous_name}_{current}.json",
             legacy=self.delta_cache_host(host_name) / f"{previous_name}_{current}",
         )
+
+    def history_index(self, host_name: HostName) -> Path:
+        return self.history_index_dir / f"{host_name}.json"
@@ -15,11 +15,13 @@ import ast
 import gzip
 import io
 import json
+import multiprocessing
 import os
 import pprint
 import shutil
 from collections import Counter
-from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Container, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import as_completed, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal, NewType, Self, TypedDict
@@ -1656,6 +1658,13 @@ def rename(
         except FileNotFoundError:
             pass
 
+    try:
+        inv_paths.history_index(HostName(old_host_name)).rename(
+            inv_paths.history_index(HostName(new_host_name))
+        )
+    except FileNotFoundError:
+        pass
+
     return list(actions)
 
 
@@ -1908,6 +1917,10 @@ class HistoryArchivePath:
     previous: HistoryPath
     current: HistoryPath
 
+    @property
+    def previous_timestamp(self) -> int:
+        return self.previous.timestamp
+
     @property
     def current_timestamp(self) -> int:
         return self.current.timestamp
@@ -1959,6 +1972,27 @@ class HistoryEntry:
         )
 
 
+@dataclass(frozen=True, kw_only=True)
+class HistoryIndexEntry:
+    """The statistics of a history entry without its delta tree"""
+
+    previous_timestamp: int
+    current_timestamp: int
+    new: int
+    changed: int
+    removed: int
+
+    @classmethod
+    def from_history_entry(cls, history_entry: HistoryEntry) -> HistoryIndexEntry:
+        return cls(
+            previous_timestamp=history_entry.previous_timestamp,
+            current_timestamp=history_entry.current_timestamp,
+            new=history_entry.new,
+            changed=history_entry.changed,
+            removed=history_entry.removed,
+        )
+
+
 class HistoryStore:
     def __init__(self, omd_root: Path) -> None:
         self.inv_paths = InventoryPaths(omd_root)
@@ -2139,6 +2173,161 @@ class HistoryStore:
         )
         delta_cache_tree.legacy.unlink(missing_ok=True)
 
+    def load_index(self, host_name: HostName) -> dict[tuple[int, int], HistoryIndexEntry]:
+        try:
+            raw_index = json.loads(
+                store.load_text_from_file(self.inv_paths.history_index(host_name)) or "[]"
+            )
+        except (MKGeneralException, ValueError):
+            # The index only caches the statistics of the history entries, it is rebuilt
+            # by 'load_history_index'.
+            return {}
+
+        return {
+            (previous_timestamp, current_timestamp): HistoryIndexEntry(
+                previous_timestamp=previous_timestamp,
+                current_timestamp=current_timestamp,
+                new=new,
+                changed=changed,
+                removed=removed,
+            )
+            for previous_timestamp, current_timestamp, new, changed, removed in raw_index
+        }
+
+    def save_index(self, host_name: HostName, index: Iterable[HistoryIndexEntry]) -> None:
+        self.inv_paths.history_index_dir.mkdir(parents=True, exist_ok=True)
+        store.save_text_to_file(
+            self.inv_paths.history_index(host_name),
+            json.dumps(
+                [
+                    (e.previous_timestamp, e.current_timestamp, e.new, e.changed, e.removed)
+                    for e in sorted(index, key=lambda e: e.current_timestamp)
+                ]
+            ),
+        )
+
+    def update_index(
+        self,
+        host_name: HostName,
+        entries: Iterable[HistoryIndexEntry],
+        *,
+        known_keys: Container[tuple[int, int]] | None = None,
+    ) -> None:
+        """Add the entries to the index and drop the ones of vanished history paths
+
+        The GUI and the history computation both update the index, so it is read and written
+        under its lock. Otherwise one of them would drop the entries added by the other one.
+        """
+        with store.locked(self.inv_paths.history_index(host_name)):
+            index = self.load_index(host_name)
+            index.update(((e.previous_timestamp, e.current_timestamp), e) for e in entries)
+            self.save_index(
+                host_name,
+                [e for k, e in index.items() if known_keys is None or k in known_keys],
+            )
+
+
+@dataclass(frozen=True)
+class HistoryIndex:
+    entries: Sequence[HistoryIndexEntry]
+    corrupted: Sequence[Path]
+
+
+def load_history_index(history_store: HistoryStore, host_name: HostName) -> HistoryIndex:
+    """Load the statistics of the history entries without their delta trees
+
+    Entries which are not yet indexed are loaded or computed like in 'load_history' and
+    added to the index.
+    """
+    index = history_store.load_index(host_name)
+    inventory_tree = history_store.inv_paths.inventory_tree(host_name)
+    entries = []
+    corrupted: set[Path] = set()
+    known_keys = set()
+    new_entries = []
+    for path_result in history_store.collect_history_paths(host_name=host_name):
+        if path_result.is_error():
+            corrupted.add(path_result.error)
+            continue
+
+        path = path_result.ok
+        known_keys.add(key := (path.previous_timestamp, path.current_timestamp))
+        if (entry := index.get(key)) is None:
+            if (
+                entry_result := history_store.load_history_entry(host_name=host_name, path=path)
+            ).is_error():
+                corrupted.update(entry_result.error)
+                continue
+
+            entry = HistoryIndexEntry.from_history_entry(entry_result.ok)
+            # The current inventory tree may still change, so its entry is not cached.
+            if not (
+                isinstance(path, HistoryArchivePath) and path.current.tree_path == inventory_tree
+            ):
+                new_entries.append(entry)
+
+        entries.append(entry)
+
+    if new_entries or not known_keys.issuperset(index):
+        history_store.update_index(host_name, new_entries, known_keys=known_keys)
+
+    return HistoryIndex(entries=entries, corrupted=list(corrupted))
+
+
+_HISTORY_CHUNK_SIZE = 32
+
+
+def _compute_history_entries(
+    omd_root: Path, host_name: HostName, paths: Sequence[HistoryArchivePath]
+) -> Sequence[HistoryIndexEntry]:
+    # One store per chunk: the tree of the current path is the previous tree of the next one.
+    history_store = HistoryStore(omd_root)
+    return [
+        HistoryIndexEntry.from_history_entry(entry_result.ok)
+        for path in paths
+        if (
+            entry_result := history_store.load_history_entry(host_name=host_name, path=path)
+        ).is_ok()
+    ]
+
+
+def compute_history_entries(
+    omd_root: Path, host_names: Iterable[HostName], *, max_workers: int | None
+) -> None:
+    """Compute, cache and index the missing history entries of the archived trees
+
+    The delta trees are computed by a pool of worker processes, each of them handling
+    consecutive archive paths of a host. The workers are spawned rather than forked: the
+    caller may run threads, and a forked child would inherit the locks they hold.
+    """
+    history_store = HistoryStore(omd_root)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {}
+        for host_name in host_names:
+            inventory_tree = history_store.inv_paths.inventory_tree(host_name)
+            index = history_store.load_index(host_name)
+            paths = [
+                p
+                for r in history_store.collect_history_paths(host_name=host_name)
+                if r.is_ok()
+                and isinstance(p := r.ok, HistoryArchivePath)
+                and p.current.tree_path != inventory_tree
+                and (p.previous_timestamp, p.current_timestamp) not in index
+            ]
+            for start in range(0, len(paths), _HISTORY_CHUNK_SIZE):
+                chunk = paths[start : start + _HISTORY_CHUNK_SIZE]
+                futures[executor.submit(_compute_history_entries, omd_root, host_name, chunk)] = (
+                    host_name
+                )
+
+        for future in as_completed(futures):
+            if future.exception() is not None:
+                # Corrupted files are reported when the history is loaded.
+                continue
+            history_store.update_index(futures[future], future.result())
+
 
 @dataclass(frozen=True)
 class History:
@@ -76,6 +76,16 @@ class PiggybackMessage:
 
 def watch_new_messages(omd_root: Path) -> Iterator[PiggybackMessage]:
     """Yields piggyback messages as they come in."""
+    for messages in watch_new_message_batches(omd_root):
+        yield from messages
+
+
+def watch_new_message_batches(omd_root: Path) -> Iterator[Sequence[PiggybackMessage]]:
+    """Yields piggyback messages as they come in, batched per read of the inotify events
+
+    A source host writes all of its piggyback files at once, so a batch usually contains
+    many messages of the same source host.
+    """
 
     host_folder_mask = Masks.MOVED_TO | Masks.DELETE_SELF
 
@@ -89,58 +99,67 @@ def watch_new_messages(omd_root: Path) -> Iterator[PiggybackMessage]:
 
         _last_processed_time: int = int(time.time())
 
-        for event in inotify.read_forever():
-            if event.type & Masks.Q_OVERFLOW:
-                logger.warning(
-                    "Too many messages for the piggyback-hub to progress at once, rescanning data. "
-                    "Consider raising /proc/sys/fs/inotify/max_queued_events."
-                )
-                # check if any data was missed when the event queue overflowed
-                for source_file in _get_source_state_files(omd_root):
-                    if (
-                        mtime := _get_mtime(source_file)
-                    ) is not None and mtime >= _last_processed_time:
-                        source = HostName(source_file.name)
-                        for piggybacked_host in _get_piggybacked_hosts_for_source(omd_root, source):
-                            yield from get_messages_for(
-                                HostAddress(piggybacked_host.name), omd_root
+        while True:
+            batch: list[PiggybackMessage] = []
+            for event in inotify.read():
+                if event.type & Masks.Q_OVERFLOW:
+                    logger.warning(
+                        "Too many messages for the piggyback-hub to progress at once, rescanning data. "
+                        "Consider raising /proc/sys/fs/inotify/max_queued_events."
+                    )
+                    # check if any data was missed when the event queue overflowed
+                    for source_file in _get_source_state_files(omd_root):
+                        if (
+                            mtime := _get_mtime(source_file)
+                        ) is not None and mtime >= _last_processed_time:
+                            source = HostName(source_file.name)
+                            for piggybacked_host in _get_piggybacked_hosts_for_source(
+                                omd_root, source
+                            ):
+                                batch.extend(
+                                    get_messages_for(HostAddress(piggybacked_host.name), omd_root)
+                                )
+                    _last_processed_time = int(time.time())
+                    continue
+
+                # check if a new piggybacked host folder was created
+                if event.watchee == watch_for_new_piggybacked_hosts:
+                    if event.type & Masks.CREATE:
+                        inotify.add_watch(event.watchee.path / event.name, host_folder_mask)
+                        # Handle all files already in the folder (we rather have duplicates than missing files)
+                        batch.extend(get_messages_for(HostAddress(event.name), omd_root))
+                    _last_processed_time = int(time.time())
+                    continue
+                if event.watchee == watch_for_deleted_status_files:
+                    if event.type & Masks.DELETE:
+                        source = HostName(event.name)
+                        for piggybacked_host_path in _get_piggybacked_hosts_for_source(
+                            omd_root, source
+                        ):
+                            batch.append(
+                                PiggybackMessage(
+                                    PiggybackMetaData(
+                                        source=source,
+                                        piggybacked=HostName(piggybacked_host_path.name),
+                                        last_update=int(time.time()),
+                                        last_contact=None,
+                                    ),
+                                    b"",
+                                )
                             )
-                _last_processed_time = int(time.time())
-                continue
+                    _last_processed_time = int(time.time())
+                    continue
 
-            # check if a new piggybacked host folder was created
-            if event.watchee == watch_for_new_piggybacked_hosts:
-                if event.type & Masks.CREATE:
-                    inotify.add_watch(event.watchee.path / event.name, host_folder_mask)
-                    # Handle all files already in the folder (we rather have duplicates than missing files)
-                    yield from get_messages_for(HostAddress(event.name), omd_root)
-                _last_processed_time = int(time.time())
-                continue
-            if event.watchee == watch_for_deleted_status_files:
-                if event.type & Masks.DELETE:
-                    source = HostName(event.name)
-                    for piggybacked_host_path in _get_piggybacked_hosts_for_source(
-                        omd_root, source
-                    ):
-                        yield PiggybackMessage(
-                            PiggybackMetaData(
-                                source=source,
-                                piggybacked=HostName(piggybacked_host_path.name),
-                                last_update=int(time.time()),
-                                last_contact=None,
-                            ),
-                            b"",
-                        )
-                _last_processed_time = int(time.time())
-                continue
+                if event.type & Masks.DELETE_SELF:
+                    inotify.rm_watch(event.watchee)
+                    continue
 
-            if event.type & Masks.DELETE_SELF:
-                inotify.rm_watch(event.watchee)
-                continue
+                if message := _make_message_from_event(event, omd_root):
+                    _last_processed_time = int(time.time())
+                    batch.append(message)
 
-            if message := _make_message_from_event(event, omd_root):
-                _last_processed_time = int(time.time())
-                yield message
+            if batch:
+                yield batch
 
 
 def _make_message_from_event(event: Event, omd_root: Path) -> PiggybackMessage | None:
@@ -41,14 +41,20 @@ class ConfigType(enum.Enum):
 class PiggybackHubConfig(BaseModel):
     type: ConfigType
     locations: HostLocations
+    # Sites known to receive batches of piggyback data. Previous versions have no queue for
+    # them and only receive the piggyback data per piggybacked host.
+    batching_sites: frozenset[str] = frozenset()
 
 
 class _PersistedPiggybackHubConfig(BaseModel):
     locations: Mapping[AnnotatedHostName, str] = {}
+    batching_sites: frozenset[str] = frozenset()
 
 
 def save_config(omd_root: Path, config: PiggybackHubConfig) -> None:
-    persisted = _PersistedPiggybackHubConfig(locations=config.locations)
+    persisted = _PersistedPiggybackHubConfig(
+        locations=config.locations, batching_sites=config.batching_sites
+    )
     path = omd_root / RELATIVE_CONFIG_PATH
     path.parent.mkdir(mode=0o770, exist_ok=True, parents=True)
     tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
@@ -58,12 +64,16 @@ def save_config(omd_root: Path, config: PiggybackHubConfig) -> None:
 
 def load_config(omd_root: Path) -> PiggybackHubConfig:
     try:
-        locations = _PersistedPiggybackHubConfig.model_validate_json(
+        persisted = _PersistedPiggybackHubConfig.model_validate_json(
             (omd_root / RELATIVE_CONFIG_PATH).read_text()
-        ).locations
+        )
     except FileNotFoundError:
-        locations = {}
-    return PiggybackHubConfig(type=ConfigType.PERSISTED, locations=locations)
+        persisted = _PersistedPiggybackHubConfig()
+    return PiggybackHubConfig(
+        type=ConfigType.PERSISTED,
+        locations=persisted.locations,
+        batching_sites=persisted.batching_sites,
+    )
 
 
 def publish_persisted_locations_for_sites(
@@ -72,6 +82,8 @@ def publish_persisted_locations_for_sites(
     omd_root: Path,
     omd_site: str,
     customer: str = DEFAULT_CUSTOMER,
+    *,
+    batching_sites: Collection[str] = (),
 ) -> None:
     """Publish host locations for continuous distribution of piggyback data to multiple sites.
 
@@ -80,11 +92,19 @@ def publish_persisted_locations_for_sites(
         omd_root: The path to the OMD root directory of this site.
         omd_site: The name of this OMD site
         customer: The customer (vhost) to publish to, or None for the provider ("/") vhost
+        batching_sites: The sites known to receive batches of piggyback data
     """
     _publish_configs(
         logger,
         [
-            (destination_site, PiggybackHubConfig(type=ConfigType.PERSISTED, locations=locations))
+            (
+                destination_site,
+                PiggybackHubConfig(
+                    type=ConfigType.PERSISTED,
+                    locations=locations,
+                    batching_sites=frozenset(batching_sites),
+                ),
+            )
             for destination_site, locations in site_locations
         ],
         omd_root,
@@ -99,6 +119,8 @@ def publish_one_shot_locations(
     locations: HostLocations,
     omd_root: Path,
     omd_site: str,
+    *,
+    batching_sites: Collection[str] = (),
 ) -> None:
     """Publish host locations for one-shot distribution of piggyback data.
 
@@ -107,8 +129,11 @@ def publish_one_shot_locations(
         locations: A mapping of host names to the sites they are monitored on.
         omd_root: The path to the OMD root directory of this site.
         omd_site: The name of this OMD site
+        batching_sites: The sites known to receive batches of piggyback data
     """
-    config = PiggybackHubConfig(type=ConfigType.ONESHOT, locations=locations)
+    config = PiggybackHubConfig(
+        type=ConfigType.ONESHOT, locations=locations, batching_sites=frozenset(batching_sites)
+    )
     # one-shot should be communicated only from central site to remote sites (customer 'provider')
     _publish_configs(
         logger, [(destination_site, config)], omd_root, omd_site, customer=DEFAULT_CUSTOMER
@@ -10,6 +10,7 @@
 
 import argparse
 import logging
+import multiprocessing
 import signal
 import sys
 from collections.abc import Callable
@@ -23,11 +24,15 @@ from pathlib import Path
 
 from cmk.ccc.daemon import daemonize, pid_file_lock
 from cmk.ccc.hostaddress import HostNameValidationError
-from cmk.messaging import Channel, DeliveryTag, QueueName, set_logging_level
+from cmk.messaging import Channel, DeliveryTag, set_logging_level
 
 from ._config import CONFIG_QUEUE, ConfigType, PiggybackHubConfig, save_config
 from ._payload import (
+    PAYLOAD_BATCH_QUEUE,
+    PAYLOAD_QUEUE,
     PiggybackPayload,
+    PiggybackPayloadBatch,
+    save_payload_batch_on_message,
     save_payload_on_message,
     send_messages_oneshot,
     SendingPayloadProcess,
@@ -58,7 +63,9 @@ def handle_received_config(
 
         match received.type:
             case ConfigType.ONESHOT:
-                send_messages_oneshot(logger, omd_root, omd_site, received.locations)
+                send_messages_oneshot(
+                    logger, omd_root, omd_site, received.locations, received.batching_sites
+                )
             case ConfigType.PERSISTED:
                 save_config(omd_root, received)
                 reload_config.set()
@@ -121,7 +128,7 @@ def run_piggyback_hub(
     logger: logging.Logger, omd_root: Path, omd_site: str, crash_report_callback: Callable[[], str]
 ) -> int:
     reload_config = make_event()
-    processes = (
+    processes: tuple[multiprocessing.Process, ...] = (
         ReceivingProcess(
             logger,
             omd_root,
@@ -129,7 +136,17 @@ def run_piggyback_hub(
             PiggybackPayload,
             save_payload_on_message(logger, omd_root),
             crash_report_callback,
-            QueueName("payload"),
+            PAYLOAD_QUEUE,
+            message_ttl=600,
+        ),
+        ReceivingProcess(
+            logger,
+            omd_root,
+            omd_site,
+            PiggybackPayloadBatch,
+            save_payload_batch_on_message(logger, omd_root),
+            crash_report_callback,
+            PAYLOAD_BATCH_QUEUE,
             message_ttl=600,
         ),
         SendingPayloadProcess(logger, omd_root, reload_config, crash_report_callback),
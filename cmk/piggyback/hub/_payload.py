@@ -8,27 +8,43 @@
 import logging
 import multiprocessing
 import signal
-from collections.abc import Callable, Mapping, Sequence
+import struct
+import zlib
+from collections.abc import Callable, Container, Iterable, Iterator, Mapping, Sequence
 from multiprocessing.synchronize import Event
 from pathlib import Path
 from typing import Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from cmk.ccc.hostaddress import HostName
-from cmk.messaging import Channel, CMKConnectionError, DeliveryTag, RoutingKey
+from cmk.messaging import Channel, CMKConnectionError, DeliveryTag, QueueName, RoutingKey
 from cmk.piggyback.backend import (
     get_messages_for,
     PiggybackMessage,
     store_piggyback_raw_data,
-    watch_new_messages,
+    watch_new_message_batches,
 )
 
 from ._config import AnnotatedHostName, load_config, PiggybackHubConfig
 from ._utils import make_connection, make_log_and_exit
 
+PAYLOAD_QUEUE = QueueName("payload")
+PAYLOAD_ROUTE = RoutingKey("payload")
+PAYLOAD_BATCH_QUEUE = QueueName("payload-batch")
+PAYLOAD_BATCH_ROUTE = RoutingKey("payload-batch")
+
+# Length of the piggybacked host name and length of its raw data
+_FRAME_HEADER = struct.Struct("!HI")
+
 
 class PiggybackPayload(BaseModel):
+    """The piggyback data of one source host for one piggybacked host
+
+    This is all previous versions send and receive. We send `PiggybackPayloadBatch` to the
+    sites known to receive it, see `PiggybackHubConfig.batching_sites`.
+    """
+
     source_host: AnnotatedHostName
     raw_data: Mapping[AnnotatedHostName, Sequence[bytes]]
     message_timestamp: int
@@ -44,6 +60,109 @@ class PiggybackPayload(BaseModel):
         )
 
 
+class PiggybackPayloadBatch(BaseModel):
+    """The piggyback data of one source host for any number of piggybacked hosts
+
+    The raw data of all piggybacked hosts is framed and zlib compressed into a single
+    blob, see `encode_raw_data`. In the JSON message it is base64 encoded.
+    """
+
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
+    source_host: AnnotatedHostName
+    compressed_raw_data: bytes
+    message_timestamp: int
+    contact_timestamp: int | None
+
+    @classmethod
+    def from_messages(cls, messages: Sequence[PiggybackMessage]) -> Self:
+        """Create the batch of messages with the same source host and time stamps"""
+        return cls(
+            source_host=messages[0].meta.source,
+            compressed_raw_data=encode_raw_data({m.meta.piggybacked: m.raw_data for m in messages}),
+            message_timestamp=messages[0].meta.last_update,
+            contact_timestamp=messages[0].meta.last_contact,
+        )
+
+    def raw_data(self) -> Mapping[HostName, Sequence[bytes]]:
+        return decode_raw_data(self.compressed_raw_data)
+
+
+def encode_raw_data(raw_data: Mapping[HostName, bytes]) -> bytes:
+    compressor = zlib.compressobj()
+    chunks = []
+    for piggybacked_host, data in raw_data.items():
+        name = piggybacked_host.encode("utf-8")
+        chunks.append(compressor.compress(_FRAME_HEADER.pack(len(name), len(data)) + name))
+        chunks.append(compressor.compress(data))
+    chunks.append(compressor.flush())
+    return b"".join(chunks)
+
+
+def decode_raw_data(compressed_raw_data: bytes) -> Mapping[HostName, Sequence[bytes]]:
+    framed = zlib.decompress(compressed_raw_data)
+    raw_data: dict[HostName, Sequence[bytes]] = {}
+    offset = 0
+    while offset < len(framed):
+        name_length, data_length = _FRAME_HEADER.unpack_from(framed, offset)
+        offset += _FRAME_HEADER.size
+        piggybacked_host = HostName.parse(framed[offset : offset + name_length].decode("utf-8"))
+        offset += name_length
+        raw_data[piggybacked_host] = (framed[offset : offset + data_length],)
+        offset += data_length
+    return raw_data
+
+
+def make_batches(
+    messages: Iterable[tuple[str, PiggybackMessage]],
+) -> Iterator[tuple[str, PiggybackPayloadBatch]]:
+    """Group the messages by destination site, source host and time stamps"""
+    groups: dict[tuple[str, HostName, int, int | None], list[PiggybackMessage]] = {}
+    for site_id, message in messages:
+        groups.setdefault(
+            (site_id, message.meta.source, message.meta.last_update, message.meta.last_contact),
+            [],
+        ).append(message)
+    for (site_id, *_source_and_time_stamps), group in groups.items():
+        yield site_id, PiggybackPayloadBatch.from_messages(group)
+
+
+def publish_messages(
+    logger: logging.Logger,
+    task_name: str,
+    *,
+    payload_channel: Channel[PiggybackPayload],
+    batch_channel: Channel[PiggybackPayloadBatch],
+    messages: Sequence[tuple[str, PiggybackMessage]],
+    batching_sites: Container[str],
+) -> None:
+    """Publish the messages to their destination sites
+
+    Sites not known to receive batches get one payload per message.
+    """
+    for site_id, batch in make_batches(
+        (site_id, message) for site_id, message in messages if site_id in batching_sites
+    ):
+        logger.debug(
+            "%s: from host '%s' to site '%s'", task_name.title(), batch.source_host, site_id
+        )
+        batch_channel.publish_for_site(site_id, batch, routing=PAYLOAD_BATCH_ROUTE)
+
+    for site_id, message in messages:
+        if site_id in batching_sites:
+            continue
+        logger.debug(
+            "%s: from host '%s' to host '%s' on site '%s'",
+            task_name.title(),
+            message.meta.source,
+            message.meta.piggybacked,
+            site_id,
+        )
+        payload_channel.publish_for_site(
+            site_id, PiggybackPayload.from_message(message), routing=PAYLOAD_ROUTE
+        )
+
+
 def save_payload_on_message(
     logger: logging.Logger,
     omd_root: Path,
@@ -66,6 +185,33 @@ def save_payload_on_message(
     return _on_message
 
 
+def save_payload_batch_on_message(
+    logger: logging.Logger,
+    omd_root: Path,
+) -> Callable[[Channel[PiggybackPayloadBatch], DeliveryTag, PiggybackPayloadBatch], None]:
+    def _on_message(
+        channel: Channel[PiggybackPayloadBatch],
+        delivery_tag: DeliveryTag,
+        received: PiggybackPayloadBatch,
+    ) -> None:
+        raw_data = received.raw_data()
+        logger.debug(
+            "Received payload for %d piggybacked hosts from source host '%s'",
+            len(raw_data),
+            received.source_host,
+        )
+        store_piggyback_raw_data(
+            source_hostname=received.source_host,
+            piggybacked_raw_data=raw_data,
+            message_timestamp=received.message_timestamp,
+            contact_timestamp=received.contact_timestamp,
+            omd_root=omd_root,
+        )
+        channel.acknowledge(delivery_tag)
+
+    return _on_message
+
+
 class SendingPayloadProcess(multiprocessing.Process):
     def __init__(
         self,
@@ -80,7 +226,9 @@ class SendingPayloadProcess(multiprocessing.Process):
         self.site = omd_root.name
         self.reload_config = reload_config
         self.crash_report_callback = crash_report_callback
-        self.task_name = "publishing on queue 'payload'"
+        self.task_name = (
+            f"publishing on queues '{PAYLOAD_QUEUE.value}' and '{PAYLOAD_BATCH_QUEUE.value}'"
+        )
 
     def run(self) -> None:
         self.logger.info("Starting: %s", self.task_name)
@@ -92,21 +240,26 @@ class SendingPayloadProcess(multiprocessing.Process):
         config = load_config(self.omd_root)
         self.logger.debug("Loaded configuration: %r", config)
 
-        failed_message = None
+        failed_messages = None
         try:
             while True:
                 with make_connection(self.omd_root, self.site, self.logger, self.task_name) as conn:
                     try:
-                        channel = conn.channel(PiggybackPayload)
-                        if failed_message is not None:
+                        payload_channel = conn.channel(PiggybackPayload)
+                        batch_channel = conn.channel(PiggybackPayloadBatch)
+                        if failed_messages is not None:
                             # Retry in case the first time the channel was not available after make_connection
-                            self._handle_message(channel, config, failed_message)
-                            failed_message = None
-                        for piggyback_message in watch_new_messages(self.omd_root):
+                            self._handle_messages(
+                                payload_channel, batch_channel, config, failed_messages
+                            )
+                            failed_messages = None
+                        for piggyback_messages in watch_new_message_batches(self.omd_root):
                             config = self._check_for_config_reload(config)
-                            self._handle_message(channel, config, piggyback_message)
+                            self._handle_messages(
+                                payload_channel, batch_channel, config, piggyback_messages
+                            )
                     except CMKConnectionError as exc:
-                        failed_message = piggyback_message
+                        failed_messages = piggyback_messages
                         self.logger.info("Reconnecting: %s: %s", self.task_name, exc)
         except CMKConnectionError:
             self.logger.exception("Connection error: %s", self.task_name)
@@ -117,24 +270,25 @@ class SendingPayloadProcess(multiprocessing.Process):
             self.logger.error(crash_report_msg)  # noqa: TRY400
             raise
 
-    def _handle_message(
+    def _handle_messages(
         self,
-        channel: Channel[PiggybackPayload],
+        payload_channel: Channel[PiggybackPayload],
+        batch_channel: Channel[PiggybackPayloadBatch],
         config: PiggybackHubConfig,
-        message: PiggybackMessage,
+        messages: Sequence[PiggybackMessage],
     ) -> None:
-        if (site_id := config.locations.get(message.meta.piggybacked, self.site)) == self.site:
-            return
-
-        self.logger.debug(
-            "%s: from host '%s' to host '%s' on site '%s'",
-            self.task_name.title(),
-            message.meta.source,
-            message.meta.piggybacked,
-            site_id,
-        )
-        channel.publish_for_site(
-            site_id, PiggybackPayload.from_message(message), routing=RoutingKey("payload")
+        publish_messages(
+            self.logger,
+            self.task_name,
+            payload_channel=payload_channel,
+            batch_channel=batch_channel,
+            messages=[
+                (site_id, message)
+                for message in messages
+                if (site_id := config.locations.get(message.meta.piggybacked, self.site))
+                != self.site
+            ],
+            batching_sites=config.batching_sites,
         )
 
     def _check_for_config_reload(self, current_config: PiggybackHubConfig) -> PiggybackHubConfig:
@@ -151,27 +305,27 @@ def send_messages_oneshot(
     omd_root: Path,
     omd_site: str,
     targets: Mapping[HostName, str],
+    batching_sites: Container[str],
 ) -> None:
     task_name = "sending oneshot messages"
     logger.info("Starting: %s", task_name)
 
-    hub_payloads = [
-        (site_id, PiggybackPayload.from_message(message))
+    messages = [
+        (site_id, message)
         for host, site_id in targets.items()
         for message in get_messages_for(host, omd_root)
     ]
 
     try:
         with make_connection(omd_root, omd_site, logger, task_name) as conn:
-            channel = conn.channel(PiggybackPayload)
-            for site, payload in hub_payloads:
-                logger.debug(
-                    "%s: to site '%s' for host '%s'",
-                    task_name.title(),
-                    site,
-                    ",".join(payload.raw_data),  # it's only one.
-                )
-                channel.publish_for_site(site, payload, routing=RoutingKey("payload"))
+            publish_messages(
+                logger,
+                task_name,
+                payload_channel=conn.channel(PiggybackPayload),
+                batch_channel=conn.channel(PiggybackPayloadBatch),
+                messages=messages,
+                batching_sites=batching_sites,
+            )
 
     except CMKConnectionError:
         logger.exception("Connection error: %s", task_name)
@@ -9,7 +9,10 @@ from __future__ import annotations
 
 import enum
 import ipaddress
+import queue
 import socket
+import threading
+import time
 from collections.abc import (
     Callable,
     Container,
@@ -19,7 +22,7 @@ from collections.abc import (
     MutableMapping,
     Sequence,
 )
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from typing import Any, assert_never, Final, Literal, Protocol
 
@@ -398,22 +401,61 @@ class IPLookupCacheSerializer:
         }
 
 
+_FAMILY_NUMBERS: Final[Mapping[SupportedAddressFamily, str]] = {
+    socket.AddressFamily.AF_INET: "4",
+    socket.AddressFamily.AF_INET6: "6",
+}
+_FAMILIES_BY_NUMBER: Final[Mapping[str, SupportedAddressFamily]] = {
+    "4": socket.AddressFamily.AF_INET,
+    "6": socket.AddressFamily.AF_INET6,
+}
+
+
+def _serialize_journal_entry(cache_id: IPLookupCacheId, ipa: HostAddress) -> bytes:
+    host_name, family = cache_id
+    return f"{host_name} {_FAMILY_NUMBERS[family]} {ipa}\n".encode()
+
+
+def _deserialize_journal(raw: bytes) -> Mapping[IPLookupCacheId, HostAddress]:
+    entries: dict[IPLookupCacheId, HostAddress] = {}
+    for line in raw.decode().splitlines():
+        try:
+            host_name, family, ipa = line.split(" ")
+            entries[(HostName(host_name), _FAMILIES_BY_NUMBER[family])] = HostAddress(ipa)
+        except (KeyError, ValueError):
+            continue  # incomplete line of an interrupted write
+    return entries
+
+
 class IPLookupCache:
+    """The persisted lookup cache
+
+    Single updates are appended to a journal next to the cache file. Appending a line
+    needs no lock, so concurrent check helpers do not wait for each other. The journal
+    is merged into the cache file once it has grown beyond JOURNAL_MERGE_SIZE.
+    """
+
     PATH = cmk.utils.paths.var_dir / "ipaddresses.cache"
+    JOURNAL_MERGE_SIZE = 64 * 1024
+
+    # Shared by all instances: During the bulk update, the lookups create their own
+    # instances of the cache.
+    _persist_on_update = True
 
     def __init__(self, cache: MutableMapping[IPLookupCacheId, HostAddress]) -> None:
         self._cache = cache
-        self._persist_on_update = True
         self._store = store.ObjectStore(self.PATH, serializer=IPLookupCacheSerializer())
+        self._journal_path = self.PATH.with_name(f"{self.PATH.name}.journal")
 
     @contextmanager
     def persisting_disabled(self) -> Iterator[None]:
-        old_persist_flag = self._persist_on_update
-        self._persist_on_update = False
+        cls = type(self)
+        old_persist_flag = cls._persist_on_update
+        cls._persist_on_update = False
         try:
             yield
         finally:
-            self._persist_on_update = old_persist_flag
+            cls._persist_on_update = old_persist_flag
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self._cache!r})"
@@ -433,6 +475,7 @@ class IPLookupCache:
     def load_persisted(self) -> None:
         try:
             self._cache.update(self._store.read_obj(default={}))
+            self._cache.update(self._read_journal())
         except (MKTerminate, MKTimeout):
             # We should be more specific with the exception handler below, then we
             # could drop this special handling here
@@ -447,32 +490,53 @@ class IPLookupCache:
         """Updates the cache with a new / changed entry
 
         When self.persist_on_update update is disabled, this simply updates the in-memory
-        cache without any persistence interaction. Otherwise:
-
-        The cache that was previously loaded into this IPLookupCache with load_persisted()
-        might be outdated compared to the current persisted lookup cache. Another process
-        might have updated the cache in the meantime.
-
-        The approach here is to load the currently persisted cache with a lock, then update
-        the current IPLookupCache with it, add the given new / changed entry and then write
-        out the resulting data structure.
-
-        This could really be solved in a better way, but may be sufficient for the moment.
+        cache without any persistence interaction. Otherwise the entry is appended to the
+        journal, and the journal is merged into the cache file if it has become too large.
 
         The cache can only be cleaned up with the "Update DNS cache" option in WATO
         or the "cmk --update-dns-cache" call that both call update_dns_cache().
         """
+        self._cache[cache_id] = ipa
         if not self._persist_on_update:
-            self._cache[cache_id] = ipa
             return
 
+        with self._journal_path.open("ab") as journal:
+            journal.write(_serialize_journal_entry(cache_id, ipa))
+            journal_size = journal.tell()
+
+        if journal_size > self.JOURNAL_MERGE_SIZE:
+            self.merge_journal()
+
+    def merge_journal(self) -> None:
+        """Merge the journal into the cache file
+
+        The cache that was previously loaded into this IPLookupCache with load_persisted()
+        might be outdated compared to the persisted lookup cache, as other processes might
+        have updated it in the meantime. So the persisted cache and the journal are loaded
+        with a lock, added to the current IPLookupCache, and the result is written out.
+
+        Entries appended by other processes while the journal is merged may get lost. They
+        are simply looked up again.
+        """
         with self._store.locked():
             self._cache.update(self._store.read_obj(default={}))
-            self._cache[cache_id] = ipa
-            self.save_persisted()
+            self._cache.update(self._read_journal())
+            self._store.write_obj(self._cache)
+            self._remove_journal()
+
+    def _read_journal(self) -> Mapping[IPLookupCacheId, HostAddress]:
+        try:
+            return _deserialize_journal(self._journal_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+
+    def _remove_journal(self) -> None:
+        with suppress(FileNotFoundError):
+            self._journal_path.unlink()
 
     def save_persisted(self) -> None:
         self._store.write_obj(self._cache)
+        self._remove_journal()
 
     def clear(self) -> None:
         """Clear the persisted AND in memory cache"""
@@ -496,7 +560,14 @@ def update_dns_cache(
     hosts: Iterable[HostName],
     get_ip_stack_config: Callable[[HostName], IPStackConfig],
     lookup_ip_address: IPLookup,
+    max_workers: int = 1,
+    lookup_timeout: float | None = None,
 ) -> tuple[int, Sequence[HostName]]:
+    """Renew the persisted lookup cache for the given hosts
+
+    With more than one worker the lookups are done concurrently. A lookup that did not
+    return after lookup_timeout seconds is reported as failed.
+    """
     failed = []
 
     ip_lookup_cache = _get_ip_lookup_cache()
@@ -507,32 +578,126 @@ def update_dns_cache(
 
         console.verbose("Updating DNS cache...")
         # `_annotate_family()` handles DUAL_STACK and NO_IP
-        for host_name, family in _annotate_family(hosts, get_ip_stack_config):
-            console.verbose_no_lf(f"{host_name} ({family})...")
-            try:
-                ip = lookup_ip_address(host_name, family)
-                console.verbose(f"{ip}")
-
-            except (MKTerminate, MKTimeout):
-                # We should be more specific with the exception handler below, then we
-                # could drop this special handling here
-                raise
-            except MKIPAddressLookupError as e:
-                failed.append(host_name)
-                console.verbose(f"lookup failed: {e}")
-                continue
-            except Exception as e:
-                failed.append(host_name)
-                console.verbose(f"lookup failed: {e}")
-                if cmk.ccc.debug.enabled():
-                    raise
+        lookups = _annotate_family(hosts, get_ip_stack_config)
+        for host_name, family, result in (
+            _lookup_sequentially(lookups, lookup_ip_address)
+            if max_workers == 1
+            else _lookup_concurrently(
+                lookups, lookup_ip_address, max_workers=max_workers, timeout=lookup_timeout
+            )
+        ):
+            if not isinstance(result, Exception):
+                console.verbose(f"{host_name} ({family})...{result}")
                 continue
 
+            failed.append(host_name)
+            console.verbose(f"{host_name} ({family})...lookup failed: {result}")
+            if not isinstance(result, MKIPAddressLookupError) and cmk.ccc.debug.enabled():
+                raise result
+
     ip_lookup_cache.save_persisted()
 
     return len(ip_lookup_cache), failed
 
 
+def _lookup_sequentially(
+    lookups: Iterable[tuple[HostName, SupportedAddressFamily]],
+    lookup_ip_address: IPLookup,
+) -> Iterator[tuple[HostName, SupportedAddressFamily, HostAddress | Exception]]:
+    for host_name, family in lookups:
+        yield host_name, family, _lookup_or_error(lookup_ip_address, host_name, family)
+
+
+def _lookup_concurrently(
+    lookups: Iterable[tuple[HostName, SupportedAddressFamily]],
+    lookup_ip_address: IPLookup,
+    *,
+    max_workers: int,
+    timeout: float | None,
+) -> Iterator[tuple[HostName, SupportedAddressFamily, HostAddress | Exception]]:
+    """Look up the addresses in worker threads and yield the results as they come in
+
+    A lookup can not be interrupted. When it times out, it is reported as failed and
+    its worker is left alone until the lookup returns. The workers are daemon threads,
+    so a hanging lookup does not keep the process from exiting.
+    """
+    todo: queue.SimpleQueue[tuple[HostName, SupportedAddressFamily] | None] = queue.SimpleQueue()
+    results: queue.SimpleQueue[tuple[HostName, SupportedAddressFamily, HostAddress | Exception]] = (
+        queue.SimpleQueue()
+    )
+    started: dict[tuple[HostName, SupportedAddressFamily], float] = {}
+    stopped = threading.Event()
+
+    def work() -> None:
+        while not stopped.is_set() and (lookup_id := todo.get()) is not None:
+            started[lookup_id] = time.monotonic()
+            result: HostAddress | Exception
+            try:
+                result = lookup_ip_address(*lookup_id)
+            except Exception as e:
+                # Including MKTerminate and MKTimeout, which are raised by the main thread
+                result = e
+            del started[lookup_id]
+            results.put((*lookup_id, result))
+
+    n_pending = 0
+    for lookup_id in lookups:
+        todo.put(lookup_id)
+        n_pending += 1
+    n_workers = min(max_workers, n_pending)
+    for _n in range(n_workers):
+        todo.put(None)
+    for n in range(n_workers):
+        threading.Thread(target=work, name=f"dns-lookup_{n}", daemon=True).start()
+
+    try:
+        timed_out: set[tuple[HostName, SupportedAddressFamily]] = set()
+        while n_pending > len(timed_out):
+            try:
+                host_name, family, result = results.get(timeout=timeout)
+            except queue.Empty:
+                assert timeout is not None
+                now = time.monotonic()
+                for host_name, family in [
+                    lookup_id
+                    for lookup_id, start in list(started.items())
+                    if now - start > timeout and lookup_id not in timed_out
+                ]:
+                    timed_out.add((host_name, family))
+                    yield (
+                        host_name,
+                        family,
+                        MKIPAddressLookupError(
+                            f"Lookup of {FAMILY_NAMES[family]} address of {host_name} timed out"
+                        ),
+                    )
+                continue
+
+            if isinstance(result, MKTerminate | MKTimeout):
+                raise result
+            if (host_name, family) in timed_out:
+                timed_out.discard((host_name, family))
+            else:
+                yield host_name, family, result
+            n_pending -= 1
+    finally:
+        # Lookups which have not started yet are skipped
+        stopped.set()
+
+
+def _lookup_or_error(
+    lookup_ip_address: IPLookup, host_name: HostName, family: SupportedAddressFamily
+) -> HostAddress | Exception:
+    try:
+        return lookup_ip_address(host_name, family)
+    except (MKTerminate, MKTimeout):
+        # We should be more specific with the exception handler below, then we
+        # could drop this special handling here
+        raise
+    except Exception as e:
+        return e
+
+
 def _annotate_family(
     hosts: Iterable[HostName],
     get_ip_stack_config: Callable[[HostName], IPStackConfig],
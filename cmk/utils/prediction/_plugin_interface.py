@@ -7,6 +7,7 @@
 # mypy: disable-error-code="unreachable"
 
 import logging
+import zlib
 from collections.abc import Callable, Mapping
 from typing import assert_never, Literal
 
@@ -25,6 +26,12 @@ EstimatedLevels = tuple[tuple[float, float] | None, tuple[float, float] | None]
 
 logger = logging.getLogger("cmk.prediction")
 
+# The predictions of the next day are computed during this time before midnight
+PRECOMPUTATION_PERIOD = 3 * 3600
+
+# Ensures to hit the next day from the end of a valid interval, even if it has 25 hours
+_DST_MARGIN = 2 * 3600
+
 
 def make_updated_predictions(
     store: PredictionStore,
@@ -32,12 +39,16 @@ def make_updated_predictions(
     now: float,
 ) -> Mapping[int, tuple[float | None, tuple[float, float] | None]]:
     store.remove_outdated_predictions(now)
-    return {
+    valid_predictions = list(store.iter_all_valid_predictions(now))
+    predictions = {
         hash(meta): _make_reference_and_prediction(
             meta, valid_prediction or _update_prediction(store, meta, get_recorded_data, now), now
         )
-        for meta, valid_prediction in store.iter_all_valid_predictions(now)
+        for meta, valid_prediction in valid_predictions
     }
+    for meta, _valid_prediction in valid_predictions:
+        _precompute_next_prediction(store, meta, get_recorded_data, now)
+    return predictions
 
 
 def _make_reference_and_prediction(
@@ -70,12 +81,53 @@ def _update_prediction(
         meta.params.period,
         meta.valid_interval[0],
     )
-    if (prediction := compute_prediction(meta, get_recorded_data, now)) is None:
+    if (
+        prediction := compute_prediction(
+            meta, get_recorded_data, now, store.slice_cache(meta.metric)
+        )
+    ) is None:
         return None
     store.save_prediction(meta, prediction)
     return prediction
 
 
+def _precompute_next_prediction(
+    store: PredictionStore,
+    meta: PredictionInfo,
+    get_recorded_data: Callable[[str, int, int], MetricRecord | None],
+    now: float,
+) -> None:
+    """Compute the prediction of the next day in advance
+
+    Otherwise all predictions would be computed right after midnight. The time of the
+    computation is spread over the last hours of the day by host, service and metric.
+    """
+    next_meta = PredictionInfo.make(
+        meta.metric, meta.direction, meta.params, meta.valid_interval[1] + _DST_MARGIN
+    )
+    next_start = next_meta.valid_interval[0]
+    offset = zlib.crc32(f"{store.path}/{meta.metric}".encode()) % PRECOMPUTATION_PERIOD
+    if now < next_start - PRECOMPUTATION_PERIOD + offset or store.has_prediction(next_meta):
+        return
+
+    logger.log(
+        VERBOSE,
+        "Precomputing prediction %s / %s / %s",
+        next_meta.metric,
+        next_meta.params.period,
+        next_start,
+    )
+    if (
+        prediction := compute_prediction(
+            next_meta, get_recorded_data, now, store.slice_cache(meta.metric)
+        )
+    ) is None:
+        return
+    # The info file must not be younger than the data file, or the prediction is outdated.
+    store.save_prediction_info(next_meta)
+    store.save_prediction(next_meta, prediction)
+
+
 def estimate_levels(
     reference_value: float,
     stdev: float | None,
@@ -4,11 +4,11 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 import logging
-import math
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import Literal, NamedTuple, Protocol, Self
+from typing import Literal, NamedTuple, Protocol
 
+import numpy as np
 from pydantic import BaseModel
 
 from cmk.agent_based.prediction_backend import PredictionInfo
@@ -18,6 +18,7 @@ from ..misc import pnp_cleanup
 from ..paths import predictions_dir
 from ..servicename import ServiceName
 from ._grouping import time_slices
+from ._slice_cache import FloatArray, SliceCache
 
 logger = logging.getLogger("cmk.prediction")
 
@@ -27,6 +28,9 @@ LevelsSpec = tuple[Literal["absolute", "relative", "stdev"], tuple[float, float]
 
 _DAY = 86400
 
+# The time after its end from which on a slice is complete
+_SLICE_SETTLING_TIME = 3600
+
 
 class MetricRecord(Protocol):
     @property
@@ -42,17 +46,6 @@ class DataStat(NamedTuple):
     max_: float
     stdev: float | None
 
-    @classmethod
-    def from_values(cls, values: Sequence[float]) -> Self:
-        """Statistically summarize all the measured values"""
-        average = sum(values) / float(len(values))
-        return cls(
-            average=average,
-            min_=min(values),
-            max_=max(values),
-            stdev=_std_dev(values, average),
-        )
-
 
 class PredictionData(BaseModel, frozen=True):
     points: list[DataStat | None]
@@ -70,6 +63,7 @@ class PredictionData(BaseModel, frozen=True):
 class PredictionStore:
     DATA_FILE_SUFFIX = ""
     INFO_FILE_SUFFIX = ".info"
+    SLICE_CACHE_FILE = "slices.npz"
     NAME_TEMPLATE = "{meta.metric}/{meta.params.period}-{meta.valid_interval[0]}-{meta.direction}"
     RETENTION = {
         "wday": 7 * _DAY,
@@ -110,6 +104,20 @@ class PredictionStore:
             if metric in prediction_file.parts
         )
 
+    def _info_file(self, meta: PredictionInfo) -> Path:
+        return self.path / f"{self.NAME_TEMPLATE.format(meta=meta)}{self.INFO_FILE_SUFFIX}"
+
+    def slice_cache(self, metric: str) -> SliceCache:
+        return SliceCache(self.path / metric / self.SLICE_CACHE_FILE)
+
+    def has_prediction(self, meta: PredictionInfo) -> bool:
+        return self._data_file(meta).exists()
+
+    def save_prediction_info(self, meta: PredictionInfo) -> None:
+        info_file = self._info_file(meta)
+        info_file.parent.mkdir(exist_ok=True, parents=True)
+        info_file.write_text(meta.model_dump_json(), encoding="utf8")
+
     def save_prediction(self, meta: PredictionInfo, prediction: PredictionData) -> None:
         data_file = self._data_file(meta)
         data_file.parent.mkdir(exist_ok=True, parents=True)
@@ -128,6 +136,10 @@ class PredictionStore:
                 info_path.unlink(missing_ok=True)
                 info_path.with_suffix(self.DATA_FILE_SUFFIX).unlink(missing_ok=True)
 
+        for slice_cache_path in self.path.glob(f"*/{self.SLICE_CACHE_FILE}"):
+            if not any(slice_cache_path.parent.glob(f"*{self.INFO_FILE_SUFFIX}")):
+                slice_cache_path.unlink(missing_ok=True)
+
     def iter_all_valid_predictions(
         self, now: float
     ) -> Iterator[tuple[PredictionInfo, PredictionData | None]]:
@@ -156,23 +168,42 @@ def compute_prediction(
     info: PredictionInfo,
     get_recorded_data: Callable[[str, int, int], MetricRecord | None],
     now: float,
+    slice_cache: SliceCache | None = None,
 ) -> PredictionData | None:
+    """Compute the prediction for now or, if it is computed in advance, its start
+
+    With a slice cache only the slices which have not been fetched before are fetched.
+    """
+    horizon_seconds = info.params.horizon * 86400
     time_windows = time_slices(
-        int(now),
-        info.params.horizon * 86400,
+        max(int(now), info.valid_interval[0]),
+        horizon_seconds,
         info.params.period,
     )
 
     from_time = time_windows[0][0]
     raw_slices = [
         (
-            response.window,
-            response.values,
+            window,
+            values,
             from_time - start,
         )
         for start, end in time_windows
-        if (response := get_recorded_data(f"{info.metric}.max", start, end))
+        if (
+            recorded := _get_recorded_slice(
+                info.metric,
+                (start, end),
+                get_recorded_data,
+                now,
+                slice_cache,
+                needed_until=end + horizon_seconds,
+            )
+        )
+        is not None
+        for window, values in [recorded]
     ]
+    if slice_cache is not None:
+        slice_cache.save(now)
 
     return (
         _calculate_data_for_prediction(raw_slices[0][0], raw_slices)
@@ -185,16 +216,37 @@ def compute_prediction(
     )
 
 
+def _get_recorded_slice(
+    metric: str,
+    interval: tuple[int, int],
+    get_recorded_data: Callable[[str, int, int], MetricRecord | None],
+    now: float,
+    slice_cache: SliceCache | None,
+    *,
+    needed_until: int,
+) -> tuple[range, FloatArray] | None:
+    if slice_cache is not None and (cached := slice_cache.get(interval, needed_until)) is not None:
+        return cached
+    if (response := get_recorded_data(f"{metric}.max", *interval)) is None:
+        return None
+
+    values = np.array(response.values, dtype=np.float64)
+    # Late check results may still be written to the slice for a while after it has ended
+    if slice_cache is not None and interval[1] + _SLICE_SETTLING_TIME <= now:
+        slice_cache.add(interval, response.window, values, needed_until)
+    return response.window, values
+
+
 def _calculate_data_for_prediction(
     youngest_range: range,
-    raw_slices: Sequence[tuple[range, Sequence[float | None], int]],
+    raw_slices: Sequence[tuple[range, Sequence[float | None] | FloatArray, int]],
 ) -> PredictionData:
     # Upsample all time slices to same resolution
     # We assume that the youngest slice has the finest resolution.
     slices = [
         _forward_fill_resample(
             current_range,
-            values,
+            np.asarray(values, dtype=np.float64),
             range(youngest_range.start - shift, youngest_range.stop - shift, youngest_range.step),
         )
         for current_range, values, shift in raw_slices
@@ -208,33 +260,49 @@ def _calculate_data_for_prediction(
 
 
 def _forward_fill_resample(
-    current_range: range, values: Sequence[float | None], new_range: range
-) -> Sequence[float | None]:
+    current_range: range, values: FloatArray, new_range: range
+) -> FloatArray:
     if current_range == new_range:
         return values
+    if not len(values):
+        return np.full(len(new_range), np.nan)
 
-    idx_max = len(values) - 1
-    return [
-        values[max(0, min(int((t - current_range.start) / current_range.step), idx_max))]
-        for t in new_range
-    ]
+    timestamps = np.arange(new_range.start, new_range.stop, new_range.step, dtype=np.int64)
+    indices = np.trunc((timestamps - current_range.start) / current_range.step).astype(np.int64)
+    return values[np.clip(indices, 0, len(values) - 1)]
 
 
-def _data_stats(slices: Iterable[Iterable[float | None]]) -> list[DataStat | None]:
+def _data_stats(slices: Sequence[Sequence[float | None] | FloatArray]) -> list[DataStat | None]:
     "Statistically summarize all the upsampled RRD data"
-    return [  # can't inline this b/c it is unit tested :-/
+    length = min((len(values) for values in slices), default=0)
+    columns = np.array([values[:length] for values in slices], dtype=np.float64).reshape(
+        len(slices), length
+    )
+    present = ~np.isnan(columns)
+    counts = present.sum(axis=0)
+    present_values = np.where(present, columns, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        averages = present_values.sum(axis=0) / counts
+        # In the case of a single data-point an unbiased standard deviation is undefined.
+        stdevs = np.sqrt(
+            np.abs((present_values**2).sum(axis=0) - averages**2 * counts) / (counts - 1)
+        )
+    return [
         (
-            DataStat.from_values(point_line)
-            if (point_line := [x for x in time_column if x is not None])
+            DataStat(
+                average=average,
+                min_=min_,
+                max_=max_,
+                stdev=None if count == 1 else stdev,
+            )
+            if count
             else None
         )
-        for time_column in zip(*slices)
+        for count, average, min_, max_, stdev in zip(
+            counts.tolist(),
+            averages.tolist(),
+            np.fmin.reduce(columns, axis=0, initial=np.nan).tolist(),
+            np.fmax.reduce(columns, axis=0, initial=np.nan).tolist(),
+            stdevs.tolist(),
+        )
     ]
-
-
-def _std_dev(point_line: Sequence[float], average: float) -> float | None:
-    samples = len(point_line)
-    # In the case of a single data-point an unbiased standard deviation is undefined.
-    if samples == 1:
-        return None
-    return math.sqrt(abs(sum(p**2 for p in point_line) - average**2 * samples) / float(samples - 1))
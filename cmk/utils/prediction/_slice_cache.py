@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+import io
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from cmk.ccc import store
+
+logger = logging.getLogger("cmk.prediction")
+
+type FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class _CachedSlice:
+    window: range
+    values: FloatArray
+    needed_until: int
+
+
+class SliceCache:
+    """The recorded data of the past time slices of one metric
+
+    The data of a slice which has ended does not change any more, so it is fetched only once
+    and kept as long as a prediction may need it. A new prediction only fetches the youngest
+    slices, the others are taken from here.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._slices = _load(path)
+        self._changed = False
+
+    def get(self, interval: tuple[int, int], needed_until: int) -> tuple[range, FloatArray] | None:
+        if (cached := self._slices.get(interval)) is None:
+            return None
+        if needed_until > cached.needed_until:
+            self._slices[interval] = _CachedSlice(cached.window, cached.values, needed_until)
+            self._changed = True
+        return cached.window, cached.values
+
+    def add(
+        self, interval: tuple[int, int], window: range, values: FloatArray, needed_until: int
+    ) -> None:
+        self._slices[interval] = _CachedSlice(window, values, needed_until)
+        self._changed = True
+
+    def save(self, now: float) -> None:
+        """Drop the slices which are not needed any longer and save the others"""
+        if expired := [
+            interval for interval, cached in self._slices.items() if cached.needed_until < now
+        ]:
+            for interval in expired:
+                del self._slices[interval]
+            self._changed = True
+        if not self._changed:
+            return
+
+        cached_slices = list(self._slices.items())
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            intervals=np.array([interval for interval, _cached in cached_slices], dtype=np.int64),
+            windows=np.array(
+                [
+                    (cached.window.start, cached.window.stop, cached.window.step)
+                    for _interval, cached in cached_slices
+                ],
+                dtype=np.int64,
+            ),
+            needed_until=np.array(
+                [cached.needed_until for _interval, cached in cached_slices], dtype=np.int64
+            ),
+            lengths=np.array(
+                [len(cached.values) for _interval, cached in cached_slices], dtype=np.int64
+            ),
+            values=np.concatenate(
+                [np.empty(0)] + [cached.values for _interval, cached in cached_slices]
+            ),
+        )
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        store.save_bytes_to_file(self._path, buffer.getvalue())
+        self._changed = False
+
+
+def _load(path: Path) -> dict[tuple[int, int], _CachedSlice]:
+    if not (raw := store.load_bytes_from_file(path, default=b"")):
+        return {}
+    try:
+        with np.load(io.BytesIO(raw), allow_pickle=False) as data:
+            intervals = data["intervals"].reshape(-1, 2).tolist()
+            windows = data["windows"].reshape(-1, 3).tolist()
+            needed_until = data["needed_until"].tolist()
+            values = np.split(data["values"], np.cumsum(data["lengths"])[:-1])
+    except Exception as e:
+        logger.warning("Ignoring unreadable slice cache %s: %s", path, e)
+        return {}
+    return {
+        (start, end): _CachedSlice(range(*window), slice_values, slice_needed_until)
+        for (start, end), window, slice_needed_until, slice_values in zip(
+            intervals, windows, needed_until, values
+        )
+    }
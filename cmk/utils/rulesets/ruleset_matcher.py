@@ -388,11 +388,6 @@ class RulesetOptimizer:
         # is enabled.
         self._all_processed_hosts = self._all_configured_hosts
 
-        # A factor which indicates how much hosts share the same host tag configuration (excluding folders).
-        # len(all_processed_hosts) / len(different tag combinations)
-        # It is used to determine the best rule evualation method
-        self._all_processed_hosts_similarity = 1.0
-
         self.__service_ruleset_cache: dict[
             tuple[int, bool], Sequence[_PreprocessedServiceRule[Any]]
         ] = {}
@@ -403,13 +398,13 @@ class RulesetOptimizer:
 
         # Reference dirname -> hosts in this dir including subfolders
         self._folder_host_lookup: dict[tuple[bool, str], set[HostName]] = {}
+        # Reference host path -> hosts in exactly this dir
+        self._hosts_by_path: dict[bool, dict[str, set[HostName]]] = {}
 
-        # Provides a list of hosts with the same hosttags, excluding the folder
-        self._hosts_grouped_by_tags: dict[tuple[tuple[TagGroupID, TagID], ...], set[HostName]] = {}
-        # Reference hostname -> tag group reference
-        self._host_grouped_ref: dict[HostName, tuple[tuple[TagGroupID, TagID], ...]] = {}
+        # The inverted indexes used to resolve the tag and label conditions of the rules
+        self._hosts_by_tag: dict[tuple[TagGroupID, TagID | None], set[HostName]] = {}
+        self._hosts_by_label: dict[bool, dict[tuple[str, str], set[HostName]]] = {}
 
-        # TODO: Clean this one up?
         self._initialize_host_lookup()
 
     def clear_ruleset_caches(self) -> None:
@@ -419,6 +414,7 @@ class RulesetOptimizer:
     def clear_caches(self) -> None:
         self.__host_ruleset_cache.clear()
         self._all_matching_hosts_match_cache.clear()
+        self._hosts_by_label.clear()
 
     def set_all_processed_hosts(self, all_processed_hosts: set[HostName]) -> None:
         involved_clusters: set[HostName] = set()
@@ -437,23 +433,12 @@ class RulesetOptimizer:
         nodes_and_clusters.intersection_update(self._all_configured_hosts)
         self._all_processed_hosts = frozenset(nodes_and_clusters)
 
-        # The folder host lookup includes a list of all -processed- hosts within a given
-        # folder. Any update with set_all_processed hosts invalidates this cache, because
-        # the scope of relevant hosts has changed. This is -good-, since the values in this
-        # lookup are iterated one by one later on in all_matching_hosts
+        # The folder and label lookups include the -processed- hosts only. Any update with
+        # set_all_processed hosts invalidates them, because the scope of relevant hosts has
+        # changed.
         self._folder_host_lookup = {}
-
-        used_groups = {
-            self._host_grouped_ref.get(hostname, ()) for hostname in self._all_processed_hosts
-        }
-
-        if not used_groups:
-            self._all_processed_hosts_similarity = 1.0
-            return
-
-        self._all_processed_hosts_similarity = (
-            1.0 * len(self._all_processed_hosts) / len(used_groups)
-        )
+        self._hosts_by_path = {}
+        self._hosts_by_label = {}
 
     def get_host_ruleset[TRuleValue](
         self,
@@ -598,7 +583,8 @@ class RulesetOptimizer:
                 host_conditions,
                 tag_conditions,
                 label_conditions,
-                labels_of_host,
+                labels_of_host=labels_of_host,
+                with_foreign_hosts=with_foreign_hosts,
             ),
         )
 
@@ -608,20 +594,10 @@ class RulesetOptimizer:
         host_conditions: HostOrServiceConditions | None,
         tag_conditions: Mapping[TagGroupID, TagCondition],
         label_conditions: LabelGroups,
+        *,
         labels_of_host: Callable[[HostName], Labels],
+        with_foreign_hosts: bool,
     ) -> set[HostName]:
-        if tag_conditions and host_conditions is None and not label_conditions:
-            # TODO: Labels could also be optimized like the tags
-            matched_by_tags = self._match_hosts_by_tags(hosts_in_rule_scope, tag_conditions)
-            if matched_by_tags is not None:
-                return matched_by_tags
-
-        only_specific_hosts = (
-            host_conditions is not None
-            and not isinstance(host_conditions, dict)
-            and all(not isinstance(x, dict) for x in host_conditions)
-        )
-
         if host_conditions == []:
             return set()  # Empty host list -> Nothing matches
 
@@ -629,42 +605,38 @@ class RulesetOptimizer:
             # If no tags are specified and the hostlist only include @all (all hosts)
             return hosts_in_rule_scope
 
-        if (
-            not tag_conditions
-            and not label_conditions
-            and only_specific_hosts
-            and host_conditions is not None
-        ):
-            # If no tags are specified and there are only specific hosts we already have the matches
-            return hosts_in_rule_scope.intersection(host_conditions)
+        only_specific_hosts = (
+            host_conditions is not None
+            and not isinstance(host_conditions, dict)
+            and all(not isinstance(x, dict) for x in host_conditions)
+        )
 
         # If the rule has only exact host restrictions, we can thin out the list of hosts to check
         if only_specific_hosts and host_conditions is not None:
-            hosts_to_check = hosts_in_rule_scope.intersection(host_conditions)
+            matching = hosts_in_rule_scope.intersection(host_conditions)
         else:
-            hosts_to_check = hosts_in_rule_scope
-
-        matching: set[HostName] = set()
-        for hostname in hosts_to_check:
-            # When no tag matching is requested, do not filter by tags. Accept all hosts
-            # and filter only by hostlist
-            if tag_conditions and not matches_host_tags(
-                self._host_tags[hostname],
-                tag_conditions,
-            ):
-                continue
-
-            if label_conditions:
-                host_labels = labels_of_host(hostname)
-                if not matches_labels(host_labels, label_conditions):
-                    continue
-
-            if not matches_host_name(host_conditions, hostname):
-                continue
+            matching = hosts_in_rule_scope
+
+        if tag_conditions:
+            matching = self._match_hosts_by_tags(matching, tag_conditions)
+
+        if label_conditions:
+            matching = (
+                # Only compute the labels of the few hosts in question
+                {h for h in matching if matches_labels(labels_of_host(h), label_conditions)}
+                if only_specific_hosts
+                else _match_hosts_by_labels(
+                    matching,
+                    label_conditions,
+                    self._get_hosts_by_label(with_foreign_hosts, labels_of_host),
+                )
+            )
 
-            matching.add(hostname)
+        if only_specific_hosts or not host_conditions:
+            return matching
 
-        return matching
+        # Negated host lists and regular expressions
+        return {h for h in matching if matches_host_name(host_conditions, h)}
 
     @staticmethod
     def _condition_cache_id(
@@ -700,95 +672,130 @@ class RulesetOptimizer:
             rule_path,
         )
 
-    # TODO: Generalize this optimization: Build some kind of key out of the tag conditions
-    # (positive, negative, ...). Make it work with the new tag group based "$or" handling.
     def _match_hosts_by_tags(
         self,
         valid_hosts: set[HostName],
         tag_conditions: Mapping[TagGroupID, TagCondition],
-    ) -> set[HostName] | None:
-        matching = set()
-        negative_match_tags = set()
-        positive_match_tags = set()
+    ) -> set[HostName]:
+        """Resolve the tag conditions via the hosts of each tag, see 'matches_tag_condition'"""
+        matching = valid_hosts
         for taggroup_id, tag_condition in tag_conditions.items():
             if isinstance(tag_condition, dict):
                 if "$ne" in tag_condition:
-                    negative_match_tags.add(
-                        (
-                            taggroup_id,
-                            cast(TagConditionNE, tag_condition)["$ne"],
-                        )
+                    matching = matching - self._hosts_with_tag(
+                        taggroup_id, cast(TagConditionNE, tag_condition)["$ne"]
                     )
                     continue
 
                 if "$or" in tag_condition:
-                    return None  # Can not be optimized, makes _all_matching_hosts proceed
+                    matching = matching & set().union(
+                        *(
+                            self._hosts_with_tag(taggroup_id, tag_id)
+                            for tag_id in cast(TagConditionOR, tag_condition)["$or"]
+                        )
+                    )
+                    continue
 
                 if "$nor" in tag_condition:
-                    return None  # Can not be optimized, makes _all_matching_hosts proceed
+                    matching = matching.difference(
+                        *(
+                            self._hosts_with_tag(taggroup_id, tag_id)
+                            for tag_id in tag_condition["$nor"]
+                        )
+                    )
+                    continue
 
                 raise NotImplementedError()
 
-            positive_match_tags.add((taggroup_id, tag_condition))
-
-        # TODO:
-        # if has_specific_folder_tag or self._all_processed_hosts_similarity < 3.0:
-        if self._all_processed_hosts_similarity < 3.0:
-            # Without shared folders
-            for hostname in valid_hosts:
-                if positive_match_tags <= self._host_tags[
-                    hostname
-                ] and not negative_match_tags.intersection(self._host_tags[hostname]):
-                    matching.add(hostname)
-
-            return matching
+            matching = matching & self._hosts_with_tag(taggroup_id, tag_condition)
 
-        # With shared folders
-        checked_hosts: set[str] = set()
-        for hostname in valid_hosts:
-            if hostname in checked_hosts:
-                continue
-
-            hosts_with_same_tag = self._filter_hosts_with_same_tags_as_host(hostname, valid_hosts)
-            checked_hosts.update(hosts_with_same_tag)
+        return matching
 
-            if positive_match_tags <= self._host_tags[
-                hostname
-            ] and not negative_match_tags.intersection(self._host_tags[hostname]):
-                matching.update(hosts_with_same_tag)
+    def _hosts_with_tag(self, taggroup_id: TagGroupID, tag_id: TagID | None) -> set[HostName]:
+        return self._hosts_by_tag.get((taggroup_id, tag_id), set())
 
-        return matching
+    def _get_hosts_by_label(
+        self, with_foreign_hosts: bool, labels_of_host: Callable[[HostName], Labels]
+    ) -> Mapping[tuple[str, str], set[HostName]]:
+        if (hosts_by_label := self._hosts_by_label.get(with_foreign_hosts)) is not None:
+            return hosts_by_label
 
-    def _filter_hosts_with_same_tags_as_host(
-        self,
-        hostname: HostName,
-        hosts: set[HostName],
-    ) -> set[HostName]:
-        return self._hosts_grouped_by_tags[self._host_grouped_ref[hostname]].intersection(hosts)
+        hosts_by_label = self._hosts_by_label.setdefault(with_foreign_hosts, {})
+        for hostname in (
+            self._all_configured_hosts if with_foreign_hosts else self._all_processed_hosts
+        ):
+            for label in labels_of_host(hostname).items():
+                hosts_by_label.setdefault(label, set()).add(hostname)
+        return hosts_by_label
 
     def _get_hosts_within_folder(self, folder_path: str, with_foreign_hosts: bool) -> set[HostName]:
         cache_id = with_foreign_hosts, folder_path
         if cache_id not in self._folder_host_lookup:
-            hosts_in_folder = set()
-            relevant_hosts = (
-                self._all_configured_hosts if with_foreign_hosts else self._all_processed_hosts
+            hosts_in_folder = set().union(
+                *(
+                    hosts
+                    for host_path, hosts in self._get_hosts_by_path(with_foreign_hosts).items()
+                    if host_path.startswith(folder_path)
+                )
             )
-
-            for hostname in relevant_hosts:
-                host_path = self._host_paths.get(hostname, "/")
-                if host_path.startswith(folder_path):
-                    hosts_in_folder.add(hostname)
-
             self._folder_host_lookup[cache_id] = hosts_in_folder
             return hosts_in_folder
 
         return self._folder_host_lookup[cache_id]
 
+    def _get_hosts_by_path(self, with_foreign_hosts: bool) -> Mapping[str, set[HostName]]:
+        if (hosts_by_path := self._hosts_by_path.get(with_foreign_hosts)) is not None:
+            return hosts_by_path
+
+        hosts_by_path = self._hosts_by_path.setdefault(with_foreign_hosts, {})
+        for hostname in (
+            self._all_configured_hosts if with_foreign_hosts else self._all_processed_hosts
+        ):
+            hosts_by_path.setdefault(self._host_paths.get(hostname, "/"), set()).add(hostname)
+        return hosts_by_path
+
     def _initialize_host_lookup(self) -> None:
-        for hostname in self._all_configured_hosts:
-            group_ref = tuple(sorted(self._host_tags[hostname]))
-            self._hosts_grouped_by_tags.setdefault(group_ref, set()).add(hostname)
-            self._host_grouped_ref[hostname] = group_ref
+        for hostname, tags_of_host in self._host_tags.items():
+            for tag in tags_of_host:
+                self._hosts_by_tag.setdefault(tag, set()).add(hostname)
+
+
+def _match_hosts_by_labels(
+    valid_hosts: set[HostName],
+    required_label_groups: LabelGroups,
+    hosts_by_label: Mapping[tuple[str, str], set[HostName]],
+) -> set[HostName]:
+    """Resolve the label conditions via the hosts of each label, see 'matches_labels'
+
+    Hosts without labels are never part of the hosts of a label, so they drop out at the
+    first "and" of a group, just like in 'matches_labels'.
+    """
+    overall_match = valid_hosts
+    for group_operator, label_group in required_label_groups:
+        group_match = valid_hosts
+        for label_operator, label in label_group:
+            if not label:
+                continue
+
+            l = BaseLabel.from_str(label)
+            label_match = hosts_by_label.get((l.name, l.value), set())
+            group_match = _and_or_not_set_match(group_match, label_match, label_operator)
+
+        overall_match = _and_or_not_set_match(overall_match, group_match, group_operator)
+
+    return overall_match & valid_hosts
+
+
+def _and_or_not_set_match(
+    given_match: set[HostName], new_match: set[HostName], operator: AndOrNotLiteral
+) -> set[HostName]:
+    match operator:
+        case "and":
+            return given_match & new_match
+        case "or":
+            return given_match | new_match
+        case "not":
+            return given_match - new_match
 
 
 def _tags_cache_id(tag_or_label_spec: object) -> object:
@@ -3,23 +3,60 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+from collections.abc import Iterable, Iterator
 from enum import Enum
-from zlib import decompress
+from zlib import decompress, decompressobj
 from zlib import error as zlibError
 
+_OUTPUT_CHUNK_SIZE = 1024 * 1024
+
 
 class DecompressionError(Exception): ...
 
 
+class SizeLimitExceededError(Exception): ...
+
+
 class Decompressor(Enum):
     ZLIB = "zlib"
 
     def __call__(self, data: bytes) -> bytes:
         return {Decompressor.ZLIB: Decompressor._zlib_decompress}[self](data)
 
+    def decompress_stream(self, chunks: Iterable[bytes], *, max_size: int) -> Iterator[bytes]:
+        """Decompress the data chunk by chunk
+
+        Raises SizeLimitExceededError as soon as the decompressed data exceeds `max_size` bytes.
+        """
+        return {Decompressor.ZLIB: Decompressor._zlib_decompress_stream}[self](chunks, max_size)
+
     @staticmethod
     def _zlib_decompress(data: bytes) -> bytes:
         try:
             return decompress(data)
         except zlibError as e:
             raise DecompressionError(f"Decompression with zlib failed: {e}") from e
+
+    @staticmethod
+    def _zlib_decompress_stream(chunks: Iterable[bytes], max_size: int) -> Iterator[bytes]:
+        decompressor = decompressobj()
+        size = 0
+        try:
+            for chunk in chunks:
+                while chunk:
+                    # Limit the output per step, so a small chunk cannot blow up the memory
+                    data = decompressor.decompress(chunk, _OUTPUT_CHUNK_SIZE)
+                    chunk = decompressor.unconsumed_tail
+                    if (size := size + len(data)) > max_size:
+                        raise SizeLimitExceededError(max_size)
+                    yield data
+            data = decompressor.flush()
+        except zlibError as e:
+            raise DecompressionError(f"Decompression with zlib failed: {e}") from e
+        if not decompressor.eof:
+            raise DecompressionError(
+                "Decompression with zlib failed: incomplete or truncated stream"
+            )
+        if size + len(data) > max_size:
+            raise SizeLimitExceededError(max_size)
+        yield data
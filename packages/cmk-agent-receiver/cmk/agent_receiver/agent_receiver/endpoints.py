@@ -5,9 +5,10 @@
 
 import os
 import tempfile
+from collections.abc import Iterable, Iterator
 from functools import cache
 from pathlib import Path
-from typing import Annotated, assert_never
+from typing import Annotated, assert_never, BinaryIO
 
 from fastapi import (
     APIRouter,
@@ -21,12 +22,14 @@ from fastapi import (
 )
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from pydantic import BaseModel, UUID4, ValidationError
+from starlette.concurrency import run_in_threadpool
 from starlette.status import (
     HTTP_204_NO_CONTENT,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
+    HTTP_413_CONTENT_TOO_LARGE,
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_501_NOT_IMPLEMENTED,
 )
@@ -42,7 +45,11 @@ from cmk.agent_receiver.agent_receiver.checkmk_rest_api import (
     register,
     register_token,
 )
-from cmk.agent_receiver.agent_receiver.decompression import DecompressionError, Decompressor
+from cmk.agent_receiver.agent_receiver.decompression import (
+    DecompressionError,
+    Decompressor,
+    SizeLimitExceededError,
+)
 from cmk.agent_receiver.agent_receiver.models import (
     CertificateRenewalBody,
     ConnectionMode,
@@ -423,9 +430,17 @@ def _validate_is_allowed(credentials: HTTPBasicCredentials, uuid: UUID4) -> None
         )
 
 
+_UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+def _read_chunks(file: BinaryIO) -> Iterator[bytes]:
+    while chunk := file.read(_UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
 def _store_agent_data(
     target_dir: Path,
-    decompressed_data: bytes,
+    decompressed_data: Iterable[bytes],
 ) -> None:
     target_dir.resolve().mkdir(parents=True, exist_ok=True)
     with tempfile.NamedTemporaryFile(
@@ -433,7 +448,7 @@ def _store_agent_data(
         delete=False,
     ) as temp_file:
         try:
-            temp_file.write(decompressed_data)
+            temp_file.writelines(decompressed_data)
             os.rename(temp_file.name, target_dir / "agent_output")
         finally:
             Path(temp_file.name).unlink(missing_ok=True)
@@ -483,8 +498,15 @@ async def agent_data(
             detail=f"Unsupported compression algorithm: {compression}",
         ) from e
 
+    max_size = get_config().max_agent_data_size
     try:
-        decompressed_agent_data = decompressor(monitoring_data.file.read())
+        # Reading, decompressing and writing is done chunk by chunk in a worker thread,
+        # so large uploads neither block the event loop nor need much memory.
+        await run_in_threadpool(
+            _store_agent_data,
+            host.source_path,
+            decompressor.decompress_stream(_read_chunks(monitoring_data.file), max_size=max_size),
+        )
     except DecompressionError as e:
         logger.error(
             "uuid=%s Decompression of agent data failed: %s",
@@ -495,11 +517,16 @@ async def agent_data(
             status_code=400,
             detail="Decompression of agent data failed",
         ) from e
-
-    _store_agent_data(
-        host.source_path,
-        decompressed_agent_data,
-    )
+    except SizeLimitExceededError as e:
+        logger.error(
+            "uuid=%s Agent data exceeds the maximum size of %d bytes",
+            uuid,
+            max_size,
+        )
+        raise HTTPException(
+            status_code=HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Agent data exceeds the maximum size of {max_size} bytes",
+        ) from e
 
     logger.info(
         "uuid=%s Agent data saved",
@@ -20,6 +20,7 @@ class Config(BaseModel):
     task_ttl: float = 120.0
     max_pending_tasks_per_relay: int = 10
     socket_timeout: float = 5.0
+    max_agent_data_size: int = 128 * 1024 * 1024  # decompressed, in bytes
 
     @classmethod
     def load(cls, path: Path | None = None) -> Config:
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Load test of the agent data ingestion
+
+5000 simulated push hosts deliver their agent output to an agent receiver with a single
+worker, up to 100 of them at the same time. Every 100th host delivers a large output. The
+latencies show whether the large uploads stall the other requests.
+
+The agent receiver runs without TLS, the client injects the verified UUID header itself.
+
+$ pytest packages/cmk-agent-receiver/tests/load -s
+"""
+
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from uuid import UUID, uuid4
+from zlib import compress
+
+import httpx
+import pytest
+from tenacity import Retrying, stop_after_delay, wait_fixed
+
+from cmk.agent_receiver.lib.config import Config, get_config
+from cmk.agent_receiver.lib.mtls_auth_validator import INJECTED_UUID_HEADER
+from cmk.testlib.agent_receiver.certs import set_up_site_certs
+
+_N_HOSTS = 5000
+_CONCURRENCY = 100
+
+_SITE_ID = "NO_SITE"
+
+_AGENT_OUTPUT = compress(
+    b"".join(b"<<<section_%d>>>\n%s\n" % (n, b"value " * 100) for n in range(200))
+)
+_LARGE_AGENT_OUTPUT = compress(os.urandom(4 * 1024 * 1024) + b"<<<logwatch>>>\n" * 1000000)
+
+
+def _multipart(agent_output: bytes) -> tuple[str, bytes]:
+    request = httpx.Request(
+        "POST", "http://localhost", files={"monitoring_data": ("monitoring_data", agent_output)}
+    )
+    return request.headers["content-type"], request.read()
+
+
+@pytest.fixture(name="site_config")
+def fixture_site_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Config:
+    (site_dir := tmp_path / _SITE_ID).mkdir()
+    monkeypatch.setenv("OMD_ROOT", str(site_dir))
+    monkeypatch.setenv("OMD_SITE", _SITE_ID)
+    get_config.cache_clear()
+    config = get_config()
+    config.agent_output_dir.mkdir(parents=True)
+    config.log_path.parent.mkdir(parents=True)
+    set_up_site_certs(config=config)
+    return config
+
+
+@pytest.fixture(name="push_hosts")
+def fixture_push_hosts(site_config: Config, tmp_path: Path) -> Sequence[UUID]:
+    uuids = [uuid4() for _ in range(_N_HOSTS)]
+    for n, uuid in enumerate(uuids):
+        (target_dir := tmp_path / "push-agent" / f"host-{n}").mkdir(parents=True)
+        (site_config.agent_output_dir / str(uuid)).symlink_to(target_dir)
+    return uuids
+
+
+@pytest.fixture(name="agent_receiver_url")
+def fixture_agent_receiver_url(site_config: Config) -> Iterator[str]:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = int(sock.getsockname()[1])
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "--factory",
+            "--log-level",
+            "warning",
+            "--timeout-keep-alive",
+            "120",
+            "--port",
+            str(port),
+            "cmk.agent_receiver.main:main_app",
+        ],
+    )
+    base_url = f"http://127.0.0.1:{port}/{site_config.site_name}/agent-receiver"
+    try:
+        for attempt in Retrying(stop=stop_after_delay(60), wait=wait_fixed(0.1), reraise=True):
+            with attempt:
+                httpx.get(f"{base_url}/openapi.json").raise_for_status()
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+@pytest.mark.asyncio
+async def test_agent_data_load(agent_receiver_url: str, push_hosts: Sequence[UUID]) -> None:
+    small_upload = _multipart(_AGENT_OUTPUT)
+    large_upload = _multipart(_LARGE_AGENT_OUTPUT)
+
+    semaphore = asyncio.Semaphore(_CONCURRENCY)
+
+    async def push(client: httpx.AsyncClient, n: int, uuid: UUID) -> float:
+        content_type, body = large_upload if n % 100 == 0 else small_upload
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(
+                f"/agent_data/{uuid}",
+                headers={
+                    INJECTED_UUID_HEADER: str(uuid),
+                    "compression": "zlib",
+                    "content-type": content_type,
+                },
+                content=body,
+            )
+            assert response.status_code == 204
+            return time.perf_counter() - start
+
+    async with httpx.AsyncClient(
+        base_url=agent_receiver_url,
+        limits=httpx.Limits(max_connections=_CONCURRENCY),
+        timeout=httpx.Timeout(60.0, pool=None),
+    ) as client:
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(push(client, n, u) for n, u in enumerate(push_hosts)))
+        duration = time.perf_counter() - start
+
+    print(
+        f"\n{_N_HOSTS} hosts: {_N_HOSTS / duration:.0f} requests/s,"
+        f" median latency {statistics.median(latencies) * 1000:.1f} ms,"
+        f" p99 latency {statistics.quantiles(latencies, n=100)[98] * 1000:.1f} ms"
+    )
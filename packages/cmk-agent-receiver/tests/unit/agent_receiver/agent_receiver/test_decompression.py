@@ -10,6 +10,7 @@ import pytest
 from cmk.agent_receiver.agent_receiver.decompression import (
     DecompressionError,
     Decompressor,
+    SizeLimitExceededError,
 )
 
 
@@ -24,3 +25,26 @@ def test_zlib_decompress_round_trip() -> None:
 def test_zlib_decompress_invalid_data() -> None:
     with pytest.raises(DecompressionError):
         Decompressor._zlib_decompress(b"blablub")  # noqa: SLF001
+
+
+def test_decompress_stream_round_trip() -> None:
+    data = b"".join(b"line %d\n" % n for n in range(100000))
+    compressed = compress(data)
+    chunks = [compressed[i : i + 1000] for i in range(0, len(compressed), 1000)]
+
+    assert b"".join(Decompressor("zlib").decompress_stream(chunks, max_size=len(data))) == data
+
+
+def test_decompress_stream_size_limit() -> None:
+    with pytest.raises(SizeLimitExceededError):
+        b"".join(
+            Decompressor("zlib").decompress_stream(
+                [compress(b"x" * 10_000_000)], max_size=9_999_999
+            )
+        )
+
+
+@pytest.mark.parametrize("chunks", [[b"blablub"], [compress(b"blablub")[:-3]], []])
+def test_decompress_stream_invalid_data(chunks: list[bytes]) -> None:
+    with pytest.raises(DecompressionError):
+        b"".join(Decompressor("zlib").decompress_stream(chunks, max_size=100))
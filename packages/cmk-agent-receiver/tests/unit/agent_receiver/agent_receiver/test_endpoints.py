@@ -694,6 +694,27 @@ def test_agent_data_success(
     assert response.status_code == 204
 
 
+@pytest.mark.usefixtures("symlink_push_host")
+def test_agent_data_too_large(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    client: TestClient,
+    uuid: UUID4,
+    agent_data_headers: MutableMapping[str, str],
+) -> None:
+    monkeypatch.setattr(get_config(), "max_agent_data_size", 8)
+
+    response = client.post(
+        f"/agent_data/{uuid}",
+        headers=agent_data_headers,
+        files={"monitoring_data": ("filename", io.BytesIO(compress(b"more than 8 bytes")))},
+    )
+
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Agent data exceeds the maximum size of 8 bytes"}
+    assert not list((tmp_path / "push-agent" / "hostname").iterdir())
+
+
 @pytest.fixture(name="registration_status_headers")
 def fixture_registration_status_headers(uuid: UUID4) -> dict[str, str]:
     return {
@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import ast
+import marshal
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from pathlib import Path
@@ -41,14 +42,35 @@ class AutocheckServiceWithNodes(NamedTuple):
 _GetEffectiveHost = Callable[[HostName, AutocheckEntry], HostName]
 
 
+_MAGIC: Final = b"CMK-AUTOCHECKS\0"
+_VERSION: Final = 1
+
+
 class AutochecksSerializer:
+    """Autochecks are written in a versioned binary format
+
+    Files in the Python literal format written by previous versions are still read.
+    """
+
     @staticmethod
     def serialize(entries: Sequence[AutocheckEntry]) -> bytes:
-        return ("[\n%s]\n" % "".join(f"  {e.dump()!r},\n" for e in entries)).encode("utf-8")
+        dumped = [e.dump() for e in entries]
+        try:
+            return _MAGIC + bytes([_VERSION]) + marshal.dumps(dumped)
+        except ValueError:
+            # Only instances of builtin types can be marshalled, not e.g. subclasses of str
+            return ("[\n%s]\n" % "".join(f"  {d!r},\n" for d in dumped)).encode("utf-8")
 
     @staticmethod
     def deserialize(raw: bytes) -> Sequence[AutocheckEntry]:
-        return [AutocheckEntry.load(d) for d in ast.literal_eval(raw.decode("utf-8"))]
+        if raw.startswith(_MAGIC):
+            if (version := raw[len(_MAGIC)]) != _VERSION:
+                raise ValueError(f"Unsupported autochecks format version: {version}")
+            # Only written by us, see serialize()
+            loaded = marshal.loads(raw[len(_MAGIC) + 1 :])  # nosec B302
+        else:
+            loaded = ast.literal_eval(raw.decode("utf-8"))
+        return [AutocheckEntry.load(d) for d in loaded]
 
 
 class AutochecksStore:
@@ -62,7 +84,7 @@ class AutochecksStore:
     def read(self) -> Sequence[AutocheckEntry]:
         try:
             return self._store.read_obj(default=[])
-        except (ValueError, TypeError, KeyError, AttributeError, SyntaxError) as exc:
+        except (ValueError, TypeError, KeyError, AttributeError, SyntaxError, EOFError) as exc:
             raise MKGeneralException(
                 f"Unable to parse autochecks of host {self._host_name}"
             ) from exc
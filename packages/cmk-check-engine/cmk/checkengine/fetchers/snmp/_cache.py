@@ -4,6 +4,7 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 import json
 import logging
+import marshal
 from collections.abc import Iterable, Iterator, Mapping, MutableMapping
 from pathlib import Path
 
@@ -14,6 +15,9 @@ from cmk.checkengine.snmplib import SNMPRawDataElem, SNMPRowInfo, SNMPSectionMar
 # mypy: disable-error-code="no-any-return"
 # mypy: disable-error-code="comparison-overlap"
 
+_WALK_MAGIC = b"CMK-WALK\0"
+_WALK_VERSION = 1
+
 
 class WalkCache(MutableMapping[tuple[str, str, bool], SNMPRowInfo]):
     """A cache on a per-fetchoid basis
@@ -37,10 +41,22 @@ class WalkCache(MutableMapping[tuple[str, str, bool], SNMPRowInfo]):
         self._logger = logger
 
     def _read_row(self, path: Path) -> SNMPRowInfo:
-        return store.load_object_from_file(path, default=None)
+        raw = store.load_bytes_from_file(path, default=b"")
+        if not raw.startswith(_WALK_MAGIC):
+            # Written by previous versions as Python literal
+            return store.load_object_from_file(path, default=None)
+        if (version := raw[len(_WALK_MAGIC)]) != _WALK_VERSION:
+            raise ValueError(f"Unsupported walk cache format version: {version}")
+        # Only written by us, see _write_row()
+        return marshal.loads(raw[len(_WALK_MAGIC) + 1 :])  # nosec B302
 
     def _write_row(self, path: Path, rowinfo: SNMPRowInfo) -> None:
-        return store.save_object_to_file(path, rowinfo, pprint_value=False)
+        try:
+            raw = _WALK_MAGIC + bytes([_WALK_VERSION]) + marshal.dumps(rowinfo)
+        except ValueError:
+            # Only instances of builtin types can be marshalled, not e.g. subclasses of str
+            return store.save_object_to_file(path, rowinfo, pprint_value=False)
+        return store.save_bytes_to_file(path, raw)
 
     @staticmethod
     def _oid2name(fetchoid: str, context_hash: str) -> str:
@@ -8,8 +8,8 @@ from __future__ import annotations
 import abc
 import logging
 import time
-from collections.abc import Iterator, Mapping, MutableMapping, Sequence
-from typing import Final, final, NamedTuple
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, Sequence
+from typing import cast, Final, final, NamedTuple
 
 import cmk.ccc.debug
 from cmk.ccc.hostaddress import HostName
@@ -31,7 +31,8 @@ from ._sectionstore import SectionStore
 
 class SectionWithHeader(NamedTuple):
     header: SectionMarker
-    section: list[AgentRawData]
+    # The raw data of the section, it is only split into lines if the section is used.
+    chunks: list[bytes | memoryview]
 
 
 MutableSection = list[SectionWithHeader]
@@ -100,7 +101,8 @@ class ParserState(abc.ABC):
         self._logger: Final = logger
 
     @abc.abstractmethod
-    def do_action(self, line: bytes) -> ParserState:
+    def do_action(self, data: bytes | memoryview) -> ParserState:
+        """Handle data lines, i.e. one or more lines without markers"""
         raise NotImplementedError()
 
     @abc.abstractmethod
@@ -270,7 +272,7 @@ class ParserState(abc.ABC):
 
 
 class NOOPParser(ParserState):
-    def do_action(self, line: bytes) -> ParserState:  # noqa: ARG002
+    def do_action(self, data: bytes | memoryview) -> ParserState:  # noqa: ARG002
         return self
 
     def on_piggyback_header(self, piggyback_header: PiggybackMarker) -> ParserState:
@@ -311,8 +313,8 @@ class PiggybackParser(ParserState):
         )
         self.current_host: Final = current_host
 
-    def do_action(self, line: bytes) -> ParserState:  # noqa: ARG002
-        # We are not in a section -> ignore line.
+    def do_action(self, data: bytes | memoryview) -> ParserState:  # noqa: ARG002
+        # We are not in a section -> ignore data.
         return self
 
     def on_piggyback_header(self, piggyback_header: PiggybackMarker) -> ParserState:
@@ -355,8 +357,8 @@ class PiggybackSectionParser(ParserState):
         self.current_host: Final = current_host
         self.current_section: Final = current_section
 
-    def do_action(self, line: bytes) -> ParserState:
-        self.piggyback_sections[self.current_host][-1].section.append(AgentRawData(line))
+    def do_action(self, data: bytes | memoryview) -> ParserState:
+        self.piggyback_sections[self.current_host][-1].chunks.append(data)
         return self
 
     def on_piggyback_header(self, piggyback_header: PiggybackMarker) -> ParserState:
@@ -397,7 +399,7 @@ class PiggybackNOOPParser(ParserState):
         )
         self.current_host: Final = current_host
 
-    def do_action(self, line: bytes) -> PiggybackNOOPParser:  # noqa: ARG002
+    def do_action(self, data: bytes | memoryview) -> PiggybackNOOPParser:  # noqa: ARG002
         return self
 
     def on_piggyback_header(self, piggyback_header: PiggybackMarker) -> ParserState:
@@ -417,7 +419,7 @@ class PiggybackNOOPParser(ParserState):
 
 
 class PiggybackIgnoreParser(ParserState):
-    def do_action(self, line: bytes) -> PiggybackIgnoreParser:  # noqa: ARG002
+    def do_action(self, data: bytes | memoryview) -> PiggybackIgnoreParser:  # noqa: ARG002
         return self
 
     def on_piggyback_header(self, piggyback_header: PiggybackMarker) -> ParserState:
@@ -457,10 +459,8 @@ class HostSectionParser(ParserState):
         )
         self.current_section: Final = current_section
 
-    def do_action(self, line: bytes) -> ParserState:
-        self.sections[-1].section.append(
-            AgentRawData(line if self.current_section.nostrip else line.strip())
-        )
+    def do_action(self, data: bytes | memoryview) -> ParserState:
+        self.sections[-1].chunks.append(data)
         return self
 
     def on_piggyback_header(self, piggyback_header: PiggybackMarker) -> ParserState:
@@ -536,17 +536,17 @@ class AgentParser(Parser[AgentRawData, AgentRawDataSection]):
         selection: SectionNameCollection,
     ) -> tuple[ImmutableSection, Mapping[PiggybackMarker, ImmutableSection]]:
         """Split agent output in chunks, splits lines by whitespaces."""
-        parser: ParserState = NOOPParser(
-            self.hostname,
-            [],
-            {},
-            translation=self.translation,
-            encoding_fallback=self.encoding_fallback,
-            logger=self._logger,
+        parser = feed(
+            NOOPParser(
+                self.hostname,
+                [],
+                {},
+                translation=self.translation,
+                encoding_fallback=self.encoding_fallback,
+                logger=self._logger,
+            ),
+            raw_data,
         )
-        for line in raw_data.split(b"\n"):
-            parser = parser(line.rstrip(b"\r"))
-
         return parser.sections if selection is NO_SELECTION else [
             s for s in parser.sections if s.header.name in selection
         ], parser.piggyback_sections
@@ -577,7 +577,7 @@ class AgentParser(Parser[AgentRawData, AgentRawDataSection]):
                             header.separator,
                         )
                     ).encode(header.encoding)
-                yield from (bytes(line) for line in content)
+                yield from section_lines(content, strip=False)
 
         return {
             header.hostname: list(
@@ -592,6 +592,51 @@ class AgentParser(Parser[AgentRawData, AgentRawDataSection]):
         }
 
 
+def feed(parser: ParserState, raw_data: bytes) -> ParserState:
+    """Feed the agent output to the parser and return the final state
+
+    Only the lines starting with "<<<" are looked at one by one, the markers are found by
+    searching the raw data. The data in between is handed to the parser as a whole, without
+    copying it.
+    """
+    view = memoryview(raw_data)
+    data_start = 0
+    line_start = 0 if raw_data.startswith(b"<<<") else _next_candidate(raw_data, 0)
+    while line_start >= 0:
+        if (line_end := raw_data.find(b"\n", line_start)) < 0:
+            line_end = len(raw_data)
+        if (line := raw_data[line_start:line_end].rstrip(b"\r")).endswith(b">>>"):
+            if data_start < line_start:
+                parser = parser.do_action(view[data_start:line_start])
+            parser = parser(line)
+            data_start = line_end
+        line_start = _next_candidate(raw_data, line_end)
+
+    if data_start < len(raw_data):
+        parser = parser.do_action(view[data_start:])
+    return parser
+
+
+def _next_candidate(raw_data: bytes, start: int) -> int:
+    """Find the next line starting with "<<<" (or return -1)"""
+    return index + 1 if (index := raw_data.find(b"\n<<<", start)) >= 0 else -1
+
+
+def section_lines(chunks: Iterable[bytes | memoryview], *, strip: bool) -> list[AgentRawData]:
+    """Split the raw data of a section into its non-blank lines
+
+    The lines are stripped completely or only from their trailing carriage returns.
+    """
+    lines: list[bytes] = []
+    for chunk in chunks:
+        raw_lines = bytes(chunk).split(b"\n")
+        if strip:
+            lines += [stripped for line in raw_lines if (stripped := line.strip())]
+        else:
+            lines += [line.rstrip(b"\r") for line in raw_lines if line and not line.isspace()]
+    return cast(list[AgentRawData], lines)
+
+
 def make_section_info(
     raw_sections: ImmutableSection,
 ) -> Mapping[SectionName, SectionMarker]:
@@ -603,7 +648,9 @@ def make_decoded_sections(
 ) -> Mapping[SectionName, list[AgentRawDataSectionElem]]:
     out: MutableMapping[SectionName, list[AgentRawDataSectionElem]] = {}
     for header, content in sections:
-        out.setdefault(header.name, []).extend(header.parse_line(line) for line in content)
+        out.setdefault(header.name, []).extend(
+            header.parse_line(line) for line in section_lines(content, strip=not header.nostrip)
+        )
     return out
 
 
@@ -17,13 +17,13 @@ from cmk.checkengine.helper_interface import AgentRawData
 from cmk.piggyback.backend import get_messages_for, PiggybackMessage
 
 from ._agent import (
+    feed,
     ImmutableSection,
     make_cache_info,
     make_decoded_sections,
     make_persisting_info,
     make_section_info,
     NOOPParser,
-    ParserState,
 )
 from ._parser import (
     AgentRawDataSection,
@@ -96,16 +96,17 @@ class PiggybackParser(Parser[AgentRawData, AgentRawDataSection]):
         selection: SectionNameCollection,
     ) -> ImmutableSection:
         """Split agent output in chunks, splits lines by whitespaces."""
-        parser: ParserState = NOOPParser(
-            self.hostname,
-            [],
-            {},
-            translation={},  # there are no "nested" piggyback sections
-            encoding_fallback=self.encoding_fallback,
-            logger=self._logger,
+        parser = feed(
+            NOOPParser(
+                self.hostname,
+                [],
+                {},
+                translation={},  # there are no "nested" piggyback sections
+                encoding_fallback=self.encoding_fallback,
+                logger=self._logger,
+            ),
+            raw_data,
         )
-        for line in raw_data.split(b"\n"):
-            parser = parser(line.rstrip(b"\r"))
 
         return (
             parser.sections
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+"""SNMP backend talking SNMPv1 and SNMPv2c to the device itself
+
+The classic backend starts a Net-SNMP command line tool for every single request and parses
+its text output. This backend encodes the requests itself and sends them via one UDP socket
+per device. The sockets are kept open, so they are reused by all requests of a fetch and by
+subsequent fetches of the same process. Walks are done with GETBULK requests if bulk walks
+are enabled for the host, the variable bindings of the responses are turned into the rows
+directly.
+
+The values are reported the same way the classic backend reports them. SNMPv3 needs the user
+based security model, which is not implemented here: Those hosts are queried by the classic
+backend.
+"""
+
+import itertools
+import logging
+import random
+import socket
+import threading
+import time
+from collections import OrderedDict
+from typing import Final, NamedTuple
+
+from cmk.checkengine.snmplib import (
+    OID,
+    SNMPBackend,
+    SNMPBackendEnum,
+    SNMPContext,
+    SNMPHostConfig,
+    SNMPRawValue,
+    SNMPRowInfo,
+    SNMPVersion,
+)
+
+from ._utils import BackendError
+from .classic import ClassicSNMPBackend
+
+__all__ = ["BuiltinSNMPBackend"]
+
+# ASN.1 / BER tags used by SNMP (RFC 1157, RFC 3416)
+_INTEGER: Final = 0x02
+_OCTET_STRING: Final = 0x04
+_NULL: Final = 0x05
+_OBJECT_IDENTIFIER: Final = 0x06
+_SEQUENCE: Final = 0x30
+_IP_ADDRESS: Final = 0x40
+_COUNTER32: Final = 0x41
+_GAUGE32: Final = 0x42
+_TIMETICKS: Final = 0x43
+_COUNTER64: Final = 0x46
+_NO_SUCH_OBJECT: Final = 0x80
+_NO_SUCH_INSTANCE: Final = 0x81
+_END_OF_MIB_VIEW: Final = 0x82
+
+_GET_REQUEST: Final = 0xA0
+_GET_NEXT_REQUEST: Final = 0xA1
+_RESPONSE: Final = 0xA2
+_GET_BULK_REQUEST: Final = 0xA5
+
+_ERROR_TOO_BIG: Final = 1
+_ERROR_NO_SUCH_NAME: Final = 2
+
+_UNSIGNED: Final = frozenset((_COUNTER32, _GAUGE32, _TIMETICKS, _COUNTER64))
+_EXCEPTIONS: Final = frozenset((_NO_SUCH_OBJECT, _NO_SUCH_INSTANCE, _END_OF_MIB_VIEW))
+
+# isprint() or isspace() in the C locale, see sprint_realloc_octet_string of Net-SNMP
+_PRINTABLE: Final = bytes(range(0x20, 0x7F)) + b"\t\n\v\f\r"
+
+# Same defaults as the Net-SNMP tools
+_DEFAULT_TIMEOUT: Final = 1.0
+_DEFAULT_RETRIES: Final = 5
+
+_MAX_MESSAGE_SIZE: Final = 65535
+_MAX_SESSIONS: Final = 256
+
+type _ObjectIdentifier = tuple[int, ...]
+
+
+class _VarBind(NamedTuple):
+    name: _ObjectIdentifier
+    tag: int
+    value: bytes
+
+
+class _Response(NamedTuple):
+    request_id: int
+    error_status: int
+    varbinds: list[_VarBind]
+
+
+def _encode(tag: int, content: bytes) -> bytes:
+    length = len(content)
+    if length < 0x80:
+        return bytes((tag, length)) + content
+    raw_length = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes((tag, 0x80 | len(raw_length))) + raw_length + content
+
+
+def _encode_integer(value: int) -> bytes:
+    return _encode(_INTEGER, value.to_bytes(value.bit_length() // 8 + 1, "big", signed=True))
+
+
+def _encode_oid(oid: _ObjectIdentifier) -> bytes:
+    first, second, *rest = (*oid, 0, 0)[: max(len(oid), 2)]
+    content = bytearray()
+    for arc in (40 * first + second, *rest):
+        chunk = [arc & 0x7F]
+        while arc := arc >> 7:
+            chunk.append(0x80 | (arc & 0x7F))
+        content.extend(reversed(chunk))
+    return _encode(_OBJECT_IDENTIFIER, bytes(content))
+
+
+def _encode_request(
+    version: SNMPVersion,
+    community: str,
+    pdu_type: int,
+    request_id: int,
+    oid: _ObjectIdentifier,
+    *,
+    max_repetitions: int = 0,
+) -> bytes:
+    """Encode a request for a single variable
+
+    For GETBULK requests the error status and index fields carry the number of non
+    repeaters and the max repetitions.
+    """
+    varbind = _encode(_SEQUENCE, _encode_oid(oid) + _encode(_NULL, b""))
+    pdu = _encode(
+        pdu_type,
+        _encode_integer(request_id)
+        + _encode_integer(0)
+        + _encode_integer(max_repetitions)
+        + _encode(_SEQUENCE, varbind),
+    )
+    return _encode(
+        _SEQUENCE,
+        _encode_integer(0 if version is SNMPVersion.V1 else 1)
+        + _encode(_OCTET_STRING, community.encode())
+        + pdu,
+    )
+
+
+def _decode(data: bytes, offset: int) -> tuple[int, bytes, int]:
+    """Decode the element at offset and return its tag, its content and the next offset"""
+    tag = data[offset]
+    length = data[offset + 1]
+    offset += 2
+    if length & 0x80:
+        num_octets = length & 0x7F
+        length = int.from_bytes(data[offset : offset + num_octets], "big")
+        offset += num_octets
+    end = offset + length
+    if end > len(data):
+        raise ValueError("truncated element")
+    return tag, data[offset:end], end
+
+
+def _decode_oid(content: bytes) -> _ObjectIdentifier:
+    arcs = []
+    arc = 0
+    for octet in content:
+        arc = (arc << 7) | (octet & 0x7F)
+        if not octet & 0x80:
+            arcs.append(arc)
+            arc = 0
+    if not arcs:
+        return ()
+    first = min(arcs[0] // 40, 2)
+    return (first, arcs[0] - 40 * first, *arcs[1:])
+
+
+def _decode_response(data: bytes) -> _Response:
+    _tag, message, _end = _decode(data, 0)
+    _tag, _version, offset = _decode(message, 0)
+    _tag, _community, offset = _decode(message, offset)
+    tag, pdu, _end = _decode(message, offset)
+    if tag != _RESPONSE:
+        raise ValueError(f"unexpected PDU type {tag:#x}")
+    _tag, request_id, offset = _decode(pdu, 0)
+    _tag, error_status, offset = _decode(pdu, offset)
+    _tag, _error_index, offset = _decode(pdu, offset)
+    _tag, bindings, _end = _decode(pdu, offset)
+
+    varbinds = []
+    offset = 0
+    while offset < len(bindings):
+        _tag, varbind, offset = _decode(bindings, offset)
+        _tag, name, value_offset = _decode(varbind, 0)
+        tag, value, _end = _decode(varbind, value_offset)
+        varbinds.append(_VarBind(_decode_oid(name), tag, value))
+    return _Response(
+        int.from_bytes(request_id, "big", signed=True),
+        int.from_bytes(error_status, "big"),
+        varbinds,
+    )
+
+
+def _raw_value(tag: int, value: bytes) -> SNMPRawValue | None:
+    """Represent a value the way the classic backend does"""
+    if tag == _OCTET_STRING:
+        # Printable strings are stripped, all others are taken as they are (hex strings).
+        return value if value.translate(None, _PRINTABLE) else value.strip()
+    if tag == _INTEGER:
+        return str(int.from_bytes(value, "big", signed=True)).encode()
+    if tag in _UNSIGNED:
+        return str(int.from_bytes(value, "big")).encode()
+    if tag == _IP_ADDRESS:
+        return ".".join(str(octet) for octet in value).encode()
+    if tag == _OBJECT_IDENTIFIER:
+        return _format_oid(_decode_oid(value)).encode()
+    if tag == _NULL:
+        return b""
+    if tag in _EXCEPTIONS:
+        return None
+    return value  # Opaque and friends
+
+
+def _parse_oid(oid: OID) -> _ObjectIdentifier:
+    try:
+        return tuple(int(arc) for arc in oid.strip(".").split("."))
+    except ValueError:
+        raise BackendError(f"Invalid OID: {oid}")
+
+
+def _format_oid(oid: _ObjectIdentifier) -> OID:
+    return "." + ".".join(str(arc) for arc in oid)
+
+
+class _Session:
+    """A UDP socket connected to an SNMP agent
+
+    Only one request is in flight at a time: Responses to other (retried or timed out)
+    requests are dropped.
+    """
+
+    def __init__(self, family: socket.AddressFamily, address: tuple[str, int]) -> None:
+        self.family: Final = family
+        self.address: Final = address
+        self._socket: socket.socket | None = None
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count(random.randrange(1, 1 << 30))
+
+    def next_request_id(self) -> int:
+        return next(self._request_ids) & 0x7FFFFFFF
+
+    def close(self) -> None:
+        with self._lock:
+            if self._socket is not None:
+                self._socket.close()
+                self._socket = None
+
+    def exchange(
+        self, message: bytes, request_id: int, *, timeout: float, retries: int
+    ) -> _Response:
+        with self._lock:
+            if self._socket is None:
+                self._socket = socket.socket(self.family, socket.SOCK_DGRAM)
+                self._socket.connect(self.address)
+            for _attempt in range(retries + 1):
+                self._socket.send(message)
+                if (response := self._receive(request_id, time.monotonic() + timeout)) is not None:
+                    return response
+        raise BackendError(f"Timeout: No Response from {self.address[0]}")
+
+    def _receive(self, request_id: int, deadline: float) -> _Response | None:
+        assert self._socket is not None
+        while (remaining := deadline - time.monotonic()) > 0:
+            self._socket.settimeout(remaining)
+            try:
+                data = self._socket.recv(_MAX_MESSAGE_SIZE)
+            except TimeoutError:
+                return None
+            except OSError as e:  # e.g. ICMP port unreachable
+                raise BackendError(f"SNMP Error on {self.address[0]}: {e}") from e
+            try:
+                response = _decode_response(data)
+            except (IndexError, ValueError):
+                continue
+            if response.request_id == request_id:
+                return response
+        return None
+
+
+_sessions: OrderedDict[tuple[socket.AddressFamily, str, int], _Session] = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+def _get_session(family: socket.AddressFamily, ipaddress: str, port: int) -> _Session:
+    """Return the session for the agent, the least recently used sessions are closed"""
+    key = (family, ipaddress, port)
+    with _sessions_lock:
+        if (session := _sessions.pop(key, None)) is None:
+            session = _Session(family, (ipaddress, port))
+        _sessions[key] = session
+        evicted = [_sessions.popitem(last=False)[1] for _ in range(len(_sessions) - _MAX_SESSIONS)]
+    for old_session in evicted:
+        old_session.close()
+    return session
+
+
+class BuiltinSNMPBackend(SNMPBackend):
+    def __init__(self, snmp_config: SNMPHostConfig, logger: logging.Logger) -> None:
+        super().__init__(snmp_config, logger)
+        self._fallback: Final = (
+            ClassicSNMPBackend(snmp_config, logger)
+            if snmp_config.snmp_version is SNMPVersion.V3
+            else None
+        )
+
+    @staticmethod
+    def get_type() -> SNMPBackendEnum:
+        return SNMPBackendEnum.BUILTIN
+
+    def get(self, /, oid: OID, *, context: SNMPContext) -> SNMPRawValue | None:
+        if self._fallback is not None:
+            return self._fallback.get(oid, context=context)
+
+        if oid.endswith(".*"):
+            oid_prefix = _parse_oid(oid[:-2])
+            pdu_type = _GET_NEXT_REQUEST
+        else:
+            oid_prefix = _parse_oid(oid)
+            pdu_type = _GET_REQUEST
+
+        try:
+            response = self._request(pdu_type, oid_prefix)
+        except BackendError as e:
+            self._logger.debug("SNMP error: %s", e)
+            return None
+
+        if response.error_status or not response.varbinds:
+            return None
+        varbind = response.varbinds[0]
+        # In case of .*, check if prefix is the one we are looking for
+        if pdu_type == _GET_NEXT_REQUEST and (
+            len(varbind.name) <= len(oid_prefix) or varbind.name[: len(oid_prefix)] != oid_prefix
+        ):
+            return None
+        return _raw_value(varbind.tag, varbind.value)
+
+    def walk(
+        self,
+        /,
+        oid: str,
+        *,
+        context: SNMPContext,
+        section_name: object = None,
+        table_base_oid: object = None,
+    ) -> SNMPRowInfo:
+        if self._fallback is not None:
+            return self._fallback.walk(
+                oid, context=context, section_name=section_name, table_base_oid=table_base_oid
+            )
+
+        root = _parse_oid(oid)
+        rowinfo: SNMPRowInfo = []
+        current = root
+        max_repetitions = max(self.config.bulk_walk_size_of, 1)
+        while True:
+            if self.config.use_bulkwalk:
+                response = self._request(_GET_BULK_REQUEST, current, max_repetitions)
+                if response.error_status == _ERROR_TOO_BIG and max_repetitions > 1:
+                    max_repetitions //= 2
+                    continue
+            else:
+                response = self._request(_GET_NEXT_REQUEST, current)
+
+            if response.error_status == _ERROR_NO_SUCH_NAME:
+                break  # SNMPv1 end of MIB view
+            if response.error_status:
+                raise BackendError(
+                    f"SNMP Error on {self.config.ipaddress}: Error status {response.error_status}"
+                )
+            if not self._add_rows(rowinfo, root, current, response.varbinds):
+                break
+            current = response.varbinds[-1].name
+
+        # Same as snmpwalk: Try to get the OID itself if there is nothing below it.
+        if not rowinfo and (value := self.get(oid, context=context)) is not None:
+            rowinfo.append((_format_oid(root), value))
+        return rowinfo
+
+    @staticmethod
+    def _add_rows(
+        rowinfo: SNMPRowInfo,
+        root: _ObjectIdentifier,
+        previous: _ObjectIdentifier,
+        varbinds: list[_VarBind],
+    ) -> bool:
+        """Add the variables within the walked subtree and tell whether to continue"""
+        if not varbinds:
+            return False
+        for name, tag, value in varbinds:
+            if tag == _END_OF_MIB_VIEW or name == previous or name[: len(root)] != root:
+                return False
+            previous = name
+            if (raw_value := _raw_value(tag, value)) is not None:
+                rowinfo.append((_format_oid(name), raw_value))
+        return True
+
+    def _request(
+        self, pdu_type: int, oid: _ObjectIdentifier, max_repetitions: int = 0
+    ) -> _Response:
+        if not isinstance(self.config.credentials, str):
+            raise TypeError()
+        family = socket.AF_INET6 if self.config.is_ipv6_primary else socket.AF_INET
+        session = _get_session(
+            family,
+            self.config.ipaddress or "0.0.0.0",  # nosec B104 # BNS:b7e3d1
+            self.config.port,
+        )
+        request_id = session.next_request_id()
+        return session.exchange(
+            _encode_request(
+                self.config.snmp_version,
+                self.config.credentials,
+                pdu_type,
+                request_id,
+                oid,
+                max_repetitions=max_repetitions,
+            ),
+            request_id,
+            timeout=self.config.timing.get("timeout", _DEFAULT_TIMEOUT),
+            retries=self.config.timing.get("retries", _DEFAULT_RETRIES),
+        )
@@ -77,6 +77,7 @@ class SNMPBackendEnum(enum.Enum):
     INLINE = "Inline"
     CLASSIC = "Classic"
     STORED_WALK = "StoredWalk"
+    BUILTIN = "Builtin"
 
     def serialize(self) -> str:
         return self.name
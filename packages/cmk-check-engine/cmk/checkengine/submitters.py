@@ -7,8 +7,9 @@ from __future__ import annotations
 
 import abc
 import os
+import select
 import time
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
 from random import Random
@@ -26,6 +27,9 @@ from cmk.utils.servicename import ServiceName
 
 _CacheInfo = tuple[int, int]
 
+# Maximum number of buffers of a single writev() call
+_IOV_MAX: Final = os.sysconf("SC_IOV_MAX")
+
 ServiceDetails = str
 
 
@@ -196,20 +200,50 @@ class PipeSubmitter(Submitter):
         if not (pipe := PipeSubmitter._open_command_pipe()):
             return
 
-        for submittee in formatted_submittees:
-            msg = "[%d] PROCESS_SERVICE_CHECK_RESULT;%s;%s;%d;%s\n" % (
-                time.time(),
-                self.host_name,
-                submittee.name,
-                submittee.state,
-                submittee.details.replace("\n", "\\n"),
-            )
-            pipe.write(msg.encode())
+        now = time.time()
+        commands = (
+            (
+                "[%d] PROCESS_SERVICE_CHECK_RESULT;%s;%s;%d;%s\n"
+                % (
+                    now,
+                    self.host_name,
+                    submittee.name,
+                    submittee.state,
+                    submittee.details.replace("\n", "\\n"),
+                )
+            ).encode()
+            for submittee in formatted_submittees
+        )
+        for chunk in _atomic_chunks(commands, select.PIPE_BUF):
+            pipe.write(chunk)
             # Important: Nagios needs the complete command in one single write() block!
             # Python buffers and sends chunks of 4096 bytes, if we do not flush.
             pipe.flush()
 
 
+def _atomic_chunks(commands: Iterable[bytes], limit: int) -> Iterator[bytes]:
+    """Join the commands to chunks of at most limit bytes
+
+    Writes of up to PIPE_BUF bytes to a pipe are atomic, so the commands of a chunk are not
+    interleaved with the ones of other writers. A command is never split: Commands longer
+    than the limit make up a chunk of their own.
+
+    >>> list(_atomic_chunks([b"a\\n", b"bb\\n", b"cccc\\n", b"d\\n"], 5))
+    [b'a\\nbb\\n', b'cccc\\n', b'd\\n']
+    """
+    chunk: list[bytes] = []
+    length = 0
+    for command in commands:
+        if chunk and length + len(command) > limit:
+            yield b"".join(chunk)
+            chunk = []
+            length = 0
+        chunk.append(command)
+        length += len(command)
+    if chunk:
+        yield b"".join(chunk)
+
+
 class _RandomNameSequence:
     """An instance of _RandomNameSequence generates an endless
     sequence of unpredictable strings which can safely be incorporated
@@ -243,26 +277,26 @@ class FileSubmitter(Submitter):
 
     def _submit(self, formatted_submittees: Iterable[FormattedSubmittee]) -> None:
         now = time.time()
+        records = [self._make_record(submittee, now) for submittee in formatted_submittees]
 
         with self._open_checkresult_file() as fd:
-            for submittee in formatted_submittees:
-                output = submittee.details.replace("\n", "\\n")
-                os.write(
-                    fd,
-                    (
-                        f"host_name={self.host_name}\n"
-                        f"service_description={submittee.name}\n"
-                        "check_type=1\n"
-                        "check_options=0\n"
-                        "reschedule_check\n"
-                        "latency=0.0\n"
-                        f"start_time={now:.1f}\n"
-                        f"finish_time={now:.1f}\n"
-                        f"return_code={submittee.state}\n"
-                        f"output={output}\n"
-                        "\n"
-                    ).encode(),
-                )
+            _write_all(fd, records)
+
+    def _make_record(self, submittee: FormattedSubmittee, now: float) -> bytes:
+        output = submittee.details.replace("\n", "\\n")
+        return (
+            f"host_name={self.host_name}\n"
+            f"service_description={submittee.name}\n"
+            "check_type=1\n"
+            "check_options=0\n"
+            "reschedule_check\n"
+            "latency=0.0\n"
+            f"start_time={now:.1f}\n"
+            f"finish_time={now:.1f}\n"
+            f"return_code={submittee.state}\n"
+            f"output={output}\n"
+            "\n"
+        ).encode()
 
     @classmethod
     @contextmanager
@@ -299,6 +333,19 @@ class FileSubmitter(Submitter):
         )
 
 
+def _write_all(fd: int, buffers: Sequence[bytes]) -> None:
+    """Write the buffers with as few system calls as possible"""
+    views = [memoryview(b) for b in buffers]
+    index = 0
+    while index < len(views):
+        written = os.writev(fd, views[index : index + _IOV_MAX])
+        while index < len(views) and written >= len(views[index]):
+            written -= len(views[index])
+            index += 1
+        if written:
+            views[index] = views[index][written:]
+
+
 def _output_check_result(
     submittee: FormattedSubmittee,
     *,
@@ -6,6 +6,7 @@
 # mypy: disable-error-code="no-untyped-call"
 
 import json
+import os
 from ast import literal_eval
 from collections.abc import (
     Callable,
@@ -110,6 +111,221 @@ class AllValueStoresStore:
             self._last_known_state = _LastState(timestamp=self.path.stat().st_mtime, data=new_data)
 
 
+def _serialize_key(key: ValueStoreKey) -> bytes:
+    return json.dumps(key).encode()
+
+
+def _deserialize_key(raw: bytes) -> ValueStoreKey:
+    hn, cn, i = json.loads(raw)
+    return HostName(hn), str(cn), None if i is None else str(i)
+
+
+class _LazyValueStores(Mapping[ValueStoreKey, _SerializedValueStore]):
+    """The value stores of a host, decoded upon first access
+
+    Hosts with thousands of items only decode the namespaces actually used.
+    Lookups use the serialized key, so not even the keys need to be decoded.
+    Corrupt entries are reported to `on_corrupt` and treated as missing once
+    they are encountered; iterating therefore decodes all of them.
+    """
+
+    def __init__(
+        self, raw: dict[bytes, bytes], on_corrupt: Callable[[bytes, bytes], object]
+    ) -> None:
+        self._raw: Final = raw
+        self._on_corrupt: Final = on_corrupt
+        self._decoded: dict[ValueStoreKey, _SerializedValueStore] = {}
+
+    def _discard(self, raw_key: bytes) -> None:
+        self._on_corrupt(raw_key, self._raw.pop(raw_key))
+
+    def _decode(self, key: ValueStoreKey, raw_key: bytes) -> _SerializedValueStore | None:
+        try:
+            value = json.loads(self._raw[raw_key])
+        except ValueError:
+            value = None
+        if not isinstance(value, dict):
+            self._discard(raw_key)
+            return None
+        return self._decoded.setdefault(key, value)
+
+    def __getitem__(self, key: ValueStoreKey) -> _SerializedValueStore:
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        if (value := self._decode(key, _serialize_key(key))) is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, tuple) and _serialize_key(key) in self._raw
+
+    def __iter__(self) -> Iterator[ValueStoreKey]:
+        for raw_key in list(self._raw):
+            try:
+                key = _deserialize_key(raw_key)
+            except (ValueError, TypeError):
+                self._discard(raw_key)
+                continue
+            if key in self._decoded or self._decode(key, raw_key) is not None:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+
+@dataclass
+class _JournalState:
+    inode: int
+    offset: int
+    lines: int
+    data: dict[bytes, bytes]
+    # corrupt entries were skipped, they are dropped upon the next update
+    corrupt: bool = False
+
+
+class JournaledValueStoresStore(AllValueStoresStore):
+    """Read and write values stored on disk as an append-only journal
+
+    Every update only appends the value stores that actually changed,
+    and every load only reads what has been appended since the last one.
+    Once the journal contains too many outdated entries it is compacted.
+
+    Files in the format of :class:`AllValueStoresStore` are read
+    and converted upon the first update.
+    """
+
+    HEADER: Final = b"# value store journal v1\n"
+    # compact if there are more outdated than current entries
+    COMPACTION_FACTOR: Final = 2
+    COMPACTION_MIN_LINES: Final = 1000
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        log_debug: Callable[[str], object] | None = None,
+    ) -> None:
+        super().__init__(path, log_debug=log_debug)
+        self._state: _JournalState | None = None
+
+    @staticmethod
+    def _serialize_entries(entries: Mapping[bytes, bytes]) -> bytes:
+        # JSON escapes tabs and newlines, so they are safe as separators.
+        return b"".join(b"%s\t%s\n" % item for item in entries.items())
+
+    def _read(self) -> _JournalState:
+        """Bring the state up to date with what is on disk"""
+        try:
+            with self.path.open("rb") as f:
+                inode = os.fstat(f.fileno()).st_ino
+                if self._state is None or self._state.inode != inode:
+                    if f.read(len(self.HEADER)) != self.HEADER:
+                        return self._read_legacy(inode)
+                    state = _JournalState(inode, len(self.HEADER), 0, {})
+                else:
+                    state = self._state
+                    f.seek(state.offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return _JournalState(0, 0, 0, {})
+
+        # Ignore an incomplete line at the end: it is the remainder of an interrupted write.
+        complete = chunk[: chunk.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            raw_key, sep, raw_value = line.partition(b"\t")
+            if sep:
+                state.data[raw_key] = raw_value
+            else:
+                self._warn_corrupt(line)
+                state.corrupt = True
+            state.lines += 1
+        state.offset += len(complete)
+        self._state = state
+        return state
+
+    def _read_legacy(self, inode: int) -> _JournalState:
+        self._log_debug("loading legacy format")
+        return _JournalState(
+            inode,
+            # never matches the file: we need to convert it upon the next update.
+            -1,
+            0,
+            {_serialize_key(k): json.dumps(v).encode() for k, v in super().load().items()},
+        )
+
+    def _warn_corrupt(self, line: bytes) -> None:
+        logger.warning("value store: ignoring corrupt entry in %s: %r", self.path, line)
+
+    def _drop_corrupt(self, state: _JournalState, raw_key: bytes, raw_value: bytes) -> None:
+        self._warn_corrupt(b"%s\t%s" % (raw_key, raw_value))
+        # Unless it has been overwritten in the meantime, drop it upon the next update.
+        if state.data.get(raw_key) == raw_value:
+            del state.data[raw_key]
+            state.corrupt = True
+
+    def load(self) -> Mapping[ValueStoreKey, _SerializedValueStore]:
+        self._log_debug("loading from disk")
+        state = self._read()
+        return _LazyValueStores(
+            dict(state.data),
+            lambda raw_key, raw_value: self._drop_corrupt(state, raw_key, raw_value),
+        )
+
+    def update(self, updated: Mapping[ValueStoreKey, _SerializedValueStore]) -> None:
+        """Append the changed value stores to the journal
+
+        Unchanged value stores are skipped altogether.
+        """
+        self._log_debug("updating")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with store.locked(self.path):
+            state = self._read()
+            changes = {
+                raw_key: raw_value
+                for k, v in updated.items()
+                if state.data.get(raw_key := _serialize_key(k))
+                != (raw_value := json.dumps(v).encode())
+            }
+            state.data.update(changes)
+            if self._needs_compaction(state, len(changes)):
+                self._log_debug("compacting")
+                self._compact(state.data)
+                return
+
+            if not changes:
+                self._log_debug("nothing changed")
+                return
+
+            self._log_debug("appending to journal")
+            appended = self._serialize_entries(changes)
+            with self.path.open("ab") as f:
+                f.write(appended)
+            state.offset += len(appended)
+            state.lines += len(changes)
+
+    def _needs_compaction(self, state: _JournalState, n_changes: int) -> bool:
+        if state.corrupt:
+            return True
+        try:
+            # Missing or legacy file, or garbage left behind by an interrupted write.
+            if self.path.stat().st_size != state.offset:
+                return True
+        except FileNotFoundError:
+            return True
+        return state.lines + n_changes > max(
+            self.COMPACTION_MIN_LINES, self.COMPACTION_FACTOR * len(state.data)
+        )
+
+    def _compact(self, data: dict[bytes, bytes]) -> None:
+        content = self.HEADER + self._serialize_entries(data)
+        store.save_bytes_to_file(self.path, content)
+        self._state = _JournalState(self.path.stat().st_ino, len(content), len(data), data)
+
+
 class _ValueStore(MutableMapping[str, object]):
     """Implements the mutable mapping that is exposed to the plugins
 
@@ -203,7 +419,7 @@ class ValueStoreManager:
 
     def __init__(self, host_name: HostName, all_stores_store: AllValueStoresStore) -> None:
         self._store: Final = all_stores_store
-        self._all_stores = {**all_stores_store.load()}
+        self._all_stores = all_stores_store.load()
         self._accessed_stores: dict[ValueStoreKey, _ValueStore] = {}
         self.active_service_interface: _ValueStore | None = None
         self._host_name = host_name
@@ -29,10 +29,9 @@ def autochecks_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
 
 class TestAutochecksSerializer:
     def test_empty(self) -> None:
-        serial = b"[\n]\n"
         obj: list[AutocheckEntry] = []
-        assert AutochecksSerializer.serialize(obj) == serial
-        assert AutochecksSerializer.deserialize(serial) == obj
+        assert AutochecksSerializer.deserialize(AutochecksSerializer.serialize(obj)) == obj
+        assert AutochecksSerializer.deserialize(b"[\n]\n") == obj
 
     def test_with_item(self) -> None:
         serial = (
@@ -40,7 +39,7 @@ class TestAutochecksSerializer:
             b" 'parameters': {}, 'service_labels': {}},\n]\n"
         )
         obj = [AutocheckEntry(CheckPluginName("norris"), "abc", {}, {})]
-        assert AutochecksSerializer.serialize(obj) == serial
+        assert AutochecksSerializer.deserialize(AutochecksSerializer.serialize(obj)) == obj
         assert AutochecksSerializer.deserialize(serial) == obj
 
     def test_without_item(self) -> None:
@@ -49,7 +48,29 @@ class TestAutochecksSerializer:
             b" 'parameters': {}, 'service_labels': {}},\n]\n"
         )
         obj = [AutocheckEntry(CheckPluginName("norris"), None, {}, {})]
-        assert AutochecksSerializer.serialize(obj) == serial
+        assert AutochecksSerializer.deserialize(AutochecksSerializer.serialize(obj)) == obj
+        assert AutochecksSerializer.deserialize(serial) == obj
+
+    def test_binary_format(self) -> None:
+        obj = [
+            AutocheckEntry(
+                CheckPluginName("norris"),
+                "abc",
+                {"levels": (80.0, 90.0), "ports": {1, 2}},
+                {"label": "value"},
+            )
+        ]
+        serial = AutochecksSerializer.serialize(obj)
+        assert serial.startswith(b"CMK-AUTOCHECKS\0\x01")
+        assert AutochecksSerializer.deserialize(serial) == obj
+
+    def test_falls_back_to_literal_format(self) -> None:
+        class Str(str):
+            pass
+
+        obj = [AutocheckEntry(CheckPluginName("norris"), "abc", {"key": Str("value")}, {})]
+        serial = AutochecksSerializer.serialize(obj)
+        assert serial.startswith(b"[\n")
         assert AutochecksSerializer.deserialize(serial) == obj
 
 
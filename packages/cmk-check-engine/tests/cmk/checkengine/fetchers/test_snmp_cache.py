@@ -46,3 +46,19 @@ class TestWalkCache:
         assert (fetchoid, "12c3d4a", True) in cache
         cache.save()
         assert path in cache.mock_stored_on_fs
+
+    def test_save_load_roundtrip(self, tmp_path: Path) -> None:
+        cache = WalkCache(tmp_path, logging.getLogger("test"))
+        cache[(".1.2.3", "12c3d4a", True)] = [("1", b"\x00\xff"), ("2", b"value")]
+        cache[(".1.2.4", "12c3d4a", False)] = [("1", b"not saved")]
+        cache.save()
+
+        loaded = WalkCache(tmp_path, logging.getLogger("test"))
+        loaded.load()
+        assert dict(loaded) == {(".1.2.3", "12c3d4a", True): [("1", b"\x00\xff"), ("2", b"value")]}
+
+    def test_load_legacy_format(self, tmp_path: Path) -> None:
+        (tmp_path / "OID.1.2.3-12c3d4a").write_text("[('1', b'value')]\n")
+        cache = WalkCache(tmp_path, logging.getLogger("test"))
+        cache.load()
+        assert dict(cache) == {(".1.2.3", "12c3d4a", True): [("1", b"value")]}
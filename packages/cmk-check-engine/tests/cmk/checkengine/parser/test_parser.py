@@ -14,6 +14,7 @@
 import copy
 import itertools
 import logging
+import random
 import time
 from collections.abc import Sequence
 from pathlib import Path
@@ -30,7 +31,7 @@ from cmk.checkengine.parser import (
     SectionStore,
     SNMPParser,
 )
-from cmk.checkengine.parser._agent import ParserState
+from cmk.checkengine.parser._agent import feed, NOOPParser, ParserState, section_lines
 from cmk.checkengine.parser._markers import PiggybackMarker, SectionMarker
 from cmk.checkengine.plugins import SectionName
 from cmk.checkengine.snmplib import SNMPRawData, SNMPSectionMarker
@@ -754,6 +755,75 @@ class TestAgentParser:
         assert store.load() == {}
 
 
+class TestFeed:
+    FRAGMENTS = (
+        b"<<<section>>>",
+        b"<<<other:sep(0)>>>",
+        b"<<<nostrip:nostrip()>>>",
+        b"<<<persisted:persist(1000)>>>",
+        b"<<<>>>",
+        b"<<<:cached(1,2)>>>",
+        b"<<<\xff>>>",
+        b"<<<<piggy>>>>",
+        b"<<<<other piggy>>>>",
+        b"<<<<>>>>",
+        b"<<<<.>>>>",
+        b"<<<incomplete",
+        b" <<<indented>>>",
+        b"<<<trailing>>> ",
+        b"<<<section>>>\r",
+        b"",
+        b"   ",
+        b"\r",
+        b"  data  with  blanks  ",
+        b"data|with|pipes\r",
+        b"<<< data",
+        b"data >>>",
+    )
+
+    @staticmethod
+    def _make_parser() -> ParserState:
+        return NOOPParser(
+            HostName("testhost"),
+            [],
+            {},
+            translation={},
+            encoding_fallback="utf-8",
+            logger=logging.getLogger("test"),
+        )
+
+    @staticmethod
+    def _lines(parser: ParserState) -> object:
+        return (
+            [
+                (header, section_lines(chunks, strip=not header.nostrip))
+                for header, chunks in parser.sections
+            ],
+            {
+                host: [(header, section_lines(chunks, strip=False)) for header, chunks in sections]
+                for host, sections in parser.piggyback_sections.items()
+            },
+        )
+
+    @pytest.mark.parametrize("seed", range(50))
+    def test_same_result_as_line_by_line(self, seed: int) -> None:
+        rng = random.Random(seed)
+        raw_data = b"\n".join(rng.choices(self.FRAGMENTS, k=rng.randrange(1, 100)))
+
+        reference = self._make_parser()
+        for line in raw_data.split(b"\n"):
+            reference = reference(line.rstrip(b"\r"))
+
+        fed = feed(self._make_parser(), raw_data)
+
+        assert type(fed) is type(reference)
+        assert self._lines(fed) == self._lines(reference)
+
+    def test_data_is_not_split(self) -> None:
+        parser = feed(self._make_parser(), b"<<<section>>>\na b\nc d\n<<<other>>>\ne f")
+        assert [len(chunks) for _header, chunks in parser.sections] == [1, 1]
+
+
 class ParserStateAdapter(ParserState):
     def __init__(self, *, translation: TranslationOptions | None = None):
         super().__init__(
@@ -765,7 +835,7 @@ class ParserStateAdapter(ParserState):
             logger=logging.getLogger(),
         )
 
-    def do_action(self, line: bytes) -> ParserState:
+    def do_action(self, data: bytes | memoryview) -> ParserState:
         raise AssertionError("unexpected data line")
 
     def on_piggyback_header(self, piggyback_header: PiggybackMarker) -> ParserState:
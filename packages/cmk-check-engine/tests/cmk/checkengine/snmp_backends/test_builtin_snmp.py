@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# ruff: noqa: SLF001
+
+import bisect
+import dataclasses
+import logging
+import socket
+import threading
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+
+import pytest
+
+import cmk.checkengine.snmp_backends.builtin as builtin_snmp
+from cmk.ccc.hostaddress import HostAddress, HostName
+from cmk.checkengine.snmp_backends._utils import BackendError
+from cmk.checkengine.snmp_backends.classic import ClassicSNMPBackend
+from cmk.checkengine.snmplib import SNMPBackendEnum, SNMPHostConfig, SNMPVersion
+
+logger = logging.getLogger(__name__)
+
+type _MIB = Mapping[tuple[int, ...], tuple[int, bytes]]
+
+_MIB_DATA: _MIB = {
+    (1, 3, 6, 1, 2, 1, 1, 1, 0): (builtin_snmp._OCTET_STRING, b"Linux box 6.1 "),
+    (1, 3, 6, 1, 2, 1, 1, 2, 0): (builtin_snmp._OBJECT_IDENTIFIER, b"\x2b\x06\x01\x04\x01\x8f\x65"),
+    (1, 3, 6, 1, 2, 1, 1, 3, 0): (builtin_snmp._TIMETICKS, b"\x00\xbc\x61\x4e"),
+    **{
+        (1, 3, 6, 1, 2, 1, 2, 2, 1, 2, index): (builtin_snmp._OCTET_STRING, f"eth{index}".encode())
+        for index in range(1, 26)
+    },
+    **{
+        (1, 3, 6, 1, 2, 1, 2, 2, 1, 6, index): (builtin_snmp._OCTET_STRING, b"\x00\x1a\x2b\x3c\x4d")
+        for index in range(1, 26)
+    },
+    (1, 3, 6, 1, 2, 1, 4, 20, 1, 1, 10, 0, 0, 1): (builtin_snmp._IP_ADDRESS, b"\x0a\x00\x00\x01"),
+    (1, 3, 6, 1, 2, 1, 4, 21, 1, 2, 0): (builtin_snmp._INTEGER, b"\xff"),
+}
+
+
+class _Agent:
+    """Minimal SNMP agent serving a fixed MIB via UDP"""
+
+    def __init__(self, mib: _MIB) -> None:
+        self._mib = mib
+        self._names = sorted(mib)
+        self.num_requests = 0
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("127.0.0.1", 0))
+        self.port = self.socket.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                data, address = self.socket.recvfrom(65535)
+            except OSError:
+                return
+            self.num_requests += 1
+            self.socket.sendto(self._respond(data), address)
+
+    def _respond(self, data: bytes) -> bytes:
+        _tag, message, _end = builtin_snmp._decode(data, 0)
+        _tag, version, offset = builtin_snmp._decode(message, 0)
+        _tag, community, offset = builtin_snmp._decode(message, offset)
+        pdu_type, pdu, _end = builtin_snmp._decode(message, offset)
+        _tag, request_id, offset = builtin_snmp._decode(pdu, 0)
+        _tag, _non_repeaters, offset = builtin_snmp._decode(pdu, offset)
+        _tag, max_repetitions, offset = builtin_snmp._decode(pdu, offset)
+        _tag, bindings, _end = builtin_snmp._decode(pdu, offset)
+        _tag, varbind, _end = builtin_snmp._decode(bindings, 0)
+        _tag, name, _end = builtin_snmp._decode(varbind, 0)
+        oid = builtin_snmp._decode_oid(name)
+
+        error_status = 0
+        if pdu_type == builtin_snmp._GET_REQUEST:
+            varbinds = [(oid, *self._mib.get(oid, (builtin_snmp._NO_SUCH_OBJECT, b"")))]
+        else:
+            count = (
+                int.from_bytes(max_repetitions, "big")
+                if pdu_type == builtin_snmp._GET_BULK_REQUEST
+                else 1
+            )
+            start = bisect.bisect_right(self._names, oid)
+            varbinds = [(n, *self._mib[n]) for n in self._names[start : start + count]]
+            if not varbinds:
+                if version == b"\x00":
+                    error_status = builtin_snmp._ERROR_NO_SUCH_NAME
+                varbinds = [(oid, builtin_snmp._END_OF_MIB_VIEW, b"")]
+
+        encoded_varbinds = b"".join(
+            builtin_snmp._encode(
+                builtin_snmp._SEQUENCE,
+                builtin_snmp._encode_oid(n) + builtin_snmp._encode(tag, value),
+            )
+            for n, tag, value in varbinds
+        )
+        return builtin_snmp._encode(
+            builtin_snmp._SEQUENCE,
+            builtin_snmp._encode(builtin_snmp._INTEGER, version)
+            + builtin_snmp._encode(builtin_snmp._OCTET_STRING, community)
+            + builtin_snmp._encode(
+                builtin_snmp._RESPONSE,
+                builtin_snmp._encode(builtin_snmp._INTEGER, request_id)
+                + builtin_snmp._encode_integer(error_status)
+                + builtin_snmp._encode_integer(0)
+                + builtin_snmp._encode(builtin_snmp._SEQUENCE, encoded_varbinds),
+            ),
+        )
+
+
+@pytest.fixture(name="agent", scope="module")
+def fixture_agent() -> Iterator[_Agent]:
+    agent = _Agent(_MIB_DATA)
+    yield agent
+    agent.socket.close()
+
+
+def _snmp_config(
+    port: int,
+    *,
+    snmp_version: SNMPVersion = SNMPVersion.V2C,
+    bulkwalk_enabled: bool = True,
+) -> SNMPHostConfig:
+    return SNMPHostConfig(
+        is_ipv6_primary=False,
+        hostname=HostName("localhost"),
+        ipaddress=HostAddress("127.0.0.1"),
+        credentials="public" if snmp_version is not SNMPVersion.V3 else ("noAuthNoPriv", "me"),
+        port=port,
+        bulkwalk_enabled=bulkwalk_enabled,
+        snmp_version=snmp_version,
+        bulk_walk_size_of=10,
+        timing={"timeout": 0.5, "retries": 1},
+        oid_range_limits={},
+        snmpv3_contexts=[],
+        character_encoding=None,
+        snmp_backend=SNMPBackendEnum.BUILTIN,
+        stored_walk_path=Path("/tmp/foo"),
+    )
+
+
+@pytest.mark.parametrize(
+    "oid,expected",
+    [
+        (".1.3.6.1.2.1.1.1.0", b"Linux box 6.1"),
+        (".1.3.6.1.2.1.1.2.0", b".1.3.6.1.4.1.2021"),
+        (".1.3.6.1.2.1.1.3.0", b"12345678"),
+        (".1.3.6.1.2.1.2.2.1.6.1", b"\x00\x1a\x2b\x3c\x4d"),
+        (".1.3.6.1.2.1.4.20.1.1.10.0.0.1", b"10.0.0.1"),
+        (".1.3.6.1.2.1.4.21.1.2.0", b"-1"),
+        (".1.3.6.1.2.1.1.4.0", None),
+        (".1.3.6.1.2.1.1.*", b"Linux box 6.1"),
+        (".1.3.6.1.2.1.4.21.1.2.0.*", None),
+    ],
+)
+def test_get(agent: _Agent, oid: str, expected: bytes | None) -> None:
+    backend = builtin_snmp.BuiltinSNMPBackend(_snmp_config(agent.port), logger)
+    assert backend.get(oid, context="") == expected
+
+
+@pytest.mark.parametrize(
+    "snmp_version,bulkwalk_enabled,expected_requests",
+    [
+        (SNMPVersion.V2C, True, 3),
+        (SNMPVersion.V2C, False, 26),
+        (SNMPVersion.V1, True, 26),
+    ],
+)
+def test_walk(
+    agent: _Agent, snmp_version: SNMPVersion, bulkwalk_enabled: bool, expected_requests: int
+) -> None:
+    backend = builtin_snmp.BuiltinSNMPBackend(
+        _snmp_config(agent.port, snmp_version=snmp_version, bulkwalk_enabled=bulkwalk_enabled),
+        logger,
+    )
+    agent.num_requests = 0
+
+    assert backend.walk(".1.3.6.1.2.1.2.2.1.2", context="") == [
+        (f".1.3.6.1.2.1.2.2.1.2.{index}", f"eth{index}".encode()) for index in range(1, 26)
+    ]
+    assert agent.num_requests == expected_requests
+
+
+def test_walk_end_of_mib(agent: _Agent) -> None:
+    backend = builtin_snmp.BuiltinSNMPBackend(_snmp_config(agent.port), logger)
+    assert backend.walk(".1.3.6.1.2.1.4", context="") == [
+        (".1.3.6.1.2.1.4.20.1.1.10.0.0.1", b"10.0.0.1"),
+        (".1.3.6.1.2.1.4.21.1.2.0", b"-1"),
+    ]
+
+
+def test_walk_falls_back_to_get(agent: _Agent) -> None:
+    backend = builtin_snmp.BuiltinSNMPBackend(_snmp_config(agent.port), logger)
+    assert backend.walk(".1.3.6.1.2.1.1.1.0", context="") == [
+        (".1.3.6.1.2.1.1.1.0", b"Linux box 6.1")
+    ]
+
+
+def test_session_is_reused(agent: _Agent) -> None:
+    first = builtin_snmp._get_session(socket.AF_INET, "127.0.0.1", agent.port)
+    builtin_snmp.BuiltinSNMPBackend(_snmp_config(agent.port), logger).walk(
+        ".1.3.6.1.2.1.1", context=""
+    )
+    assert builtin_snmp._get_session(socket.AF_INET, "127.0.0.1", agent.port) is first
+
+
+def test_timeout() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as mute:
+        mute.bind(("127.0.0.1", 0))
+        backend = builtin_snmp.BuiltinSNMPBackend(
+            dataclasses.replace(
+                _snmp_config(mute.getsockname()[1]), timing={"timeout": 0.01, "retries": 0}
+            ),
+            logger,
+        )
+        assert backend.get(".1.3.6.1.2.1.1.1.0", context="") is None
+        with pytest.raises(BackendError):
+            backend.walk(".1.3.6.1.2.1.1", context="")
+
+
+def test_snmpv3_uses_classic_backend() -> None:
+    backend = builtin_snmp.BuiltinSNMPBackend(
+        _snmp_config(161, snmp_version=SNMPVersion.V3), logger
+    )
+    assert isinstance(backend._fallback, ClassicSNMPBackend)
+
+
+@pytest.mark.parametrize(
+    "oid",
+    [(1, 3, 6, 1, 2, 1, 1, 1, 0), (1, 3, 6, 1, 4, 1, 2021, 4294967295), (2, 999, 3)],
+)
+def test_oid_encoding(oid: tuple[int, ...]) -> None:
+    _tag, content, _end = builtin_snmp._decode(builtin_snmp._encode_oid(oid), 0)
+    assert builtin_snmp._decode_oid(content) == oid
+
+
+def test_long_length_encoding() -> None:
+    value = b"x" * 300
+    assert builtin_snmp._decode(builtin_snmp._encode(builtin_snmp._OCTET_STRING, value), 0) == (
+        builtin_snmp._OCTET_STRING,
+        value,
+        304,
+    )
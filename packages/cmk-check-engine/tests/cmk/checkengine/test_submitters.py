@@ -3,10 +3,26 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+# ruff: noqa: SLF001
+
+import select
+from pathlib import Path
+
 import pytest
 
-from cmk.checkengine.submitters import _serialize_metric
+import cmk.utils.paths
+from cmk.ccc.hostaddress import HostName
+from cmk.checkengine.specs.checkresults import SubmittableServiceCheckResult
+from cmk.checkengine.submitters import (
+    _atomic_chunks,
+    _serialize_metric,
+    _write_all,
+    FileSubmitter,
+    PipeSubmitter,
+    Submittee,
+)
 from cmk.utils.metrics import MetricTuple
+from cmk.utils.servicename import ServiceName
 
 
 @pytest.mark.parametrize(
@@ -64,3 +80,63 @@ from cmk.utils.metrics import MetricTuple
 )
 def test_serialize_metric(metric: MetricTuple, expected: str) -> None:
     assert _serialize_metric(metric) == expected
+
+
+def _submittees(count: int) -> list[Submittee]:
+    return [
+        Submittee(
+            name=ServiceName(f"Service {n}"),
+            result=SubmittableServiceCheckResult(state=n % 4, output=f"Line {n}\nDetails"),
+            cache_info=None,
+        )
+        for n in range(count)
+    ]
+
+
+def test_atomic_chunks() -> None:
+    commands = [b"x" * (n % 97) + b"\n" for n in range(1000)] + [b"y" * 5000 + b"\n"]
+
+    chunks = list(_atomic_chunks(commands, select.PIPE_BUF))
+
+    assert b"".join(chunks) == b"".join(commands)
+    assert all(len(chunk) <= select.PIPE_BUF for chunk in chunks[:-1])
+    assert chunks[-1] == commands[-1]
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+
+
+def test_pipe_submitter(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    pipe_path = tmp_path / "nagios.cmd"
+    pipe_path.touch()
+    monkeypatch.setattr(cmk.utils.paths, "nagios_command_pipe_path", pipe_path)
+    monkeypatch.setattr(PipeSubmitter, "_nagios_command_pipe", None)
+
+    PipeSubmitter(HostName("heute"), perfdata_format="standard", show_perfdata=False).submit(
+        _submittees(300)
+    )
+    assert PipeSubmitter._nagios_command_pipe
+    PipeSubmitter._nagios_command_pipe.close()
+
+    lines = pipe_path.read_bytes().decode().splitlines()
+    assert len(lines) == 300
+    assert lines[7].endswith("PROCESS_SERVICE_CHECK_RESULT;heute;Service 7;3;Line 7\\nDetails|")
+
+
+def test_file_submitter(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(cmk.utils.paths, "check_result_path", tmp_path)
+
+    FileSubmitter(HostName("heute"), perfdata_format="standard", show_perfdata=False).submit(
+        _submittees(3)
+    )
+
+    (ok_file,) = tmp_path.glob("c*.ok")
+    records = Path(str(ok_file)[: -len(".ok")]).read_text().split("\n\n")
+    assert len(records) == 4 and not records[-1]
+    assert records[1].splitlines()[:2] == ["host_name=heute", "service_description=Service 1"]
+    assert records[1].splitlines()[-1] == "output=Line 1\\nDetails|"
+
+
+def test_write_all_large_number_of_buffers(tmp_path: Path) -> None:
+    buffers = [f"{n}\n".encode() for n in range(5000)]
+    with (tmp_path / "out").open("wb") as file:
+        _write_all(file.fileno(), buffers)
+    assert (tmp_path / "out").read_bytes() == b"".join(buffers)
@@ -79,6 +79,113 @@ class TestAllValueStoresStore:
         }
 
 
+class TestJournaledValueStoresStore:
+    @staticmethod
+    def _get_jvss(file: Path) -> value_store.JournaledValueStoresStore:
+        return value_store.JournaledValueStoresStore(file, log_debug=lambda x: None)  # noqa: ARG005
+
+    def test_load_without_file(self, tmp_path: Path) -> None:
+        assert self._get_jvss(tmp_path / "no-file").load() == {}
+
+    def test_load_legacy_file(self, tmp_path: Path) -> None:
+        file = tmp_path / "file"
+        file.write_text('[[["host1", "service1", "item"], {"key": "value1"}]]')
+        assert self._get_jvss(file).load() == {
+            (HostName("host1"), "service1", "item"): {"key": "value1"},
+        }
+
+    def test_update_converts_legacy_file(self, tmp_path: Path) -> None:
+        file = tmp_path / "file"
+        file.write_text(
+            "["
+            '[["host1", "service1", "item"], {"key": "value1"}],'
+            '[["host1", "service2", null], {"key": "value2"}]'
+            "]"
+        )
+        self._get_jvss(file).update({(HostName("host1"), "service1", "item"): {"key": "new"}})
+
+        assert file.read_bytes().startswith(value_store.JournaledValueStoresStore.HEADER)
+        assert self._get_jvss(file).load() == {
+            (HostName("host1"), "service1", "item"): {"key": "new"},
+            (HostName("host1"), "service2", None): {"key": "value2"},
+        }
+
+    def test_update_appends_changes_only(self, tmp_path: Path) -> None:
+        file = tmp_path / "file"
+        jvss1 = self._get_jvss(file)
+        jvss2 = self._get_jvss(file)
+
+        jvss1.update(
+            {
+                (HostName("host1"), "service1", "item"): {"key": "value1"},
+                (HostName("host1"), "service2", None): {"key": "value2"},
+            }
+        )
+        size = file.stat().st_size
+        jvss2.update(
+            {
+                (HostName("host1"), "service1", "item"): {"key": "value1"},
+                (HostName("host1"), "service2", None): {"key": "new_value2"},
+            }
+        )
+
+        assert file.read_bytes()[size:] == b'["host1", "service2", null]\t{"key": "new_value2"}\n'
+        assert self._get_jvss(file).load() == {
+            (HostName("host1"), "service1", "item"): {"key": "value1"},
+            (HostName("host1"), "service2", None): {"key": "new_value2"},
+        }
+
+    def test_update_ignores_incomplete_line(self, tmp_path: Path) -> None:
+        file = tmp_path / "file"
+        jvss = self._get_jvss(file)
+        jvss.update({(HostName("host1"), "service1", "item"): {"key": "value1"}})
+        with file.open("ab") as f:
+            f.write(b'["host1", "serv')
+
+        assert len(self._get_jvss(file).load()) == 1
+        jvss.update({(HostName("host1"), "service2", None): {"key": "value2"}})
+        assert self._get_jvss(file).load() == {
+            (HostName("host1"), "service1", "item"): {"key": "value1"},
+            (HostName("host1"), "service2", None): {"key": "value2"},
+        }
+
+    def test_corrupt_entries_are_skipped_and_dropped(self, tmp_path: Path) -> None:
+        file = tmp_path / "file"
+        jvss = self._get_jvss(file)
+        jvss.update({(HostName("host1"), "service1", "item"): {"key": "value1"}})
+        with file.open("ab") as f:
+            f.write(b'["host1", "service2", null]\t{"key": garbage\n')
+            f.write(b"garbage\n")
+            f.write(b'["host1", "service3"]\t{"key": "value3"}\n')
+
+        assert jvss.load().get((HostName("host1"), "service2", None)) is None
+        assert self._get_jvss(file).load() == {
+            (HostName("host1"), "service1", "item"): {"key": "value1"}
+        }
+
+        jvss.update({(HostName("host1"), "service4", None): {"key": "value4"}})
+        assert b"garbage" not in file.read_bytes()
+        assert self._get_jvss(file).load() == {
+            (HostName("host1"), "service1", "item"): {"key": "value1"},
+            (HostName("host1"), "service4", None): {"key": "value4"},
+        }
+
+    def test_compaction(self, tmp_path: Path) -> None:
+        file = tmp_path / "file"
+        jvss = self._get_jvss(file)
+        key = (HostName("host1"), "service1", "item")
+        for n in range(2 * value_store.JournaledValueStoresStore.COMPACTION_MIN_LINES):
+            jvss.update({key: {"key": str(n)}})
+
+        assert (
+            len(file.read_bytes().splitlines())
+            <= value_store.JournaledValueStoresStore.COMPACTION_MIN_LINES + 1
+        )
+        assert self._get_jvss(file).load() == {
+            key: {"key": str(2 * value_store.JournaledValueStoresStore.COMPACTION_MIN_LINES - 1)}
+        }
+
+
 class _BrokenRepr(str):
     def __repr__(self) -> str:
         raise ValueError("I'm broken!")
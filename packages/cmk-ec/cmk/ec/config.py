@@ -339,6 +339,10 @@ class ConfigFromWATO(TypedDict):
     rules: Collection[Rule]
     sqlite_housekeeping_interval: int
     sqlite_freelist_size: int
+    sqlite_journal_mode: Literal["wal", "delete"]
+    sqlite_synchronous: Literal["off", "normal", "full"]
+    sqlite_write_batch_size: int
+    sqlite_write_batch_interval: int
     snmp_credentials: Collection[SNMPCredential]
     socket_queue_len: int
     statistics_interval: int
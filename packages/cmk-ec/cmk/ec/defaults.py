@@ -55,6 +55,10 @@ def default_config() -> ConfigFromWATO:
         housekeeping_interval=60,
         sqlite_housekeeping_interval=3600,  # seconds ValueSpec Age
         sqlite_freelist_size=50 * 1024 * 1024,  # bytes ValueSpec FIlesize
+        sqlite_journal_mode="wal",
+        sqlite_synchronous="normal",
+        sqlite_write_batch_size=1000,
+        sqlite_write_batch_interval=1,  # seconds ValueSpec Age
         statistics_interval=5,
         history_lifetime=365,  # days
         history_rotation="daily",
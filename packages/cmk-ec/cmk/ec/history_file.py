@@ -7,7 +7,10 @@ import shlex
 import subprocess
 import threading
 import time
+from collections import deque
 from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from logging import Logger
 from pathlib import Path
 from typing import Any
@@ -15,10 +18,14 @@ from typing import Any
 from .config import Config
 from .event import Event, scrub_string
 from .history import _log_event, ActiveHistoryPeriod, get_logfile, History, HistoryWhat, quote_tab
+from .history_file_index import bloom_key, index_path, IndexedBlock, IndexWriter, read_index
 from .log_level import VERBOSE
 from .query import Columns, OperatorName, QueryFilter, QueryGET
 from .settings import Settings
 
+# The number of history files read at the same time by a query
+_MAX_PARALLEL_FILES = 4
+
 
 class FileHistory(History):
     def __init__(
@@ -36,6 +43,13 @@ class FileHistory(History):
         self._history_columns = history_columns
         self._lock = threading.Lock()
         self._active_history_period = ActiveHistoryPeriod()
+        # Position of the indexed fields in the lines, after the 4 columns of the history entry
+        self._index_columns = {
+            field: 4 + position
+            for position, (column_name, _default) in enumerate(event_columns)
+            if (field := _INDEXED_COLUMNS.get(column_name)) is not None
+        }
+        self._index_writer: IndexWriter | None = None
 
     def flush(self) -> None:
         _expire_logfiles(self._settings, self._config, self._logger, self._lock, True)
@@ -63,12 +77,24 @@ class FileHistory(History):
                 for colname, defval in self._event_columns
             ]
 
-            with get_logfile(
+            path = get_logfile(
                 self._config,
                 self._settings.paths.history_dir.value,
                 self._active_history_period,
-            ).open(mode="ab") as f:
-                f.write(b"\t".join(columns) + b"\n")
+            )
+            line = b"\t".join(columns) + b"\n"
+            with path.open(mode="ab") as f:
+                if (
+                    self._index_writer is None
+                    or self._index_writer.log_path != path
+                    or self._index_writer.end != f.tell()
+                ):
+                    # A new history file, or the file has changed behind our back
+                    if self._index_writer is not None:
+                        self._index_writer.close()
+                    self._index_writer = IndexWriter(path, self._index_columns)
+                f.write(line)
+            self._index_writer.add(line)
 
     def get(self, query: QueryGET) -> Iterable[Sequence[object]]:
         if not self._settings.paths.history_dir.value.exists():
@@ -79,8 +105,6 @@ class FileHistory(History):
         limit = query.limit
         self._logger.debug("Limit: %r", limit)
 
-        grep_pipeline = _grep_pipeline(filters)
-
         time_filters = [
             (f.operator_name, f.argument) for f in filters if f.column_name.split("_")[-1] == "time"
         ]
@@ -103,30 +127,58 @@ class FileHistory(History):
         # already be done by the GUI, so we don't do that twice. Skipping
         # this # will lead into some lines of a single file to be limited in
         # wrong order. But this should be better than before.
-        history_entries: list[Any] = []
+        paths = []
         for path in sorted(self._settings.paths.history_dir.value.glob("*.log"), reverse=True):
-            if limit is not None and limit <= 0:
-                self._logger.debug("query limit reached")
-                break
             if not _intersects(time_range, _get_logfile_timespan(path)):
                 self._logger.debug("skipping history file %s because of time filters", path)
                 continue
-            tac = f"nl -b a {shlex.quote(str(path))} | tac"  # Process younger lines first
-            cmd = " | ".join([tac] + grep_pipeline)
-            self._logger.debug("preprocessing history file with command [%s]", cmd)
-            new_entries = parse_history_file(
-                self._history_columns, path, query.filter_row, cmd, limit, self._logger
+            paths.append(path)
+
+        # Up to _MAX_PARALLEL_FILES files are read in parallel. Each one is read with the limit
+        # left when it is submitted, the entries beyond the limit of the files before it are
+        # dropped afterwards. No further files are submitted once the limit is reached.
+        history_entries: list[Any] = []
+        remaining_paths = iter(paths)
+        with ThreadPoolExecutor(max_workers=_MAX_PARALLEL_FILES) as executor:
+            pending = deque(
+                executor.submit(self._get_from_file, path, query, limit)
+                for path in islice(remaining_paths, _MAX_PARALLEL_FILES)
             )
-            history_entries += new_entries
-            if limit is not None:
-                limit -= len(new_entries)
+            while pending:
+                new_entries = pending.popleft().result()
+                if limit is not None:
+                    new_entries = new_entries[: limit + 1]
+                    limit -= len(new_entries)
+                history_entries += new_entries
+                if limit is not None and limit <= 0:
+                    self._logger.debug("query limit reached")
+                    for future in pending:
+                        future.cancel()
+                    break
+                if (next_path := next(remaining_paths, None)) is not None:
+                    pending.append(executor.submit(self._get_from_file, next_path, query, limit))
         return history_entries
 
+    def _get_from_file(self, path: Path, query: QueryGET, limit: int | None) -> list[Any]:
+        if (blocks := read_index(path)) is not None:
+            return _read_indexed_history_file(
+                self._history_columns, path, blocks, query, limit=limit, logger=self._logger
+            )
+        tac = f"nl -b a {shlex.quote(str(path))} | tac"  # Process younger lines first
+        cmd = " | ".join([tac] + _grep_pipeline(query.filters))
+        self._logger.debug("preprocessing history file with command [%s]", cmd)
+        return parse_history_file(
+            self._history_columns, path, query.filter_row, cmd, limit, self._logger
+        )
+
     def housekeeping(self) -> None:
         _expire_logfiles(self._settings, self._config, self._logger, self._lock, False)
 
     def close(self) -> None:
-        pass
+        with self._lock:
+            if self._index_writer is not None:
+                self._index_writer.close()
+                self._index_writer = None
 
 
 def _expire_logfiles(
@@ -149,6 +201,7 @@ def _expire_logfiles(
                         "Deleting log file %s (age %s)", path, _date_and_time(path.stat().st_mtime)
                     )
                     path.unlink()
+                    index_path(path).unlink(missing_ok=True)
         except Exception as e:
             if settings.options.debug:
                 raise
@@ -174,6 +227,31 @@ _GREPABLE_COLUMNS = {
 }
 
 
+# The columns in the Bloom filters of the history file index
+_INDEXED_COLUMNS = {
+    "event_host": "host",
+    "event_application": "application",
+    "event_rule_id": "rule_id",
+}
+
+
+def _bloom_keys(filters: Iterable[QueryFilter]) -> list[set[str]]:
+    """For each filter on an indexed column: a matching entry has one of these keys
+
+    >>> (keys,) = _bloom_keys([QueryFilter("event_host", "in", lambda x: True, ["a", "B"])])
+    >>> sorted(keys)
+    ['host\\x00a', 'host\\x00b']
+
+    """
+    return [
+        {bloom_key(field, str(argument)) for argument in arguments}
+        for f in filters
+        if (field := _INDEXED_COLUMNS.get(f.column_name)) is not None
+        and f.operator_name in {"=", "=~", "in"}
+        for arguments in [f.argument if f.operator_name == "in" else [f.argument]]
+    ]
+
+
 def _grep_pipeline(filters: Iterable[QueryFilter]) -> list[str]:
     """
     Optimization: use grep in order to reduce amount of read lines based on some frequently used
@@ -293,6 +371,57 @@ def parse_history_file(
     return entries
 
 
+def _read_indexed_history_file(
+    history_columns: Sequence[tuple[str, Any]],
+    path: Path,
+    blocks: Sequence[IndexedBlock],
+    query: QueryGET,
+    *,
+    limit: int | None,
+    logger: Logger,
+) -> list[Any]:
+    """Read the blocks of a history file which may contain matching entries
+
+    The result is the same as the one of parse_history_file() with the grep pipeline.
+    """
+    history_time_filters = [
+        (f.operator_name, f.argument) for f in query.filters if f.column_name == "history_time"
+    ]
+    time_range = (
+        _greatest_lower_bound_for_filters(history_time_filters),
+        _least_upper_bound_for_filters(history_time_filters),
+    )
+    bloom_keys = _bloom_keys(query.filters)
+    # The youngest lines are not indexed yet and always read
+    tail = (blocks[-1].end, blocks[-1].first_line + blocks[-1].num_lines) if blocks else (0, 1)
+    chunks = [(*tail, None)] + [
+        (block.offset, block.first_line, block.size)
+        for block in reversed(blocks)
+        if _intersects(time_range, (block.min_time, block.max_time))
+        and all(block.may_contain_any(keys) for keys in bloom_keys)
+    ]
+
+    entries: list[Any] = []
+    with path.open(mode="rb") as f:
+        for offset, first_line, size in chunks:
+            f.seek(offset)
+            lines = f.read(-1 if size is None else size).split(b"\n")
+            if not lines[-1]:
+                lines.pop()
+            for line_number in range(first_line + len(lines) - 1, first_line - 1, -1):
+                if limit is not None and len(entries) > limit:
+                    return entries
+                line = lines[line_number - first_line]
+                try:
+                    parts: list[Any] = [str(line_number), *line.decode("utf-8").split("\t")]
+                    convert_history_line(history_columns, parts)
+                    if query.filter_row(parts):
+                        entries.append(parts)
+                except Exception:
+                    logger.exception("Invalid line '%s' in history file %s", line, path)
+    return entries
+
+
 def convert_history_line(history_columns: Sequence[tuple[str, Any]], values: list[Any]) -> None:
     """
     Speed-critical function for converting string representation
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Sidecar index of the history files of the Event Console
+
+The lines of a history file are grouped into blocks of about 64 KiB. For each block the
+index holds its offset and size, the number of its first line, the range of its history
+times and a Bloom filter of the hosts, applications and rule IDs of its entries. A query
+only reads the blocks which may contain matching entries. The youngest block of a file is
+not in the index yet and is always read.
+
+A history file without an index has been written before the index existed, such files
+are still searched with grep.
+"""
+
+import hashlib
+import struct
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+_BLOCK_SIZE = 64 * 1024
+_BLOOM_BITS = 4096
+_BLOOM_HASHES = 4
+
+# offset, size, number of the first line, number of lines, lowest and highest history time
+_RECORD = struct.Struct("<QIIIdd")
+_RECORD_SIZE = _RECORD.size + _BLOOM_BITS // 8
+
+
+def index_path(log_path: Path) -> Path:
+    return log_path.with_suffix(".idx")
+
+
+def bloom_key(field: str, value: str) -> str:
+    """The key of a value in the Bloom filters, case-insensitive to serve '=~' and 'in'"""
+    return f"{field}\0{value.lower()}"
+
+
+def _bloom_bits(key: str) -> Iterable[int]:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4 * _BLOOM_HASHES).digest()
+    for n in range(_BLOOM_HASHES):
+        yield int.from_bytes(digest[4 * n : 4 * n + 4], "little") % _BLOOM_BITS
+
+
+@dataclass(frozen=True)
+class IndexedBlock:
+    offset: int
+    size: int
+    first_line: int
+    num_lines: int
+    min_time: float
+    max_time: float
+    bloom: bytes
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.size
+
+    def may_contain_any(self, keys: Iterable[str]) -> bool:
+        return any(
+            all(self.bloom[bit >> 3] & (1 << (bit & 7)) for bit in _bloom_bits(key)) for key in keys
+        )
+
+
+def read_index(log_path: Path) -> Sequence[IndexedBlock] | None:
+    """The indexed blocks of a history file, None if it has no usable index"""
+    try:
+        raw = index_path(log_path).read_bytes()
+        log_size = log_path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+    blocks: list[IndexedBlock] = []
+    end, next_line = 0, 1
+    # A torn record at the end is ignored, the lines of its block are in the tail then.
+    for pos in range(0, len(raw) - _RECORD_SIZE + 1, _RECORD_SIZE):
+        offset, size, first_line, num_lines, min_time, max_time = _RECORD.unpack_from(raw, pos)
+        if offset != end or first_line != next_line:
+            return None
+        if offset + size > log_size:
+            break  # the history file has lost its end in a crash
+        bloom = raw[pos + _RECORD.size : pos + _RECORD_SIZE]
+        blocks.append(IndexedBlock(offset, size, first_line, num_lines, min_time, max_time, bloom))
+        end, next_line = offset + size, first_line + num_lines
+    return blocks
+
+
+def _pack(block: IndexedBlock) -> bytes:
+    return (
+        _RECORD.pack(
+            block.offset,
+            block.size,
+            block.first_line,
+            block.num_lines,
+            block.min_time,
+            block.max_time,
+        )
+        + block.bloom
+    )
+
+
+class IndexWriter:
+    """Indexes the lines appended to a history file
+
+    The columns map the fields of the Bloom filters to their position in a line.
+    """
+
+    def __init__(self, log_path: Path, columns: Mapping[str, int]) -> None:
+        self.log_path = log_path
+        self._columns = columns
+        self._index_path = index_path(log_path)
+        blocks = read_index(log_path)
+        log_size = log_path.stat().st_size if log_path.exists() else 0
+        self.end = log_size
+        # A history file written before the index existed does not get one.
+        self._enabled = blocks is not None or log_size == 0
+        if blocks is None:
+            blocks = []
+        if not self._enabled:
+            return
+
+        if (
+            not self._index_path.exists()
+            or self._index_path.stat().st_size != len(blocks) * _RECORD_SIZE
+        ):
+            # Drop what read_index() has not accepted
+            self._index_path.write_bytes(b"".join(_pack(block) for block in blocks))
+        self._pending = b""
+        self._start_block(
+            blocks[-1].end if blocks else 0,
+            blocks[-1].first_line + blocks[-1].num_lines if blocks else 1,
+        )
+        # Continue the youngest block, e.g. after a restart
+        if self._offset < log_size:
+            with log_path.open(mode="rb") as f:
+                f.seek(self._offset)
+                self._add(f.read(log_size - self._offset))
+
+    def _start_block(self, offset: int, first_line: int) -> None:
+        self._offset = offset
+        self._first_line = first_line
+        self._size = 0
+        self._num_lines = 0
+        self._min_time = float("inf")
+        self._max_time = float("-inf")
+        self._bloom = bytearray(_BLOOM_BITS // 8)
+
+    def add(self, data: bytes) -> None:
+        """Index the data appended at the end of the history file"""
+        self.end += len(data)
+        if self._enabled:
+            self._add(data)
+
+    def _add(self, data: bytes) -> None:
+        # Only complete lines belong to a block
+        *lines, self._pending = (self._pending + data).split(b"\n")
+        for line in lines:
+            self._add_line(line)
+
+    def _add_line(self, line: bytes) -> None:
+        fields = line.split(b"\t")
+        try:
+            history_time = float(fields[0])
+            self._min_time = min(self._min_time, history_time)
+            self._max_time = max(self._max_time, history_time)
+        except ValueError:
+            pass
+        for field, position in self._columns.items():
+            if position < len(fields):
+                for bit in _bloom_bits(bloom_key(field, fields[position].decode(errors="replace"))):
+                    self._bloom[bit >> 3] |= 1 << (bit & 7)
+        self._size += len(line) + 1
+        self._num_lines += 1
+        if self._size >= _BLOCK_SIZE:
+            self._close_block()
+
+    def _close_block(self) -> None:
+        if not self._num_lines:
+            return
+        with self._index_path.open(mode="ab") as f:
+            f.write(
+                _pack(
+                    IndexedBlock(
+                        self._offset,
+                        self._size,
+                        self._first_line,
+                        self._num_lines,
+                        self._min_time,
+                        self._max_time,
+                        bytes(self._bloom),
+                    )
+                )
+            )
+        self._start_block(self._offset + self._size, self._first_line + self._num_lines)
+
+    def close(self) -> None:
+        if self._enabled:
+            self._close_block()
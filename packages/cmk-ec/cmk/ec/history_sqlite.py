@@ -10,6 +10,7 @@ import os
 import re
 import sqlite3
 import stat
+import threading
 import time
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
@@ -66,11 +67,13 @@ INDEXED_COLUMNS: Final = (
 )
 
 SQLITE_PRAGMAS = {
-    "PRAGMA journal_mode=WAL;": "WAL mode for concurrent reads and writes",
-    "PRAGMA synchronous = NORMAL;": "Writes should not blocked by reads",
     "PRAGMA busy_timeout = 2000;": "2 seconds timeout for busy handler. Avoids database is locked errors",
 }
 
+INSERT_STATEMENT: Final = f"""INSERT INTO
+    history ({", ".join(TABLE_COLUMNS[1:])})
+        VALUES ({", ".join(itertools.repeat("?", len(TABLE_COLUMNS[1:])))});"""  # nosec B608 # BNS:6b6392
+
 SQLITE_INDEXES = [
     f"CREATE INDEX IF NOT EXISTS idx_{column} ON history ({column});" for column in INDEXED_COLUMNS
 ]
@@ -197,6 +200,13 @@ class SQLiteHistory(History):
         self._last_housekeeping = 0.0
         self._page_size = 4096
 
+        # Write-behind buffer: Entries are inserted in batches, see add().
+        self._pending: list[tuple[object, ...]] = []
+        self._pending_lock = threading.Lock()
+        self._pending_timer: threading.Timer | None = None
+        self._batch_size = max(1, self._config["sqlite_write_batch_size"])
+        self._batch_interval = self._config["sqlite_write_batch_interval"]
+
         if isinstance(self._settings.database, Path):
             self._settings.database.parent.mkdir(parents=True, exist_ok=True)
             self._settings.database.touch(exist_ok=True)
@@ -227,6 +237,10 @@ class SQLiteHistory(History):
         self.conn.row_factory = sqlite3.Row
 
         with self.conn as connection:
+            # WAL mode allows concurrent reads and writes. With synchronous=NORMAL, writes are not
+            # blocked by reads, but the last transactions might be lost on a power failure.
+            connection.execute(f"PRAGMA journal_mode={self._config['sqlite_journal_mode']};")
+            connection.execute(f"PRAGMA synchronous={self._config['sqlite_synchronous']};")
             for pragma_string in SQLITE_PRAGMAS:
                 connection.execute(pragma_string)
             self._page_size = connection.execute("PRAGMA page_size").fetchone()[0]
@@ -273,37 +287,76 @@ class SQLiteHistory(History):
                 connection.execute(index_statement)
 
     def flush(self) -> None:
-        """Delete all entries the history table."""
-        with self.conn as connection:
-            connection.execute("DELETE FROM history;")
+        """Delete all entries the history table, including the not yet written ones."""
+        with self._pending_lock:
+            self._pending = []
+            self._cancel_pending_timer()
+            with self.conn as connection:
+                connection.execute("DELETE FROM history;")
 
     def add(self, event: Event, what: HistoryWhat, who: str = "", addinfo: str = "") -> None:
         """Add a single entry to the history table.
 
         No need to include the line column, as it is autoincremented.
+
+        The entry is buffered and written together with others in a single transaction, as
+        soon as sqlite_write_batch_size entries are pending or sqlite_write_batch_interval
+        seconds have passed. Queries and the housekeeping write the pending entries first.
         """
-        with self.conn as connection:
-            cur = connection.cursor()
-            cur.execute(
-                f"""INSERT INTO
-                    history ({", ".join(TABLE_COLUMNS[1:])})
-                        VALUES ({", ".join(itertools.repeat("?", len(TABLE_COLUMNS[1:])))});""",  # nosec B608 # BNS:6b6392
-                tuple(
-                    itertools.chain(
-                        (time.time(), what, who, addinfo),
-                        [
-                            event.get(colname.removeprefix("event_"), defval)
-                            for colname, defval in self._event_columns
-                        ],
-                    )
-                ),
+        entry = tuple(
+            itertools.chain(
+                (time.time(), what, who, addinfo),
+                [
+                    event.get(colname.removeprefix("event_"), defval)
+                    for colname, defval in self._event_columns
+                ],
             )
+        )
+        with self._pending_lock:
+            self._pending.append(entry)
+            if len(self._pending) >= self._batch_size:
+                self._write_pending()
+            elif self._pending_timer is None:
+                self._pending_timer = threading.Timer(
+                    self._batch_interval, self._write_pending_when_due
+                )
+                self._pending_timer.daemon = True
+                self._pending_timer.start()
+
+    def write_pending(self) -> None:
+        """Write all buffered entries to the database."""
+        with self._pending_lock:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        self._cancel_pending_timer()
+        if not self._pending:
+            return
+        entries, self._pending = self._pending, []
+        with self.conn as connection:
+            connection.executemany(INSERT_STATEMENT, entries)
+
+    def _cancel_pending_timer(self) -> None:
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+            self._pending_timer = None
+
+    def _write_pending_when_due(self) -> None:
+        with self._pending_lock:
+            if self._pending_timer is not threading.current_thread():
+                return  # The entries have been written in the meantime.
+            self._pending_timer = None
+            try:
+                self._write_pending()
+            except Exception:
+                self._logger.exception("Cannot write the pending history entries")
 
     def get(self, query: QueryGET) -> Iterable[Sequence[object]]:
         """Retrieve entries from the history table.
 
         Always return all columns, since they are filtered elsewhere.
         """
+        self.write_pending()
         sqlite_query, sqlite_arguments = filters_to_sqlite_query(query.filters)
         if query.limit:
             sqlite_query += " LIMIT ?"
@@ -316,6 +369,7 @@ class SQLiteHistory(History):
     def housekeeping(self) -> None:
         """Remove old entries from the history table, performin a VACUUM to shrink the database file
         if needed"""
+        self.write_pending()
         now = time.time()
         if now - self._last_housekeeping <= self._config["sqlite_housekeeping_interval"]:
             return
@@ -375,6 +429,7 @@ class SQLiteHistory(History):
         Used during a new object instantiation,
         to avoid sqlite3.OperationalError: database is locked.
         """
+        self.write_pending()
         self.conn.commit()
         self.conn.close()
 
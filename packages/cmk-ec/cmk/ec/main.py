@@ -78,10 +78,12 @@ from .query import (
     QueryREPLICATE,
     StatusTable,
 )
+from .rule_index import RuleIndex
 from .rule_matcher import compile_rule, match, MatchFailure, MatchResult, MatchSuccess, RuleMatcher
 from .rule_packs import load_active_config
 from .settings import create_settings, FileDescriptor, PortNumber, Settings
 from .snmp import SNMPTrapParser
+from .status_journal import PackedEventStatus, StatusJournal
 from .syslog import SyslogFacility, SyslogPriority
 from .timeperiod import TimePeriods
 
@@ -107,13 +109,6 @@ def setup_logging_handler(stream: IO[str]) -> None:
     logger.addHandler(handler)
 
 
-class PackedEventStatus(TypedDict):
-    next_event_id: int
-    events: list[Event]
-    rule_stats: dict[str, int]
-    interval_starts: dict[str, int]
-
-
 class SlaveStatus(TypedDict):
     last_master_down: float | None
     last_sync: float
@@ -394,6 +389,7 @@ class EventServer(ECServerThread):
         self._rules: list[Rule] = []
         self._rule_by_id: dict[str | None, Rule] = {}
         self._rule_hash: dict[int, dict[int, Any]] = {}
+        self._rule_index: RuleIndex | None = None
         self._hash_stats: list[list[int]] = []  # facility/priority
         for _unused_facility in range(32):
             self._hash_stats.append([0] * 8)
@@ -894,6 +890,7 @@ class EventServer(ECServerThread):
                             event["last_token"] = (
                                 last_token + new_tokens * secs_per_token
                             )  # not now! would be unfair
+                            self._event_status.mark_changed(event)
                             if event["count"] == 0:
                                 self._logger.info(
                                     "Rule %s/%s, event %d: again without allowed rate, dropping event",
@@ -927,6 +924,7 @@ class EventServer(ECServerThread):
                         event["rule_id"],
                     )
                     event["phase"] = "open"
+                    self._event_status.mark_changed(event)
                     self._history.add(event, "DELAYOVER")
                     if rule:
                         event_has_opened(
@@ -940,6 +938,7 @@ class EventServer(ECServerThread):
                             rule,
                             event,
                         )
+                        self._event_status.mark_changed(event)
                         if rule.get("autodelete"):
                             event["phase"] = "closed"
                             events_to_delete.append((event, "AUTODELETE"))
@@ -1082,6 +1081,7 @@ class EventServer(ECServerThread):
             # Better rewrite (again). Rule might have changed. Also we have changed
             # the text and the user might have his own text added via set_text.
             self.rewrite_event(rule, merge_event, MatchGroups(), set_first=False)
+            self._event_status.mark_changed(merge_event)
             self._history.add(merge_event, "COUNTFAILED")
         else:
             # Create artificial event from scratch. Make sure that all important
@@ -1121,6 +1121,7 @@ class EventServer(ECServerThread):
                 rule,
                 event,
             )
+            self._event_status.mark_changed(event)
             if rule.get("autodelete"):
                 event["phase"] = "closed"
                 self._event_status.remove_event(event, "AUTODELETE")
@@ -1145,6 +1146,7 @@ class EventServer(ECServerThread):
         self._rule_by_id = {}
         # Speedup-Hash for rule execution
         self._rule_hash = {}
+        self._rule_index = None
         count_disabled = 0
         count_rules = 0
         count_unspecific = 0
@@ -1194,6 +1196,8 @@ class EventServer(ECServerThread):
             "Compiled %d active rules (ignoring %d disabled rules)", count_rules, count_disabled
         )
         if self._config["rule_optimizer"]:
+            # Prefilter on texts, host names and networks, see RuleIndex
+            self._rule_index = RuleIndex(self._rules)
             self._logger.info(
                 "Rule hash: %d rules - %d hashed, %d unspecific",
                 len(self._rules),
@@ -1277,6 +1281,13 @@ class EventServer(ECServerThread):
         else:
             rule_candidates = self._rules
 
+        # Skip the rules which certainly do not match. Not done when debugging the rules,
+        # the log shall contain the reasons for all rules.
+        if self._rule_index is not None and not self._config["debug_rules"]:
+            rule_candidates, num_pruned = self._rule_index.candidates(rule_candidates, event)
+            if num_pruned:
+                self._perfcounters.count("rule_prunes", num_pruned)
+
         skip_pack = None
         for rule in rule_candidates:
             if skip_pack and rule["pack"] == skip_pack:
@@ -1381,6 +1392,7 @@ class EventServer(ECServerThread):
                                 existing_event,
                             )
 
+                        self._event_status.mark_changed(existing_event)
                         self._history.add(existing_event, "COUNTREACHED")
 
                         if "delay" not in rule and rule.get("autodelete"):
@@ -1412,6 +1424,7 @@ class EventServer(ECServerThread):
                             rule,
                             event,
                         )
+                        self._event_status.mark_changed(event)
                         if rule.get("autodelete"):
                             event["phase"] = "closed"
                             with self._event_status.lock:
@@ -2314,6 +2327,7 @@ class StatusServer(ECServerThread):
                 event["contact"] = contact
             if user:
                 event["owner"] = user
+            self._event_status.mark_changed(event)
             self._history.add(event, "UPDATE", user)
         if failures:
             raise MKClientError(" ".join(failures))
@@ -2336,6 +2350,7 @@ class StatusServer(ECServerThread):
             event["state"] = int(newstate)
             if user:
                 event["owner"] = user
+            self._event_status.mark_changed(event)
             self._history.add(event, "CHANGESTATE", user)
         if failures:
             raise MKClientError(" ".join(failures))
@@ -2377,6 +2392,7 @@ class StatusServer(ECServerThread):
             event: Event | None = self._event_status.event(int(event_id))
             if user and event is not None:
                 event["owner"] = user
+                self._event_status.mark_changed(event)
 
             # TODO: De-duplicate code from do_event_actions()
             if action_id == "@NOTIFY" and event is not None:
@@ -2564,6 +2580,9 @@ def run_eventd(
     event_server.join()
     status_server.join()
 
+    # Write the history entries that are still buffered
+    history.close()
+
 
 # .
 #   .--EventStatus---------------------------------------------------------.
@@ -2601,6 +2620,7 @@ class EventStatus:
         self._history = history
         self._logger = logger
         self._connection = connection
+        self._status_journal = StatusJournal(settings.paths.status_file.value, logger)
         self.flush()
 
     def reload_configuration(self, config: Config, history: History) -> None:
@@ -2614,6 +2634,10 @@ class EventStatus:
         self._rule_stats: dict[str, int] = {}
         # needed for expecting rules
         self._interval_starts: dict[str, int] = {}
+        # The events to be journaled by the next save
+        self._changed_event_ids: set[int] = set()
+        self._removed_event_ids: set[int] = set()
+        self._status_journal.request_snapshot()
         self._initialize_event_limit_status()
 
         # TODO: might introduce some performance counters, like:
@@ -2695,20 +2719,31 @@ class EventStatus:
         self._events = status["events"]
         self._rule_stats = status["rule_stats"]
         self._interval_starts = status["interval_starts"]
+        self._status_journal.request_snapshot()
+
+    def mark_changed(self, event: Event) -> None:
+        """Journal an event which has been changed in place with the next save"""
+        self._changed_event_ids.add(event["id"])
 
     def save_status(self) -> None:
         now = time.time()
-        status = self.pack_status()
-        path = self.settings.paths.status_file.value
-        path_new = path.parent / (path.name + ".new")
-        # Believe it or not: cPickle is more than two times slower than repr()
-        with path_new.open(mode="wb") as f:
-            f.write((repr(status) + "\n").encode("utf-8"))
-            f.flush()
-            os.fsync(f.fileno())
-        path_new.rename(path)
+        changed_event_ids, self._changed_event_ids = self._changed_event_ids, set()
+        removed_event_ids, self._removed_event_ids = self._removed_event_ids, set()
+        self._status_journal.save(
+            self.pack_status(),
+            [event for event in self._events if event["id"] in changed_event_ids],
+            removed_event_ids,
+        )
         elapsed = time.time() - now
-        self._logger.log(VERBOSE, "Saved event state to %s in %.3fms.", path, elapsed * 1000)
+        self._logger.log(
+            VERBOSE,
+            "Saved event state to %s in %.3fms.",
+            self.settings.paths.status_file.value,
+            elapsed * 1000,
+        )
+
+    def close_status(self) -> None:
+        self._status_journal.close()
 
     def reset_counters(self, rule_id: str | None) -> None:
         if rule_id:
@@ -2720,17 +2755,16 @@ class EventStatus:
 
     def load_status(self, event_server: EventServer) -> None:
         path = self.settings.paths.status_file.value
-        if path.exists():
-            try:
-                status = ast.literal_eval(path.read_text(encoding="utf-8"))
-                self._next_event_id = status["next_event_id"]
-                self._events = status["events"]
-                self._rule_stats = status["rule_stats"]
-                self._interval_starts = status.get("interval_starts", {})
-                self._logger.info("Loaded event state from %s.", path)
-            except Exception:
-                self._logger.exception("Error loading event state from %s", path)
-                raise
+        try:
+            status = self._status_journal.load()
+        except Exception:
+            self._logger.exception("Error loading event state from %s", path)
+            raise
+        if status is not None:
+            self._next_event_id = status["next_event_id"]
+            self._events = status["events"]
+            self._rule_stats = status["rule_stats"]
+            self._interval_starts = status["interval_starts"]
 
         # Add new columns and fix broken events
         for event in self._events:
@@ -2783,6 +2817,7 @@ class EventStatus:
         event["id"] = self._next_event_id
         self._next_event_id += 1
         self._events.append(event)
+        self._changed_event_ids.add(event["id"])
         self.num_existing_events += 1
         self._count_event_add(event)
         self._history.add(event, "NEW")
@@ -2797,6 +2832,8 @@ class EventStatus:
     def remove_event(self, event: Event, delete_reason: HistoryWhat, user: str = "") -> None:
         try:
             self._events.remove(event)
+            self._changed_event_ids.discard(event["id"])
+            self._removed_event_ids.add(event["id"])
             self._history.add(event, delete_reason, user)
             self._count_event_remove(event)
         except ValueError:
@@ -3035,6 +3072,7 @@ class EventStatus:
                 preserve["contact"] = found["contact"]
         found.update(event)
         found.update(preserve)
+        self.mark_changed(found)
 
     def count_expected_event(self, event_server: EventServer, event: Event) -> None:
         for ev in self._events:
@@ -3089,6 +3127,7 @@ class EventStatus:
         # Did we just count the event that was just one too much?
         if found["phase"] == "counting" and found["count"] >= count["count"]:
             found["phase"] = "open"
+            self.mark_changed(found)
             return found  # do event action, return found copy of event
         return None  # do not do event action
 
@@ -3588,6 +3627,7 @@ def main(omd_root: Path, argv: Sequence[str]) -> None:
 
             logger.log(VERBOSE, "Saving final event state")
             event_status.save_status()
+            event_status.close_status()
 
             logger.log(VERBOSE, "Cleaning up sockets")
             settings.paths.unix_socket.value.unlink()
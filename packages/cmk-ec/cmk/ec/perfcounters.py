@@ -23,6 +23,7 @@ class Perfcounters:
     _counter_names: Sequence[str] = [
         "messages",
         "rule_tries",
+        "rule_prunes",
         "rule_hits",
         "drops",
         "overflows",
@@ -51,9 +52,9 @@ class Perfcounters:
 
         self._logger = logger.getChild("Perfcounters")
 
-    def count(self, counter: str) -> None:
+    def count(self, counter: str, value: int = 1) -> None:
         with self._lock:
-            self._counters[counter] += 1
+            self._counters[counter] += value
 
     def count_time(self, counter: str, ptime: float) -> None:
         with self._lock:
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+"""Prefilter for the rule matching of the event server
+
+Matching a rule means evaluating its regular expressions for the host, the application and
+the message text. With thousands of rules this dominates the processing time of a message,
+although for most messages nearly all rules fail because of some literal text that is not
+present in the message.
+
+The RuleIndex is built when the rules are compiled. For every rule it determines the cheap,
+necessary conditions of a match:
+
+* literal strings that must be contained in the message text or the syslog application,
+* the exact host name to match and
+* the IP network the sender address has to be in.
+
+For an incoming event it computes the rules violating one of these conditions. Those rules
+would certainly fail in RuleMatcher.event_rule_matches, so they can be skipped without
+changing the outcome. All other rules still have to be matched completely.
+
+The literals of regular expressions are determined with the parser of the re module, which
+is not a public API. If it is missing or behaves unexpectedly, no literals are determined,
+i.e. the rules are not pruned because of their regular expressions.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import re
+from collections.abc import Iterable, Sequence
+from typing import Final, Literal
+
+from .config import Rule, TextPattern
+from .event import Event
+
+_GRAM_LENGTH: Final = 3
+
+try:
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+
+    _REPEATS = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, sre_parse.POSSESSIVE_REPEAT}
+except (ImportError, AttributeError):
+    sre_parse = None
+    _REPEATS = set()
+
+
+def required_literals(pattern: re.Pattern[str]) -> list[str]:
+    """Determine strings that are contained in every text the pattern matches
+
+    The strings are lower case, they need to be searched for in the lower case text.
+    Only ASCII literals are returned: For non-ASCII characters the lower case conversion and
+    the case insensitive matching of the re module do not agree.
+
+    >>> required_literals(re.compile("ODBC Error (\\\\d+) in ([a-z]+)\\\\.log", re.IGNORECASE))
+    ['odbc error ', ' in ', '.log']
+    >>> required_literals(re.compile("(warn|error): disk"))
+    [': disk']
+    >>> required_literals(re.compile("^a?b*$"))
+    []
+    """
+    if sre_parse is None:
+        return []
+    literals: list[str] = []
+    try:
+        _collect_literals(sre_parse.parse(pattern.pattern, pattern.flags), literals)
+    except Exception:
+        # Invalid pattern, or the parser changed: don't prune because of this pattern
+        return []
+    return [lit.lower() for lit in literals if lit and lit.isascii()]
+
+
+def _collect_literals(subpattern: Iterable[tuple[object, object]], literals: list[str]) -> None:
+    current: list[str] = []
+    for op, av in subpattern:
+        if op is sre_parse.LITERAL:
+            assert isinstance(av, int)
+            current.append(chr(av))
+            continue
+        literals.append("".join(current))
+        current = []
+        if op is sre_parse.SUBPATTERN:
+            assert isinstance(av, tuple)
+            _collect_literals(av[-1], literals)
+        elif op is sre_parse.ATOMIC_GROUP:
+            assert isinstance(av, sre_parse.SubPattern)
+            _collect_literals(av, literals)
+        elif op in _REPEATS:
+            assert isinstance(av, tuple)
+            if av[0] >= 1:
+                _collect_literals(av[2], literals)
+        # Everything else (branches, character sets, assertions, ...) ends the current
+        # literal and does not contribute one.
+    literals.append("".join(current))
+
+
+def _literal_of(pattern: TextPattern) -> tuple[str, bool] | None:
+    """The most selective literal of a compiled matching value, if any
+
+    The second element tells whether the literal was extracted from a regular expression.
+    """
+    if isinstance(pattern, str):
+        # Plain texts are matched as lower case substrings (see rule_matcher.match).
+        return (pattern, False) if pattern else None
+    if literals := required_literals(pattern):
+        return max(literals, key=len), True
+    return None
+
+
+class _LiteralIndex:
+    """Find the rules one of whose literals is contained in a text
+
+    The literals are bucketed by their leading trigram. A text only needs to be checked for
+    the literals in the buckets of the trigrams it contains, and building the trigram set
+    of a text is a single pass implemented in C.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, dict[str, set[int]]] = {}
+        self._short: dict[str, set[int]] = {}
+        # Literals from regular expressions can only be trusted for ASCII texts.
+        self._from_regex: set[int] = set()
+
+    def add(self, literal: str, from_regex: bool, rule_key: int) -> None:
+        if len(literal) < _GRAM_LENGTH:
+            self._short.setdefault(literal, set()).add(rule_key)
+        else:
+            self._buckets.setdefault(literal[:_GRAM_LENGTH], {}).setdefault(literal, set()).add(
+                rule_key
+            )
+        if from_regex:
+            self._from_regex.add(rule_key)
+
+    def matching(self, text: str) -> set[int]:
+        lower_text = text.lower()
+        found: set[int] = set() if text.isascii() else set(self._from_regex)
+        grams = {lower_text[i : i + _GRAM_LENGTH] for i in range(len(lower_text) - 2)}
+        for gram in self._buckets.keys() & grams:
+            for literal, rule_keys in self._buckets[gram].items():
+                if literal in lower_text:
+                    found |= rule_keys
+        for literal, rule_keys in self._short.items():
+            if literal in lower_text:
+                found |= rule_keys
+        return found
+
+
+class _TextCondition:
+    """Rules that need one of their literals to be contained in an event field"""
+
+    def __init__(self, field: Literal["text", "application"]) -> None:
+        self.field: Final = field
+        self.constrained: set[int] = set()
+        self.index: Final = _LiteralIndex()
+
+    def add(self, rule_key: int, patterns: Sequence[TextPattern | None]) -> None:
+        """Add a rule that matches if one of its patterns matches
+
+        Absent patterns never match. The rule is only constrained if each present pattern
+        has a literal.
+        """
+        literals = [_literal_of(p) for p in patterns if p is not None]
+        if not literals or None in literals:
+            return
+        self.constrained.add(rule_key)
+        for literal in literals:
+            assert literal is not None
+            self.index.add(*literal, rule_key=rule_key)
+
+    def violating(self, event: Event) -> set[int]:
+        if not self.constrained:
+            return set()
+        return self.constrained - self.index.matching(event[self.field])
+
+
+class RuleIndex:
+    """Prefilter for the rules that are possibly matching an event"""
+
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        # Rules are dicts, so we identify them by their id(). They are kept alive by
+        # self._rules, so the identities are stable for the lifetime of the index.
+        self._rules = list(rules)
+        self._message = _TextCondition("text")
+        self._application = _TextCondition("application")
+        self._hosts: dict[str, set[int]] = {}
+        self._host_constrained: set[int] = set()
+        self._networks: dict[ipaddress.IPv4Network | ipaddress.IPv6Network, set[int]] = {}
+        self._network_constrained: set[int] = set()
+        for rule in self._rules:
+            self._add(rule)
+
+    def _add(self, rule: Rule) -> None:
+        # Inverted rules match exactly when their conditions fail. Disabled rules are in a
+        # half compiled state (see EventServer.compile_rules). Both are always candidates.
+        if rule.get("invert_matching") or rule.get("disabled"):
+            return
+        key = id(rule)
+
+        # The message is always matched, match_ok is an alternative for cancelling.
+        if "match" in rule:
+            self._message.add(key, [rule["match"], rule.get("match_ok")])
+        if "match_application" in rule or "cancel_application" in rule:
+            self._application.add(
+                key, [rule.get("match_application"), rule.get("cancel_application")]
+            )
+
+        if isinstance(host := rule.get("match_host"), str):
+            # Plain host names are matched completely.
+            self._host_constrained.add(key)
+            self._hosts.setdefault(host, set()).add(key)
+
+        if "match_ipaddress" in rule:
+            try:
+                network = ipaddress.ip_network(rule["match_ipaddress"], strict=False)
+            except ValueError:
+                self._network_constrained.add(key)  # matches nothing
+            else:
+                if int(network.netmask) != 0:  # matches everything, otherwise
+                    self._network_constrained.add(key)
+                    self._networks.setdefault(network, set()).add(key)
+
+    def _violating(self, event: Event) -> set[int]:
+        violating = self._message.violating(event) | self._application.violating(event)
+        if self._host_constrained:
+            violating |= self._host_constrained - self._hosts.get(event["host"].lower(), set())
+        if self._network_constrained:
+            violating |= self._network_constrained - self._matching_networks(event["ipaddress"])
+        return violating
+
+    def _matching_networks(self, ipaddress_text: str) -> set[int]:
+        try:
+            address = ipaddress.ip_address(ipaddress_text)
+        except ValueError:
+            return set()  # invalid address never matches
+        found: set[int] = set()
+        for network, rule_keys in self._networks.items():
+            if address in network:
+                found |= rule_keys
+        return found
+
+    def candidates(self, rules: Sequence[Rule], event: Event) -> tuple[Sequence[Rule], int]:
+        """Filter the rules (in order) and return them together with the number of pruned rules
+
+        All rules need to be part of the index.
+        """
+        if not (violating := self._violating(event)):
+            return rules, 0
+        remaining = [rule for rule in rules if id(rule) not in violating]
+        return remaining, len(rules) - len(remaining)
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Persistence of the event status as a snapshot plus a journal of changes
+
+Saving the complete status takes seconds with hundreds of thousands of open events.
+Instead, each save appends a record with the events created, changed and removed since
+the previous save to a journal. Once the journal has grown as large as the snapshot, a
+new snapshot is written in the background and a new journal is started.
+
+Snapshots and journals carry a generation number: the journal of generation N holds the
+changes after the snapshot of generation N. Loading the status reads the snapshot and
+replays all journals from its generation on, so a crash while writing a snapshot loses
+nothing.
+"""
+
+import ast
+import io
+import os
+import pickle
+import struct
+import threading
+import time
+from collections.abc import Collection, Iterator, Sequence
+from logging import Logger
+from pathlib import Path
+from typing import BinaryIO, TypedDict
+
+from cmk.ccc.hostaddress import HostAddress
+
+from .event import Event
+from .log_level import VERBOSE
+
+
+class PackedEventStatus(TypedDict):
+    next_event_id: int
+    events: list[Event]
+    rule_stats: dict[str, int]
+    interval_starts: dict[str, int]
+
+
+# Below this size the journal is not worth a new snapshot
+_MIN_JOURNAL_SIZE = 1024 * 1024
+
+_RECORD_HEADER = struct.Struct(">I")
+
+# next event ID, rule stats, interval starts, events created or changed, IDs of removed events
+type _JournalRecord = tuple[int, dict[str, int], dict[str, int], list[Event], list[int]]
+
+
+def _reduce_host_name(host_name: HostAddress) -> tuple[type[str], tuple[str]]:
+    # Host names are stored as plain strings, just like repr() did. Validating them again
+    # on loading would take most of the time.
+    return str, (str(host_name),)
+
+
+class _Unpickler(pickle.Unpickler):
+    """Only builtin types may be loaded from the status files"""
+
+    def find_class(self, module: str, name: str) -> type:
+        if (module, name) == ("builtins", "str"):
+            return str
+        raise pickle.UnpicklingError(f"Forbidden class in event status: {module}.{name}")
+
+
+def _dumps(obj: object) -> bytes:
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = {HostAddress: _reduce_host_name}
+    pickler.dump(obj)
+    return buffer.getvalue()
+
+
+def _loads(raw: bytes) -> object:
+    return _Unpickler(io.BytesIO(raw)).load()
+
+
+class StatusJournal:
+    def __init__(self, path: Path, logger: Logger) -> None:
+        self._path = path
+        self._logger = logger
+        self._generation = 0
+        self._snapshot_size = 0
+        self._snapshot_due = True
+        self._snapshot_thread: threading.Thread | None = None
+        self._journal: BinaryIO | None = None
+        self._journal_size = 0
+
+    def _journal_path(self, generation: int) -> Path:
+        return self._path.parent / f"{self._path.name}.journal.{generation}"
+
+    def _journal_paths(self) -> Iterator[tuple[int, Path]]:
+        for path in self._path.parent.glob(f"{self._path.name}.journal.*"):
+            try:
+                yield int(path.name.rsplit(".", 1)[1]), path
+            except ValueError:
+                continue
+
+    def request_snapshot(self) -> None:
+        """Write a snapshot on the next save, e.g. after the whole status has been replaced"""
+        self._snapshot_due = True
+
+    def load(self) -> PackedEventStatus | None:
+        if not self._path.exists():
+            for _generation, path in self._journal_paths():
+                path.unlink(missing_ok=True)
+            return None
+        raw = self._path.read_bytes()
+        self._snapshot_size = len(raw)
+        if raw.startswith(b"{"):
+            # Written by versions without the journal
+            status: PackedEventStatus = ast.literal_eval(raw.decode("utf-8"))
+            status.setdefault("interval_starts", {})
+            self._generation = 0
+        else:
+            self._generation, status = _loads(raw)  # type: ignore[misc]
+
+        events = {event["id"]: event for event in status["events"]}
+        num_records = 0
+        for generation, path in sorted(self._journal_paths()):
+            if generation < self._generation:
+                path.unlink(missing_ok=True)
+                continue
+            for (
+                next_event_id,
+                rule_stats,
+                interval_starts,
+                changed_events,
+                removed_ids,
+            ) in self._read_journal(path):
+                status["next_event_id"] = next_event_id
+                status["rule_stats"] = rule_stats
+                status["interval_starts"] = interval_starts
+                for event in changed_events:
+                    events[event["id"]] = event
+                for event_id in removed_ids:
+                    events.pop(event_id, None)
+                num_records += 1
+            self._generation = generation
+        status["events"] = list(events.values())
+
+        self._logger.info(
+            "Loaded event state of generation %d from %s and %d journal records.",
+            self._generation,
+            self._path,
+            num_records,
+        )
+        # Continue with a clean journal, which must not start behind a torn record
+        self._snapshot_due = True
+        return status
+
+    def _read_journal(self, path: Path) -> Iterator[_JournalRecord]:
+        raw = path.read_bytes()
+        offset = 0
+        while offset + _RECORD_HEADER.size <= len(raw):
+            (length,) = _RECORD_HEADER.unpack_from(raw, offset)
+            offset += _RECORD_HEADER.size
+            if offset + length > len(raw):
+                break
+            yield _loads(raw[offset : offset + length])  # type: ignore[misc]
+            offset += length
+        if offset != len(raw):
+            self._logger.warning("Ignoring incomplete record at the end of %s", path)
+
+    def save(
+        self,
+        status: PackedEventStatus,
+        changed_events: Sequence[Event],
+        removed_ids: Collection[int],
+    ) -> None:
+        """Save the changes of the status since the previous save
+
+        The caller must hold the lock of the event status, the status is not modified
+        while the changes are appended or the snapshot is copied.
+        """
+        if self._snapshot_due:
+            # The previous snapshot must be complete before its journal may be removed.
+            self._wait_for_snapshot()
+            self._start_snapshot(status)
+            return
+        if self._journal_size >= max(self._snapshot_size, _MIN_JOURNAL_SIZE) and not (
+            self._snapshot_thread is not None and self._snapshot_thread.is_alive()
+        ):
+            self._start_snapshot(status)
+            return
+        self._append(
+            (
+                status["next_event_id"],
+                status["rule_stats"],
+                status["interval_starts"],
+                list(changed_events),
+                list(removed_ids),
+            )
+        )
+
+    def _append(self, record: _JournalRecord) -> None:
+        if self._journal is None:
+            self._journal = self._journal_path(self._generation).open(mode="ab")
+        raw = _dumps(record)
+        self._journal.write(_RECORD_HEADER.pack(len(raw)) + raw)
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal_size += _RECORD_HEADER.size + len(raw)
+
+    def _start_snapshot(self, status: PackedEventStatus) -> None:
+        # The events are changed in place, the snapshot needs a copy of them as they are now.
+        copy = PackedEventStatus(
+            next_event_id=status["next_event_id"],
+            events=[event.copy() for event in status["events"]],
+            rule_stats=dict(status["rule_stats"]),
+            interval_starts=dict(status["interval_starts"]),
+        )
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self._generation += 1
+        self._journal_size = 0
+        self._snapshot_due = False
+        # Not a daemon thread: a snapshot in progress is finished on shutdown.
+        self._snapshot_thread = threading.Thread(
+            target=self._write_snapshot,
+            args=(self._generation, copy),
+            name="EventStatusSnapshot",
+        )
+        self._snapshot_thread.start()
+
+    def _write_snapshot(self, generation: int, status: PackedEventStatus) -> None:
+        try:
+            start = time.time()
+            raw = _dumps((generation, status))
+            path_new = self._path.parent / (self._path.name + ".new")
+            with path_new.open(mode="wb") as f:
+                f.write(raw)
+                f.flush()
+                os.fsync(f.fileno())
+            path_new.rename(self._path)
+            self._snapshot_size = len(raw)
+            for journal_generation, path in self._journal_paths():
+                if journal_generation < generation:
+                    path.unlink(missing_ok=True)
+            self._logger.log(
+                VERBOSE,
+                "Saved snapshot of event state to %s in %.3fms.",
+                self._path,
+                (time.time() - start) * 1000,
+            )
+        except Exception:
+            # The journals of the previous snapshot are kept, nothing is lost.
+            self._logger.exception("Error saving snapshot of event state to %s", self._path)
+            self._snapshot_due = True
+
+    def _wait_for_snapshot(self) -> None:
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+            self._snapshot_thread = None
+
+    def close(self) -> None:
+        """Wait for a snapshot in progress and close the journal"""
+        self._wait_for_snapshot()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
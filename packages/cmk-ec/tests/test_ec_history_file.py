@@ -7,13 +7,16 @@
 import datetime
 import logging
 import shlex
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
+import pytest
 import time_machine
 
 import cmk.ec.export as ec
+import cmk.ec.history_file
 from cmk.ccc.hostaddress import HostName
 from cmk.ec.config import Config
 from cmk.ec.history import _current_history_period
@@ -56,6 +59,48 @@ def test_file_add_get(history: FileHistory) -> None:
     assert row[column_index("event_host")] == "ABC1"
 
 
+def test_file_get_stops_reading_at_limit(
+    settings: ec.Settings, history: FileHistory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Files older than the ones needed for the limit are not read at all."""
+    for day in range(1, 6):
+        with time_machine.travel(
+            datetime.datetime(2024, 1, day, 12, tzinfo=ZoneInfo("UTC")), tick=False
+        ):
+            for n in range(3):
+                history.add(
+                    event=ec.Event(host=HostName(f"host{day}"), text=f"Event {n}", core_host=None),
+                    what="NEW",
+                )
+    paths = sorted(settings.paths.history_dir.value.glob("*.log"), reverse=True)
+    assert len(paths) == 5
+
+    logger = logging.getLogger("cmk.mkeventd")
+
+    def get_table(name: str) -> StatusTable:
+        assert name == "history"
+        return StatusTableHistory(logger, history)
+
+    def get(*headers: str) -> list[Sequence[object]]:
+        return list(history.get(QueryGET(get_table, ["GET history", *headers], logger)))
+
+    all_rows = get()
+    read_paths = []
+    get_from_file = history._get_from_file  # noqa: SLF001
+
+    def recording_get_from_file(path: Path, query: QueryGET, limit: int | None) -> list[Any]:
+        read_paths.append(path)
+        return get_from_file(path, query, limit)
+
+    monkeypatch.setattr(cmk.ec.history_file, "_MAX_PARALLEL_FILES", 1)
+    monkeypatch.setattr(history, "_get_from_file", recording_get_from_file)
+
+    limited_rows = get("Limit: 4")
+
+    assert limited_rows == all_rows[: len(limited_rows)]
+    assert read_paths == paths[:2]
+
+
 def test_current_history_period(config: Config) -> None:
     """timestamp of the beginning of the current history period correctly returned."""
     with time_machine.travel(datetime.datetime.fromtimestamp(1550000000.0, tz=ZoneInfo("CET"))):
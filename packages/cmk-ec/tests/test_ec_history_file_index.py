@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+import logging
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import pytest
+import time_machine
+
+import cmk.ec.export as ec
+from cmk.ccc.hostaddress import HostName
+from cmk.ec import history_file_index
+from cmk.ec.config import Config
+from cmk.ec.history_file import FileHistory
+from cmk.ec.history_file_index import index_path, read_index
+from cmk.ec.main import create_history, StatusTableEvents, StatusTableHistory
+from cmk.ec.query import QueryGET, StatusTable
+
+_LOGGER = logging.getLogger("cmk.mkeventd")
+
+_QUERIES = [
+    [],
+    ["Filter: event_host = host3"],
+    ["Filter: event_host =~ HOST3"],
+    ["Filter: event_host in host1 host7", "Filter: event_application = app2"],
+    ["Filter: event_rule_id = rule4", "Limit: 5"],
+    ["Filter: history_time >= 1700000300", "Filter: history_time < 1700000500"],
+    ["Filter: event_host = host3", "Filter: history_time > 1700000400"],
+    ["Filter: event_host = nowhere"],
+    ["Limit: 17"],
+]
+
+
+@pytest.fixture(name="small_blocks", autouse=True)
+def fixture_small_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(history_file_index, "_BLOCK_SIZE", 1024)
+
+
+def _new_history(settings: ec.Settings, config: Config) -> FileHistory:
+    history = create_history(
+        settings,
+        config | {"archive_mode": "file"},
+        _LOGGER,
+        StatusTableEvents.columns,
+        StatusTableHistory.columns,
+    )
+    assert isinstance(history, FileHistory)
+    return history
+
+
+def _add_events(history: FileHistory, numbers: Iterable[int]) -> None:
+    for n in numbers:
+        with time_machine.travel(1_700_000_000 + n, tick=False):
+            history.add(
+                ec.Event(
+                    id=n,
+                    host=HostName(f"host{n % 10}"),
+                    application=f"app{n % 3}",
+                    rule_id=f"rule{n % 7}",
+                    text=f"Event {n}",
+                    core_host=None,
+                ),
+                "NEW",
+            )
+
+
+def _get(history: FileHistory, query_lines: Sequence[str]) -> list[Sequence[object]]:
+    def get_table(name: str) -> StatusTable:
+        assert name == "history"
+        return StatusTableHistory(_LOGGER, history)
+
+    return list(history.get(QueryGET(get_table, ["GET history", *query_lines], _LOGGER)))
+
+
+def _log_files(settings: ec.Settings) -> list[Path]:
+    return sorted(settings.paths.history_dir.value.glob("*.log"))
+
+
+@pytest.mark.parametrize("query_lines", _QUERIES)
+def test_indexed_get_matches_grep(
+    settings: ec.Settings, config: Config, query_lines: Sequence[str]
+) -> None:
+    history = _new_history(settings, config)
+    _add_events(history, range(600))
+    (path,) = _log_files(settings)
+    assert len(read_index(path) or []) > 10
+
+    indexed = _get(history, query_lines)
+    index_path(path).unlink()
+    assert indexed == _get(history, query_lines)
+
+
+def test_history_file_without_index_is_not_indexed(settings: ec.Settings, config: Config) -> None:
+    history = _new_history(settings, config)
+    _add_events(history, range(100))
+    history.close()
+    (path,) = _log_files(settings)
+    index_path(path).unlink()
+
+    history = _new_history(settings, config)
+    _add_events(history, range(100, 200))
+    assert not index_path(path).exists()
+    assert len(_get(history, ["Filter: event_host = host3"])) == 20
+
+
+def test_index_is_continued_after_restart(settings: ec.Settings, config: Config) -> None:
+    history = _new_history(settings, config)
+    _add_events(history, range(100))
+    (path,) = _log_files(settings)
+    num_blocks = len(read_index(path) or [])
+
+    # No close(): the youngest block is indexed from the file on the next start
+    history = _new_history(settings, config)
+    _add_events(history, range(100, 200))
+    history.close()
+
+    blocks = read_index(path)
+    assert blocks is not None
+    assert len(blocks) > num_blocks
+    assert blocks[-1].end == path.stat().st_size
+    assert sum(block.num_lines for block in blocks) == 200
+
+
+def test_torn_index_record_is_dropped(settings: ec.Settings, config: Config) -> None:
+    history = _new_history(settings, config)
+    _add_events(history, range(100))
+    history.close()
+    (path,) = _log_files(settings)
+    blocks = read_index(path)
+    with index_path(path).open("ab") as f:
+        f.write(b"torn")
+
+    assert read_index(path) == blocks
+    history = _new_history(settings, config)
+    _add_events(history, range(100, 200))
+    history.close()
+    assert sum(block.num_lines for block in read_index(path) or []) == 200
@@ -5,14 +5,17 @@
 
 import logging
 import sqlite3
+import time
+from pathlib import Path
 from typing import Literal
 
 import pytest
 
 import cmk.ec.export as ec
 from cmk.ccc.hostaddress import HostName
-from cmk.ec.history_sqlite import filters_to_sqlite_query, SQLiteHistory
-from cmk.ec.main import StatusTableHistory
+from cmk.ec.config import Config
+from cmk.ec.history_sqlite import filters_to_sqlite_query, SQLiteHistory, SQLiteSettings
+from cmk.ec.main import StatusTableEvents, StatusTableHistory
 from cmk.ec.query import QueryFilter, QueryGET, StatusTable
 
 
@@ -401,6 +404,7 @@ def test_housekeeping(history_sqlite: SQLiteHistory) -> None:
     event2 = ec.Event(host=HostName("ABC2"), text="Event2 text", core_host=HostName("ABC"))
     history_sqlite.add(event=event1, what="NEW")
     history_sqlite.add(event=event2, what="NEW")
+    history_sqlite.write_pending()
 
     with history_sqlite.conn as connection:
         cur = connection.cursor()
@@ -411,3 +415,79 @@ def test_housekeeping(history_sqlite: SQLiteHistory) -> None:
         history_sqlite.housekeeping()
         cur.execute("SELECT count(*) FROM history;")
         assert cur.fetchone()["count(*)"] == 1
+
+
+def _sqlite_history(
+    settings: ec.Settings,
+    config: Config,
+    database: Literal[":memory:"] | Path = ":memory:",
+    batch_size: int = 1000,
+    batch_interval: int = 60,
+) -> SQLiteHistory:
+    return SQLiteHistory(
+        SQLiteSettings.from_settings(settings, database=database),
+        config
+        | {
+            "archive_mode": "sqlite",
+            "sqlite_write_batch_size": batch_size,
+            "sqlite_write_batch_interval": batch_interval,
+        },
+        logging.getLogger("cmk.mkeventd"),
+        StatusTableEvents.columns,
+        StatusTableHistory.columns,
+    )
+
+
+def _count_written(history: SQLiteHistory) -> int:
+    return int(history.conn.execute("SELECT count(*) FROM history;").fetchone()[0])
+
+
+def test_add_writes_full_batches(settings: ec.Settings, config: Config) -> None:
+    history = _sqlite_history(settings, config, batch_size=3)
+    event = ec.Event(host=HostName("ABC1"), text="Event1 text", core_host=HostName("ABC"))
+
+    history.add(event=event, what="NEW")
+    history.add(event=event, what="UPDATE")
+    assert _count_written(history) == 0
+
+    history.add(event=event, what="DELETE")
+    assert _count_written(history) == 3
+    assert [row["what"] for row in history.conn.execute("SELECT what FROM history")] == [
+        "NEW",
+        "UPDATE",
+        "DELETE",
+    ]
+
+
+def test_add_writes_pending_entries_after_interval(settings: ec.Settings, config: Config) -> None:
+    history = _sqlite_history(settings, config, batch_interval=0)
+
+    history.add(event=ec.Event(host=HostName("ABC1"), text="Event1 text"), what="NEW")
+
+    deadline = time.time() + 10
+    while _count_written(history) == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    assert _count_written(history) == 1
+
+
+def test_close_writes_pending_entries(
+    settings: ec.Settings, config: Config, tmp_path: Path
+) -> None:
+    database = tmp_path / "history.sqlite"
+    history = _sqlite_history(settings, config, database=database)
+    history.add(event=ec.Event(host=HostName("ABC1"), text="Event1 text"), what="NEW")
+
+    history.close()
+
+    with sqlite3.connect(database) as connection:
+        assert connection.execute("SELECT count(*) FROM history;").fetchone() == (1,)
+
+
+def test_flush_drops_pending_entries(settings: ec.Settings, config: Config) -> None:
+    history = _sqlite_history(settings, config)
+    history.add(event=ec.Event(host=HostName("ABC1"), text="Event1 text"), what="NEW")
+
+    history.flush()
+    history.write_pending()
+
+    assert _count_written(history) == 0
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+import logging
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+
+import cmk.ec.export as ec
+from cmk.ccc.hostaddress import HostName
+from cmk.ec import status_journal
+from cmk.ec.config import Config
+from cmk.ec.history_file import FileHistory
+from cmk.ec.main import EventServer, EventStatus
+from cmk.ec.perfcounters import Perfcounters
+from cmk.ec.status_journal import PackedEventStatus, StatusJournal
+
+from .conftest import RaisingConnection
+from .helpers import new_event
+
+
+def _reloaded(
+    settings: ec.Settings,
+    config: Config,
+    perfcounters: Perfcounters,
+    history: FileHistory,
+    event_server: EventServer,
+) -> EventStatus:
+    event_status = EventStatus(
+        settings,
+        config,
+        perfcounters,
+        history,
+        logging.getLogger("cmk.mkeventd.EventStatus"),
+        RaisingConnection(),
+    )
+    event_status.load_status(event_server)
+    return event_status
+
+
+def _journals(settings: ec.Settings) -> list[str]:
+    path = settings.paths.status_file.value
+    return sorted(p.name for p in path.parent.glob(f"{path.name}.journal.*"))
+
+
+def test_status_is_restored_from_snapshot_and_journal(
+    settings: ec.Settings,
+    config: Config,
+    perfcounters: Perfcounters,
+    history: FileHistory,
+    event_status: EventStatus,
+    event_server: EventServer,
+) -> None:
+    for num in range(3):
+        event_status.new_event(new_event({"host": HostName(f"host{num}"), "core_host": None}))
+    event_status.count_rule_match("rule")
+    event_status.save_status()  # the first save writes a snapshot
+    event_status.close_status()
+
+    first, second, third = event_status.events()
+    first["comment"] = "changed"
+    event_status.mark_changed(first)
+    event_status.remove_event(second, "DELETE")
+    event_status.new_event(new_event({"host": HostName("host3"), "core_host": None}))
+    event_status.count_rule_match("rule")
+    event_status.save_status()
+    assert _journals(settings) == ["status.journal.1"]
+
+    reloaded = _reloaded(settings, config, perfcounters, history, event_server)
+    assert reloaded.pack_status() == event_status.pack_status()
+    assert [event["id"] for event in reloaded.events()] == [1, 3, 4]
+    assert reloaded.events()[0]["comment"] == "changed"
+    assert list(reloaded.get_rule_stats()) == [("rule", 2)]
+    assert reloaded.num_existing_events == 3
+
+
+def test_snapshot_replaces_journal(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: ec.Settings,
+    config: Config,
+    perfcounters: Perfcounters,
+    history: FileHistory,
+    event_status: EventStatus,
+    event_server: EventServer,
+) -> None:
+    monkeypatch.setattr(status_journal, "_MIN_JOURNAL_SIZE", 0)
+    for num in range(10):
+        event_status.new_event(new_event({"host": HostName(f"host{num}"), "core_host": None}))
+        event_status.save_status()
+    event_status.close_status()
+
+    # Each snapshot removes the journals before it
+    assert len(_journals(settings)) == 1
+    reloaded = _reloaded(settings, config, perfcounters, history, event_server)
+    assert reloaded.pack_status() == event_status.pack_status()
+
+
+def test_flushed_status_is_not_restored(
+    settings: ec.Settings,
+    config: Config,
+    perfcounters: Perfcounters,
+    history: FileHistory,
+    event_status: EventStatus,
+    event_server: EventServer,
+) -> None:
+    event_status.new_event(new_event({"host": HostName("host"), "core_host": None}))
+    event_status.save_status()
+    event_status.save_status()
+    event_status.flush()
+    event_status.save_status()
+    event_status.close_status()
+
+    reloaded = _reloaded(settings, config, perfcounters, history, event_server)
+    assert not reloaded.events()
+
+
+def test_load_legacy_status_file(tmp_path: Path) -> None:
+    path = tmp_path / "status"
+    status = PackedEventStatus(
+        next_event_id=2,
+        events=[new_event({"id": 1, "host": HostName("host"), "match_groups": ("a", "b")})],
+        rule_stats={"rule": 1},
+        interval_starts={},
+    )
+    path.write_text(repr(status) + "\n", encoding="utf-8")
+    assert StatusJournal(path, logging.getLogger("cmk.mkeventd")).load() == status
+
+
+def test_load_ignores_incomplete_journal_record(tmp_path: Path) -> None:
+    path = tmp_path / "status"
+    journal = StatusJournal(path, logging.getLogger("cmk.mkeventd"))
+    status = PackedEventStatus(next_event_id=1, events=[], rule_stats={}, interval_starts={})
+    journal.save(status, [], [])
+    journal.close()
+
+    status["events"].append(new_event({"id": 1}))
+    status["next_event_id"] = 2
+    journal.save(status, status["events"], [])
+    journal.close()
+    with (tmp_path / "status.journal.1").open("ab") as f:
+        f.write(b"\x00\x00\x01\x00torn")
+
+    assert StatusJournal(path, logging.getLogger("cmk.mkeventd")).load() == status
+
+
+def test_load_refuses_foreign_classes(tmp_path: Path) -> None:
+    path = tmp_path / "status"
+    path.write_bytes(pickle.dumps((1, os.getcwd)))
+    with pytest.raises(pickle.UnpicklingError, match="Forbidden class"):
+        StatusJournal(path, logging.getLogger("cmk.mkeventd")).load()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# ruff: noqa: SLF001
+
+import itertools
+import re
+from types import SimpleNamespace
+
+import pytest
+
+import cmk.ec.export as ec
+from cmk.ccc.hostaddress import HostName
+from cmk.ccc.site import SiteId
+from cmk.ec import rule_index
+from cmk.ec.config import Config, Rule
+from cmk.ec.main import EventServer, EventStatus
+from cmk.ec.perfcounters import Perfcounters
+from cmk.ec.rule_index import required_literals, RuleIndex
+from cmk.ec.rule_matcher import compile_rule, MatchFailure, RuleMatcher
+
+from .helpers import new_event
+
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+        pytest.param("ODBC", ["odbc"], id="plain"),
+        pytest.param("^kernel: (\\d+) oops", ["kernel: ", " oops"], id="groups and anchors"),
+        pytest.param("disk (full|empty)", ["disk "], id="branches"),
+        pytest.param("fo+bar", ["f", "o", "bar"], id="required repeat"),
+        pytest.param("ab?c*d", ["a", "d"], id="optional repeats"),
+        pytest.param("(?x) a b", ["ab"], id="verbose"),
+        pytest.param("\\.log$", [".log"], id="escaped"),
+        pytest.param("süd", [], id="non-ascii"),
+        pytest.param("[a-z]+\\d", [], id="classes only"),
+    ],
+)
+def test_required_literals(pattern: str, expected: list[str]) -> None:
+    assert required_literals(re.compile(pattern, re.IGNORECASE)) == expected
+
+
+@pytest.mark.parametrize(
+    "parser",
+    [
+        pytest.param(None, id="missing"),
+        pytest.param(SimpleNamespace(parse=lambda _pattern, _flags: None), id="changed"),
+    ],
+)
+def test_required_literals_without_usable_parser(
+    monkeypatch: pytest.MonkeyPatch, parser: object
+) -> None:
+    monkeypatch.setattr(rule_index, "sre_parse", parser)
+    assert required_literals(re.compile("ODBC", re.IGNORECASE)) == []
+
+    rules = [
+        _compiled_rule("regex", match="ODBC error (\\d+)"),
+        _compiled_rule("plain", match="disk full"),
+    ]
+    event = new_event(ec.Event(text="nothing of interest"))
+    # Plain texts are still pruned
+    assert RuleIndex(rules).candidates(rules, event) == (rules[:1], 1)
+
+
+def _compiled_rule(rule_id: str, **attributes: object) -> Rule:
+    rule = Rule(id=rule_id, pack="default", state=0)
+    rule.update(attributes)  # type: ignore[typeddict-item]
+    compile_rule(rule)
+    return rule
+
+
+_RULES = [
+    _compiled_rule(f"rule{nr}", **dict(itertools.chain.from_iterable(attributes)))
+    for nr, attributes in enumerate(
+        itertools.product(
+            [(), (("match", "ODBC error (\\d+)"),), (("match", "disk full"),)],
+            [(), (("match_ok", "recovered"),), (("match_ok", "(\\d+)"),)],
+            [(), (("match_application", "^sshd"),), (("cancel_application", "cron"),)],
+            [(), (("match_host", "Heute"),), (("match_host", "heute[0-9]"),)],
+            [(), (("match_ipaddress", "10.0.0.0/8"),), (("match_ipaddress", "0.0.0.0/0"),)],
+            [(), (("invert_matching", True),)],
+        )
+    )
+]
+
+
+@pytest.mark.parametrize(
+    "text,host,application,ipaddress",
+    [
+        ("ODBC Error 42 occurred", "heute", "sshd", "10.1.2.3"),
+        ("The disk is full", "HEUTE", "cron[42]", "192.168.1.1"),
+        ("Disk full, then recovered", "heute1", "", ""),
+        ("odbc error 42 in Süd", "morgen", "SSHD", "::1"),
+        ("nothing of interest", "heute", "crond", "10.0.0.1"),
+    ],
+)
+def test_rule_index_only_prunes_failing_rules(
+    text: str, host: str, application: str, ipaddress: str
+) -> None:
+    event = new_event(
+        ec.Event(text=text, host=HostName(host), application=application, ipaddress=ipaddress)
+    )
+    matcher = RuleMatcher(None, SiteId("hurz"), lambda _name: True)
+
+    candidates, num_pruned = RuleIndex(_RULES).candidates(_RULES, event)
+
+    assert num_pruned > 0
+    assert len(candidates) + num_pruned == len(_RULES)
+    assert [rule["id"] for rule in candidates] == [
+        rule["id"] for rule in _RULES if any(rule is candidate for candidate in candidates)
+    ]
+    for rule in _RULES:
+        if not any(rule is candidate for candidate in candidates):
+            assert isinstance(matcher.event_rule_matches(rule, event), MatchFailure), rule
+
+
+def test_rule_index_keeps_unconstrained_rules() -> None:
+    rules = [
+        _compiled_rule("inverted", match="foo", invert_matching=True),
+        _compiled_rule("regex host", match_host="^x"),
+        _compiled_rule("any network", match_ipaddress="0.0.0.0/0"),
+        _compiled_rule("cancel without literal", match="foo", match_ok="\\d"),
+    ]
+    event = new_event(ec.Event(text="bar", host=HostName("y"), ipaddress="10.0.0.1"))
+
+    assert RuleIndex(rules).candidates(rules, event) == (rules, 0)
+
+
+def test_process_potential_event_skips_pruned_rules(
+    event_server: EventServer,
+    event_status: EventStatus,
+    perfcounters: Perfcounters,
+    config: Config,
+) -> None:
+    event_server.compile_rules(
+        [
+            ec.ECRulePackSpec(
+                id="first",
+                disabled=False,
+                rules=[
+                    Rule(id="skip", state=0, match="Hurz", drop="skip_pack"),
+                    Rule(id="skipped", state=0, match="Hurz", drop=True),
+                ],
+            ),
+            ec.ECRulePackSpec(
+                id="second",
+                disabled=False,
+                rules=[
+                    Rule(id="pruned", state=0, match="Lamm", drop=True),
+                    Rule(id="hit", state=0, match="Hurz", drop=True),
+                    Rule(id="not reached", state=0, match="Hurz", drop=True),
+                ],
+            ),
+        ]
+    )
+
+    event_server.process_potential_event(new_event(ec.Event(text="Und dann: Hurz!")))
+
+    assert event_status._rule_stats == {"skip": 1, "hit": 1}
+    assert perfcounters._counters["rule_tries"] == 2
+    assert perfcounters._counters["rule_prunes"] == 1
+    assert perfcounters._counters["drops"] == 1
@@ -56,6 +56,7 @@ from ._quantities import (
     ScalarType,
     Sum,
 )
+from ._resample import resample
 from ._source import (
     fetch_metric_names,
     RRDDataSource,
@@ -129,4 +130,5 @@ __all__ = [
     "build_matched_graphs_per_service",
     "build_curve",
     "evaluate_graphs",
+    "resample",
 ]
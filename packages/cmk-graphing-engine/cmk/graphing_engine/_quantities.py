@@ -6,13 +6,15 @@
 from __future__ import annotations
 
 import enum
-import math
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass, KW_ONLY
 from typing import Protocol
 
+import numpy as np
+
 from ._options import ConsolidationFunction, TimeRange
 from ._perfdata import HostName, MetricName, PerformanceData, Service, ServiceName, TimeSeries
+from ._series import FloatArray, stack, to_array, to_values
 from ._units import CurveAttributes
 
 
@@ -41,37 +43,38 @@ class Quantity(Protocol):
     def evaluate(self, context: EvaluationContext) -> EvaluatedQuantity | None: ...
 
 
-type _Operator = Callable[[Sequence[float | None]], float | None]
+type _Operator = Callable[[FloatArray], FloatArray]
+
 
+# The operators combine the rows of the stacked operands to one row
 
-def _op_sum(point: Sequence[float | None]) -> float | None:
-    return sum(value for value in point if value is not None)
 
+def _op_sum(operands: FloatArray) -> FloatArray:
+    return np.nansum(operands, axis=0)
 
-def _op_product(point: Sequence[float | None]) -> float | None:
-    if None in point:
-        return None
-    return math.prod(value for value in point if value is not None)
 
+def _op_product(operands: FloatArray) -> FloatArray:
+    return np.prod(operands, axis=0)
 
-def _op_difference(point: Sequence[float | None]) -> float | None:
-    minuend, subtrahend = point
-    if minuend is None or subtrahend is None:
-        return None
+
+def _op_difference(operands: FloatArray) -> FloatArray:
+    minuend, subtrahend = operands
     return minuend - subtrahend
 
 
-def _op_fraction(point: Sequence[float | None]) -> float | None:
-    dividend, divisor = point
-    if dividend is None or divisor is None or divisor == 0:
-        return None
-    return dividend / divisor
+def _op_fraction(operands: FloatArray) -> FloatArray:
+    dividend, divisor = operands
+    return np.divide(dividend, divisor, out=np.full_like(dividend, np.nan), where=divisor != 0)
+
 
+def _apply(operator: _Operator, values: Sequence[float]) -> float | None:
+    with np.errstate(all="ignore"):
+        return to_values(operator(to_array(values).reshape(len(values), 1)))[0]
 
-def _apply(operator: _Operator, point: Sequence[float | None]) -> float | None:
-    if all(value is None for value in point):
-        return None
-    return operator(point)
+
+def _apply_pointwise(operator: _Operator, operands: FloatArray) -> FloatArray:
+    with np.errstate(all="ignore"):
+        return np.where(np.isnan(operands).all(axis=0), np.nan, operator(operands))
 
 
 def _num_points(time_range: TimeRange) -> int:
@@ -95,10 +98,16 @@ def _apply_operator(
         for operand in operands
     ]
     return EvaluatedQuantity(
-        value=None if any(value is None for value in values) else operator(values),
+        value=(
+            None
+            if any(value is None for value in values)
+            else _apply(operator, [value for value in values if value is not None])
+        ),
         time_series=TimeSeries(
             time_range=context.time_range,
-            values=[_apply(operator, point) for point in zip(*(ts.values for ts in time_series))],
+            values=to_values(
+                _apply_pointwise(operator, stack([to_array(ts.values) for ts in time_series]))
+            ),
         ),
     )
 
@@ -3,76 +3,99 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
-from collections.abc import Sequence
-from statistics import fmean
+import numpy as np
+import numpy.typing as npt
 
 from ._options import ConsolidationFunction, TimeRange
 from ._perfdata import TimeSeries
+from ._series import ArrayTimeSeries, FloatArray
 
 
-def _timestamps(time_range: TimeRange) -> Sequence[int]:
+def _num_timestamps(time_range: TimeRange) -> int:
     if time_range.step <= 0:
-        return []
-    return [t + time_range.step for t in range(time_range.start, time_range.end, time_range.step)]
+        return 0
+    return len(range(time_range.start, time_range.end, time_range.step))
 
 
 def _aggregate(
-    values: Sequence[float | None], consolidation_function: ConsolidationFunction
-) -> float | None:
-    present = [value for value in values if value is not None]
-    if not present:
-        return None
+    values: FloatArray, starts: npt.NDArray[np.intp], consolidation_function: ConsolidationFunction
+) -> FloatArray:
+    """Aggregate the buckets of values starting at the given indices, ignoring the gaps"""
     match consolidation_function:
         case ConsolidationFunction.MIN:
-            return min(present)
+            return np.fmin.reduceat(values, starts)
         case ConsolidationFunction.MAX:
-            return max(present)
+            return np.fmax.reduceat(values, starts)
         case ConsolidationFunction.AVERAGE:
-            return fmean(present)
+            present = ~np.isnan(values)
+            sums = np.add.reduceat(np.where(present, values, 0.0), starts)
+            counts = np.add.reduceat(present, starts, dtype=np.int64)
+            with np.errstate(invalid="ignore"):
+                return sums / counts
 
 
 def _downsample(
-    time_series: TimeSeries,
+    time_series: ArrayTimeSeries,
     time_range: TimeRange,
     consolidation_function: ConsolidationFunction,
-) -> Sequence[float | None]:
-    desired = _timestamps(time_range)
-    resampled: list[float | None] = []
-    bucket: list[float | None] = []
-    index = 0
-    for timestamp, value in zip(_timestamps(time_series.time_range), time_series.values):
-        if index < len(desired) and timestamp > desired[index]:
-            resampled.append(_aggregate(bucket, consolidation_function))
-            bucket = []
-            index += 1
-        bucket.append(value)
-    if (missing := len(desired) - len(resampled)) > 0:
-        resampled.append(_aggregate(bucket, consolidation_function))
-        resampled += [None] * (missing - 1)
+) -> FloatArray:
+    source = time_series.time_range
+    num_desired = _num_timestamps(time_range)
+    values = time_series.values[: _num_timestamps(source)]
+    positions = np.arange(1, len(values) + 1, dtype=np.int64)
+    timestamps = source.start + source.step * positions
+    # The value at a timestamp belongs to the first desired timestamp not before it. A value
+    # only ever moves on by one bucket though, so the values behind a leading run of empty
+    # buckets lag behind until they have caught up.
+    preceding = np.clip(-((time_range.start - timestamps) // time_range.step) - 1, 0, num_desired)
+    buckets = np.minimum(positions, preceding)
+
+    # Values after the last desired timestamp are dropped
+    in_range = buckets < num_desired
+    values, buckets = values[in_range], buckets[in_range]
+
+    resampled = np.full(num_desired, np.nan)
+    if len(values):
+        starts = np.flatnonzero(np.diff(buckets, prepend=-1))
+        resampled[buckets[starts]] = _aggregate(values, starts, consolidation_function)
     return resampled
 
 
-def _forward_fill(time_series: TimeSeries, time_range: TimeRange) -> Sequence[float | None]:
+def _forward_fill(time_series: ArrayTimeSeries, time_range: TimeRange) -> FloatArray:
+    if time_range.step <= 0:
+        return np.empty(0)
     source = time_series.time_range
-    last = len(time_series.values) - 1
-    return [
-        time_series.values[max(0, min((timestamp - source.start) // source.step, last))]
-        for timestamp in range(time_range.start, time_range.end, time_range.step)
-    ]
+    timestamps = np.arange(time_range.start, time_range.end, time_range.step, dtype=np.int64)
+    indices = np.clip((timestamps - source.start) // source.step, 0, len(time_series.values) - 1)
+    return time_series.values[indices]
 
 
-def resample(
-    time_series: TimeSeries,
+def resample_array(
+    time_series: ArrayTimeSeries,
     time_range: TimeRange,
     consolidation_function: ConsolidationFunction,
-) -> TimeSeries:
+) -> ArrayTimeSeries:
     if time_series.time_range == time_range:
         return time_series
-    if not time_series.values or time_series.time_range.step <= 0:
-        return TimeSeries(time_range=time_range, values=[None] * len(_timestamps(time_range)))
+    if not len(time_series.values) or time_series.time_range.step <= 0:
+        return ArrayTimeSeries(
+            time_range=time_range, values=np.full(_num_timestamps(time_range), np.nan)
+        )
     values = (
         _downsample(time_series, time_range, consolidation_function)
         if time_range.step >= time_series.time_range.step
         else _forward_fill(time_series, time_range)
     )
-    return TimeSeries(time_range=time_range, values=values)
+    return ArrayTimeSeries(time_range=time_range, values=values)
+
+
+def resample(
+    time_series: TimeSeries,
+    time_range: TimeRange,
+    consolidation_function: ConsolidationFunction,
+) -> TimeSeries:
+    if time_series.time_range == time_range:
+        return time_series
+    return resample_array(
+        ArrayTimeSeries.from_time_series(time_series), time_range, consolidation_function
+    ).to_time_series()
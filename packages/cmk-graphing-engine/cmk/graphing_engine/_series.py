@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Self
+
+import numpy as np
+import numpy.typing as npt
+
+from ._options import TimeRange
+from ._perfdata import TimeSeries
+
+type FloatArray = npt.NDArray[np.float64]
+
+
+def to_array(values: Sequence[float | None]) -> FloatArray:
+    """Convert the values of a time series to an array, gaps become NaN"""
+    return np.array(values, dtype=np.float64)
+
+
+def to_values(array: FloatArray) -> list[float | None]:
+    """Convert an array to the values of a time series, NaN becomes a gap"""
+    objects = array.astype(object)
+    objects[np.isnan(array)] = None
+    values: list[float | None] = objects.tolist()
+    return values
+
+
+def stack(arrays: Sequence[FloatArray]) -> FloatArray:
+    """Stack the arrays as rows, cut to the shortest one like zip()"""
+    length = min((len(array) for array in arrays), default=0)
+    return np.array([array[:length] for array in arrays], dtype=np.float64).reshape(
+        len(arrays), length
+    )
+
+
+@dataclass(frozen=True, kw_only=True)
+class ArrayTimeSeries:
+    """A time series with its values in an array, NaN marks the gaps"""
+
+    time_range: TimeRange
+    values: FloatArray
+
+    @classmethod
+    def from_time_series(cls, time_series: TimeSeries) -> Self:
+        return cls(time_range=time_series.time_range, values=to_array(time_series.values))
+
+    def to_time_series(self) -> TimeSeries:
+        return TimeSeries(time_range=self.time_range, values=to_values(self.values))
@@ -6,6 +6,8 @@
 from collections.abc import Iterable, Mapping, Sequence
 from typing import Protocol
 
+import numpy as np
+
 from cmk.graphing.v1 import translations as translations_v1
 
 from ._from_api import parse_translations_from_api
@@ -20,7 +22,8 @@ from ._perfdata import (
     TimeSeries,
 )
 from ._quantities import RRDMetric
-from ._resample import resample
+from ._resample import resample_array
+from ._series import ArrayTimeSeries, stack, to_values
 from ._translate import (
     originals_for_metric_name,
     translate_metric_names,
@@ -97,22 +100,19 @@ def _consolidation_function(
     )
 
 
-def _scaled(time_series: TimeSeries, scale: float) -> TimeSeries:
+def _scaled(time_series: ArrayTimeSeries, scale: float) -> ArrayTimeSeries:
     if scale == 1.0:
         return time_series
-    return TimeSeries(
-        time_range=time_series.time_range,
-        values=[None if value is None else value * scale for value in time_series.values],
-    )
+    return ArrayTimeSeries(time_range=time_series.time_range, values=time_series.values * scale)
 
 
-def _merge(time_series: Sequence[TimeSeries], time_range: TimeRange) -> TimeSeries:
+def _merge(time_series: Sequence[ArrayTimeSeries], time_range: TimeRange) -> TimeSeries:
+    stacked = stack([member.values for member in time_series])
+    # Take the value of the first member which has one
+    first = np.argmax(~np.isnan(stacked), axis=0)
     return TimeSeries(
         time_range=time_range,
-        values=[
-            next((value for value in point if value is not None), None)
-            for point in zip(*(member.values for member in time_series))
-        ],
+        values=to_values(stacked[first, np.arange(stacked.shape[1])]),
     )
 
 
@@ -162,7 +162,12 @@ def fetch_time_series(
     for metric, (function, rrd_metrics) in rrd_metrics_per_metric.items():
         raw = raw_per_function[function]
         scaled = [
-            _scaled(resample(raw[rrd_metric], time_range, function), scale)
+            _scaled(
+                resample_array(
+                    ArrayTimeSeries.from_time_series(raw[rrd_metric]), time_range, function
+                ),
+                scale,
+            )
             for rrd_metric, scale in rrd_metrics
             if rrd_metric in raw
         ]
@@ -3,6 +3,12 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import random
+import statistics
+from collections.abc import Callable, Mapping
+
+import pytest
+
 from cmk.graphing_engine import ConsolidationFunction, TimeRange, TimeSeries
 from cmk.graphing_engine._resample import resample
 
@@ -51,3 +57,62 @@ def test_resample_of_an_empty_series_yields_the_target_length_of_gaps() -> None:
     other = TimeRange(start=0, end=30, step=15)
     assert resample(source, other, ConsolidationFunction.MAX).values == [None, None]
     assert resample(source, target, ConsolidationFunction.MAX) is source
+
+
+def _reference_resample(
+    source: TimeSeries, target: TimeRange, consolidation_function: ConsolidationFunction
+) -> list[float | None]:
+    # The former implementation on lists, consolidating bucket by bucket
+    functions: Mapping[ConsolidationFunction, Callable[[list[float]], float]] = {
+        ConsolidationFunction.MIN: min,
+        ConsolidationFunction.MAX: max,
+        ConsolidationFunction.AVERAGE: statistics.fmean,
+    }
+    source_range = source.time_range
+    if target.step < source_range.step:
+        last = len(source.values) - 1
+        return [
+            source.values[max(0, min((timestamp - source_range.start) // source_range.step, last))]
+            for timestamp in range(target.start, target.end, target.step)
+        ]
+    desired = [t + target.step for t in range(target.start, target.end, target.step)]
+    timestamps = [
+        t + source_range.step
+        for t in range(source_range.start, source_range.end, source_range.step)
+    ]
+    resampled: list[float | None] = []
+    bucket: list[float] = []
+    index = 0
+    for timestamp, value in zip(timestamps, source.values):
+        if index < len(desired) and timestamp > desired[index]:
+            resampled.append(functions[consolidation_function](bucket) if bucket else None)
+            bucket = []
+            index += 1
+        if value is not None:
+            bucket.append(value)
+    if (missing := len(desired) - len(resampled)) > 0:
+        resampled.append(functions[consolidation_function](bucket) if bucket else None)
+        resampled += [None] * (missing - 1)
+    return resampled
+
+
+@pytest.mark.parametrize("consolidation_function", list(ConsolidationFunction))
+def test_resample_matches_the_consolidation_bucket_by_bucket(
+    consolidation_function: ConsolidationFunction,
+) -> None:
+    rng = random.Random(4711)
+    source = _ts(
+        TimeRange(start=1000, end=4000, step=10),
+        *(None if rng.random() < 0.2 else rng.uniform(-100, 100) for _ in range(300)),
+    )
+    for target in (
+        TimeRange(start=1000, end=4000, step=60),
+        TimeRange(start=1005, end=3900, step=70),
+        # Starts long before the source, so that the values lag behind the desired timestamps
+        TimeRange(start=0, end=5000, step=30),
+        TimeRange(start=1500, end=2500, step=10),
+        TimeRange(start=1003, end=4100, step=7),
+    ):
+        assert resample(source, target, consolidation_function).values == pytest.approx(
+            _reference_resample(source, target, consolidation_function)
+        )
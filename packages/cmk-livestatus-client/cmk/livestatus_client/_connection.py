@@ -12,6 +12,7 @@ import json
 import os
 import re
 import select
+import selectors
 import socket
 import ssl
 import threading
@@ -594,6 +595,8 @@ class SingleSiteConnection(Helpers):
         self.socket: socket.socket | None = None
         self.timeout: int | None = None
         self.successful_persistence = False
+        # Data read ahead by MultiSiteConnection.query_parallel(), see prefetch()
+        self._prefetched = bytearray()
         self._output_format = LivestatusOutputFormat.PYTHON
 
         # Whether to establish an encrypted connection
@@ -701,6 +704,7 @@ class SingleSiteConnection(Helpers):
         self._close_socket()
 
     def _close_socket(self) -> None:
+        self._prefetched.clear()
         if self.socket is not None:
             if isinstance(self.socket, ssl.SSLSocket):
                 with contextlib.suppress(ssl.SSLError, OSError):
@@ -719,10 +723,17 @@ class SingleSiteConnection(Helpers):
                 pass
 
     def receive_data(self, size: int, timeout: float | None = None) -> bytes:
+        data = BytesIO()
+        if self._prefetched:
+            data.write(self._prefetched[:size])
+            del self._prefetched[:size]
+            size -= data.getbuffer().nbytes
+            if size == 0:
+                return data.getvalue()
+
         if self.socket is None:
             raise MKLivestatusSocketError("Socket to '%s' is not connected" % self.socketurl)
 
-        data = BytesIO()
         self.socket.settimeout(timeout)
         receive_start = time.time()
         while size > 0:
@@ -742,6 +753,43 @@ class SingleSiteConnection(Helpers):
 
         return data.getvalue()
 
+    def prefetch(self) -> bool:
+        """Read the available part of the pending response without blocking
+
+        The data is buffered and consumed by the next receive_raw_response().
+        Nothing beyond the end of the response is read. Returns False if
+        there is nothing more to prefetch: either the response is complete or
+        the socket is in a state that receive_raw_response() has to deal with.
+        """
+        if self.socket is None:
+            return False
+
+        self.socket.settimeout(0.0)
+        try:
+            while (missing := self._missing_response_bytes()) > 0:
+                try:
+                    packet = self.socket.recv(missing)
+                except (ssl.SSLWantReadError, BlockingIOError):
+                    return True
+                except OSError:
+                    return False
+                if not packet:
+                    return False
+                self._prefetched += packet
+            return False
+        finally:
+            if self.socket is not None:
+                self.socket.settimeout(None if self.timeout is None else float(self.timeout))
+
+    def _missing_response_bytes(self) -> int:
+        if len(self._prefetched) < 16:
+            return 16 - len(self._prefetched)
+        try:
+            length = int(self._prefetched[4:15].lstrip())
+        except ValueError:
+            return 0  # malformed header, leave it to receive_raw_response()
+        return 16 + length - len(self._prefetched)
+
     def do_query(self, query: Query, add_headers: str = "") -> LivestatusResponse:
         with (
             tracer.span(
@@ -1038,6 +1086,7 @@ class MultiSiteConnection(Helpers):
         self.limit: int | None = None
         self.parallelize = True
         self._only_sites_postprocess = only_sites_postprocess
+        self._site_latencies: dict[SiteId, float] = {}
 
         # Status host: A status host helps to prevent trying to connect
         # to a remote site which is unreachable. This is done by looking
@@ -1212,6 +1261,10 @@ class MultiSiteConnection(Helpers):
     def dead_sites(self) -> dict[SiteId, DeadSite]:
         return self.deadsites
 
+    def site_latencies(self) -> dict[SiteId, float]:
+        """The response time in seconds per site of the last query"""
+        return dict(self._site_latencies)
+
     def alive_sites(self) -> list[SiteId]:
         return [s.id for s in self.connections]
 
@@ -1254,6 +1307,7 @@ class MultiSiteConnection(Helpers):
         result = LivestatusResponse([])
         stillalive = []
         limit = self.limit
+        self._site_latencies.clear()
         for connected_site in self.connections:
             if self.only_sites is not None and connected_site.id not in self.only_sites:
                 stillalive.append(connected_site)  # state unknown, assume still alive
@@ -1263,7 +1317,9 @@ class MultiSiteConnection(Helpers):
                     limit_header = "Limit: %d\n" % limit
                 else:
                     limit_header = ""
+                sent_at = time.monotonic()
                 r = connected_site.connection.query(query, add_headers + limit_header)
+                self._site_latencies[connected_site.id] = time.monotonic() - sent_at
                 if self.prepend_site:
                     for row in r:
                         row.insert(0, connected_site.id)
@@ -1297,7 +1353,9 @@ class MultiSiteConnection(Helpers):
         else:
             connect_to_sites = self.connections
 
+        self._site_latencies.clear()
         with tracer.span("query_parallel", attributes={"cmk.livestatus.query": str(query)}):
+            sent_at = time.monotonic()
             # First send all queries
             retrieve_responses = self._send_queries(
                 query,
@@ -1306,11 +1364,9 @@ class MultiSiteConnection(Helpers):
                 limit_header="Limit: %d\n" % self.limit if self.limit is not None else "",
             )
 
-            # Then retrieve all raw responses. We will be as slow as the slowest of all connections.
-            site_responses = self._retrieve_responses(query, retrieve_responses, stillalive)
-
-            # Convert responses to python format
-            result = self._parse_responses(query, site_responses, stillalive)
+            # Then receive and parse the responses as they arrive.
+            # We will be as slow as the slowest of all connections.
+            result = self._receive_responses(query, retrieve_responses, stillalive, sent_at)
 
         self.connections = stillalive
         return LivestatusResponse(result)
@@ -1343,74 +1399,101 @@ class MultiSiteConnection(Helpers):
                     }
         return retrieve_responses
 
-    def _retrieve_responses(
+    def _receive_responses(
         self,
         query: Query,
         retrieve_responses: list[tuple[str, trace.Span, ConnectedSite]],
         stillalive: ConnectedSites,
-    ) -> list[tuple[ConnectedSite, bytes]]:
-        site_responses: list[tuple[ConnectedSite, bytes]] = []
-        for str_query, request_span, connected_site in retrieve_responses:
-            with tracer.span(
-                f"receive_from_site[{connected_site.id}]",
-                kind=trace.SpanKind.CONSUMER,
-                links=[trace.Link(request_span.get_span_context())],
+        sent_at: float,
+    ) -> list[LivestatusRow]:
+        """Receive and parse the responses of all sites
+
+        The sockets of all sites are drained at the same time as the data
+        arrives, and every response is parsed as soon as it is complete.
+        This way one slow site does not hold up reading from the fast ones.
+        The rows are returned in the order of the sites, nevertheless.
+        """
+        outcomes: list[list[LivestatusRow] | Exception] = [[] for _ in retrieve_responses]
+
+        def finish(index: int) -> None:
+            str_query, _request_span, connected_site = retrieve_responses[index]
+            outcomes[index] = self._receive_and_parse_response(query, str_query, connected_site)
+            latency = time.monotonic() - sent_at
+            self._site_latencies[connected_site.id] = latency
+            span.add_event(
+                f"response_from_site[{connected_site.id}]",
                 attributes={
-                    "cmk.livestatus.query": str_query,
                     "cmk.livestatus.target_site_id": str(connected_site.id),
+                    "cmk.livestatus.latency": latency,
                 },
-            ):
+            )
+
+        with (
+            tracer.span(
+                "receive_from_sites",
+                kind=trace.SpanKind.CONSUMER,
+                links=[
+                    trace.Link(request_span.get_span_context())
+                    for _str_query, request_span, _connected_site in retrieve_responses
+                ],
+                attributes={"cmk.livestatus.query": str(query)},
+            ) as span,
+            selectors.DefaultSelector() as selector,
+        ):
+            for index, (_str_query, _request_span, connected_site) in enumerate(retrieve_responses):
                 try:
-                    site_responses.append(
-                        (
-                            connected_site,
-                            connected_site.connection.receive_raw_response(
-                                str_query, query.suppress_exceptions
-                            ),
-                        )
+                    selector.register(
+                        connected_site.connection.socket,  # type: ignore[arg-type]
+                        selectors.EVENT_READ,
+                        index,
                     )
-                except query.suppress_exceptions:
-                    # Mostly handles exception types MKLivestatusTableNotFoundError
-                    stillalive.append(connected_site)
-                    continue
-                except LivestatusTestingError:
-                    raise
-                except Exception as e:
-                    connected_site.connection.disconnect()
-                    self.deadsites[connected_site.id] = {
-                        "exception": e,
-                        "site": connected_site.config,
-                    }
-        return site_responses
+                except (ValueError, KeyError, OSError):
+                    # not connected (anymore), receive_raw_response() knows what to do
+                    finish(index)
+
+            while selector.get_map():
+                for key, _events in selector.select():
+                    if not retrieve_responses[key.data][2].connection.prefetch():
+                        selector.unregister(key.fileobj)
+                        finish(key.data)
 
-    def _parse_responses(
-        self,
-        query: Query,
-        site_responses: list[tuple[ConnectedSite, bytes]],
-        stillalive: ConnectedSites,
-    ) -> list[LivestatusRow]:
         result: list[LivestatusRow] = []
-        for connected_site, raw_response in site_responses:
-            try:
-                rows = connected_site.connection.parse_raw_response(raw_response, query)
-                stillalive.append(connected_site)
-                if self.prepend_site:
-                    for row in rows:
-                        row.insert(0, connected_site.id)
-                result.extend(rows)
-            except query.suppress_exceptions:
-                stillalive.append(connected_site)
-                continue
-            except LivestatusTestingError:
-                raise
-            except Exception as e:
+        for (_str_query, _request_span, connected_site), outcome in zip(
+            retrieve_responses, outcomes
+        ):
+            if isinstance(outcome, Exception):
                 connected_site.connection.disconnect()
                 self.deadsites[connected_site.id] = {
-                    "exception": e,
+                    "exception": outcome,
                     "site": connected_site.config,
                 }
+                continue
+            stillalive.append(connected_site)
+            if self.prepend_site:
+                for row in outcome:
+                    row.insert(0, connected_site.id)
+            result.extend(outcome)
         return result
 
+    @staticmethod
+    def _receive_and_parse_response(
+        query: Query, str_query: str, connected_site: ConnectedSite
+    ) -> list[LivestatusRow] | Exception:
+        try:
+            return connected_site.connection.parse_raw_response(
+                connected_site.connection.receive_raw_response(
+                    str_query, query.suppress_exceptions
+                ),
+                query,
+            )
+        except query.suppress_exceptions:
+            # Mostly handles exception types MKLivestatusTableNotFoundError
+            return []
+        except LivestatusTestingError:
+            raise
+        except Exception as e:
+            return e
+
     def command(self, command: str, sitename: SiteId | None = SiteId("local")) -> None:
         if sitename in self.deadsites:
             raise MKLivestatusSocketError(
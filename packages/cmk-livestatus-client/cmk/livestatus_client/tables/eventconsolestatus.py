@@ -66,6 +66,13 @@ class Eventconsolestatus(Table):
     )
     """The average rule hit rate"""
 
+    status_average_rule_prune_rate = Column(
+        'status_average_rule_prune_rate',
+        col_type='float',
+        description='The average rate of rules skipped by the rule index',
+    )
+    """The average rate of rules skipped by the rule index"""
+
     status_average_rule_trie_rate = Column(
         'status_average_rule_trie_rate',
         col_type='float',
@@ -241,6 +248,20 @@ class Eventconsolestatus(Table):
     )
     """The number of rule hits since startup of the Event Console"""
 
+    status_rule_prune_rate = Column(
+        'status_rule_prune_rate',
+        col_type='float',
+        description='The rate of rules skipped by the rule index',
+    )
+    """The rate of rules skipped by the rule index"""
+
+    status_rule_prunes = Column(
+        'status_rule_prunes',
+        col_type='int',
+        description='The number of rules skipped by the rule index since startup of the Event Console',
+    )
+    """The number of rules skipped by the rule index since startup of the Event Console"""
+
     status_rule_trie_rate = Column(
         'status_rule_trie_rate',
         col_type='float',
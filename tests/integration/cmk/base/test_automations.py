@@ -392,7 +392,7 @@ def test_automation_set_autochecks_v2(site: Site) -> None:
         autochecks_file = f"var/check_mk/autochecks/{host_name}.mk"
         assert site.file_exists(autochecks_file)
 
-        data = AutochecksSerializer().deserialize(site.read_file(autochecks_file).encode("utf-8"))
+        data = AutochecksSerializer().deserialize(site.read_file(autochecks_file, encoding=None))
         services = [
             (
                 (str(s.check_plugin_name), s.item),
@@ -62,7 +62,7 @@ check_info["test_check_3"] = LegacyCheckDefinition(
 
     # Verify that the discovery worked as expected
     entries = AutochecksSerializer().deserialize(
-        site.read_file(f"var/check_mk/autochecks/{host_name}.mk").encode("utf-8")
+        site.read_file(f"var/check_mk/autochecks/{host_name}.mk", encoding=None)
     )
     assert str(entries[0].check_plugin_name) == "test_check_3"
     assert entries[0].item is None
@@ -69,7 +69,7 @@ check_plugin_test_check_1 = CheckPlugin(
 
     # Verify that the discovery worked as expected
     entries = AutochecksSerializer().deserialize(
-        site.read_file(f"var/check_mk/autochecks/{host_name}.mk").encode("utf-8")
+        site.read_file(f"var/check_mk/autochecks/{host_name}.mk", encoding=None)
     )
     for entry in entries:
         if str(entry.check_plugin_name) == "test_check_1":
@@ -88,7 +88,7 @@ check_plugin_test_check_1 = CheckPlugin(
     site.delete_file(f"var/check_mk/autochecks/{host_name}.mk")
     site.openapi.service_discovery.run_discovery_and_wait_for_completion(host_name)
     entries = AutochecksSerializer().deserialize(
-        site.read_file(f"var/check_mk/autochecks/{host_name}.mk").encode("utf-8")
+        site.read_file(f"var/check_mk/autochecks/{host_name}.mk", encoding=None)
     )
     for entry in entries:
         if str(entry.check_plugin_name) == "test_check_1":
@@ -152,7 +152,7 @@ check_plugin_test_check_2 = CheckPlugin(
 
     # Verify that the discovery worked as expected
     entries = AutochecksSerializer().deserialize(
-        site.read_file(f"var/check_mk/autochecks/{host_name}.mk").encode("utf-8")
+        site.read_file(f"var/check_mk/autochecks/{host_name}.mk", encoding=None)
     )
 
     for entry in entries:
@@ -172,7 +172,7 @@ check_plugin_test_check_2 = CheckPlugin(
     site.delete_file(f"var/check_mk/autochecks/{host_name}.mk")
     site.openapi.service_discovery.run_discovery_and_wait_for_completion(host_name)
     entries = AutochecksSerializer().deserialize(
-        site.read_file(f"var/check_mk/autochecks/{host_name}.mk").encode("utf-8")
+        site.read_file(f"var/check_mk/autochecks/{host_name}.mk", encoding=None)
     )
     for entry in entries:
         if str(entry.check_plugin_name) == "test_check_2":
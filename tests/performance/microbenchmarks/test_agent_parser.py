@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark parsing a large agent output
+
+The output contains a big logwatch section and a big process table, as well as a few small
+sections. Only the small sections are selected, like for a host where most of the output
+is handled by other plugins.
+
+$ pytest tests/performance/microbenchmarks/test_agent_parser.py
+"""
+
+import logging
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cmk.ccc.hostaddress import HostName
+from cmk.checkengine.helper_interface import AgentRawData
+from cmk.checkengine.parser import AgentParser, NO_SELECTION, SectionNameCollection, SectionStore
+from cmk.checkengine.plugins import SectionName
+
+_RAW_DATA = AgentRawData(
+    b"\n".join(
+        (
+            b"<<<check_mk>>>",
+            b"Version: 2.5.0",
+            b"AgentOS: linux",
+            b"<<<logwatch>>>",
+            b"[[[/var/log/messages]]]",
+            *(
+                b"C Oct 18 06:17:%02d server kernel: [%d] eth0: link is down, %d packets dropped\r"
+                % (n % 60, n, n)
+                for n in range(200_000)
+            ),
+            b"<<<ps_lnx>>>",
+            b"[header] CGROUP USER VSZ RSS TIME ELAPSED PID COMMAND",
+            *(
+                b"0::/system.slice/app.service   app  123456  7890  00:00:%02d  1-02:03:04  %d"
+                b"  /usr/bin/python3 -m app.worker --id=%d\r" % (n % 60, n, n)
+                for n in range(100_000)
+            ),
+            b"<<<uptime>>>",
+            b"123456.78 234567.89",
+            b"<<<<piggy>>>>",
+            b"<<<uptime>>>",
+            b"123.4",
+            b"<<<<>>>>",
+        )
+    )
+)
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [
+        pytest.param(NO_SELECTION, id="all"),
+        pytest.param({SectionName("check_mk"), SectionName("uptime")}, id="selected"),
+    ],
+)
+def test_parse_agent_output(
+    tmp_path: Path, benchmark: BenchmarkFixture, selection: SectionNameCollection
+) -> None:
+    logger = logging.getLogger("test")
+    parser = AgentParser(
+        HostName("heute"),
+        SectionStore(tmp_path / "persisted", logger=logger),
+        host_check_interval=60,
+        keep_outdated=True,
+        translation={},
+        encoding_fallback="utf-8",
+        logger=logger,
+    )
+
+    host_sections = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        parser.parse, args=(_RAW_DATA,), kwargs={"selection": selection}, rounds=5
+    )
+
+    assert host_sections.sections[SectionName("uptime")] == [["123456.78", "234567.89"]]
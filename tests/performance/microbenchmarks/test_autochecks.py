@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark loading the autochecks of all hosts and an SNMP walk cache
+
+Each host has 30 services with some parameters and labels. The autochecks are read from
+files in the Python literal format of previous versions and from files in the binary
+format. The walk cache holds 10 cached OIDs with 1000 rows each.
+
+$ pytest tests/performance/microbenchmarks/test_autochecks.py --benchmark-group-by=func
+"""
+
+import logging
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cmk.ccc.hostaddress import HostName
+from cmk.checkengine.discovery import AutochecksMemoizer
+from cmk.checkengine.discovery._autochecks import AutochecksSerializer
+from cmk.checkengine.fetchers.snmp._cache import WalkCache
+from cmk.checkengine.plugins import AutocheckEntry, CheckPluginName
+
+_NUM_HOSTS = 2000
+
+
+def _entries(n: int) -> list[AutocheckEntry]:
+    return [
+        AutocheckEntry(
+            CheckPluginName(f"plugin_{s % 7}"),
+            f"Interface {s}",
+            {"discovered_state": ["1"], "discovered_speed": 10_000_000 * n, "levels": (80.0, 90.0)},
+            {"cmk/os_family": "linux", "team": f"team{n % 10}"},
+        )
+        for s in range(30)
+    ]
+
+
+def _write_autochecks(autochecks_dir: Path, *, legacy: bool) -> None:
+    autochecks_dir.mkdir()
+    for n in range(_NUM_HOSTS):
+        entries = _entries(n)
+        (autochecks_dir / f"host{n}.mk").write_bytes(
+            ("[\n%s]\n" % "".join(f"  {e.dump()!r},\n" for e in entries)).encode("utf-8")
+            if legacy
+            else AutochecksSerializer.serialize(entries)
+        )
+
+
+def _read_all(autochecks_dir: Path) -> None:
+    memoizer = AutochecksMemoizer(autochecks_dir)
+    for n in range(_NUM_HOSTS):
+        memoizer.read(HostName(f"host{n}"))
+
+
+@pytest.mark.parametrize("legacy", [True, False], ids=["literal", "binary"])
+def test_read_autochecks_files(tmp_path: Path, benchmark: BenchmarkFixture, legacy: bool) -> None:
+    autochecks_dir = tmp_path / "autochecks"
+    _write_autochecks(autochecks_dir, legacy=legacy)
+    benchmark.pedantic(_read_all, args=(autochecks_dir,), rounds=5)  # type: ignore[no-untyped-call]
+
+
+@pytest.mark.parametrize("legacy", [True, False], ids=["literal", "binary"])
+def test_load_walk_cache(tmp_path: Path, benchmark: BenchmarkFixture, legacy: bool) -> None:
+    cache = WalkCache(tmp_path, logging.getLogger("test"))
+    for oid in range(10):
+        cache[(f".1.3.6.1.2.1.2.2.1.{oid}", "12c3d4a", True)] = [
+            (f"{row}", f"value of row {row}".encode()) for row in range(1000)
+        ]
+    cache.save()
+    if legacy:
+        for path in tmp_path.iterdir():
+            path.write_text(repr(cache[(path.name[3:].split("-")[0], "12c3d4a", True)]))
+
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        lambda: WalkCache(tmp_path, logging.getLogger("test")).load(), rounds=5
+    )
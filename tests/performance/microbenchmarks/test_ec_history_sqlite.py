@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark the write throughput of the SQLite history of the Event Console
+
+One round adds the history entries of an event storm and closes the history, so
+that all pending entries are written. A batch size of 1 corresponds to the former
+behaviour of one transaction per entry. The throughput is 10000 entries divided by
+the time of a round.
+
+$ pytest tests/performance/microbenchmarks/test_ec_history_sqlite.py --benchmark-group-by=param:synchronous
+"""
+
+import logging
+from pathlib import Path
+from typing import Literal
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import cmk.ec.export as ec
+from cmk.ccc.hostaddress import HostName
+from cmk.ec.history_sqlite import SQLiteHistory, SQLiteSettings
+from cmk.ec.main import make_config, StatusTableEvents, StatusTableHistory
+from cmk.ec.settings import create_settings
+
+_N_ENTRIES = 10_000
+
+
+@pytest.mark.parametrize("synchronous", ["normal", "full"])
+@pytest.mark.parametrize("batch_size", [1, 100, 1000])
+def test_add_event_storm(
+    tmp_path: Path,
+    benchmark: BenchmarkFixture,
+    batch_size: int,
+    synchronous: Literal["normal", "full"],
+) -> None:
+    settings = create_settings("1.2.3i45", tmp_path / "omd_root", ["mkeventd"])
+    config = make_config(ec.default_config()) | {
+        "sqlite_synchronous": synchronous,
+        "sqlite_write_batch_size": batch_size,
+    }
+    events = [
+        ec.Event(host=HostName(f"host{n % 100}"), text=f"Event {n}", id=n, count=1)
+        for n in range(_N_ENTRIES)
+    ]
+
+    def add_events(database: Path) -> None:
+        history = SQLiteHistory(
+            SQLiteSettings.from_settings(settings, database=database),
+            config,
+            logging.getLogger("cmk.mkeventd"),
+            StatusTableEvents.columns,
+            StatusTableHistory.columns,
+        )
+        for event in events:
+            history.add(event, "NEW")
+        history.close()
+
+    databases = (tmp_path / f"history{n}.sqlite" for n in range(1000))
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        add_events,
+        setup=lambda: ((next(databases),), {}),
+        rounds=3,
+    )
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark saving and loading the status of the Event Console
+
+A periodic save appends the events changed since the previous save to the journal,
+here 100 of them. A snapshot copies all open events and writes them in the background,
+the round includes waiting for it. Loading reads a snapshot and a journal of 100 saves.
+The repr() variants measure the status file as it was written before the journal.
+
+$ pytest tests/performance/microbenchmarks/test_ec_status_journal.py --benchmark-group-by=param:num_events
+"""
+
+import ast
+import logging
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import cmk.ec.export as ec
+from cmk.ccc.hostaddress import HostName
+from cmk.ec.status_journal import PackedEventStatus, StatusJournal
+
+_NUM_CHANGED = 100
+
+_LOGGER = logging.getLogger("cmk.mkeventd")
+
+
+def _status(num_events: int) -> PackedEventStatus:
+    return PackedEventStatus(
+        next_event_id=num_events + 1,
+        events=[
+            ec.Event(
+                id=n,
+                rule_id=f"rule{n % 50}",
+                text=f"Something happened on interface {n % 48}, state changed to down",
+                phase="open",
+                count=1,
+                time=1_700_000_000.0 + n,
+                first=1_700_000_000.0 + n,
+                last=1_700_000_000.0 + n,
+                comment="",
+                host=HostName(f"host{n % 1000}"),
+                core_host=HostName(f"host{n % 1000}"),
+                host_in_downtime=False,
+                ipaddress="10.0.0.1",
+                application="kernel",
+                pid=0,
+                priority=3,
+                facility=1,
+                match_groups=(f"{n % 48}", "down"),
+                contact_groups=None,
+            )
+            for n in range(1, num_events + 1)
+        ],
+        rule_stats={f"rule{n}": n for n in range(50)},
+        interval_starts={},
+    )
+
+
+def _change_events(status: PackedEventStatus, round_: int) -> list[ec.Event]:
+    changed = status["events"][round_ * _NUM_CHANGED : (round_ + 1) * _NUM_CHANGED]
+    for event in changed:
+        event["count"] += 1
+    return changed
+
+
+@pytest.mark.parametrize("num_events", [10_000, 100_000, 500_000])
+def test_save_changes(tmp_path: Path, benchmark: BenchmarkFixture, num_events: int) -> None:
+    status = _status(num_events)
+    journal = StatusJournal(tmp_path / "status", _LOGGER)
+    journal.save(status, [], [])
+    journal.close()
+    rounds = iter(range(1000))
+
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        journal.save,
+        setup=lambda: ((status, _change_events(status, next(rounds)), []), {}),
+        rounds=20,
+    )
+
+
+@pytest.mark.parametrize("num_events", [10_000, 100_000, 500_000])
+def test_save_snapshot(tmp_path: Path, benchmark: BenchmarkFixture, num_events: int) -> None:
+    status = _status(num_events)
+    journal = StatusJournal(tmp_path / "status", _LOGGER)
+
+    def save_snapshot() -> None:
+        journal.request_snapshot()
+        journal.save(status, [], [])
+        journal.close()
+
+    benchmark.pedantic(save_snapshot, rounds=3)  # type: ignore[no-untyped-call]
+
+
+@pytest.mark.parametrize("num_events", [10_000, 100_000, 500_000])
+def test_load(tmp_path: Path, benchmark: BenchmarkFixture, num_events: int) -> None:
+    status = _status(num_events)
+    path = tmp_path / "status"
+    journal = StatusJournal(path, _LOGGER)
+    journal.save(status, [], [])
+    for round_ in range(100):
+        journal.save(status, _change_events(status, round_), [])
+    journal.close()
+
+    benchmark.pedantic(StatusJournal(path, _LOGGER).load, rounds=3)  # type: ignore[no-untyped-call]
+
+
+@pytest.mark.parametrize("num_events", [10_000, 100_000, 500_000])
+def test_save_repr(tmp_path: Path, benchmark: BenchmarkFixture, num_events: int) -> None:
+    status = _status(num_events)
+    path = tmp_path / "status"
+
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        lambda: path.write_bytes((repr(status) + "\n").encode("utf-8")), rounds=3
+    )
+
+
+@pytest.mark.parametrize("num_events", [10_000, 100_000, 500_000])
+def test_load_repr(tmp_path: Path, benchmark: BenchmarkFixture, num_events: int) -> None:
+    path = tmp_path / "status"
+    path.write_bytes((repr(_status(num_events)) + "\n").encode("utf-8"))
+
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        lambda: ast.literal_eval(path.read_text(encoding="utf-8")), rounds=3
+    )
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark resampling and combining time series of the size of RRD archives
+
+The source series are synthetic with a few gaps. They have the size of the default RRD
+archives of Checkmk: one day with a step of one minute, ten days with five minutes, 90
+days with 30 minutes and four years with six hours. A year of one minute values covers a
+series fetched from an RRD without consolidation. One round resamples a series to the
+width of a graph or combines the series of a stacked graph.
+
+$ pytest tests/performance/microbenchmarks/test_graph_resampling.py --benchmark-group-by=func
+"""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cmk.graphing_engine import (
+    ConsolidationFunction,
+    EvaluationContext,
+    HostName,
+    MetricName,
+    PerformanceData,
+    resample,
+    RRDMetric,
+    Service,
+    ServiceName,
+    Sum,
+    TimeRange,
+    TimeSeries,
+)
+
+_END = 1_700_006_400
+_GRAPH_POINTS = 800
+
+# The number of points and the step of the archives
+_ARCHIVES = {
+    "1d@60s": (1440, 60),
+    "10d@300s": (2880, 300),
+    "90d@1800s": (4320, 1800),
+    "4y@21600s": (5840, 21600),
+    "1y@60s": (525_600, 60),
+}
+
+
+def _time_series(archive: str) -> TimeSeries:
+    length, step = _ARCHIVES[archive]
+    return TimeSeries(
+        time_range=TimeRange(start=_END - length * step, end=_END, step=step),
+        values=[None if n % 97 == 0 else float(n % 1000) for n in range(length)],
+    )
+
+
+@pytest.mark.parametrize("consolidation_function", list(ConsolidationFunction))
+@pytest.mark.parametrize("archive", list(_ARCHIVES))
+def test_downsample(
+    benchmark: BenchmarkFixture, archive: str, consolidation_function: ConsolidationFunction
+) -> None:
+    time_series = _time_series(archive)
+    source = time_series.time_range
+    step = max(source.step, (source.end - source.start) // _GRAPH_POINTS)
+    target = TimeRange(start=source.start, end=source.end, step=step + 1)
+
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        resample, args=(time_series, target, consolidation_function), rounds=5
+    )
+
+
+def test_forward_fill(benchmark: BenchmarkFixture) -> None:
+    time_series = _time_series("4y@21600s")
+    source = time_series.time_range
+    target = TimeRange(start=source.start, end=source.end, step=3600)
+
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        resample, args=(time_series, target, ConsolidationFunction.MAX), rounds=5
+    )
+
+
+@pytest.mark.parametrize("archive", ["90d@1800s", "1y@60s"])
+def test_sum_of_stacked_metrics(benchmark: BenchmarkFixture, archive: str) -> None:
+    time_series = _time_series(archive)
+    metrics = [
+        RRDMetric(
+            host_name=HostName("host"),
+            service_name=ServiceName("Interfaces"),
+            metric_name=MetricName(f"if_in_octets_{n}"),
+        )
+        for n in range(20)
+    ]
+    service = Service(host_name=HostName("host"), service_name=ServiceName("Interfaces"))
+    context = EvaluationContext(
+        performance_data={
+            service: {
+                metric.metric_name: PerformanceData(value=1.0, originals=[]) for metric in metrics
+            }
+        },
+        time_series=dict.fromkeys(metrics, time_series),
+        time_range=time_series.time_range,
+    )
+
+    benchmark.pedantic(Sum(metrics).evaluate, args=(context,), rounds=5)  # type: ignore[no-untyped-call]
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark updating the DNS cache and persisting single cache misses
+
+A stub resolver replaces getaddrinfo(). It answers every query after a fixed latency,
+like a name server in the local network. One round of the update looks up the IPv4
+addresses of 2000 hosts, either one after another or with concurrent workers. One round
+of the cache misses adds 100 entries to a persisted cache of 40k hosts.
+
+$ pytest tests/performance/microbenchmarks/test_ip_lookup.py
+"""
+
+import socket
+import time
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cmk.ccc.hostaddress import HostAddress, HostName
+from cmk.utils import ip_lookup
+from cmk.utils.caching import cache_manager
+
+_LATENCY = 0.002
+_N_HOSTS = 2000
+_N_CACHED_HOSTS = 40_000
+
+
+def _stub_getaddrinfo(
+    host: str, port: object, family: int = 0, *args: object
+) -> list[tuple[int, int, int, str, tuple[str, int]]]:
+    time.sleep(_LATENCY)
+    n = int(host.rsplit("-", 1)[1])
+    return [(family, 0, 0, "", (f"10.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}", 0))]
+
+
+def _lookup_config() -> ip_lookup.IPLookupConfig:
+    return ip_lookup.IPLookupConfig(
+        ip_stack_config=lambda host_name: ip_lookup.IPStackConfig.IPv4,
+        is_snmp_host=lambda host_name: False,
+        is_snmp_management=lambda host_name: False,
+        is_use_walk_host=lambda host_name: False,
+        default_address_family=lambda host_name: socket.AddressFamily.AF_INET,
+        management_address=lambda host_name, family: None,
+        is_dyndns_host=lambda host_name: False,
+        ipv4_addresses={},
+        ipv6_addresses={},
+        simulation_mode=False,
+        fake_dns=None,
+        use_dns_cache=True,
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 16, 64])
+def test_update_dns_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    benchmark: BenchmarkFixture,
+    max_workers: int,
+) -> None:
+    monkeypatch.setattr(ip_lookup.IPLookupCache, "PATH", tmp_path / "ipaddresses.cache")
+    monkeypatch.setattr(socket, "getaddrinfo", _stub_getaddrinfo)
+    hosts = [HostName(f"host-{n}") for n in range(_N_HOSTS)]
+    lookup_config = _lookup_config()
+
+    def update() -> None:
+        cache_manager.clear()
+        n_updated, failed = ip_lookup.update_dns_cache(
+            hosts=hosts,
+            get_ip_stack_config=lookup_config.ip_stack_config,
+            lookup_ip_address=ip_lookup.make_lookup_ip_address(lookup_config),
+            max_workers=max_workers,
+            lookup_timeout=10.0,
+        )
+        assert n_updated == _N_HOSTS and not failed
+
+    benchmark.pedantic(update, rounds=3)  # type: ignore[no-untyped-call]
+
+
+def test_persist_cache_misses(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, benchmark: BenchmarkFixture
+) -> None:
+    monkeypatch.setattr(ip_lookup.IPLookupCache, "PATH", tmp_path / "ipaddresses.cache")
+    ip_lookup.IPLookupCache(
+        {
+            (HostName(f"host-{n}"), socket.AddressFamily.AF_INET): HostAddress(f"10.0.{n}")
+            for n in range(_N_CACHED_HOSTS)
+        }
+    ).save_persisted()
+
+    def add_misses() -> None:
+        cache = ip_lookup.IPLookupCache({})
+        for n in range(100):
+            cache[(HostName(f"new-host-{n}"), socket.AddressFamily.AF_INET)] = HostAddress(
+                f"10.1.{n}"
+            )
+
+    benchmark.pedantic(add_misses, rounds=5)  # type: ignore[no-untyped-call]
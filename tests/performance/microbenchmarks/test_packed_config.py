@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark the start-up of a helper checking one host of a synthetic configuration
+
+The hosts are spread over a folder tree and carry tags, labels, attributes and an alias,
+one in fifty is the node of a cluster. A round loads the packed configuration, builds the
+config cache from it and computes a host ruleset for one host, like a precompiled host
+check does before fetching. The complete variant loads the configuration of all hosts, the
+sliced variant only the slice of the host. The peak RSS of a fresh interpreter doing the
+same is recorded as extra info.
+
+$ pytest tests/performance/microbenchmarks/test_packed_config.py --benchmark-group-by=param:num_hosts
+"""
+
+import os
+import subprocess
+import sys
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cmk.base import config
+from cmk.ccc.hostaddress import HostAddress, HostName
+from cmk.ccc.version import Edition
+
+_NUM_RULES = 100
+
+
+def _host_name(index: int) -> HostName:
+    return HostName(f"host-{index:06d}")
+
+
+def _tags(index: int) -> Mapping[str, str]:
+    return {
+        "criticality": ("prod", "test")[index % 2],
+        "networking": ("lan", "wan", "dmz")[index % 3],
+        "address_family": "ip-v4-only",
+        "ip-v4": "ip-v4",
+        "agent": "cmk-agent",
+        "tcp": "tcp",
+        "snmp_ds": "no-snmp",
+        "piggyback": "auto-piggyback",
+        "site": "heute",
+    }
+
+
+def _helper_config(num_hosts: int) -> Mapping[str, Any]:
+    host_names = [_host_name(index) for index in range(num_hosts)]
+    cluster_names = [HostName(f"cluster-{index:06d}") for index in range(num_hosts // 50)]
+    return {
+        "all_hosts": host_names,
+        "clusters": {
+            name: [host_names[index * 50], host_names[index * 50 + 1]]
+            for index, name in enumerate(cluster_names)
+        },
+        "host_tags": {
+            name: _tags(index) for index, name in enumerate([*host_names, *cluster_names])
+        },
+        "host_paths": {
+            name: f"/wato/dc{index % 5}/rack{index % 20}/hosts.mk"
+            for index, name in enumerate(host_names)
+        },
+        "host_labels": {
+            name: {"os": ("linux", "windows")[index % 2], "team": f"team{index % 25}"}
+            for index, name in enumerate(host_names)
+        },
+        "host_attributes": {
+            name: {
+                "alias": f"Host {index}",
+                "ipaddress": f"10.{index // 256 % 256}.{index % 256}.1",
+            }
+            for index, name in enumerate(host_names)
+        },
+        "ipaddresses": {
+            name: HostAddress(f"10.{index // 256 % 256}.{index % 256}.1")
+            for index, name in enumerate(host_names)
+        },
+        "explicit_host_conf": {
+            "alias": {name: f"Host {index}" for index, name in enumerate(host_names)}
+        },
+        "distributed_wato_site": "heute",
+        "host_check_commands": [
+            {
+                "id": f"rule-{n}",
+                "value": "smart",
+                "condition": {"host_folder": f"/dc{n % 5}/rack{n % 20}/"},
+            }
+            for n in range(_NUM_RULES)
+        ],
+    }
+
+
+def _start_helper(config_path: Path, host_name: HostName, sliced: bool) -> Sequence[object]:
+    raw_config = (
+        config.load_packed_config_of_host(config_path, host_name)
+        if sliced
+        else config.load_packed_config(config_path)
+    )
+    loading_result = config.perform_post_config_loading_actions(
+        raw_config, lambda _site_id: {}, edition=Edition.COMMUNITY
+    )
+    config_cache = loading_result.config_cache
+    return config_cache.ruleset_matcher.get_host_values_all(
+        host_name,
+        loading_result.loaded_config.host_check_commands,
+        config_cache.label_manager.labels_of_host,
+    )
+
+
+def _max_rss_kib(config_path: Path, host_name: HostName, sliced: bool) -> int:
+    code = (
+        "from pathlib import Path\n"
+        "from tests.performance.microbenchmarks.test_packed_config import _start_helper\n"
+        f"_start_helper(Path({str(config_path)!r}), {str(host_name)!r}, {sliced!r})\n"
+        # Unlike ru_maxrss, this is not inherited from the forking process
+        "print(Path('/proc/self/status').read_text().split('VmHWM:')[1].split()[0])\n"
+    )
+    return int(
+        subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        ).stdout.split()[-1]
+    )
+
+
+@pytest.mark.parametrize("sliced", [False, True])
+@pytest.mark.parametrize("num_hosts", [10_000, 60_000])
+def test_start_helper(
+    tmp_path: Path, benchmark: BenchmarkFixture, num_hosts: int, sliced: bool
+) -> None:
+    config_path = tmp_path / "helper_config" / "1"
+    helper_config = _helper_config(num_hosts)
+    config.PackedConfigStore.from_serial(config_path).write(helper_config)
+    config.HostSlicedConfigStore.from_serial(config_path).write(helper_config)
+    host_name = _host_name(num_hosts // 2)
+
+    values = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        _start_helper, args=(config_path, host_name, sliced), rounds=3
+    )
+    if sliced:
+        assert values == _start_helper(config_path, host_name, sliced=False)
+    benchmark.extra_info["max_rss_kib"] = _max_rss_kib(config_path, host_name, sliced)
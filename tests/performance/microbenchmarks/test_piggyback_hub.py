@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark transporting one cycle of a special agent with many piggybacked hosts
+
+A local stand-in replaces the broker: it queues the published message bodies and hands
+them to the consumer. One round publishes the piggyback data of 5000 piggybacked hosts of
+one source host, consumes the messages and stores the data, either as one message per
+piggybacked host (like older versions) or as a single batch.
+
+$ pytest tests/performance/microbenchmarks/test_piggyback_hub.py
+"""
+
+import collections
+import contextlib
+import logging
+from collections.abc import Callable
+from pathlib import Path
+
+import pika
+import pika.channel
+import pika.spec
+from pika.exceptions import StreamLostError
+from pydantic import BaseModel
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cmk.ccc.hostaddress import HostName
+from cmk.messaging import Channel, CMKConnectionError, DeliveryTag, QueueName, RoutingKey
+from cmk.piggyback.backend import PiggybackMessage, PiggybackMetaData
+from cmk.piggyback.hub._payload import (
+    make_batches,
+    PAYLOAD_BATCH_QUEUE,
+    PAYLOAD_BATCH_ROUTE,
+    PiggybackPayload,
+    PiggybackPayloadBatch,
+    save_payload_batch_on_message,
+    save_payload_on_message,
+)
+from cmk.piggyback.hub._utils import APP_NAME
+
+_N_PIGGYBACKED_HOSTS = 5000
+
+_MESSAGES = [
+    PiggybackMessage(
+        meta=PiggybackMetaData(
+            source=HostName("kubernetes-cluster"),
+            piggybacked=HostName(f"pod-{n}"),
+            last_update=1700000060,
+            last_contact=1700000000,
+        ),
+        raw_data=(
+            f"<<<kube_pod_info_v1:sep(0)>>>\n"
+            f'{{"namespace": "default", "name": "pod-{n}", "node": "node-{n % 50}",'
+            f' "creation_timestamp": 1700000000, "labels": {{"app": "app-{n % 300}"}}}}\n'
+            f"<<<kube_pod_resources_v1:sep(0)>>>\n"
+            f'{{"running": ["pod-{n}"], "pending": [], "succeeded": [], "failed": []}}\n'
+            f"<<<kube_cpu_usage_v1:sep(0)>>>\n"
+            f'{{"usage": 0.{n:04d}}}\n'
+            f"<<<kube_memory_resources_v1:sep(0)>>>\n"
+            f'{{"request": {n * 1024}, "limit": {n * 2048}, "count_unspecified_requests": 0}}\n'
+        ).encode(),
+    )
+    for n in range(_N_PIGGYBACKED_HOSTS)
+]
+
+
+class _StandInBroker:
+    """Queues the published message bodies and delivers them to the consumer"""
+
+    def __init__(self) -> None:
+        self.bodies: collections.deque[bytes] = collections.deque()
+        self._on_message: Callable[..., object] | None = None
+
+    def queue_declare(self, queue: str, *, arguments: object = None) -> None:
+        pass
+
+    def queue_bind(
+        self, queue: str, exchange: str, routing_key: str, arguments: None = None
+    ) -> None:
+        pass
+
+    def basic_publish(
+        self,
+        exchange: str,
+        routing_key: str,
+        body: bytes,
+        properties: pika.BasicProperties | None,
+    ) -> None:
+        self.bodies.append(body)
+
+    def basic_consume(
+        self, queue: str, on_message_callback: Callable[..., object], auto_ack: bool
+    ) -> None:
+        self._on_message = on_message_callback
+
+    def start_consuming(self) -> None:
+        assert self._on_message is not None
+        while self.bodies:
+            self._on_message(
+                None,
+                pika.spec.Basic.Deliver(delivery_tag=1),
+                pika.BasicProperties(),
+                self.bodies.popleft(),
+            )
+        # Like a closed connection, as consuming never returns otherwise
+        raise StreamLostError()
+
+    def basic_ack(self, delivery_tag: int, multiple: bool) -> None:
+        pass
+
+
+def _transport[ModelT: BaseModel](
+    model: type[ModelT],
+    payloads: list[ModelT],
+    routing: RoutingKey,
+    queue: QueueName,
+    on_message: Callable[[Channel[ModelT], DeliveryTag, ModelT], None],
+) -> None:
+    broker = _StandInBroker()
+    channel = Channel(APP_NAME, broker, model)
+    for payload in payloads:
+        channel.publish_for_site("remote", payload, routing=routing)
+    with contextlib.suppress(CMKConnectionError):
+        channel.consume(queue, on_message)
+
+
+def test_single_payloads(tmp_path: Path, benchmark: BenchmarkFixture) -> None:
+    on_message = save_payload_on_message(logging.getLogger(__name__), tmp_path)
+
+    def transport() -> None:
+        _transport(
+            PiggybackPayload,
+            [
+                PiggybackPayload(
+                    source_host=message.meta.source,
+                    raw_data={message.meta.piggybacked: (message.raw_data,)},
+                    message_timestamp=message.meta.last_update,
+                    contact_timestamp=message.meta.last_contact,
+                )
+                for message in _MESSAGES
+            ],
+            RoutingKey("payload"),
+            QueueName("payload"),
+            on_message,
+        )
+
+    benchmark.pedantic(transport, rounds=5)  # type: ignore[no-untyped-call]
+
+
+def test_batched_payload(tmp_path: Path, benchmark: BenchmarkFixture) -> None:
+    on_message = save_payload_batch_on_message(logging.getLogger(__name__), tmp_path)
+
+    def transport() -> None:
+        _transport(
+            PiggybackPayloadBatch,
+            [batch for _site, batch in make_batches(("remote", m) for m in _MESSAGES)],
+            PAYLOAD_BATCH_ROUTE,
+            PAYLOAD_BATCH_QUEUE,
+            on_message,
+        )
+
+    benchmark.pedantic(transport, rounds=5)  # type: ignore[no-untyped-call]
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark matching a host ruleset against all hosts of a synthetic configuration
+
+The hosts are spread over a folder tree and carry tags and labels. The ruleset mixes
+folder, tag, label, explicit host name and regex conditions. One round creates a fresh
+matcher, as the configuration loading does, and computes the values of every host.
+
+$ pytest tests/performance/microbenchmarks/test_ruleset_matcher.py --benchmark-group-by=param:n_hosts
+"""
+
+from collections.abc import Mapping, Sequence
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cmk.ccc.hostaddress import HostName
+from cmk.utils.labels import Labels
+from cmk.utils.rulesets.ruleset_matcher import RuleConditionsSpec, RulesetMatcher, RuleSpec
+from cmk.utils.tags import TagGroupID, TagID
+
+_N_RULES = 300
+
+
+def _host_name(index: int) -> HostName:
+    return HostName(f"host-{index:06d}")
+
+
+def _tags(index: int) -> Mapping[TagGroupID, TagID]:
+    return {
+        TagGroupID("criticality"): TagID(("prod", "test", "critical", "offline")[index % 4]),
+        TagGroupID("networking"): TagID(("lan", "wan", "dmz")[index % 3]),
+        TagGroupID("agent"): TagID(("cmk-agent", "no-agent")[index % 2]),
+        TagGroupID("site"): TagID(f"site{index % 10}"),
+    }
+
+
+def _labels(index: int) -> Labels:
+    return {"os": ("linux", "windows", "aix")[index % 3], "team": f"team{index % 25}"}
+
+
+def _ruleset(n_hosts: int) -> Sequence[RuleSpec[int]]:
+    rules: list[RuleSpec[int]] = []
+    for n in range(_N_RULES):
+        match n % 6:
+            case 0:
+                condition: RuleConditionsSpec = {"host_folder": f"/dc{n % 5}/rack{n % 20}/"}
+            case 1:
+                condition = {
+                    "host_tags": {
+                        TagGroupID("criticality"): TagID("prod"),
+                        TagGroupID("site"): {"$ne": TagID(f"site{n % 10}")},
+                    }
+                }
+            case 2:
+                condition = {
+                    "host_tags": {
+                        TagGroupID("networking"): {"$or": [TagID("lan"), TagID("dmz")]},
+                    },
+                    "host_label_groups": [("and", [("and", f"team:team{n % 25}")])],
+                }
+            case 3:
+                condition = {
+                    "host_label_groups": [
+                        ("and", [("and", "os:linux"), ("not", f"team:team{n % 25}")])
+                    ]
+                }
+            case 4:
+                condition = {"host_name": [_host_name((n * 7919 + k) % n_hosts) for k in range(5)]}
+            case _:
+                condition = {
+                    "host_folder": f"/dc{n % 5}/",
+                    "host_name": [{"$regex": f"host-0*{n % 10}"}],
+                }
+        rules.append({"id": f"rule-{n}", "value": n, "condition": condition})
+    return rules
+
+
+@pytest.mark.parametrize("n_hosts", [10_000, 50_000, 100_000])
+def test_get_host_values_all(benchmark: BenchmarkFixture, n_hosts: int) -> None:
+    host_names = [_host_name(index) for index in range(n_hosts)]
+    host_tags = {name: _tags(index) for index, name in enumerate(host_names)}
+    host_paths = {
+        name: f"/dc{index % 5}/rack{index % 20}/hosts.mk" for index, name in enumerate(host_names)
+    }
+    labels = {name: _labels(index) for index, name in enumerate(host_names)}
+    ruleset = _ruleset(n_hosts)
+
+    def match_all_hosts() -> None:
+        matcher = RulesetMatcher(
+            host_tags=host_tags,
+            host_paths=host_paths,
+            all_configured_hosts=frozenset(host_names),
+            clusters_of={},
+            nodes_of={},
+        )
+        for name in host_names:
+            matcher.get_host_values_all(name, ruleset, labels.__getitem__)
+
+    benchmark.pedantic(match_all_hosts, rounds=3)  # type: ignore[no-untyped-call]
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark searching the index of the Setup search
+
+The synthetic index holds 20,000 hosts and 10,000 rules, each with two match texts. A
+search finds the candidates in the trigram index and only checks these. Without the
+trigram index, like with an index built by a previous version, all match texts of all
+categories are scanned. The permission checks of the results are not part of the round.
+The index is held by fakeredis, which is a lot slower than Redis, compare the ratios.
+
+$ pytest tests/performance/microbenchmarks/test_setup_search.py --benchmark-group-by=param:query
+"""
+
+import pytest
+from fakeredis import FakeRedis
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cmk.gui.config import Config
+from cmk.gui.search import (
+    ABCMatchItemGenerator,
+    IndexBuilder,
+    IndexSearcher,
+    MatchItem,
+    MatchItemGeneratorRegistry,
+    MatchItems,
+)
+from cmk.gui.search.engines.indexed import _query_fragments
+from cmk.gui.search.type_defs import VisibilityCheck
+from cmk.gui.utils.roles import UserPermissions
+
+_NUM_HOSTS = 20_000
+_NUM_RULES = 10_000
+_CATEGORIES = ("hosts", "rules")
+_RULESETS = ("cpu_utilization", "filesystem", "interfaces", "memory")
+
+
+class _SyntheticMatchItemGenerator(ABCMatchItemGenerator):
+    def __init__(self, name: str, match_items: list[MatchItem]) -> None:
+        super().__init__(name, provider="setup")
+        self._match_items = match_items
+
+    def generate_match_items(self, user_permissions: UserPermissions) -> MatchItems:
+        yield from self._match_items
+
+    @staticmethod
+    def is_affected_by_change(_change_action_name: str) -> bool:
+        return False
+
+    @property
+    def is_localization_dependent(self) -> bool:
+        return False
+
+
+class _AllowAll:
+    def may_see_category(self, category: str) -> bool:
+        return True
+
+    def get_visibility_check(self, category: str) -> VisibilityCheck:
+        return lambda _url: True
+
+
+def _registry() -> MatchItemGeneratorRegistry:
+    registry = MatchItemGeneratorRegistry()
+    registry.register(
+        _SyntheticMatchItemGenerator(
+            "hosts",
+            [
+                MatchItem(
+                    title=f"srv-{n:05d}.dc{n % 7}.example.com",
+                    topic="Hosts",
+                    url=f"wato.py?mode=edit_host&host=srv-{n:05d}",
+                    match_texts=[
+                        f"srv-{n:05d}.dc{n % 7}.example.com",
+                        f"10.{n // 256}.{n % 256}.1",
+                    ],
+                )
+                for n in range(_NUM_HOSTS)
+            ],
+        )
+    )
+    registry.register(
+        _SyntheticMatchItemGenerator(
+            "rules",
+            [
+                MatchItem(
+                    title=f"Rule {n} of {_RULESETS[n % 4]}",
+                    topic="Service monitoring rules",
+                    url=f"wato.py?mode=edit_rule&varname={_RULESETS[n % 4]}&rule_id={n}",
+                    match_texts=[
+                        f"rule {n} of {_RULESETS[n % 4]}",
+                        f"check parameters for {_RULESETS[n % 4]} {n % 97}",
+                    ],
+                )
+                for n in range(_NUM_RULES)
+            ],
+        )
+    )
+    return registry
+
+
+def _build_index(client: FakeRedis, *, trigram_index: bool) -> None:
+    # Without the GUI context for translations and the super user, the synthetic match items
+    # need neither.
+    index_builder = IndexBuilder(_registry(), client)
+    with client.pipeline() as pipeline:
+        index_builder._add_language_independent_item_generators_to_redis(
+            index_builder._registry.values(), pipeline, UserPermissions({}, {}, {}, [])
+        )
+        pipeline.execute()
+    index_builder._mark_index_as_built()
+    if not trigram_index:
+        client.delete(*(IndexBuilder.key_trigrams(_prefix(category)) for category in _CATEGORIES))
+
+
+def _prefix(category: str) -> str:
+    return IndexBuilder.add_to_prefix(IndexBuilder.PREFIX_LOCALIZATION_INDEPENDENT, category)
+
+
+def _search(searcher: IndexSearcher, query: str) -> list[dict[str, str]]:
+    # Like IndexSearcher._search_redis, without translating the topics of the results
+    query_preprocessed = f"*{query.lower().replace(' ', '*')}*"
+    fragments = _query_fragments(query)
+    return [
+        match_item
+        for category in _CATEGORIES
+        for match_item in searcher._find_match_items(
+            _prefix(category), query_preprocessed, fragments
+        )
+    ]
+
+
+@pytest.fixture(name="redis_clients", scope="module")
+def fixture_redis_clients() -> dict[bool, FakeRedis]:
+    """Clients of an index with and without the trigram index"""
+    clients = {}
+    for trigram_index in (True, False):
+        clients[trigram_index] = FakeRedis(decode_responses=True)
+        _build_index(clients[trigram_index], trigram_index=trigram_index)
+    return clients
+
+
+@pytest.mark.parametrize("query", ["srv-01234", "filesystem 42", "example"])
+@pytest.mark.parametrize("trigram_index", [True, False])
+def test_search(
+    benchmark: BenchmarkFixture,
+    redis_clients: dict[bool, FakeRedis],
+    query: str,
+    trigram_index: bool,
+) -> None:
+    searcher = IndexSearcher(Config(), redis_clients[trigram_index], _AllowAll())
+    results = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        _search, args=(searcher, query), rounds=3
+    )
+    if trigram_index:
+        # Same results as the scan, only in the order of the match items
+        scanned = _search(IndexSearcher(Config(), redis_clients[False], _AllowAll()), query)
+        assert sorted(item["url"] for item in results) == sorted(item["url"] for item in scanned)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark walking an interface table with the SNMP backends
+
+A local stand-in agent serves an interface table of 500 interfaces. One round walks the
+columns of the table, like the fetcher does for the interface section. The classic backend
+needs the Net-SNMP command line tools and is skipped without them.
+
+$ pytest tests/performance/microbenchmarks/test_snmp_backends.py --benchmark-group-by=param:bulkwalk_enabled
+"""
+
+import bisect
+import logging
+import shutil
+import socket
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import cmk.checkengine.snmp_backends.builtin as builtin_snmp
+from cmk.ccc.hostaddress import HostAddress, HostName
+from cmk.checkengine.snmp_backends.classic import ClassicSNMPBackend
+from cmk.checkengine.snmplib import SNMPBackend, SNMPHostConfig, SNMPVersion
+
+_IF_ENTRY = (1, 3, 6, 1, 2, 1, 2, 2, 1)
+_N_COLUMNS = 20
+_N_INTERFACES = 500
+
+
+class _StandInAgent:
+    """SNMPv2c agent serving a static interface table"""
+
+    def __init__(self) -> None:
+        self._mib: dict[tuple[int, ...], tuple[int, bytes]] = {
+            (*_IF_ENTRY, column, index): (
+                (builtin_snmp._OCTET_STRING, f"Ethernet{index}".encode())
+                if column == 2
+                else (builtin_snmp._COUNTER32, (index * column).to_bytes(4, "big"))
+            )
+            for column in range(1, _N_COLUMNS + 1)
+            for index in range(1, _N_INTERFACES + 1)
+        }
+        self._names = sorted(self._mib)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("127.0.0.1", 0))
+        self.port = self.socket.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                data, address = self.socket.recvfrom(65535)
+            except OSError:
+                return
+            self.socket.sendto(self._respond(data), address)
+
+    def _respond(self, data: bytes) -> bytes:
+        _tag, message, _end = builtin_snmp._decode(data, 0)
+        _tag, version, offset = builtin_snmp._decode(message, 0)
+        _tag, community, offset = builtin_snmp._decode(message, offset)
+        pdu_type, pdu, _end = builtin_snmp._decode(message, offset)
+        _tag, request_id, offset = builtin_snmp._decode(pdu, 0)
+        _tag, _non_repeaters, offset = builtin_snmp._decode(pdu, offset)
+        _tag, max_repetitions, offset = builtin_snmp._decode(pdu, offset)
+        _tag, bindings, _end = builtin_snmp._decode(pdu, offset)
+        _tag, varbind, _end = builtin_snmp._decode(bindings, 0)
+        _tag, name, _end = builtin_snmp._decode(varbind, 0)
+        oid = builtin_snmp._decode_oid(name)
+
+        if pdu_type == builtin_snmp._GET_REQUEST:
+            varbinds = [(oid, *self._mib.get(oid, (builtin_snmp._NO_SUCH_OBJECT, b"")))]
+        else:
+            count = (
+                int.from_bytes(max_repetitions, "big")
+                if pdu_type == builtin_snmp._GET_BULK_REQUEST
+                else 1
+            )
+            start = bisect.bisect_right(self._names, oid)
+            varbinds = [(n, *self._mib[n]) for n in self._names[start : start + count]] or [
+                (oid, builtin_snmp._END_OF_MIB_VIEW, b"")
+            ]
+
+        return builtin_snmp._encode(
+            builtin_snmp._SEQUENCE,
+            builtin_snmp._encode(builtin_snmp._INTEGER, version)
+            + builtin_snmp._encode(builtin_snmp._OCTET_STRING, community)
+            + builtin_snmp._encode(
+                builtin_snmp._RESPONSE,
+                builtin_snmp._encode(builtin_snmp._INTEGER, request_id)
+                + builtin_snmp._encode_integer(0)
+                + builtin_snmp._encode_integer(0)
+                + builtin_snmp._encode(
+                    builtin_snmp._SEQUENCE,
+                    b"".join(
+                        builtin_snmp._encode(
+                            builtin_snmp._SEQUENCE,
+                            builtin_snmp._encode_oid(n) + builtin_snmp._encode(tag, value),
+                        )
+                        for n, tag, value in varbinds
+                    ),
+                ),
+            ),
+        )
+
+
+@pytest.fixture(name="agent", scope="module")
+def fixture_agent() -> Iterator[_StandInAgent]:
+    agent = _StandInAgent()
+    yield agent
+    agent.socket.close()
+
+
+@pytest.mark.parametrize("bulkwalk_enabled", [True, False])
+@pytest.mark.parametrize(
+    "backend_type",
+    [
+        pytest.param(
+            ClassicSNMPBackend,
+            marks=pytest.mark.skipif(
+                shutil.which("snmpbulkwalk") is None, reason="Net-SNMP tools not installed"
+            ),
+        ),
+        builtin_snmp.BuiltinSNMPBackend,
+    ],
+)
+def test_walk_interface_table(
+    agent: _StandInAgent,
+    benchmark: BenchmarkFixture,
+    backend_type: type[SNMPBackend],
+    bulkwalk_enabled: bool,
+) -> None:
+    backend = backend_type(
+        SNMPHostConfig(
+            is_ipv6_primary=False,
+            hostname=HostName("stand-in"),
+            ipaddress=HostAddress("127.0.0.1"),
+            credentials="public",
+            port=agent.port,
+            bulkwalk_enabled=bulkwalk_enabled,
+            snmp_version=SNMPVersion.V2C,
+            bulk_walk_size_of=10,
+            timing={"timeout": 1.0, "retries": 1},
+            oid_range_limits={},
+            snmpv3_contexts=[],
+            character_encoding=None,
+            snmp_backend=backend_type.get_type(),
+            stored_walk_path=Path("/tmp/foo"),
+        ),
+        logging.getLogger("cmk.helper.snmp"),
+    )
+
+    def walk_columns() -> None:
+        for column in range(1, _N_COLUMNS + 1):
+            assert len(backend.walk(f".1.3.6.1.2.1.2.2.1.{column}", context="")) == _N_INTERFACES
+
+    benchmark.pedantic(walk_columns, rounds=3)  # type: ignore[no-untyped-call]
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark submitting the check results of a host with many services
+
+Only the writing of the already formatted results is measured. The pipe submitter writes
+to a FIFO that is drained by a thread, like the command pipe of the core. The file
+submitter writes a check result file.
+
+$ pytest tests/performance/microbenchmarks/test_submitters.py
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import cmk.utils.paths
+from cmk.ccc.hostaddress import HostName
+from cmk.checkengine.submitters import FileSubmitter, FormattedSubmittee, PipeSubmitter
+from cmk.utils.servicename import ServiceName
+
+_N_SERVICES = 3000
+
+_SUBMITTEES = [
+    FormattedSubmittee(
+        name=ServiceName(f"Interface {n}"),
+        state=0,
+        details=(
+            f"[{n}], (up), Speed: 10 GBit/s\nIn: 1.2 MB/s, Out: 3.4 MB/s"
+            "|in=1200000;;;0;1250000000 out=3400000;;;0;1250000000"
+        ),
+        cache_info=None,
+        pending=False,
+    )
+    for n in range(_N_SERVICES)
+]
+
+
+def test_pipe_submitter(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, benchmark: BenchmarkFixture
+) -> None:
+    pipe_path = tmp_path / "nagios.cmd"
+    os.mkfifo(pipe_path)
+    monkeypatch.setattr(cmk.utils.paths, "nagios_command_pipe_path", pipe_path)
+    monkeypatch.setattr(PipeSubmitter, "_nagios_command_pipe", None)
+
+    def drain() -> None:
+        with pipe_path.open("rb") as pipe:
+            while pipe.read(65536):
+                pass
+
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    submitter = PipeSubmitter(HostName("heute"), perfdata_format="pnp", show_perfdata=False)
+
+    benchmark.pedantic(submitter._submit, args=(_SUBMITTEES,), rounds=20)  # type: ignore[no-untyped-call]
+
+    assert PipeSubmitter._nagios_command_pipe
+    PipeSubmitter._nagios_command_pipe.close()
+    reader.join()
+
+
+def test_file_submitter(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, benchmark: BenchmarkFixture
+) -> None:
+    monkeypatch.setattr(cmk.utils.paths, "check_result_path", tmp_path)
+    submitter = FileSubmitter(HostName("heute"), perfdata_format="pnp", show_perfdata=False)
+
+    benchmark.pedantic(submitter._submit, args=(_SUBMITTEES,), rounds=20)  # type: ignore[no-untyped-call]
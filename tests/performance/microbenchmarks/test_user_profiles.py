@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark loading the attribute files of the profile directories of all users
+
+Each user has eight of the eleven attribute files loaded by load_users(), one in ten is an
+automation user. The files variant reads them like load_users() did before the profile
+index: checking each attribute file and opening it. The index variants read the profile
+index written by a previous process, or use the copy of the index held by this process,
+and only check the profile directories.
+
+$ pytest tests/performance/microbenchmarks/test_user_profiles.py --benchmark-group-by=param:num_users
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cmk.ccc import store
+from cmk.ccc.user import UserId
+from cmk.gui.userdb import _profile_index
+from cmk.gui.userdb._profile_index import load_profile_attributes
+from cmk.gui.utils.roles import AutomationUserFile
+from cmk.utils.local_secrets import AutomationUserSecret
+
+_KEYS = [
+    "num_failed_logins",
+    "last_pw_change",
+    "enforce_pw_change",
+    "idle_timeout",
+    "session_info",
+    "start_url",
+    "ui_theme",
+    "two_factor_credentials",
+    "ui_sidebar_position",
+    "navbar_changes_action",
+    "last_login",
+]
+
+
+def _create_profiles(profile_dir: Path, num_users: int) -> list[UserId]:
+    user_ids = [UserId(f"user{n:05d}") for n in range(num_users)]
+    for n, user_id in enumerate(user_ids):
+        user_dir = profile_dir / user_id
+        user_dir.mkdir(parents=True)
+        for key in _KEYS[:8]:
+            (user_dir / f"{key}.mk").write_text("{}\n" if key == "session_info" else "0\n")
+        if n % 10 == 0:
+            (user_dir / "automation.secret").write_text("secret")
+            store.save_object_to_file(user_dir / "automation_user.mk", True)
+        os.utime(user_dir, ns=(1_700_000_000 * 10**9, 1_700_000_000 * 10**9))
+    return user_ids
+
+
+def _load_from_files(profile_dir: Path, user_ids: list[UserId]) -> None:
+    for user_id in user_ids:
+        for key in _KEYS:
+            if (path := profile_dir / user_id / f"{key}.mk").exists():
+                with open(path) as file_object:
+                    file_object.read()
+        AutomationUserSecret(user_id, profile_dir).exists()
+        AutomationUserSecret(user_id, profile_dir).exists() or AutomationUserFile(
+            user_id, profile_dir
+        ).load()
+
+
+@pytest.mark.parametrize("source", ["files", "index", "index_in_memory"])
+@pytest.mark.parametrize("num_users", [1_000, 15_000])
+def test_load_profile_attributes(
+    tmp_path: Path, benchmark: BenchmarkFixture, num_users: int, source: str
+) -> None:
+    profile_dir = tmp_path / "web"
+    user_ids = _create_profiles(profile_dir, num_users)
+
+    if source == "files":
+        benchmark.pedantic(  # type: ignore[no-untyped-call]
+            _load_from_files, args=(profile_dir, user_ids), rounds=5
+        )
+        return
+
+    load_profile_attributes(profile_dir, user_ids, _KEYS)
+
+    def setup() -> None:
+        if source == "index":
+            _profile_index._cached_indices.clear()
+
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        load_profile_attributes, args=(profile_dir, user_ids, _KEYS), setup=setup, rounds=5
+    )
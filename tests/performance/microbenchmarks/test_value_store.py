@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark the value store backends
+
+One round corresponds to a check cycle: load the value stores of the host
+and write back the ones that changed (one percent of them).
+
+$ pytest tests/performance/microbenchmarks/test_value_store.py --benchmark-group-by=param:n_keys
+"""
+
+import itertools
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cmk.ccc.hostaddress import HostName
+from cmk.checkengine.value_store import AllValueStoresStore, JournaledValueStoresStore
+
+type _Stores = Mapping[tuple[HostName, str, str | None], Mapping[str, str]]
+
+_HOST = HostName("switch")
+
+
+def _make_stores(n_keys: int, generation: int) -> _Stores:
+    return {
+        (_HOST, "if64", f"{n:06}"): {
+            "in_octets": f"({1700000000.0 + generation}, {n * 1000 + generation})",
+            "out_octets": f"({1700000000.0 + generation}, {n * 2000 + generation})",
+        }
+        for n in range(n_keys)
+    }
+
+
+@pytest.mark.parametrize("n_keys", [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize("backend", [AllValueStoresStore, JournaledValueStoresStore])
+def test_check_cycle(
+    tmp_path: Path,
+    benchmark: BenchmarkFixture,
+    backend: type[AllValueStoresStore],
+    n_keys: int,
+) -> None:
+    path = tmp_path / str(_HOST)
+    backend(path).update(_make_stores(n_keys, 0))
+    changes = [
+        {k: v for n, (k, v) in enumerate(_make_stores(n_keys, g).items()) if n % 100 == 0}
+        for g in range(1, 6)
+    ]
+
+    def check_cycle(changed: _Stores) -> None:
+        store = backend(path)
+        stores = store.load()
+        for key in changed:
+            _ = stores[key]
+        store.update(changed)
+
+    cycles = itertools.cycle(changes)
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        check_cycle,
+        setup=lambda: ((next(cycles),), {}),
+        rounds=5,
+    )
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+"""Benchmark sorting the rows of a service view with the builtin sorters
+
+The rows are synthetic service rows of many hosts on a few sites. They are sorted by
+service state (worst first), site and host name and the first metric value, like a
+problem view sorted by the user. The sorters are used with their key functions and, for
+comparison, with their cmp functions only.
+
+$ pytest tests/performance/microbenchmarks/test_view_sorting.py --benchmark-group-by=param:n_rows
+"""
+
+import copy
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from cmk.gui.config import Config
+from cmk.gui.type_defs import Rows
+from cmk.gui.views.page_show_view import _sort_data
+from cmk.gui.views.sorter import SorterEntry
+from cmk.gui.views.sorter.sorters import SorterSiteHost, SorterSvcPerfVal01, SorterSvcstate
+
+
+def _rows(n_rows: int) -> Rows:
+    return [
+        {
+            "site": f"site{n % 5}",
+            "host_name": f"host-{(n // 40) % 5000}",
+            "service_state": (0, 0, 0, 1, 2, 3)[n % 6],
+            "service_has_been_checked": int(n % 97 != 0),
+            "service_perf_data": f"load1={n % 1000 / 100};5;10;0;8 load5={n % 700 / 100};5;10;0;8",
+        }
+        for n in range(n_rows)
+    ]
+
+
+def _entries(by_keys: bool) -> list[SorterEntry]:
+    entries = []
+    for sorter, negate in (
+        (SorterSvcstate, True),
+        (SorterSiteHost, False),
+        (SorterSvcPerfVal01, True),
+    ):
+        if not by_keys:
+            sorter = copy.copy(sorter)
+            sorter.key = None
+        entries.append(SorterEntry(sorter, negate, None, None))
+    return entries
+
+
+@pytest.mark.parametrize("by_keys", [True, False])
+@pytest.mark.parametrize("n_rows", [100_000, 500_000])
+def test_sort_service_rows(benchmark: BenchmarkFixture, n_rows: int, by_keys: bool) -> None:
+    rows = _rows(n_rows)
+    entries = _entries(by_keys)
+    config = Config()
+
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        _sort_data, setup=lambda: ((rows.copy(), entries, config), {}), rounds=3
+    )
@@ -45,6 +45,8 @@ EMPTY_CONFIG = BaseConfig(
     is_distributed_setup_remote_site=False,
     simulation_mode=False,
     use_dns_cache=True,
+    dns_cache_update_workers=16,
+    dns_cache_update_timeout=10.0,
     ipaddresses={},
     ipv6addresses={},
     inventory_check_interval=None,
@@ -161,6 +163,7 @@ EMPTY_CONFIG = BaseConfig(
     restart_locking="abort",
     check_submission="file",
     check_max_cachefile_age=0,
+    check_max_concurrent_fetches=1,
     check_mk_perfdata_with_times=True,
     perfdata_format="pnp",
     host_notification_periods=[],
@@ -178,6 +181,8 @@ EMPTY_CONFIG = BaseConfig(
     notification_fallback_email="",
     notification_fallback_format=("asciimail", {}),
     notification_plugin_timeout=60,
+    notification_delivery_workers=8,
+    notification_plugin_concurrency={},
     notification_logging=15,
     notification_spooling=None,
     notification_spool_to=None,
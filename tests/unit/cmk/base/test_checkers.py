@@ -4,10 +4,14 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 
+import signal
 import sys
+import threading
 import time
 from collections.abc import Iterable, Mapping
-from typing import Literal
+from pathlib import Path
+from types import FrameType
+from typing import Any, Literal, Self
 
 import pytest
 
@@ -23,9 +27,20 @@ from cmk.ccc import resulttype as result
 from cmk.ccc.exceptions import MKTimeout
 from cmk.ccc.hostaddress import HostName
 from cmk.checkengine.checkerplugin import ConfiguredService
-from cmk.checkengine.helper_interface import FetcherType, HostKey, SourceInfo, SourceType
+from cmk.checkengine.fetcher import Fetcher, Mode
+from cmk.checkengine.fetcher_utils.secrets import ActivatedSecrets
+from cmk.checkengine.fetcher_utils.trigger import PlainFetcherTrigger
+from cmk.checkengine.filecache import FileCache, FileCacheOptions, NoCache
+from cmk.checkengine.helper_interface import (
+    AgentRawData,
+    FetcherType,
+    HostKey,
+    SourceInfo,
+    SourceType,
+)
 from cmk.checkengine.parser import HostSections
 from cmk.checkengine.plugins import CheckPluginName, FinalCheckResult
+from cmk.checkengine.sources import Source
 from cmk.checkengine.specs.checkresults import (
     ServiceCheckResult,
     SubmittableServiceCheckResult,
@@ -347,3 +362,111 @@ def test_consume_check_results_clamps_inf_lower_levels() -> None:
     assert len(perfdata) == 1
     assert perfdata[0].warn_lower == sys.float_info.max
     assert perfdata[0].crit_lower == -sys.float_info.max
+
+
+class _BarrierFetcher(Fetcher[AgentRawData]):
+    """Only returns if all fetchers sharing the barrier are running at the same time"""
+
+    def __init__(self, barrier: threading.Barrier, payload: bytes) -> None:
+        super().__init__()
+        self.barrier = barrier
+        self.payload = payload
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def _fetch_from_io(self, *_args: object, **_kw: object) -> AgentRawData:
+        self.barrier.wait()
+        return AgentRawData(self.payload)
+
+    def serialized_params(self) -> Mapping[str, Any]:
+        raise NotImplementedError()
+
+    @classmethod
+    def from_params(cls, _params: Mapping[str, Any], _ctx: object) -> Self:
+        raise NotImplementedError()
+
+
+class _BarrierSource(Source[AgentRawData]):
+    def __init__(self, ident: str, barrier: threading.Barrier) -> None:
+        self.ident = ident
+        self.barrier = barrier
+
+    def source_info(self) -> SourceInfo:
+        return SourceInfo(
+            HostName("heute"), None, self.ident, FetcherType.PUSH_AGENT, SourceType.HOST
+        )
+
+    def fetcher(self) -> Fetcher[AgentRawData]:
+        return _BarrierFetcher(self.barrier, self.ident.encode())
+
+    def file_cache(
+        self, *, simulation: bool, file_cache_options: FileCacheOptions
+    ) -> FileCache[AgentRawData]:
+        return NoCache(HostName("heute"))
+
+
+def test_fetch_all_concurrently_keeps_order() -> None:
+    barrier = threading.Barrier(3, timeout=10)
+    fetched = checkers._fetch_all(
+        PlainFetcherTrigger(Path("/")),
+        [_BarrierSource(ident, barrier) for ident in ("agent", "snmp", "special")],
+        FileCacheOptions(),
+        Mode.CHECKING,
+        ActivatedSecrets(),
+        simulation=False,
+        max_concurrent_fetches=3,
+    )
+
+    assert [(source.ident, raw_data) for source, raw_data, _duration in fetched] == [
+        ("agent", result.OK(b"agent")),
+        ("snmp", result.OK(b"snmp")),
+        ("special", result.OK(b"special")),
+    ]
+
+
+def test_fetch_all_concurrently_abandons_fetches_on_timeout() -> None:
+    def raise_timeout(_signum: int, _frame: FrameType | None) -> None:
+        raise MKTimeout("Timed out")
+
+    # Never passed: only two fetchers wait for it
+    barrier = threading.Barrier(3)
+    previous_handler = signal.signal(signal.SIGALRM, raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, 0.1)
+    try:
+        with pytest.raises(MKTimeout):
+            checkers._fetch_all(
+                PlainFetcherTrigger(Path("/")),
+                [_BarrierSource(ident, barrier) for ident in ("agent", "snmp")],
+                FileCacheOptions(),
+                Mode.CHECKING,
+                ActivatedSecrets(),
+                simulation=False,
+                max_concurrent_fetches=2,
+            )
+        hanging_threads = [t for t in threading.enumerate() if t.name.startswith("fetch")]
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+        barrier.abort()
+
+    # Unlike daemon threads, the others are joined when the interpreter exits
+    assert len(hanging_threads) == 2
+    assert all(t.daemon for t in hanging_threads)
+
+
+def test_fetch_all_sequentially_by_default() -> None:
+    barrier = threading.Barrier(1)
+    fetched = checkers._fetch_all(
+        PlainFetcherTrigger(Path("/")),
+        [_BarrierSource(ident, barrier) for ident in ("agent", "snmp")],
+        FileCacheOptions(),
+        Mode.CHECKING,
+        ActivatedSecrets(),
+        simulation=False,
+    )
+
+    assert [source.ident for source, _raw_data, _duration in fetched] == ["agent", "snmp"]
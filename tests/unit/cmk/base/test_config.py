@@ -2982,6 +2982,8 @@ def test_save_packed_config(monkeypatch: MonkeyPatch, config_path: Path) -> None
     config.save_packed_config(config_path, config_cache, loading_result.hosts_config)
 
     assert precompiled_check_config.exists()
+    assert (config_path / "precompiled_check_config.hosts").exists()
+    assert config.load_packed_config_of_host(config_path, HostName("bla1"))["all_hosts"] == ["bla1"]
 
 
 class TestPackedConfigStore:
@@ -3003,6 +3005,66 @@ class TestPackedConfigStore:
         assert store.read() == {"abc": 1}
 
 
+class TestHostSlicedConfigStore:
+    @pytest.fixture()
+    def store(self, config_path: Path) -> config.HostSlicedConfigStore:
+        store = config.HostSlicedConfigStore.from_serial(config_path)
+        store.write(
+            {
+                "abc": 1,
+                "all_hosts": ["host|lan", "other", "node1", "node2"],
+                "clusters": {"cluster|lan": ["node1", "node2"]},
+                "ipaddresses": {
+                    HostName("host"): HostAddress("127.0.0.1"),
+                    HostName("node1"): HostAddress("127.0.0.2"),
+                },
+                "explicit_host_conf": {
+                    "alias": {HostName("host"): "Host", HostName("cluster"): "Cluster"}
+                },
+                "explicit_service_custom_variables": {
+                    (HostName("node1"), "Service"): {"var": "value"}
+                },
+            }
+        )
+        return store
+
+    def test_read_not_existing_file(self, config_path: Path) -> None:
+        assert config.HostSlicedConfigStore.from_serial(config_path).read(HostName("host")) is None
+
+    def test_read_unknown_host(self, store: config.HostSlicedConfigStore) -> None:
+        assert store.read(HostName("unknown")) is None
+
+    def test_read_host(self, store: config.HostSlicedConfigStore) -> None:
+        assert store.read(HostName("host")) == {
+            "abc": 1,
+            "all_hosts": ["host|lan"],
+            "clusters": {},
+            "ipaddresses": {HostName("host"): HostAddress("127.0.0.1")},
+            "explicit_host_conf": {"alias": {HostName("host"): "Host"}},
+            "explicit_service_custom_variables": {},
+        }
+
+    @pytest.mark.parametrize("host_name", [HostName("node2"), HostName("cluster")])
+    def test_read_cluster_and_node(
+        self, store: config.HostSlicedConfigStore, host_name: HostName
+    ) -> None:
+        assert store.read(host_name) == {
+            "abc": 1,
+            "all_hosts": ["node1", "node2"],
+            "clusters": {"cluster|lan": ["node1", "node2"]},
+            "ipaddresses": {HostName("node1"): HostAddress("127.0.0.2")},
+            "explicit_host_conf": {"alias": {HostName("cluster"): "Cluster"}},
+            "explicit_service_custom_variables": {(HostName("node1"), "Service"): {"var": "value"}},
+        }
+
+    def test_load_unknown_host_falls_back_to_packed_config(
+        self, store: config.HostSlicedConfigStore, config_path: Path
+    ) -> None:
+        config.PackedConfigStore.from_serial(config_path).write({"abc": 2})
+        assert config.load_packed_config_of_host(config_path, HostName("unknown"))["abc"] == 2
+        assert config.load_packed_config_of_host(config_path, HostName("host"))["abc"] == 1
+
+
 def test__extract_check_plugins(monkeypatch: MonkeyPatch) -> None:
     duplicate_legacy_plugin = LegacyCheckDefinition(
         name="duplicate_plugin",
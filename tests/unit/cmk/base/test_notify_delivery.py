@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from cmk.base.notify_delivery import (
+    DeliveryPool,
+    load_queued_notifications,
+    queue_notification,
+)
+from cmk.events.notification_result import NotificationContext
+from cmk.utils.notify_types import CustomPluginName, NotificationPluginNameStr
+
+
+def _context(nr: int) -> NotificationContext:
+    return NotificationContext({"CONTACTNAME": "harry", "NR": str(nr)})
+
+
+def _wait_until(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 10
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_load_queued_notifications(tmp_path: Path) -> None:
+    first = queue_notification(tmp_path, "mail", _context(1))
+    second = queue_notification(tmp_path, "slack", _context(2))
+    (tmp_path / "incomplete.new").write_text("{")
+    (tmp_path / "corrupted").write_text("{")
+
+    assert [(n.plugin_name, n.context) for n in load_queued_notifications(tmp_path)] == [
+        ("mail", first.context),
+        ("slack", second.context),
+    ]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([first.path.name, second.path.name])
+
+
+def test_slow_plugin_does_not_hold_up_other_plugins(tmp_path: Path) -> None:
+    release = threading.Event()
+    delivered: list[tuple[NotificationPluginNameStr, str]] = []
+
+    def deliver(plugin_name: NotificationPluginNameStr, context: NotificationContext) -> None:
+        if plugin_name == "slow":
+            release.wait(10)
+        delivered.append((plugin_name, context["NR"]))
+
+    pool = DeliveryPool(tmp_path, deliver, max_workers=4, plugin_concurrency={})
+    pool.submit(CustomPluginName("slow"), _context(1))
+    pool.submit(CustomPluginName("slow"), _context(2))
+    for nr in range(3, 6):
+        pool.submit(CustomPluginName("fast"), _context(nr))
+
+    _wait_until(lambda: len(delivered) == 3)
+    assert delivered == [("fast", "3"), ("fast", "4"), ("fast", "5")]
+    assert pool.metrics()[CustomPluginName("slow")].waiting == 1
+    assert pool.metrics()[CustomPluginName("slow")].running == 1
+
+    release.set()
+    _wait_until(lambda: len(delivered) == 5)
+    pool.shutdown()
+    assert delivered[3:] == [("slow", "1"), ("slow", "2")]
+    assert not list(tmp_path.iterdir())
+
+
+def test_shutdown_keeps_waiting_notifications_queued(tmp_path: Path) -> None:
+    release = threading.Event()
+    delivered: list[str] = []
+
+    def deliver(plugin_name: NotificationPluginNameStr, context: NotificationContext) -> None:
+        release.wait(10)
+        delivered.append(context["NR"])
+
+    pool = DeliveryPool(tmp_path, deliver, max_workers=4, plugin_concurrency={})
+    pool.submit("mail", _context(1))
+    pool.submit("mail", _context(2))
+    # The first notification is still being delivered while shutting down
+    threading.Timer(0.2, release.set).start()
+    pool.shutdown()
+
+    assert delivered == ["1"]
+    assert [n.context["NR"] for n in load_queued_notifications(tmp_path)] == ["2"]
+
+    resumed: list[str] = []
+    pool = DeliveryPool(
+        tmp_path,
+        lambda plugin_name, context: resumed.append(context["NR"]),
+        max_workers=4,
+        plugin_concurrency={},
+    )
+    assert pool.resume() == 1
+    pool.shutdown()
+    assert resumed == ["2"]
+    assert not list(tmp_path.iterdir())
+
+
+def test_plugin_concurrency(tmp_path: Path) -> None:
+    barrier = threading.Barrier(3, timeout=10)
+    pool = DeliveryPool(
+        tmp_path,
+        lambda plugin_name, context: barrier.wait(),
+        max_workers=4,
+        plugin_concurrency={CustomPluginName("ticket"): 3},
+    )
+    for nr in range(3):
+        pool.submit(CustomPluginName("ticket"), _context(nr))
+    pool.shutdown()
+
+    assert not barrier.broken
+    assert pool.metrics()[CustomPluginName("ticket")].delivered == 3
+
+
+def test_bulk_is_not_submitted_twice(tmp_path: Path) -> None:
+    release = threading.Event()
+    pool = DeliveryPool(tmp_path, lambda *args: None, max_workers=4, plugin_concurrency={})
+
+    assert pool.submit_bulk("mail", "/bulk/harry/mail/60,1000", lambda: release.wait(10))
+    assert not pool.submit_bulk("mail", "/bulk/harry/mail/60,1000", lambda: None)
+    release.set()
+    _wait_until(lambda: pool.metrics()["mail"].delivered == 1)
+    assert pool.submit_bulk("mail", "/bulk/harry/mail/60,1000", lambda: None)
+    pool.shutdown()
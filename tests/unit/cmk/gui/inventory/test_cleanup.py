@@ -1256,3 +1256,26 @@ def test_abandoned_file_age_remaining_files_not_too_old(tmp_path: Path) -> None:
     assert unknown_files_no_history.inventory_tree.path.exists()
     assert unknown_files_no_history.inventory_tree_gz.path.exists()
     assert unknown_files_no_history.status_data_tree.path.exists()
+
+
+def test_abandoned_history_index(tmp_path: Path) -> None:
+    inv_paths = InventoryPaths(tmp_path)
+    inv_paths.history_index_dir.mkdir(parents=True)
+    for host_name, timestamp in [("known", 99), ("unknown-too-old", 99), ("unknown", 100)]:
+        history_index = inv_paths.history_index(HostName(host_name))
+        history_index.write_text("[]")
+        os.utime(history_index, (timestamp, timestamp))
+    InventoryCleanup(tmp_path)._run(
+        Config(
+            inventory_cleanup=InvCleanupParams(
+                for_hosts=[],
+                default=None,
+                abandoned_file_age=2,
+            )
+        ),
+        host_names=[HostName("known")],
+        now=101,
+    )
+    assert inv_paths.history_index(HostName("known")).exists()
+    assert not inv_paths.history_index(HostName("unknown-too-old")).exists()
+    assert inv_paths.history_index(HostName("unknown")).exists()
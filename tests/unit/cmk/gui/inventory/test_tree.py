@@ -4,6 +4,7 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 import os
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -16,6 +17,7 @@ from cmk.ccc.hostaddress import HostName
 from cmk.gui.inventory._tree import (
     _make_filter_choices_from_permitted_paths,
     get_history,
+    HistoryDeltaTrees,
     InventoryPath,
     load_delta_tree,
     load_latest_delta_tree,
@@ -524,6 +526,45 @@ def test_load_delta_tree_no_such_timestamp(tmp_path: Path, request_context: None
     assert "Found no history entry at the time of '-1' for the host 'inv-host'" == str(e.value)
 
 
+def test_history_delta_trees(
+    tmp_path: Path, monkeypatch: MonkeyPatch, request_context: None
+) -> None:
+    history_store = HistoryStore(tmp_path)
+    hostname = HostName("inv-host")
+
+    # history
+    cmk.ccc.store.save_object_to_file(
+        tmp_path / "var/check_mk/inventory_archive" / hostname / "0",
+        {"inv": "attr-0"},
+    )
+    cmk.ccc.store.save_object_to_file(
+        tmp_path / "var/check_mk/inventory_archive" / hostname / "1",
+        {"inv": "attr-1"},
+    )
+    cmk.ccc.store.save_object_to_file(
+        tmp_path / "var/check_mk/inventory_archive" / hostname / "2",
+        {"inv-2": "attr"},
+    )
+
+    collected = []
+    collect_history_paths = history_store.collect_history_paths
+
+    def _collect_history_paths(*, host_name: HostName) -> Iterator[object]:
+        collected.append(host_name)
+        return collect_history_paths(host_name=host_name)
+
+    monkeypatch.setattr(history_store, "collect_history_paths", _collect_history_paths)
+
+    delta_trees = HistoryDeltaTrees(history_store, hostname)
+    for timestamp in (0, 1, 2):
+        delta_tree, _corrupted_history_files = load_delta_tree(
+            HistoryStore(tmp_path), hostname, timestamp
+        )
+        assert delta_trees.lookup(timestamp) == delta_tree
+    assert not delta_trees.lookup(-1)
+    assert collected == [hostname]
+
+
 def test_load_latest_delta_tree(tmp_path: Path, request_context: None) -> None:
     history_store = HistoryStore(tmp_path)
     hostname = HostName("inv-host")
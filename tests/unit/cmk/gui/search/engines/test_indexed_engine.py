@@ -350,6 +350,80 @@ class TestIndexBuilderAndSearcher:
             ("Localization-dependent", [SearchResult(title="localization_dependent", url="")]),
         ]
 
+    @pytest.mark.usefixtures("with_admin_login")
+    @pytest.mark.parametrize(
+        "query, expected_titles",
+        [
+            ("change_dep", ["change_dependent"]),
+            ("Change dep", ["change_dependent"]),
+            ("depend*change", []),
+            ("dep", ["change_dependent", "localization_dependent"]),
+            ("ge_?ep", ["change_dependent"]),
+        ],
+    )
+    def test_search_with_trigram_index(
+        self,
+        index_builder: IndexBuilder,
+        index_searcher: IndexSearcher,
+        query: str,
+        expected_titles: list[str],
+    ) -> None:
+        index_builder.build_full_index(UserPermissions({}, {}, {}, []))
+        assert sorted(result.title for _c, _t, result in index_searcher.search(query)) == (
+            expected_titles
+        )
+
+    @pytest.mark.usefixtures("with_admin_login")
+    def test_search_without_trigram_index(
+        self,
+        clean_redis_client: "Redis",
+        index_builder: IndexBuilder,
+        index_searcher: IndexSearcher,
+    ) -> None:
+        """An index built by a previous version is scanned"""
+        index_builder.build_full_index(UserPermissions({}, {}, {}, []))
+        clean_redis_client.delete(
+            IndexBuilder.key_trigrams(
+                IndexBuilder.add_to_prefix(
+                    IndexBuilder.PREFIX_LOCALIZATION_INDEPENDENT, "change_dependent"
+                )
+            )
+        )
+        assert [result.title for _c, _t, result in index_searcher.search("change_dep")] == [
+            "change_dependent"
+        ]
+
+    @pytest.mark.usefixtures("with_admin_login")
+    def test_update_replaces_trigram_index(
+        self,
+        monkeypatch: MonkeyPatch,
+        match_item_generator_registry: MatchItemGeneratorRegistry,
+        clean_redis_client: "Redis",
+        index_builder: IndexBuilder,
+        index_searcher: IndexSearcher,
+    ) -> None:
+        def renamed_match_item_gen(user_permissions: UserPermissions):
+            yield MatchItem(title="renamed", topic="Change-dependent", url="", match_texts=["xyz"])
+
+        index_builder.build_full_index(UserPermissions({}, {}, {}, []))
+        monkeypatch.setattr(
+            match_item_generator_registry["change_dependent"],
+            "generate_match_items",
+            renamed_match_item_gen,
+        )
+        index_builder.build_changed_sub_indices(
+            ["some_change_dependent_whatever"], UserPermissions({}, {}, {}, [])
+        )
+
+        prefix = IndexBuilder.add_to_prefix(
+            IndexBuilder.PREFIX_LOCALIZATION_INDEPENDENT, "change_dependent"
+        )
+        assert sorted(clean_redis_client.keys(IndexBuilder.key_trigram(prefix, "*"))) == [
+            IndexBuilder.key_trigram(prefix, "xyz")
+        ]
+        assert not list(index_searcher.search("change_dep"))
+        assert [result.title for _c, _t, result in index_searcher.search("xyz")] == ["renamed"]
+
     @staticmethod
     def _evaluate_search_results_by_topic(
         results: Iterable[tuple[str, str, SearchResult]],
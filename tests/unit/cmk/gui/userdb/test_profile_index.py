@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+import os
+from pathlib import Path
+
+import pytest
+
+from cmk.ccc import store
+from cmk.ccc.user import UserId
+from cmk.gui.userdb._profile_index import (
+    load_profile_attributes,
+    profile_index_path,
+    ProfileAttributes,
+)
+
+_KEYS = ["num_failed_logins", "ui_theme"]
+
+
+def _age(path: Path) -> None:
+    # Older than any change within the resolution of the file system clock
+    os.utime(path, ns=(1_700_000_000 * 10**9, 1_700_000_000 * 10**9))
+
+
+@pytest.fixture(name="profile_dir")
+def fixture_profile_dir(tmp_path: Path) -> Path:
+    profile_dir = tmp_path / "web"
+    (profile_dir / "alice").mkdir(parents=True)
+    store.save_text_to_file(profile_dir / "alice" / "num_failed_logins.mk", "3\n")
+    store.save_text_to_file(profile_dir / "alice" / "ui_theme.mk", "modern-dark\n")
+    store.save_text_to_file(profile_dir / "alice" / "other.mk", "ignored\n")
+    (profile_dir / "automation").mkdir()
+    (profile_dir / "automation" / "automation.secret").write_text("secret")
+    store.save_object_to_file(profile_dir / "automation" / "automation_user.mk", True)
+    for user_dir in profile_dir.iterdir():
+        _age(user_dir)
+    return profile_dir
+
+
+def _load(profile_dir: Path) -> dict[UserId, ProfileAttributes]:
+    return load_profile_attributes(
+        profile_dir, [UserId("alice"), UserId("automation"), UserId("no_profile")], _KEYS
+    )
+
+
+def test_load_profile_attributes(profile_dir: Path) -> None:
+    profiles = _load(profile_dir)
+    assert sorted(profiles) == ["alice", "automation"]
+    assert profiles[UserId("alice")].attributes == {
+        "num_failed_logins": "3\n",
+        "ui_theme": "modern-dark\n",
+    }
+    assert not profiles[UserId("alice")].has_automation_secret
+    assert not profiles[UserId("alice")].is_automation_user
+    assert profiles[UserId("automation")].attributes == {}
+    assert profiles[UserId("automation")].has_automation_secret
+    assert profiles[UserId("automation")].is_automation_user
+    assert profile_index_path(profile_dir).exists()
+
+
+def test_unchanged_profiles_are_loaded_from_index(profile_dir: Path) -> None:
+    _load(profile_dir)
+    # Written in place, the profile directory stays unchanged
+    (profile_dir / "alice" / "ui_theme.mk").write_text("facelift\n")
+    _age(profile_dir / "alice")
+    assert _load(profile_dir)[UserId("alice")].attributes["ui_theme"] == "modern-dark\n"
+
+    # Replaced like by save_custom_attr()
+    store.save_text_to_file(profile_dir / "alice" / "ui_theme.mk", "facelift\n")
+    assert _load(profile_dir)[UserId("alice")].attributes["ui_theme"] == "facelift\n"
+
+
+def test_recently_changed_profiles_are_not_indexed(profile_dir: Path) -> None:
+    store.save_text_to_file(profile_dir / "alice" / "ui_theme.mk", "facelift\n")
+    _load(profile_dir)
+    (profile_dir / "alice" / "ui_theme.mk").write_text("modern-dark\n")
+    assert _load(profile_dir)[UserId("alice")].attributes["ui_theme"] == "modern-dark\n"
+
+
+def test_index_of_other_attributes_is_ignored(profile_dir: Path) -> None:
+    load_profile_attributes(profile_dir, [UserId("alice")], ["ui_theme"])
+    assert _load(profile_dir)[UserId("alice")].attributes == {
+        "num_failed_logins": "3\n",
+        "ui_theme": "modern-dark\n",
+    }
+
+
+def test_broken_index_is_ignored(profile_dir: Path) -> None:
+    profile_index_path(profile_dir).write_bytes(b"broken")
+    assert _load(profile_dir)[UserId("alice")].attributes["num_failed_logins"] == "3\n"
@@ -30,7 +30,6 @@ EXPECTED_INV_HIST_KEYS = [
     "site",
     "host_name",
     "invhist_time",
-    "invhist_delta",
     "invhist_removed",
     "invhist_new",
     "invhist_changed",
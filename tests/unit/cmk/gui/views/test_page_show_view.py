@@ -5,10 +5,17 @@
 
 # mypy: disable-error-code="no-untyped-def"
 
+import functools
 from collections.abc import Iterable
 
+import pytest
+
+from cmk.gui.config import Config
+from cmk.gui.http import request
+from cmk.gui.type_defs import Row
 from cmk.gui.view import View
-from cmk.gui.views.page_show_view import _get_needed_regular_columns
+from cmk.gui.views.page_show_view import _get_needed_regular_columns, _sort_data
+from cmk.gui.views.sorter import sorter_registry, SorterEntry
 from cmk.gui.visuals.filter import Filter
 from cmk.gui.visuals.filter.components import FilterComponent
 
@@ -72,3 +79,61 @@ def test_get_needed_regular_columns(view: View) -> None:
             "some_column",
         ]
     )
+
+
+def _sort_rows() -> list[Row]:
+    return [
+        {
+            "site": "heute",
+            "host_name": f"host{n % 13}",
+            "service_description": ("Check_MK", "CPU load", f"Interface {n % 11}")[n % 3],
+            "service_state": n % 4,
+            "service_has_been_checked": int(n % 17 != 0),
+            "service_last_state_change": n % 7,
+            "service_plugin_output": ("OK", "ok", "WARN - high", "")[n % 4],
+            "JOIN": (
+                {"CPU load": {"service_state": n % 3, "service_has_been_checked": int(n % 19 != 0)}}
+                if n % 5
+                else {}
+            ),
+            "index": n,
+        }
+        for n in range(200)
+    ]
+
+
+@pytest.mark.usefixtures("request_context")
+@pytest.mark.parametrize(
+    "sorters",
+    [
+        [("svcstate", False, None)],
+        [("svcstate", True, None), ("host_name", False, None)],
+        [("host_name", False, None), ("svcdescr", False, None), ("stateage", True, None)],
+        [("svcoutput", True, None), ("stateage", True, None), ("site_host", False, None)],
+        [("svcstate", False, "CPU load"), ("svcdescr", True, None)],
+    ],
+)
+def test_sort_data_by_keys_like_cmp(sorters: list[tuple[str, bool, str | None]]) -> None:
+    config = Config()
+    entries = [
+        SorterEntry(sorter_registry[name], negate, join_key, None)
+        for name, negate, join_key in sorters
+    ]
+    rows = _sort_rows()
+
+    def multisort(r1: Row, r2: Row) -> int:
+        for entry in entries:
+            c1 = r1["JOIN"].get(entry.join_key) if entry.join_key else r1
+            c2 = r2["JOIN"].get(entry.join_key) if entry.join_key else r2
+            if c1 is None or c2 is None:
+                c = (c1 is not None) - (c2 is not None)
+            else:
+                c = entry.sorter.cmp(c1, c2, parameters=None, config=config, request=request)
+            if c := -c if entry.negate else c:
+                return c
+        return 0
+
+    expected = sorted(rows, key=functools.cmp_to_key(multisort))
+    _sort_data(rows, entries, config)
+
+    assert [row["index"] for row in rows] == [row["index"] for row in expected]
@@ -11,6 +11,7 @@ import io
 import logging
 import os
 import tarfile
+import tempfile
 from collections.abc import Mapping
 from pathlib import Path
 
@@ -263,6 +264,41 @@ def test_get_config_sync_file_infos() -> None:
     }
 
 
+def test_config_sync_file_hash_cache(tmp_path: Path) -> None:
+    cache_path = tmp_path / "hashes.pkl"
+    unchanged = tmp_path / "unchanged"
+    unchanged.write_text("abc")
+    os.utime(unchanged, (1700000000, 1700000000))
+    recently_changed = tmp_path / "recently_changed"
+    recently_changed.write_text("abc")
+
+    file_hash_cache = activate_changes._ConfigSyncFileHashCache(cache_path)
+    for path in (unchanged, recently_changed):
+        assert file_hash_cache.file_hash(str(path), path.stat()) == (
+            "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+        )
+    file_hash_cache.save()
+
+    # Same inode, modification time and size: the file is not read again
+    unchanged.write_text("xyz")
+    os.utime(unchanged, (1700000000, 1700000000))
+    file_hash_cache = activate_changes._ConfigSyncFileHashCache(cache_path)
+    assert file_hash_cache.file_hash(str(unchanged), unchanged.stat()) == (
+        "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+    )
+
+    # Changed: read again, and the entry of the previous content is dropped
+    os.utime(unchanged, (1700000001, 1700000001))
+    file_hash_cache = activate_changes._ConfigSyncFileHashCache(cache_path)
+    assert file_hash_cache.file_hash(str(unchanged), unchanged.stat()) == (
+        "3608bca1e44ea6c4d268eb6db02260269892c0b42b86bbf1e77a6fa16c3c9282"
+    )
+    file_hash_cache.save()
+    assert list(ccc_store.load_object_from_pickle_file(cache_path, default={}).values()) == [
+        "3608bca1e44ea6c4d268eb6db02260269892c0b42b86bbf1e77a6fa16c3c9282"
+    ]
+
+
 def _create_get_config_sync_file_infos_test_config(base_dir: Path) -> None:
     base_dir.joinpath("etc/d1").mkdir(parents=True, exist_ok=True)
 
@@ -543,17 +579,21 @@ def _get_test_sync_archive(tmp_path: Path) -> bytes:
     tmp_path.joinpath("broken-symlink").symlink_to("eeg")
     tmp_path.joinpath("working-symlink").symlink_to("ding")
 
-    return activate_changes._get_sync_archive(
-        [
-            "etc/abc",
-            "file-to-dir/aaa",
-            "ding",
-            "dir-to-file",
-            "broken-symlink",
-            "working-symlink",
-        ],
-        tmp_path,
-    )
+    with tempfile.TemporaryFile() as sync_archive:
+        activate_changes._create_sync_archive(
+            [
+                "etc/abc",
+                "file-to-dir/aaa",
+                "ding",
+                "dir-to-file",
+                "broken-symlink",
+                "working-symlink",
+            ],
+            tmp_path,
+            sync_archive,
+        )
+        sync_archive.seek(0)
+        return sync_archive.read()
 
 
 class TestAutomationReceiveConfigSync:
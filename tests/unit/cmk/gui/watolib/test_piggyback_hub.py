@@ -12,9 +12,14 @@ from livestatus import SiteConfiguration
 
 from cmk.ccc.hostaddress import HostAddress
 from cmk.ccc.site import SiteId
+from cmk.ccc.version import __version__
 from cmk.gui.exceptions import MKUserError
 from cmk.gui.type_defs import GlobalSettings
-from cmk.gui.watolib.piggyback_hub import _validate_piggyback_hub_config, compute_new_config
+from cmk.gui.watolib.piggyback_hub import (
+    _validate_piggyback_hub_config,
+    compute_batching_sites,
+    compute_new_config,
+)
 
 
 def default_site_config() -> SiteConfiguration:
@@ -60,6 +65,17 @@ def test_update_sites_with_hub_config() -> None:
     ]
 
 
+def test_compute_batching_sites() -> None:
+    configured_sites = {
+        SiteId("updated"): default_site_config(),
+        SiteId("previous"): default_site_config(),
+        SiteId("offline"): default_site_config(),
+    }
+    site_versions = {SiteId("updated"): __version__, SiteId("previous"): "2.4.0p10"}
+
+    assert compute_batching_sites(configured_sites, site_versions) == ["updated"]
+
+
 @pytest.mark.parametrize(
     ["settings_per_site", "expected_raises"],
     [
@@ -86,6 +86,7 @@ def test_registered_configvars() -> None:
         "auth_by_http_header",
         "builtin_icon_visibility",
         "bulk_discovery_default_settings",
+        "check_max_concurrent_fetches",
         "check_mk_perfdata_with_times",
         "cluster_max_cachefile_age",
         "crash_report_target",
@@ -111,6 +112,10 @@ def test_registered_configvars() -> None:
         "housekeeping_interval",
         "sqlite_housekeeping_interval",
         "sqlite_freelist_size",
+        "sqlite_journal_mode",
+        "sqlite_synchronous",
+        "sqlite_write_batch_size",
+        "sqlite_write_batch_interval",
         "user_security_notification_duration",
         "http_proxies",
         "inventory_check_autotrigger",
@@ -133,9 +138,11 @@ def test_registered_configvars() -> None:
         "multisite_draw_ruleicon",
         "notification_backlog",
         "notification_bulk_interval",
+        "notification_delivery_workers",
         "notification_fallback_email",
         "notification_fallback_format",
         "notification_logging",
+        "notification_plugin_concurrency",
         "notification_plugin_timeout",
         "page_heading",
         "pagetitle_date_format",
@@ -181,6 +188,8 @@ def test_registered_configvars() -> None:
         "trusted_certificate_authorities",
         "ui_theme",
         "use_dns_cache",
+        "dns_cache_update_workers",
+        "dns_cache_update_timeout",
         "snmp_backend_default",
         "use_new_descriptions_for",
         "user_downtime_timeranges",
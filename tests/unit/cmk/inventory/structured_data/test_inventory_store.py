@@ -6,16 +6,24 @@
 import gzip
 import io
 import json
+import threading
+import warnings
+from collections.abc import Iterable
 from pathlib import Path
 
+import pytest
+
 import cmk.ccc.store
 from cmk.ccc.hostaddress import HostName
 from cmk.inventory.structured_data import (
+    compute_history_entries,
     deserialize_delta_tree,
     deserialize_tree,
+    HistoryIndexEntry,
     HistoryStore,
     InventoryStore,
     load_history,
+    load_history_index,
     make_meta,
     rename,
     SDKey,
@@ -264,6 +272,138 @@ def test_load_history(tmp_path: Path) -> None:
         assert delta_cache_file_path.suffixes == [".json"]
 
 
+def _save_archive(tmp_path: Path, host_name: HostName, count: int) -> None:
+    for idx in range(count):
+        cmk.ccc.store.save_text_to_file(
+            tmp_path / f"var/check_mk/inventory_archive/{host_name}/{idx}.json",
+            json.dumps(_raw_tree(f"val-{idx}")),
+        )
+    cmk.ccc.store.save_text_to_file(
+        tmp_path / f"var/check_mk/inventory/{host_name}.json", json.dumps(_raw_tree("val"))
+    )
+
+
+def test_load_history_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    host_name = HostName("hostname")
+    _save_archive(tmp_path, host_name, 5)
+    history_store = HistoryStore(tmp_path)
+
+    history = load_history(
+        history_store,
+        host_name,
+        history_paths_filter=lambda paths: paths,
+        delta_tree_filters=None,
+    )
+    history_index = load_history_index(HistoryStore(tmp_path), host_name)
+    assert history_index.entries == [
+        HistoryIndexEntry.from_history_entry(e) for e in history.entries
+    ]
+    assert not history_index.corrupted
+    # The entry of the current inventory tree is not indexed
+    assert len(history_store.load_index(host_name)) == 5
+
+    def load_history_entry(*args: object, **kwargs: object) -> None:
+        raise AssertionError("indexed entry is loaded")
+
+    history_store = HistoryStore(tmp_path)
+    monkeypatch.setattr(history_store, "load_history_entry", load_history_entry)
+    (tmp_path / "var/check_mk/inventory/hostname.json").unlink()
+    assert load_history_index(history_store, host_name).entries == history_index.entries[:-1]
+
+
+def test_load_history_index_removes_outdated_entries(tmp_path: Path) -> None:
+    host_name = HostName("hostname")
+    _save_archive(tmp_path, host_name, 3)
+    history_store = HistoryStore(tmp_path)
+    history_store.save_index(
+        host_name,
+        [
+            HistoryIndexEntry(
+                previous_timestamp=-5, current_timestamp=-4, new=1, changed=0, removed=0
+            )
+        ],
+    )
+
+    assert len(load_history_index(history_store, host_name).entries) == 4
+    assert sorted(history_store.load_index(host_name)) == [(-1, 0), (0, 1), (1, 2)]
+
+
+def test_load_history_index_corrupted_index(tmp_path: Path) -> None:
+    host_name = HostName("hostname")
+    _save_archive(tmp_path, host_name, 2)
+    cmk.ccc.store.save_text_to_file(
+        tmp_path / "var/check_mk/inventory_history_index/hostname.json", "[[1, 2"
+    )
+
+    history_index = load_history_index(HistoryStore(tmp_path), host_name)
+    assert len(history_index.entries) == 3
+    assert not history_index.corrupted
+
+
+def test_update_history_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    host_name = HostName("hostname")
+    history_store = HistoryStore(tmp_path)
+    entries = [
+        HistoryIndexEntry(
+            previous_timestamp=idx - 1, current_timestamp=idx, new=idx, changed=0, removed=0
+        )
+        for idx in range(3)
+    ]
+    save_index = history_store.save_index
+    locked_on_save = []
+
+    def locking_save_index(host_name: HostName, index: Iterable[HistoryIndexEntry]) -> None:
+        locked_on_save.append(
+            cmk.ccc.store.have_lock(tmp_path / "var/check_mk/inventory_history_index/hostname.json")
+        )
+        save_index(host_name, index)
+
+    monkeypatch.setattr(history_store, "save_index", locking_save_index)
+
+    history_store.update_index(host_name, entries[:2])
+    history_store.update_index(host_name, entries[2:])
+    assert list(history_store.load_index(host_name).values()) == entries
+
+    history_store.update_index(host_name, [], known_keys={(0, 1), (1, 2)})
+    assert list(history_store.load_index(host_name).values()) == entries[1:]
+    assert locked_on_save == [True, True, True]
+
+
+def test_compute_history_entries(tmp_path: Path) -> None:
+    host_names = [HostName("host1"), HostName("host2")]
+    for host_name in host_names:
+        _save_archive(tmp_path, host_name, 40)
+
+    compute_history_entries(tmp_path, host_names, max_workers=2)
+
+    history_store = HistoryStore(tmp_path)
+    for host_name in host_names:
+        assert (
+            len(list((tmp_path / f"var/check_mk/inventory_delta_cache/{host_name}").iterdir()))
+            == 40
+        )
+        assert sorted(history_store.load_index(host_name)) == [(idx - 1, idx) for idx in range(40)]
+
+
+def test_compute_history_entries_in_threaded_process(tmp_path: Path) -> None:
+    # Like in the GUI job scheduler: forking the workers would warn about the other thread
+    host_name = HostName("hostname")
+    _save_archive(tmp_path, host_name, 3)
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            compute_history_entries(tmp_path, [host_name], max_workers=1)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert not [w for w in caught if "fork()" in str(w.message)]
+    assert sorted(HistoryStore(tmp_path).load_index(host_name)) == [(-1, 0), (0, 1), (1, 2)]
+
+
 def test_rename_legacy(tmp_path: Path) -> None:
     old_host_name = HostName("old_host_name")
     raw_tree = _raw_tree("val")
@@ -341,9 +481,15 @@ def test_rename(tmp_path: Path) -> None:
             json.dumps(raw_tree),
         )
 
+    cmk.ccc.store.save_text_to_file(
+        tmp_path / f"var/check_mk/inventory_history_index/{old_host_name}.json", "[]"
+    )
+
     new_host_name = HostName("new_host_name")
     rename(tmp_path, old_host_name=old_host_name, new_host_name=new_host_name)
 
+    assert not (tmp_path / f"var/check_mk/inventory_history_index/{old_host_name}.json").exists()
+    assert (tmp_path / f"var/check_mk/inventory_history_index/{new_host_name}.json").exists()
     assert not (tmp_path / f"var/check_mk/inventory/{old_host_name}.json").exists()
     assert (tmp_path / f"var/check_mk/inventory/{new_host_name}.json").exists()
     assert not (tmp_path / f"var/check_mk/inventory/{old_host_name}.json.gz").exists()
@@ -42,3 +42,106 @@ def test__on_message() -> None:
     ]
     actual_payload = get_messages_for(HostName("target"), cmk.utils.paths.omd_root)
     assert actual_payload == expected_payload
+
+
+def _message(source: str, piggybacked: str, raw_data: bytes) -> PiggybackMessage:
+    return PiggybackMessage(
+        meta=PiggybackMetaData(
+            source=HostName(source),
+            piggybacked=HostName(piggybacked),
+            last_update=1640000020,
+            last_contact=1640000000,
+        ),
+        raw_data=raw_data,
+    )
+
+
+def test_batch_serialization_roundtrip() -> None:
+    batch = payload.PiggybackPayloadBatch.from_messages(
+        [
+            _message("source", "target1", b"<<<a>>>\nline1\n"),
+            _message("source", "target2", b"\x00\xff binary"),
+            _message("source", "target3", b""),
+        ]
+    )
+
+    received = payload.PiggybackPayloadBatch.model_validate_json(batch.model_dump_json())
+
+    assert received == batch
+    assert received.raw_data() == {
+        HostName("target1"): (b"<<<a>>>\nline1\n",),
+        HostName("target2"): (b"\x00\xff binary",),
+        HostName("target3"): (b"",),
+    }
+
+
+def test_make_batches() -> None:
+    batches = list(
+        payload.make_batches(
+            [
+                ("site1", _message("source1", "target1", b"1")),
+                ("site2", _message("source1", "target2", b"2")),
+                ("site1", _message("source2", "target3", b"3")),
+                ("site1", _message("source1", "target4", b"4")),
+            ]
+        )
+    )
+
+    assert [(site, batch.source_host, batch.raw_data()) for site, batch in batches] == [
+        ("site1", "source1", {"target1": (b"1",), "target4": (b"4",)}),
+        ("site2", "source1", {"target2": (b"2",)}),
+        ("site1", "source2", {"target3": (b"3",)}),
+    ]
+
+
+def test__on_batch_message() -> None:
+    test_logger = logging.getLogger("test")
+    input_payload = payload.PiggybackPayloadBatch.from_messages(
+        [
+            _message("source", "target1", b"line1\nline2"),
+            _message("source", "target2", b"line3"),
+        ]
+    )
+    on_message = payload.save_payload_batch_on_message(test_logger, cmk.utils.paths.omd_root)
+
+    on_message(Mock(), DeliveryTag(0), input_payload)
+
+    assert get_messages_for(HostName("target1"), cmk.utils.paths.omd_root) == [
+        _message("source", "target1", b"line1\nline2\n")
+    ]
+    assert get_messages_for(HostName("target2"), cmk.utils.paths.omd_root) == [
+        _message("source", "target2", b"line3\n")
+    ]
+
+
+def test_publish_messages_to_sites_of_previous_versions() -> None:
+    payload_channel, batch_channel = Mock(), Mock()
+
+    payload.publish_messages(
+        logging.getLogger("test"),
+        "test",
+        payload_channel=payload_channel,
+        batch_channel=batch_channel,
+        messages=[
+            ("updated", _message("source", "target1", b"1")),
+            ("updated", _message("source", "target2", b"2")),
+            ("previous", _message("source", "target3", b"3")),
+            ("previous", _message("source", "target4", b"4")),
+        ],
+        batching_sites={"updated"},
+    )
+
+    # Sites of previous versions have no queue for batches
+    assert [
+        (call.args[0], call.args[1].raw_data, call.kwargs["routing"])
+        for call in payload_channel.publish_for_site.call_args_list
+    ] == [
+        ("previous", {"target3": (b"3",)}, payload.PAYLOAD_ROUTE),
+        ("previous", {"target4": (b"4",)}, payload.PAYLOAD_ROUTE),
+    ]
+    assert [
+        (call.args[0], call.args[1].raw_data(), call.kwargs["routing"])
+        for call in batch_channel.publish_for_site.call_args_list
+    ] == [
+        ("updated", {"target1": (b"1",), "target2": (b"2",)}, payload.PAYLOAD_BATCH_ROUTE),
+    ]
@@ -3,8 +3,21 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import datetime
+from dataclasses import dataclass
+from pathlib import Path
+from zoneinfo import ZoneInfo
 
-from cmk.utils.prediction import estimate_levels
+import time_machine
+
+from cmk.agent_based.prediction_backend import PredictionInfo, PredictionParameters
+from cmk.ccc.hostaddress import HostName
+from cmk.utils.prediction import (
+    estimate_levels,
+    make_updated_predictions,
+    PredictionStore,
+)
+from cmk.utils.servicename import ServiceName
 
 
 def test_estimate_levels_absolute() -> None:
@@ -45,3 +58,39 @@ def test_estimate_levels_lower_ubound() -> None:
     )
 
     assert estimate_levels(42.0, 1.0, "lower", ("stdev", (2.3, 3.2)), (38.5, 50.0)) == (38.5, 38.8)
+
+
+@dataclass(frozen=True)
+class _Record:
+    window: range
+    values: list[float | None]
+
+
+class _RecordedData:
+    def __init__(self) -> None:
+        self.fetched: list[tuple[int, int]] = []
+
+    def __call__(self, rpn: str, start: int, end: int) -> _Record:
+        self.fetched.append((start, end))
+        window = range(start, end, 3600)
+        return _Record(window=window, values=[float(t // 3600 % 24) for t in window])
+
+
+def test_make_updated_predictions_precomputes_next_day(tmp_path: Path) -> None:
+    params = PredictionParameters(period="hour", horizon=3, levels=("absolute", (1.0, 2.0)))
+    # Thursday, 2018-07-12 23:59:59 UTC
+    now = 1531439999
+    store = PredictionStore(HostName("host"), ServiceName("CPU load"))
+    store.path = tmp_path
+    with time_machine.travel(datetime.datetime.fromtimestamp(now, tz=ZoneInfo("UTC"))):
+        store.save_prediction_info(PredictionInfo.make("load15", "upper", params, now))
+        make_updated_predictions(store, _RecordedData(), now)
+
+        tomorrow = PredictionInfo.make("load15", "upper", params, now + 1)
+        assert store.has_prediction(tomorrow)
+
+        recorded_data = _RecordedData()
+        predictions = make_updated_predictions(store, recorded_data, now + 1)
+
+    assert hash(tomorrow) in predictions
+    assert not recorded_data.fetched
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+import datetime
+from dataclasses import dataclass
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import time_machine
+
+from cmk.agent_based.prediction_backend import PredictionInfo, PredictionParameters
+from cmk.utils.prediction._prediction import compute_prediction
+from cmk.utils.prediction._slice_cache import SliceCache
+
+_DAY = 86400
+# Thursday, 2018-07-12 00:00:10 UTC
+_NOW = 1531353610
+
+
+@dataclass(frozen=True)
+class _Record:
+    window: range
+    values: list[float | None]
+
+
+class _RecordedData:
+    def __init__(self) -> None:
+        self.fetched: list[tuple[int, int]] = []
+
+    def __call__(self, rpn: str, start: int, end: int) -> _Record:
+        self.fetched.append((start, end))
+        window = range(start, end, 300)
+        return _Record(
+            window=window,
+            values=[None if t % 7200 == 0 else float(t // 300 % 37) for t in window],
+        )
+
+
+def _info(now: int) -> PredictionInfo:
+    return PredictionInfo.make(
+        "load15",
+        "upper",
+        PredictionParameters(period="hour", horizon=5, levels=("absolute", (1.0, 2.0))),
+        now,
+    )
+
+
+def test_slice_cache_keeps_slices_until_they_are_not_needed(tmp_path: Path) -> None:
+    path = tmp_path / "load15" / "slices.npz"
+    cache = SliceCache(path)
+    cache.add((0, 600), range(0, 600, 300), np.array([1.0, np.nan]), needed_until=1000)
+    cache.add((600, 1200), range(600, 1200, 60), np.arange(10.0), needed_until=2000)
+    cache.save(now=500)
+
+    cache = SliceCache(path)
+    assert (cached := cache.get((0, 600), needed_until=1000)) is not None
+    assert cached[0] == range(0, 600, 300)
+    np.testing.assert_array_equal(cached[1], [1.0, np.nan])
+    cache.save(now=1500)
+
+    cache = SliceCache(path)
+    assert cache.get((0, 600), needed_until=1000) is None
+    assert (cached := cache.get((600, 1200), needed_until=2000)) is not None
+    np.testing.assert_array_equal(cached[1], np.arange(10.0))
+
+
+def test_slice_cache_ignores_unreadable_file(tmp_path: Path) -> None:
+    path = tmp_path / "slices.npz"
+    path.write_bytes(b"garbage")
+    assert SliceCache(path).get((0, 600), needed_until=1000) is None
+
+
+def test_incremental_prediction_fetches_only_new_slices(tmp_path: Path) -> None:
+    with time_machine.travel(datetime.datetime.fromtimestamp(_NOW, tz=ZoneInfo("UTC"))):
+        recorded_data = _RecordedData()
+        first = compute_prediction(
+            _info(_NOW), recorded_data, _NOW, SliceCache(tmp_path / "slices.npz")
+        )
+        assert len(recorded_data.fetched) == 5
+        assert first == compute_prediction(_info(_NOW), _RecordedData(), _NOW)
+
+        next_day = _NOW + _DAY
+        recorded_data = _RecordedData()
+        second = compute_prediction(
+            _info(next_day), recorded_data, next_day, SliceCache(tmp_path / "slices.npz")
+        )
+        # Right after midnight the slice of the day before has not been complete yet
+        assert recorded_data.fetched == [
+            (next_day - 10, next_day - 10 + _DAY),
+            (next_day - 10 - _DAY, next_day - 10),
+            (next_day - 10 - 2 * _DAY, next_day - 10 - _DAY),
+        ]
+        assert second == compute_prediction(_info(next_day), _RecordedData(), next_day)
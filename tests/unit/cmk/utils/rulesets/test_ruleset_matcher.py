@@ -7,7 +7,7 @@
 # mypy: disable-error-code="type-arg"
 
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from typing import Any
 
 import pytest
@@ -15,6 +15,9 @@ from pytest import MonkeyPatch
 
 from cmk.ccc.hostaddress import HostName
 from cmk.utils.rulesets.ruleset_matcher import (
+    matches_host_name,
+    matches_host_tags,
+    matches_labels,
     matches_tag_condition,
     RuleConditionsSpec,
     RulesetMatcher,
@@ -925,3 +928,160 @@ class TestSingleRulesetMatcher:
             host_ruleset=self._ruleset(),
             labels_of_host=lambda x: {},
         )(HostName("testhost2")) == ["lala", "lulu"]
+
+
+_INDEXED_HOSTS = [HostName(f"host{n:02d}") for n in range(48)]
+_INDEXED_HOST_TAGS = {
+    host_name: {
+        TagGroupID("criticality"): TagID(("prod", "test", "critical")[n % 3]),
+        TagGroupID("networking"): TagID(("lan", "wan")[n % 2]),
+        **({TagGroupID("ping"): TagID("ping")} if n % 5 == 0 else {}),
+    }
+    for n, host_name in enumerate(_INDEXED_HOSTS)
+}
+_INDEXED_HOST_PATHS = {
+    host_name: ("/dc1/hosts.mk", "/dc1/rack1/hosts.mk", "/dc2/hosts.mk", "/dc1_old/hosts.mk")[n % 4]
+    for n, host_name in enumerate(_INDEXED_HOSTS)
+    # the others are in the main folder
+    if n % 7
+}
+_INDEXED_CONDITIONS: Sequence[RuleConditionsSpec] = [
+    {},
+    {"host_tags": {TagGroupID("criticality"): TagID("prod")}},
+    {"host_tags": {TagGroupID("criticality"): {"$ne": TagID("prod")}}},
+    {"host_tags": {TagGroupID("criticality"): {"$or": [TagID("prod"), TagID("critical")]}}},
+    {"host_tags": {TagGroupID("criticality"): {"$nor": [TagID("prod"), TagID("critical")]}}},
+    {
+        "host_tags": {
+            TagGroupID("criticality"): {"$ne": TagID("test")},
+            TagGroupID("networking"): TagID("wan"),
+            TagGroupID("ping"): TagID("ping"),
+        }
+    },
+    {"host_tags": {TagGroupID("ping"): {"$ne": TagID("ping")}}},
+    {"host_tags": {TagGroupID("unknown"): TagID("unknown")}},
+    {"host_folder": "/dc1/"},
+    {"host_folder": "/dc1/rack1/"},
+    {"host_folder": "/dc1/", "host_tags": {TagGroupID("networking"): {"$ne": TagID("lan")}}},
+    {"host_label_groups": [("and", [("and", "os:linux")])]},
+    {"host_label_groups": [("and", [("not", "os:linux")])]},
+    {"host_label_groups": [("and", [("and", "os:linux"), ("or", "team:team1")])]},
+    {
+        "host_label_groups": [
+            ("and", [("and", "os:windows")]),
+            ("or", [("and", "team:team2"), ("not", "os:linux")]),
+            ("not", [("and", "team:team0")]),
+        ]
+    },
+    {
+        "host_folder": "/dc2/",
+        "host_tags": {TagGroupID("criticality"): {"$nor": [TagID("test")]}},
+        "host_label_groups": [("and", [("not", "team:team1")])],
+    },
+    {"host_name": ["host01", "host02", "host03", "unknown"]},
+    {
+        "host_name": ["host01", "host02", "host03"],
+        "host_label_groups": [("and", [("and", "os:linux")])],
+    },
+    {"host_name": {"$nor": ["host01", "host02"]}},
+    {
+        "host_name": [{"$regex": "host1"}, "host20"],
+        "host_tags": {TagGroupID("networking"): TagID("lan")},
+    },
+    {
+        "host_name": {"$nor": [{"$regex": "host.[05]"}]},
+        "host_folder": "/dc1/",
+        "host_label_groups": [("and", [("and", "os:windows")])],
+    },
+]
+
+
+def _indexed_labels(n_team: int) -> Callable[[HostName], Mapping[str, str]]:
+    def labels_of_host(host_name: HostName) -> Mapping[str, str]:
+        n = int(host_name.removeprefix("host"))
+        if n % 6 == 0:
+            return {}
+        return {"os": ("linux", "windows")[n % 2], "team": f"team{n % n_team}"}
+
+    return labels_of_host
+
+
+def _indexed_ruleset() -> Sequence[RuleSpec[int]]:
+    return [
+        {"id": str(n), "value": n, "condition": condition, "options": {}}
+        for n, condition in enumerate(_INDEXED_CONDITIONS)
+    ]
+
+
+def _make_indexed_matcher() -> RulesetMatcher:
+    return RulesetMatcher(
+        host_tags=_INDEXED_HOST_TAGS,
+        host_paths=_INDEXED_HOST_PATHS,
+        all_configured_hosts=frozenset(_INDEXED_HOSTS),
+        clusters_of={},
+        nodes_of={},
+    )
+
+
+def _matches_per_host(
+    host_name: HostName,
+    condition: RuleConditionsSpec,
+    labels_of_host: Callable[[HostName], Mapping[str, str]],
+) -> bool:
+    """The conditions of a rule, evaluated for the given host only"""
+    return (
+        condition.get("host_name") != []
+        and _INDEXED_HOST_PATHS.get(host_name, "/").startswith(condition.get("host_folder", "/"))
+        and matches_host_tags(
+            set(_INDEXED_HOST_TAGS[host_name].items()), condition.get("host_tags", {})
+        )
+        and matches_labels(labels_of_host(host_name), condition.get("host_label_groups", []))
+        and matches_host_name(condition.get("host_name"), host_name)
+    )
+
+
+def _assert_matches_per_host(
+    matcher: RulesetMatcher,
+    ruleset: Sequence[RuleSpec[int]],
+    labels_of_host: Callable[[HostName], Mapping[str, str]],
+) -> None:
+    for host_name in _INDEXED_HOSTS:
+        assert matcher.get_host_values_all(host_name, ruleset, labels_of_host) == [
+            rule["value"]
+            for rule in ruleset
+            if _matches_per_host(host_name, rule["condition"], labels_of_host)
+        ], host_name
+
+
+def test_ruleset_matcher_indexes_match_like_per_host_matching() -> None:
+    _assert_matches_per_host(_make_indexed_matcher(), _indexed_ruleset(), _indexed_labels(3))
+
+
+def test_ruleset_matcher_indexes_of_processed_and_foreign_hosts() -> None:
+    matcher = _make_indexed_matcher()
+    matcher.ruleset_optimizer.set_all_processed_hosts(set(_INDEXED_HOSTS[::3]))
+    # The processed hosts are matched within their scope, the others as foreign hosts
+    _assert_matches_per_host(matcher, _indexed_ruleset(), _indexed_labels(3))
+
+
+def test_ruleset_matcher_indexes_are_invalidated_by_clear_caches() -> None:
+    matcher = _make_indexed_matcher()
+    ruleset = _indexed_ruleset()
+    _assert_matches_per_host(matcher, ruleset, _indexed_labels(3))
+
+    matcher.clear_caches()
+    _assert_matches_per_host(matcher, ruleset, _indexed_labels(4))
+
+
+def test_ruleset_matcher_indexes_are_invalidated_by_set_all_processed_hosts() -> None:
+    matcher = _make_indexed_matcher()
+    ruleset = _indexed_ruleset()
+    matcher.ruleset_optimizer.set_all_processed_hosts(set(_INDEXED_HOSTS[:24]))
+    _assert_matches_per_host(matcher, ruleset, _indexed_labels(3))
+
+    # Like the automation helper does before each call. Only set_all_processed_hosts
+    # invalidates the folder lookups, the caches of the matched hosts are cleared separately.
+    matcher.ruleset_optimizer.set_all_processed_hosts(set(_INDEXED_HOSTS[12:]))
+    matcher.ruleset_optimizer.clear_caches()
+    matcher.ruleset_optimizer.clear_ruleset_caches()
+    _assert_matches_per_host(matcher, ruleset, _indexed_labels(3))
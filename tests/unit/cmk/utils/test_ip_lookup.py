@@ -5,6 +5,7 @@
 
 
 import socket
+import threading
 from collections.abc import Mapping
 from pathlib import Path
 from typing import Final
@@ -12,7 +13,7 @@ from typing import Final
 import pytest
 from pytest import MonkeyPatch
 
-from cmk.ccc.exceptions import MKIPAddressLookupError
+from cmk.ccc.exceptions import MKIPAddressLookupError, MKTimeout
 from cmk.ccc.hostaddress import HostAddress, HostName
 from cmk.utils import ip_lookup
 from cmk.utils.caching import cache_manager
@@ -490,6 +491,49 @@ class TestIPLookupCache:
         ip_lookup_cache.load_persisted()
         assert not ip_lookup_cache
 
+    def test_update_appends_to_journal(self, tmp_path: Path) -> None:
+        cache_id1: ip_lookup.IPLookupCacheId = HostName("host1"), socket.AddressFamily.AF_INET
+        cache_id2: ip_lookup.IPLookupCacheId = HostName("host2"), socket.AddressFamily.AF_INET6
+        ip_lookup.IPLookupCache({cache_id1: HostAddress("1")}).save_persisted()
+        persisted = ip_lookup.IPLookupCache.PATH.read_bytes()
+
+        ip_lookup_cache = ip_lookup.IPLookupCache({})
+        ip_lookup_cache[cache_id1] = HostAddress("127.0.0.1")
+        ip_lookup_cache[cache_id2] = HostAddress("::1")
+
+        assert ip_lookup.IPLookupCache.PATH.read_bytes() == persisted
+        new_cache_instance = ip_lookup.IPLookupCache({})
+        new_cache_instance.load_persisted()
+        assert new_cache_instance == {
+            cache_id1: HostAddress("127.0.0.1"),
+            cache_id2: HostAddress("::1"),
+        }
+
+    def test_merge_journal(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setattr(ip_lookup.IPLookupCache, "JOURNAL_MERGE_SIZE", 40)
+        cache_ids: list[ip_lookup.IPLookupCacheId] = [
+            (HostName(f"host{n}"), socket.AddressFamily.AF_INET) for n in range(3)
+        ]
+
+        ip_lookup_cache = ip_lookup.IPLookupCache({})
+        for cache_id in cache_ids:
+            ip_lookup_cache[cache_id] = HostAddress("127.0.0.1")
+
+        # The third entry exceeds the size and triggers the merge
+        assert not (tmp_path / "cache.journal").exists()
+        new_cache_instance = ip_lookup.IPLookupCache({})
+        new_cache_instance.load_persisted()
+        assert new_cache_instance == dict.fromkeys(cache_ids, HostAddress("127.0.0.1"))
+
+    def test_load_ignores_incomplete_journal_line(self, tmp_path: Path) -> None:
+        (tmp_path / "cache.journal").write_text("host1 4 127.0.0.1\nhost2 4")
+
+        ip_lookup_cache = ip_lookup.IPLookupCache({})
+        ip_lookup_cache.load_persisted()
+        assert ip_lookup_cache == {
+            (HostName("host1"), socket.AddressFamily.AF_INET): HostAddress("127.0.0.1")
+        }
+
 
 def test_update_dns_cache(monkeypatch: MonkeyPatch) -> None:
     def ip_lookup_cache() -> ip_lookup.IPLookupCache:
@@ -552,6 +596,63 @@ def test_update_dns_cache(monkeypatch: MonkeyPatch) -> None:
     assert cache.get((HostName("dual"), socket.AddressFamily.AF_INET6)) is None
 
 
+def test_update_dns_cache_concurrently() -> None:
+    released = threading.Event()
+
+    def lookup_ip_address(
+        host_name: HostName, family: ip_lookup.SupportedAddressFamily
+    ) -> HostAddress:
+        if host_name == "slow":
+            released.wait()
+            return HostAddress("127.0.0.1")
+        if host_name == "unknown":
+            raise MKIPAddressLookupError(f"Failed to lookup address of {host_name}")
+        ip_lookup._get_ip_lookup_cache()[(host_name, family)] = HostAddress("127.0.0.1")
+        return HostAddress("127.0.0.1")
+
+    hosts = [HostName(f"host{n}") for n in range(20)] + [HostName("unknown"), HostName("slow")]
+    try:
+        result = ip_lookup.update_dns_cache(
+            hosts=hosts,
+            get_ip_stack_config=lambda host_name: ip_lookup.IPStackConfig.IPv4,
+            lookup_ip_address=lookup_ip_address,
+            max_workers=4,
+            lookup_timeout=0.1,
+        )
+        # The worker of the hanging lookup does not keep the process from exiting
+        hanging = [t for t in threading.enumerate() if t.name.startswith("dns-lookup")]
+        assert hanging and all(t.daemon for t in hanging)
+    finally:
+        released.set()
+
+    assert result == (20, ["unknown", "slow"])
+    cache = ip_lookup.IPLookupCache({})
+    cache.load_persisted()
+    assert cache == {
+        (host_name, socket.AddressFamily.AF_INET): HostAddress("127.0.0.1")
+        for host_name in hosts[:20]
+    }
+
+
+@pytest.mark.usefixtures("disable_debug")
+def test_update_dns_cache_concurrently_raises_timeout() -> None:
+    def lookup_ip_address(
+        host_name: HostName, family: ip_lookup.SupportedAddressFamily
+    ) -> HostAddress:
+        if host_name == "host3":
+            raise MKTimeout()
+        return HostAddress("127.0.0.1")
+
+    with pytest.raises(MKTimeout):
+        ip_lookup.update_dns_cache(
+            hosts=[HostName(f"host{n}") for n in range(8)],
+            get_ip_stack_config=lambda host_name: ip_lookup.IPStackConfig.IPv4,
+            lookup_ip_address=lookup_ip_address,
+            max_workers=4,
+            lookup_timeout=None,
+        )
+
+
 @pytest.mark.parametrize(
     "hostname_str, tags, result_address",
     [
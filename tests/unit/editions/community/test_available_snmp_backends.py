@@ -11,4 +11,5 @@ def test_available_snmp_backends() -> None:
     assert set(discover_backends()) == {
         SNMPBackendEnum.CLASSIC,
         SNMPBackendEnum.STORED_WALK,
+        SNMPBackendEnum.BUILTIN,
     }
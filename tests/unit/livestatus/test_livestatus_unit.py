@@ -7,6 +7,8 @@
 import errno
 import socket
 import ssl
+import threading
+import time
 from collections.abc import Sequence
 from contextlib import closing
 from pathlib import Path
@@ -15,6 +17,7 @@ import pytest
 from pytest import MonkeyPatch
 
 import livestatus
+from livestatus import SiteConfigurations
 
 from cmk.ccc.site import SiteId
 from cmk.ccc.user import UserId
@@ -335,3 +338,66 @@ def test_livestatus_lql(
     result: str,
 ) -> None:
     assert livestatus.livestatus_lql(*args) == result
+
+
+def _serve_once(sock: socket.socket, response: bytes, delay: float) -> None:
+    conn, _addr = sock.accept()
+    with conn:
+        request = b""
+        while not request.endswith(b"\n\n"):
+            request += conn.recv(4096)
+        time.sleep(delay)
+        # send the response in pieces, the client has to put them together
+        for offset in range(0, len(response), 7):
+            conn.sendall(response[offset : offset + 7])
+            time.sleep(delay / 100)
+        conn.recv(1)  # wait for the client to disconnect
+
+
+def test_query_parallel_drains_all_sites(tmp_path: Path) -> None:
+    responses = {
+        SiteId("slow"): (b'[["slow-host"]]', 0.5),
+        SiteId("fast"): (b'[["fast-host1"], ["fast-host2"]]', 0.0),
+        SiteId("broken"): (b"no python", 0.0),
+    }
+    servers = []
+    for site_id, (data, delay) in responses.items():
+        sock = socket.socket(socket.AF_UNIX)
+        sock.bind(str(tmp_path / site_id))
+        sock.listen(1)
+        server = threading.Thread(
+            target=_serve_once,
+            args=(sock, b"200 %11d\n%s" % (len(data), data), delay),
+            daemon=True,
+        )
+        server.start()
+        servers.append((sock, server))
+
+    live = livestatus.MultiSiteConnection(
+        SiteConfigurations(
+            {
+                site_id: {  # type: ignore[typeddict-item]
+                    "socket": f"unix:{tmp_path / site_id}",
+                    "status_host": None,
+                }
+                for site_id in responses
+            }
+        )
+    )
+    live.set_prepend_site(True)
+    try:
+        assert live.query("GET hosts\nColumns: name\n") == [
+            ["slow", "slow-host"],
+            ["fast", "fast-host1"],
+            ["fast", "fast-host2"],
+        ]
+        latencies = live.site_latencies()
+        assert set(latencies) == {"slow", "fast", "broken"}
+        assert latencies["fast"] < latencies["slow"]
+        assert live.alive_sites() == ["slow", "fast"]
+        assert list(live.dead_sites()) == ["broken"]
+    finally:
+        live.disconnect()
+        for sock, server in servers:
+            server.join(timeout=5)
+            sock.close()